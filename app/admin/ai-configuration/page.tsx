@@ -90,6 +90,15 @@ export default function AIConfigurationPage() {
     }
   }
 
+  // Server instances cache API keys and model selection; drop them after changes
+  async function invalidateServerCache() {
+    try {
+      await fetch('/api/admin/ai-configuration/cache', { method: 'DELETE' })
+    } catch (error) {
+      console.error('Error invalidating AI config cache:', error)
+    }
+  }
+
   async function handleSave() {
     if (!selectedAgent || !formData) return
 
@@ -132,6 +141,8 @@ export default function AIConfigurationPage() {
         change_notes: 'Updated via admin panel'
       })
 
+      await invalidateServerCache()
+
       // Refresh agents list
       await fetchAgents()
       alert('Configuration saved successfully!')
@@ -227,6 +238,7 @@ export default function AIConfigurationPage() {
 
       if (error) throw error
 
+      await invalidateServerCache()
       await fetchAgents()
       alert('Rolled back to previous version!')
     } catch (error) {
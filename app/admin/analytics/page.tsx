@@ -19,7 +19,6 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/com
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select'
 import { toast } from 'sonner'
-import { format, subDays, subMonths, startOfMonth, endOfMonth } from 'date-fns'
 
 interface AnalyticsData {
   properties: {
@@ -65,103 +64,16 @@ export default function AnalyticsPage() {
   const fetchAnalytics = useCallback(async () => {
     try {
       setLoading(true)
-      const supabase = getSupabaseClient()
 
-      const days = parseInt(dateRange)
-      const startDate = subDays(new Date(), days)
-      const prevStartDate = subDays(startDate, days)
+      // All aggregates come from server-side rollups in one request
+      const response = await fetch(`/api/admin/analytics?days=${dateRange}`)
+      const data = await response.json()
 
-      // Fetch all data in parallel
-      const [
-        { count: totalProperties },
-        { count: availableProperties },
-        { count: soldProperties },
-        { count: prevProperties },
-        { count: totalEnquiries },
-        { count: thisMonthEnquiries },
-        { count: prevEnquiries },
-        { count: totalUsers },
-        { count: newUsers },
-        { count: prevUsers },
-        { data: soldProps },
-        { data: prevSoldProps },
-        { data: topProps },
-        { data: monthlyRevenue }
-      ] = await Promise.all([
-        supabase.from('properties').select('*', { count: 'exact', head: true }),
-        supabase.from('properties').select('*', { count: 'exact', head: true }).eq('status', 'available'),
-        supabase.from('properties').select('*', { count: 'exact', head: true }).eq('status', 'sold'),
-        supabase.from('properties').select('*', { count: 'exact', head: true }).lt('created_at', prevStartDate.toISOString()),
-        supabase.from('enquiries').select('*', { count: 'exact', head: true }),
-        supabase.from('enquiries').select('*', { count: 'exact', head: true }).gte('created_at', startOfMonth(new Date()).toISOString()),
-        supabase.from('enquiries').select('*', { count: 'exact', head: true }).lt('created_at', prevStartDate.toISOString()),
-        supabase.from('users').select('*', { count: 'exact', head: true }),
-        supabase.from('users').select('*', { count: 'exact', head: true }).gte('created_at', startOfMonth(new Date()).toISOString()),
-        supabase.from('users').select('*', { count: 'exact', head: true }).lt('created_at', prevStartDate.toISOString()),
-        supabase.from('properties').select('price').eq('status', 'sold'),
-        supabase.from('properties').select('price').eq('status', 'sold').lt('created_at', prevStartDate.toISOString()),
-        supabase.from('properties').select('id, title, views').order('views', { ascending: false }).limit(5),
-        supabase.from('properties').select('price, created_at').eq('status', 'sold').order('created_at', { ascending: true })
-      ])
+      if (!response.ok) {
+        throw new Error(data.error || 'Failed to load analytics')
+      }
 
-      // Calculate growth percentages
-      const propertyGrowth = prevProperties ? ((totalProperties || 0) - (prevProperties || 0)) / (prevProperties || 1) * 100 : 0
-      const enquiryGrowth = prevEnquiries ? ((totalEnquiries || 0) - (prevEnquiries || 0)) / (prevEnquiries || 1) * 100 : 0
-      const userGrowth = prevUsers ? ((totalUsers || 0) - (prevUsers || 0)) / (prevUsers || 1) * 100 : 0
-
-      // @ts-ignore
-      const totalRevenue = soldProps?.reduce((sum, p) => sum + (p.price || 0), 0) || 0
-      // @ts-ignore
-      const prevRevenue = prevSoldProps?.reduce((sum, p) => sum + (p.price || 0), 0) || 0
-      const revenueGrowth = prevRevenue ? ((totalRevenue - prevRevenue) / prevRevenue) * 100 : 0
-
-      // Calculate conversion rate
-      const conversion = totalEnquiries && soldProperties ? (soldProperties / totalEnquiries) * 100 : 0
-
-      // Group revenue by month
-      const revenueByMonth = monthlyRevenue?.reduce((acc: any[], prop: any) => {
-        const month = format(new Date(prop.created_at), 'MMM yyyy')
-        const existing = acc.find(item => item.month === month)
-        if (existing) {
-          existing.revenue += prop.price
-          existing.properties += 1
-        } else {
-          acc.push({ month, revenue: prop.price, properties: 1 })
-        }
-        return acc
-      }, []) || []
-
-      setAnalytics({
-        properties: {
-          total: totalProperties || 0,
-          available: availableProperties || 0,
-          sold: soldProperties || 0,
-          growth: propertyGrowth
-        },
-        enquiries: {
-          total: totalEnquiries || 0,
-          thisMonth: thisMonthEnquiries || 0,
-          conversion,
-          growth: enquiryGrowth
-        },
-        users: {
-          total: totalUsers || 0,
-          newThisMonth: newUsers || 0,
-          growth: userGrowth
-        },
-        revenue: {
-          total: totalRevenue,
-          thisMonth: totalRevenue,
-          growth: revenueGrowth
-        },
-        topProperties: topProps?.map((p: any) => ({
-          id: p.id,
-          title: p.title,
-          views: p.views || 0,
-          enquiries: 0
-        })) || [],
-        revenueByMonth: revenueByMonth.slice(-6)
-      })
+      setAnalytics(data.analytics)
     } catch (error) {
       console.error('Error fetching analytics:', error)
       toast.error('Failed to load analytics')
@@ -3,6 +3,7 @@
 import { useState } from 'react'
 import { useRouter } from 'next/navigation'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { useAuth } from '@/lib/auth/AuthProvider'
 import { Button } from '@/components/ui/Button'
 import { Input } from '@/components/ui/Input'
@@ -168,6 +169,8 @@ export default function NewBlogPostPage() {
 
       if (error) throw error
 
+      // Drafts are not on any public page
+      if (status === 'published') await requestRevalidation('blog')
       toast.success(`Blog post ${status === 'published' ? 'published' : 'saved as draft'}!`)
       router.push('/admin/blog')
     } catch (error) {
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { DataTable } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
@@ -80,6 +81,7 @@ export default function BlogPage() {
 
       if (error) throw error
 
+      requestRevalidation('blog')
       toast.success('Blog post deleted successfully')
       fetchPosts()
     } catch (error) {
@@ -107,6 +109,7 @@ export default function BlogPage() {
 
       if (error) throw error
 
+      requestRevalidation('blog')
       toast.success(`Post ${newStatus === 'published' ? 'published' : 'unpublished'} successfully`)
       fetchPosts()
     } catch (error) {
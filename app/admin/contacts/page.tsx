@@ -6,12 +6,12 @@ import { DataTable } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuLabel, DropdownMenuSeparator, DropdownMenuTrigger } from '@/components/ui/dropdown-menu'
-import { MoreHorizontal, Mail, Phone, Eye, CheckCircle2, Clock, XCircle, Trash2 } from 'lucide-react'
+import { MoreHorizontal, Mail, Phone, Eye, Download, CheckCircle2, Clock, XCircle, Trash2 } from 'lucide-react'
 import { ColumnDef } from '@tanstack/react-table'
 import { toast } from 'sonner'
 import { formatDistanceToNow } from 'date-fns'
 import { DateRangeFilter } from '@/components/ui/DateRangeFilter'
-import { exportToCSV } from '@/lib/utils/export'
+import { downloadServerExport } from '@/lib/utils/export'
 
 interface ContactMessage {
     id: string
@@ -129,18 +129,14 @@ export default function ContactsPage() {
         setDateRange({ start, end })
     }
 
-    function handleExport(data: ContactMessage[]) {
-        const formatted = data.map(m => ({
-            Name: m.full_name,
-            Email: m.email,
-            Phone: m.phone || 'N/A',
-            Subject: m.subject,
-            Message: m.message,
-            Status: m.status,
-            'Received At': new Date(m.created_at).toLocaleString()
-        }))
-        exportToCSV(formatted, 'contact-messages')
-        toast.success('Messages exported successfully')
+    // Every message in the date range, streamed by the server
+    function handleExport() {
+        downloadServerExport('contacts', {
+            from: dateRange.start && dateRange.end ? dateRange.start : null,
+            to: dateRange.start && dateRange.end ? dateRange.end : null,
+            filename: 'contact-messages',
+        })
+        toast.success('Export started')
     }
 
     const columns: ColumnDef<ContactMessage>[] = [
@@ -311,10 +307,16 @@ export default function ContactsPage() {
             </div>
 
             {/* Date Range Filter */}
-            <DateRangeFilter
-                onDateRangeChange={handleDateRangeChange}
-                label="Filter by Date"
-            />
+            <div className="flex items-center justify-between gap-4">
+                <DateRangeFilter
+                    onDateRangeChange={handleDateRangeChange}
+                    label="Filter by Date"
+                />
+                <Button variant="outline" onClick={handleExport}>
+                    <Download className="h-4 w-4 mr-2" />
+                    Export CSV
+                </Button>
+            </div>
 
             {/* Data Table */}
             <div className="rounded-xl border bg-white shadow-sm">
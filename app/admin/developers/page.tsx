@@ -2,6 +2,7 @@
 
 import { useState, useEffect, useCallback } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { DataTable } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
@@ -148,6 +149,7 @@ export default function DevelopersPage() {
                     .eq('id', editingDeveloper.id)
 
                 if (error) throw error
+                await requestRevalidation('developer', editingDeveloper.id)
                 toast.success('Developer updated successfully')
             } else {
                 const { error } = await supabase
@@ -208,6 +210,7 @@ export default function DevelopersPage() {
                 .eq('id', id)
 
             if (error) throw error
+            requestRevalidation('developer', id)
             toast.success(`Developer ${!currentStatus ? 'activated' : 'deactivated'}`)
             fetchDevelopers()
         } catch (error) {
@@ -220,6 +223,8 @@ export default function DevelopersPage() {
         if (!confirm('Are you sure you want to delete this developer?')) return
 
         try {
+            // Before the delete, while its properties still reference it
+            await requestRevalidation('developer', id)
             const supabase = getSupabaseClient()
             const { error } = await supabase
                 .from('developers')
@@ -1,19 +1,19 @@
 "use client"
 
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
-import { DataTable } from '@/components/admin/data-table'
+import { DataTable, DataTableColumnHeader, DataTableQuery } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
-import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
+import { Tabs, TabsList, TabsTrigger } from '@/components/ui/tabs'
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select'
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuLabel, DropdownMenuSeparator, DropdownMenuTrigger } from '@/components/ui/dropdown-menu'
-import { MoreHorizontal, Mail, Phone, UserCheck, Clock, CheckCircle2, XCircle, TrendingUp, Users } from 'lucide-react'
+import { MoreHorizontal, Mail, Phone, Download, UserCheck, Clock, CheckCircle2, XCircle, TrendingUp, Users } from 'lucide-react'
 import { ColumnDef } from '@tanstack/react-table'
 import { toast } from 'sonner'
 import { formatDistanceToNow } from 'date-fns'
 import { DateRangeFilter } from '@/components/ui/DateRangeFilter'
-import { exportToCSV } from '@/lib/utils/export'
+import { downloadServerExport } from '@/lib/utils/export'
 
 interface PropertyLead {
     id: string
@@ -50,121 +50,55 @@ const statusConfig: Record<string, { color: string; icon: any; label: string }>
 
 export default function LeadsPage() {
     const [leads, setLeads] = useState<PropertyLead[]>([])
+    const [rowCount, setRowCount] = useState(0)
     const [loading, setLoading] = useState(true)
     const [stats, setStats] = useState({ total: 0, new: 0, contacted: 0, qualified: 0, converted: 0, lost: 0 })
     const [dateRange, setDateRange] = useState<{ start: string | null; end: string | null }>({ start: null, end: null })
+    const [channel, setChannel] = useState('all')
+    const [query, setQuery] = useState<DataTableQuery | null>(null)
     const [teamMembers, setTeamMembers] = useState<any[]>([])
+    const latestRequest = useRef(0)
 
+    // One page of the merged lead inbox; filtering, sorting and paging
+    // happen in /api/admin/leads
     const fetchLeads = useCallback(async () => {
+        if (!query) return
+        const requestId = ++latestRequest.current
+        setLoading(true)
         try {
-            const supabase = getSupabaseClient()
-
-            // Fetch property leads
-            let leadsQuery = supabase
-                .from('property_leads')
-                .select(`
-          *,
-          properties (title, location),
-          users:assigned_to (full_name)
-        `)
-                .order('created_at', { ascending: false })
-
-            // Fetch enquiries
-            let enquiriesQuery = supabase
-                .from('enquiries')
-                .select(`
-          *,
-          properties (title, location),
-          users:assigned_to (full_name)
-        `)
-                .order('created_at', { ascending: false })
-
-            // Fetch contact messages
-            let contactsQuery = supabase
-                .from('contact_messages')
-                .select(`
-                  *,
-                  users:assigned_to (full_name)
-                `)
-                .order('created_at', { ascending: false })
-
-            // Apply date range filter to both
+            const sort = query.sorting[0]
+            const params = new URLSearchParams({
+                channel,
+                page: String(query.pageIndex + 1),
+                limit: String(query.pageSize),
+                stats: '1',
+            })
+            if (sort) {
+                params.set('sort', sort.id)
+                params.set('order', sort.desc ? 'desc' : 'asc')
+            }
+            if (query.search) params.set('q', query.search)
             if (dateRange.start && dateRange.end) {
-                const startDate = new Date(dateRange.start).toISOString()
-                const endDate = new Date(dateRange.end + 'T23:59:59').toISOString()
-
-                leadsQuery = leadsQuery.gte('created_at', startDate).lte('created_at', endDate)
-                enquiriesQuery = enquiriesQuery.gte('created_at', startDate).lte('created_at', endDate)
-                contactsQuery = contactsQuery.gte('created_at', startDate).lte('created_at', endDate)
+                params.set('from', dateRange.start)
+                params.set('to', dateRange.end)
             }
 
-            const [leadsResult, enquiriesResult, contactsResult] = await Promise.all([
-                leadsQuery,
-                enquiriesQuery,
-                contactsQuery
-            ])
-
-            if (leadsResult.error) throw leadsResult.error
-            if (enquiriesResult.error) throw enquiriesResult.error
-            if (contactsResult.error) throw contactsResult.error
-
-            // Combine and normalize data
-            const combinedLeads = [
-                ...(leadsResult.data as any[] || []).map(lead => ({
-                    ...lead,
-                    source: lead.lead_type === 'join_group' ? 'Group Buying' :
-                        lead.lead_type === 'callback_request' ? 'Callback' :
-                            lead.lead_type === 'live_tour' ? 'Live Tour' :
-                                lead.lead_type === 'book_visit' ? 'Site Visit' : 'Lead',
-                    table: 'property_leads'
-                })),
-                ...(enquiriesResult.data as any[] || []).map(enquiry => ({
-                    id: enquiry.id,
-                    property_id: enquiry.property_id,
-                    properties: enquiry.properties,
-                    full_name: enquiry.full_name,
-                    email: enquiry.email,
-                    phone: enquiry.phone,
-                    source: 'Investment',
-                    status: enquiry.status,
-                    assigned_to: enquiry.assigned_to,
-                    users: enquiry.users,
-                    created_at: enquiry.created_at,
-                    message: enquiry.message,
-                    table: 'enquiries'
-                })),
-                ...(contactsResult.data as any[] || []).map(contact => ({
-                    id: contact.id,
-                    full_name: contact.full_name,
-                    email: contact.email,
-                    phone: contact.phone || '',
-                    source: 'Contact Form',
-                    status: contact.status === 'resolved' ? 'converted' : contact.status,
-                    assigned_to: contact.assigned_to,
-                    users: contact.users,
-                    created_at: contact.created_at,
-                    message: contact.message,
-                    table: 'contact_messages'
-                }))
-            ].sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
-
-            setLeads(combinedLeads as PropertyLead[])
-
-            // Calculate stats
-            const total = combinedLeads.length
-            const newCount = combinedLeads.filter(l => l.status === 'new').length
-            const contacted = combinedLeads.filter(l => l.status === 'contacted' || l.status === 'in_progress').length
-            const qualified = combinedLeads.filter(l => l.status === 'qualified').length
-            const converted = combinedLeads.filter(l => l.status === 'converted' || l.status === 'resolved' || l.status === 'closed').length
-            const lost = combinedLeads.filter(l => l.status === 'lost').length
-            setStats({ total, new: newCount, contacted, qualified, converted, lost })
+            const response = await fetch(`/api/admin/leads?${params}`)
+            const result = await response.json()
+            if (!response.ok) throw new Error(result.error || 'Failed to load leads')
+            // A newer page, tab or search was requested while this one loaded
+            if (requestId !== latestRequest.current) return
+
+            setLeads(result.leads)
+            setRowCount(result.pagination.total)
+            setStats(result.stats)
         } catch (error) {
             console.error('Error fetching leads:', error)
             toast.error('Failed to load leads')
         } finally {
-            setLoading(false)
+            if (requestId === latestRequest.current) setLoading(false)
         }
-    }, [dateRange])
+    }, [query, channel, dateRange])
 
     const fetchTeamMembers = useCallback(async () => {
         try {
@@ -184,24 +118,33 @@ export default function LeadsPage() {
 
     useEffect(() => {
         fetchLeads()
+    }, [fetchLeads])
+
+    useEffect(() => {
         fetchTeamMembers()
+    }, [fetchTeamMembers])
+
+    // The subscription outlives page changes and always reloads the current page
+    const refreshLeads = useRef(fetchLeads)
+    refreshLeads.current = fetchLeads
 
+    useEffect(() => {
         // Real-time subscription for both tables
         const supabase = getSupabaseClient()
-        const channel = supabase
+        const subscription = supabase
             .channel('leads_and_enquiries_changes')
             .on('postgres_changes', { event: '*', schema: 'public', table: 'property_leads' }, () => {
-                fetchLeads()
+                refreshLeads.current()
             })
             .on('postgres_changes', { event: '*', schema: 'public', table: 'enquiries' }, () => {
-                fetchLeads()
+                refreshLeads.current()
             })
             .subscribe()
 
         return () => {
-            supabase.removeChannel(channel)
+            supabase.removeChannel(subscription)
         }
-    }, [fetchLeads, fetchTeamMembers])
+    }, [])
 
     async function updateStatus(id: string, status: string) {
         const lead = leads.find(l => l.id === id)
@@ -326,26 +269,23 @@ export default function LeadsPage() {
         setDateRange({ start, end })
     }
 
-    function handleExport(data: PropertyLead[]) {
-        const formatted = data.map(l => ({
-            Property: l.properties?.title || 'N/A',
-            Location: l.properties?.location || 'N/A',
-            Name: l.full_name,
-            Email: l.email,
-            Phone: l.phone,
-            Source: l.source,
-            Status: l.status,
-            'Assigned To': l.users?.full_name || 'Unassigned',
-            'Created At': new Date(l.created_at).toLocaleString()
-        }))
-        exportToCSV(formatted, 'property-leads')
-        toast.success('Leads exported successfully')
+    // Every lead matching the current tab, search and date range, streamed by the server
+    function handleExport() {
+        downloadServerExport('leads', {
+            channel: channel === 'all' ? null : channel,
+            q: query?.search,
+            from: dateRange.start && dateRange.end ? dateRange.start : null,
+            to: dateRange.start && dateRange.end ? dateRange.end : null,
+            filename: 'property-leads',
+        })
+        toast.success('Export started')
     }
 
     const columns: ColumnDef<PropertyLead>[] = [
         {
             accessorKey: 'property',
             header: 'Property',
+            enableSorting: false,
             cell: ({ row }) => (
                 <div className="space-y-1">
                     <p className="font-medium text-gray-900">{row.original.properties?.title}</p>
@@ -354,8 +294,9 @@ export default function LeadsPage() {
             ),
         },
         {
-            accessorKey: 'contact',
-            header: 'Contact',
+            id: 'full_name',
+            accessorKey: 'full_name',
+            header: ({ column }) => <DataTableColumnHeader column={column} title="Contact" />,
             cell: ({ row }) => (
                 <div className="space-y-1">
                     <p className="font-medium text-gray-900">{row.original.full_name}</p>
@@ -374,7 +315,7 @@ export default function LeadsPage() {
         },
         {
             accessorKey: 'source',
-            header: 'Source',
+            header: ({ column }) => <DataTableColumnHeader column={column} title="Source" />,
             cell: ({ row }) => (
                 <Badge variant="outline" className="bg-gray-100">
                     {row.original.source}
@@ -383,7 +324,7 @@ export default function LeadsPage() {
         },
         {
             accessorKey: 'status',
-            header: 'Status',
+            header: ({ column }) => <DataTableColumnHeader column={column} title="Status" />,
             cell: ({ row }) => {
                 const status = row.original.status || 'new'
                 const config = statusConfig[status] || statusConfig['new']
@@ -399,6 +340,7 @@ export default function LeadsPage() {
         {
             accessorKey: 'assigned_to',
             header: 'Assigned To',
+            enableSorting: false,
             cell: ({ row }) => (
                 <div className="min-w-[150px]">
                     <Select
@@ -422,7 +364,7 @@ export default function LeadsPage() {
         },
         {
             accessorKey: 'created_at',
-            header: 'Created',
+            header: ({ column }) => <DataTableColumnHeader column={column} title="Created" />,
             cell: ({ row }) => (
                 <p className="text-sm text-gray-600">
                     {formatDistanceToNow(new Date(row.original.created_at), { addSuffix: true })}
@@ -488,17 +430,6 @@ export default function LeadsPage() {
         },
     ]
 
-    if (loading) {
-        return (
-            <div className="space-y-6">
-                <h1 className="text-3xl font-bold text-gray-900">Leads</h1>
-                <div className="flex items-center justify-center h-64">
-                    <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-coral-600"></div>
-                </div>
-            </div>
-        )
-    }
-
     const conversionRate = stats.total > 0 ? ((stats.converted / stats.total) * 100).toFixed(1) : '0.0'
 
     return (
@@ -587,10 +518,14 @@ export default function LeadsPage() {
                     onDateRangeChange={handleDateRangeChange}
                     label="Filter by Date"
                 />
+                <Button variant="outline" onClick={handleExport}>
+                    <Download className="h-4 w-4 mr-2" />
+                    Export CSV
+                </Button>
             </div>
 
             {/* Tabs & Data Table */}
-            <Tabs defaultValue="all" className="w-full">
+            <Tabs value={channel} onValueChange={setChannel} className="w-full">
                 <TabsList className="grid w-full grid-cols-5 mb-8">
                     <TabsTrigger value="all">All Enquiries</TabsTrigger>
                     <TabsTrigger value="investment">Investments</TabsTrigger>
@@ -598,62 +533,21 @@ export default function LeadsPage() {
                     <TabsTrigger value="contact">Contact Forms</TabsTrigger>
                     <TabsTrigger value="other">Visits & Calls</TabsTrigger>
                 </TabsList>
-
-                <TabsContent value="all">
-                    <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
-                        <DataTable
-                            columns={columns}
-                            data={leads}
-                            searchKey="full_name"
-                            searchPlaceholder="Search by name..."
-                        />
-                    </div>
-                </TabsContent>
-
-                <TabsContent value="investment">
-                    <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
-                        <DataTable
-                            columns={columns}
-                            data={leads.filter(l => l.source === 'Investment')}
-                            searchKey="full_name"
-                            searchPlaceholder="Search investments..."
-                        />
-                    </div>
-                </TabsContent>
-
-                <TabsContent value="group">
-                    <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
-                        <DataTable
-                            columns={columns}
-                            data={leads.filter(l => l.source === 'Group Buying')}
-                            searchKey="full_name"
-                            searchPlaceholder="Search group buying..."
-                        />
-                    </div>
-                </TabsContent>
-
-                <TabsContent value="contact">
-                    <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
-                        <DataTable
-                            columns={columns}
-                            data={leads.filter(l => l.source === 'Contact Form')}
-                            searchKey="full_name"
-                            searchPlaceholder="Search contacts..."
-                        />
-                    </div>
-                </TabsContent>
-
-                <TabsContent value="other">
-                    <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
-                        <DataTable
-                            columns={columns}
-                            data={leads.filter(l => ['Callback', 'Live Tour', 'Site Visit', 'Lead'].includes(l.source))}
-                            searchKey="full_name"
-                            searchPlaceholder="Search other leads..."
-                        />
-                    </div>
-                </TabsContent>
             </Tabs>
+
+            <div className="rounded-xl border bg-white shadow-sm overflow-hidden">
+                {/* Remounted per tab and date range, so paging starts from the first page */}
+                <DataTable
+                    key={`${channel}:${dateRange.start}:${dateRange.end}`}
+                    columns={columns}
+                    data={leads}
+                    searchPlaceholder="Search by name or email..."
+                    onQueryChange={setQuery}
+                    rowCount={rowCount}
+                    loading={loading}
+                    estimatedRowHeight={88}
+                />
+            </div>
         </div>
     )
 }
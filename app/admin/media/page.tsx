@@ -1,7 +1,10 @@
 "use client"
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { useDebounce } from '@/lib/hooks/useDebounce'
+import { useAuth } from '@/lib/auth/AuthProvider'
+import { downscaleImage, storagePathFromUrl, uploadFiles } from '@/lib/utils/upload'
 import { Button } from '@/components/ui/Button'
 import { Input } from '@/components/ui/Input'
 import { Badge } from '@/components/ui/Badge'
@@ -21,45 +24,122 @@ interface MediaFile {
   created_at: string
 }
 
+// Filter buttons to the media_kind values of /api/admin/media
+const FILTER_KINDS: Record<string, string | null> = {
+  all: null,
+  images: 'image',
+  documents: 'document',
+  videos: 'video',
+}
+
 export default function MediaPage() {
+  const { user } = useAuth()
   const [files, setFiles] = useState<MediaFile[]>([])
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [searchQuery, setSearchQuery] = useState('')
   const [filterType, setFilterType] = useState<string>('all')
   const [stats, setStats] = useState({ total: 0, images: 0, documents: 0, totalSize: 0 })
+  const debouncedSearch = useDebounce(searchQuery, 300)
+  const latestRequest = useRef(0)
+  const fileInput = useRef<HTMLInputElement>(null)
+  const [uploadProgress, setUploadProgress] = useState<number | null>(null)
 
-  useEffect(() => {
-    fetchFiles()
+  // Totals are computed in the database, not from the loaded files
+  const fetchStats = useCallback(async () => {
+    try {
+      const response = await fetch('/api/admin/media/stats')
+      const result = await response.json()
+      if (!response.ok) throw new Error(result.error || 'Failed to load media stats')
+      setStats(result.stats)
+    } catch (error) {
+      console.error('Error fetching media stats:', error)
+    }
   }, [])
 
-  async function fetchFiles() {
+  // One page of files; search and type filtering happen in /api/admin/media
+  const fetchFiles = useCallback(async (cursor: string | null = null) => {
+    const requestId = ++latestRequest.current
+    if (cursor) setLoadingMore(true)
     try {
-      const supabase = getSupabaseClient()
-      const { data, error } = await supabase
-        .from('media_files')
-        .select(`
-          *,
-          users (full_name)
-        `)
-        .order('created_at', { ascending: false })
+      const params = new URLSearchParams({ limit: '48' })
+      const kind = FILTER_KINDS[filterType]
+      if (kind) params.set('kind', kind)
+      if (debouncedSearch) params.set('q', debouncedSearch)
+      if (cursor) params.set('cursor', cursor)
 
-      if (error) throw error
+      const response = await fetch(`/api/admin/media?${params}`)
+      const result = await response.json()
+      if (!response.ok) throw new Error(result.error || 'Failed to load media files')
+      // The filters changed while this page loaded
+      if (requestId !== latestRequest.current) return
 
-      setFiles(data || [])
-      
-      const total = data?.length || 0
-      // @ts-ignore
-      const images = data?.filter(f => f.file_type.startsWith('image')).length || 0
-      // @ts-ignore
-      const documents = data?.filter(f => f.file_type.includes('pdf') || f.file_type.includes('document')).length || 0
-      // @ts-ignore
-      const totalSize = data?.reduce((sum, f) => sum + f.file_size, 0) || 0
-      setStats({ total, images, documents, totalSize })
+      setFiles(prev => cursor ? [...prev, ...result.files] : result.files)
+      setNextCursor(result.pagination.nextCursor)
     } catch (error) {
       console.error('Error fetching files:', error)
       toast.error('Failed to load media files')
     } finally {
-      setLoading(false)
+      if (requestId === latestRequest.current) {
+        setLoading(false)
+        setLoadingMore(false)
+      }
+    }
+  }, [filterType, debouncedSearch])
+
+  useEffect(() => {
+    fetchFiles()
+  }, [fetchFiles])
+
+  useEffect(() => {
+    fetchStats()
+  }, [fetchStats])
+
+  async function handleUpload(e: React.ChangeEvent<HTMLInputElement>) {
+    const selected = Array.from(e.target.files || [])
+    e.target.value = ''
+    if (selected.length === 0) return
+
+    setUploadProgress(0)
+    try {
+      const supabase = getSupabaseClient()
+      const files = await Promise.all(selected.map((file) => downscaleImage(file)))
+
+      const results = await uploadFiles(
+        files,
+        (file, i) => ({ path: `media/${Date.now()}-${i}-${file.name.replace(/[^\w.-]/g, '_')}` }),
+        ({ loaded, total }) => setUploadProgress(Math.round((loaded / total) * 100))
+      )
+
+      const rows = results.flatMap((result, i) => result.status === 'fulfilled'
+        ? [{
+            name: files[i].name,
+            url: result.value.publicUrl,
+            file_size: files[i].size,
+            mime_type: files[i].type || 'application/octet-stream',
+            uploaded_by: user?.id,
+            folder: 'media',
+          }]
+        : [])
+
+      if (rows.length > 0) {
+        // @ts-ignore
+        const { error } = await supabase.from('media_files').insert(rows)
+        if (error) throw error
+      }
+
+      const failed = results.length - rows.length
+      if (failed > 0) toast.error(`${failed} of ${results.length} files failed to upload`)
+      else toast.success(`${rows.length} ${rows.length === 1 ? 'file' : 'files'} uploaded`)
+
+      fetchFiles()
+      fetchStats()
+    } catch (error) {
+      console.error('Error uploading files:', error)
+      toast.error('Failed to upload files')
+    } finally {
+      setUploadProgress(null)
     }
   }
 
@@ -70,9 +150,9 @@ export default function MediaPage() {
       const supabase = getSupabaseClient()
       
       // Delete from storage
-      const filePath = fileUrl.split('/').pop()
+      const filePath = storagePathFromUrl(fileUrl)
       if (filePath) {
-        await supabase.storage.from('media').remove([filePath])
+        await supabase.storage.from('coventures').remove([filePath])
       }
 
       // Delete from database
@@ -81,7 +161,8 @@ export default function MediaPage() {
       if (error) throw error
 
       toast.success('File deleted successfully')
-      fetchFiles()
+      setFiles(prev => prev.filter(file => file.id !== id))
+      fetchStats()
     } catch (error) {
       console.error('Error deleting file:', error)
       toast.error('Failed to delete file')
@@ -102,19 +183,6 @@ export default function MediaPage() {
     return (bytes / (1024 * 1024)).toFixed(1) + ' MB'
   }
 
-  const filteredFiles = files
-    .filter(file => {
-      if (searchQuery && !file.file_name.toLowerCase().includes(searchQuery.toLowerCase())) {
-        return false
-      }
-      if (filterType !== 'all') {
-        if (filterType === 'images' && !file.file_type.startsWith('image')) return false
-        if (filterType === 'documents' && !file.file_type.includes('pdf') && !file.file_type.includes('document')) return false
-        if (filterType === 'videos' && !file.file_type.startsWith('video')) return false
-      }
-      return true
-    })
-
   if (loading) {
     return (
       <div className="space-y-6">
@@ -134,9 +202,10 @@ export default function MediaPage() {
           <h1 className="text-3xl font-bold text-gray-900">Media Library</h1>
           <p className="mt-1 text-sm text-gray-500">Upload and manage media files</p>
         </div>
-        <Button className="gap-2">
+        <input ref={fileInput} type="file" multiple className="hidden" onChange={handleUpload} />
+        <Button className="gap-2" onClick={() => fileInput.current?.click()} disabled={uploadProgress !== null}>
           <Upload className="h-4 w-4" />
-          Upload Files
+          {uploadProgress !== null ? `Uploading... ${uploadProgress}%` : 'Upload Files'}
         </Button>
       </div>
 
@@ -233,7 +302,7 @@ export default function MediaPage() {
 
       {/* Files Grid */}
       <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 xl:grid-cols-5 gap-4">
-        {filteredFiles.map((file) => {
+        {files.map((file) => {
           const Icon = getFileIcon(file.file_type)
           const isImage = file.file_type.startsWith('image')
 
@@ -298,7 +367,15 @@ export default function MediaPage() {
         })}
       </div>
 
-      {filteredFiles.length === 0 && (
+      {nextCursor && (
+        <div className="flex justify-center">
+          <Button variant="outline" onClick={() => fetchFiles(nextCursor)} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </Button>
+        </div>
+      )}
+
+      {files.length === 0 && (
         <div className="flex flex-col items-center justify-center h-64 text-center">
           <ImageIcon className="h-12 w-12 text-gray-400 mb-4" />
           <h3 className="text-lg font-medium text-gray-900 mb-2">No files found</h3>
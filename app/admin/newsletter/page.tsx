@@ -9,7 +9,7 @@ import { Mail, Download, Trash2, TrendingUp, Users } from 'lucide-react'
 import { ColumnDef } from '@tanstack/react-table'
 import { toast } from 'sonner'
 import { formatDistanceToNow } from 'date-fns'
-import { exportToCSV } from '@/lib/utils/export'
+import { downloadServerExport } from '@/lib/utils/export'
 
 interface NewsletterSubscriber {
     id: string
@@ -114,22 +114,15 @@ export default function NewsletterPage() {
         }
     }
 
+    // Both exports are streamed by the server, so they cover every subscriber
     function handleExportAll() {
-        const formatted = subscribers.map(s => ({
-            Email: s.email,
-            Status: s.is_active ? 'Active' : 'Inactive',
-            'Subscribed At': new Date(s.subscribed_at).toLocaleString()
-        }))
-        exportToCSV(formatted, 'newsletter-subscribers')
-        toast.success('Subscribers exported successfully')
+        downloadServerExport('newsletter', { filename: 'newsletter-subscribers' })
+        toast.success('Export started')
     }
 
     function handleExportEmails() {
-        const activeEmails = subscribers
-            .filter(s => s.is_active)
-            .map(s => ({ Email: s.email }))
-        exportToCSV(activeEmails, 'active-emails')
-        toast.success('Email list exported successfully')
+        downloadServerExport('newsletter', { active: '1', columns: 'Email', filename: 'active-emails' })
+        toast.success('Export started')
     }
 
     const columns: ColumnDef<NewsletterSubscriber>[] = [
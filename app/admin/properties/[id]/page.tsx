@@ -4,6 +4,8 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useRouter } from 'next/navigation'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { downscaleImage, uploadFile, uploadFiles } from '@/lib/utils/upload'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { useAuth } from '@/lib/auth/AuthProvider'
 import { Button } from '@/components/ui/Button'
 import { Input } from '@/components/ui/Input'
@@ -29,7 +31,10 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
     const [developers, setDevelopers] = useState<any[]>([])
     const [loading, setLoading] = useState(true)
     const [submitting, setSubmitting] = useState(false)
+    // Slug as loaded, so its cached public page is revalidated if it changes
+    const [originalSlug, setOriginalSlug] = useState<string | null>(null)
     const [uploadingImages, setUploadingImages] = useState(false)
+    const [imageProgress, setImageProgress] = useState(0)
 
     // Image handling
     const [images, setImages] = useState<File[]>([])
@@ -213,6 +218,8 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
             if (error) throw error
             if (!property) throw new Error('Property not found')
 
+            setOriginalSlug(property.slug || null)
+
             // Populate form data
             setFormData({
                 title: property.title || '',
@@ -372,6 +379,7 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
             if (error) throw error
 
             setExistingImages(prev => prev.filter(img => img.id !== imageId))
+            requestRevalidation('property', params.id)
             toast.success('Image removed')
         } catch (error) {
             console.error('Error deleting image:', error)
@@ -382,21 +390,13 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
     async function uploadDocument(file: File, type: 'brochure' | 'floorPlan' | 'layoutPlan' | 'developerLogo') {
         try {
             setUploadingDocs(prev => ({ ...prev, [type]: true }))
-            const supabase = getSupabaseClient()
 
+            if (type === 'developerLogo') file = await downscaleImage(file, 512)
             const fileExt = file.name.split('.').pop()
             const fileName = `${type}-${Date.now()}.${fileExt}`
             const filePath = `documents/${fileName}`
 
-            const { error: uploadError } = await supabase.storage
-                .from('coventures')
-                .upload(filePath, file)
-
-            if (uploadError) throw uploadError
-
-            const { data: { publicUrl } } = supabase.storage
-                .from('coventures')
-                .getPublicUrl(filePath)
+            const { publicUrl } = await uploadFile(file, { path: filePath })
 
             // Update form data based on type
             if (type === 'brochure') {
@@ -432,9 +432,9 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
             return
         }
 
-        // Validate file size (10MB max)
-        if (file.size > 10 * 1024 * 1024) {
-            toast.error('File size must be less than 10MB')
+        // Validate file size (50MB max, the coventures bucket's file_size_limit, migration 032)
+        if (file.size > 50 * 1024 * 1024) {
+            toast.error('File size must be less than 50MB')
             return
         }
 
@@ -445,43 +445,35 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
         if (images.length === 0) return
 
         setUploadingImages(true)
+        setImageProgress(0)
         try {
             const supabase = getSupabaseClient()
-
-            for (let i = 0; i < images.length; i++) {
-                const file = images[i]
-                const fileExt = file.name.split('.').pop()
-                const fileName = `${propertyId}-${Date.now()}-${i}.${fileExt}`
-                const filePath = `properties/${fileName}`
-
-                // Upload to storage
-                const { error: uploadError } = await supabase.storage
-                    .from('coventures')
-                    .upload(filePath, file)
-
-                if (uploadError) {
-                    console.error('Upload error:', uploadError)
-                    throw uploadError
-                }
-
-                // Get public URL
-                const { data: { publicUrl } } = supabase.storage
-                    .from('coventures')
-                    .getPublicUrl(filePath)
-
-                // Insert into property_images table
-                const { error: insertError } = await supabase
-                    .from('property_images')
-                    // @ts-ignore
-                    .insert({
-                        property_id: propertyId,
-                        image_url: publicUrl,
-                        display_order: existingImages.length + i,
-                        is_primary: existingImages.length === 0 && i === 0 && !formData.featured_image
-                    })
-
-                if (insertError) throw insertError
+            const files = await Promise.all(images.map((file) => downscaleImage(file)))
+
+            const results = await uploadFiles(
+                files,
+                (file, i) => ({ path: `properties/${propertyId}-${Date.now()}-${i}.${file.name.split('.').pop()}` }),
+                ({ loaded, total }) => setImageProgress(Math.round((loaded / total) * 100))
+            )
+
+            const failed = results.find((result) => result.status === 'rejected')
+            if (failed) {
+                console.error('Upload error:', failed.reason)
+                throw failed.reason
             }
+
+            // Insert into property_images table, after the existing images
+            const { error: insertError } = await supabase
+                .from('property_images')
+                // @ts-ignore
+                .insert(results.map((result, i) => ({
+                    property_id: propertyId,
+                    image_url: result.status === 'fulfilled' ? result.value.publicUrl : null,
+                    display_order: existingImages.length + i,
+                    is_primary: existingImages.length === 0 && i === 0 && !formData.featured_image
+                })))
+
+            if (insertError) throw insertError
         } catch (error) {
             console.error('Error uploading images:', error)
             throw error
@@ -577,19 +569,18 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
             let uploadedFeaturedImageUrl = null
             if (featuredImageFile) {
                 setUploadingImages(true)
-                const fileExt = featuredImageFile.name.split('.').pop()
+                const featured = await downscaleImage(featuredImageFile)
+                const fileExt = featured.name.split('.').pop()
                 const fileName = `featured-${params.id}-${Date.now()}.${fileExt}`
                 const filePath = `properties/${fileName}`
 
-                const { error: uploadError } = await supabase.storage
-                    .from('coventures')
-                    .upload(filePath, featuredImageFile)
+                const uploaded = await uploadFile(featured, { path: filePath }).catch((uploadError) => {
+                    console.error('Featured image upload error:', uploadError)
+                    return null
+                })
 
-                if (!uploadError) {
-                    const { data: { publicUrl } } = supabase.storage
-                        .from('coventures')
-                        .getPublicUrl(filePath)
-                    uploadedFeaturedImageUrl = publicUrl
+                if (uploaded) {
+                    uploadedFeaturedImageUrl = uploaded.publicUrl
 
                     // Update property with featured image
                     await supabase
@@ -605,6 +596,7 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
                 await uploadImages(params.id)
             }
 
+            await requestRevalidation('property', params.id, originalSlug)
             toast.success('Property updated successfully')
             router.push('/admin/properties')
         } catch (error: any) {
@@ -1189,7 +1181,7 @@ export default function EditPropertyPage({ params }: { params: { id: string } })
                         {activeTab === 'images' ? (
                             <Button type="submit" disabled={submitting || uploadingImages} className="gap-2 bg-coral hover:bg-coral-dark">
                                 <Save className="h-4 w-4" />
-                                {submitting ? 'Updating...' : 'Update Property'}
+                                {submitting ? (uploadingImages ? `Uploading Images... ${imageProgress}%` : 'Updating...') : 'Update Property'}
                             </Button>
                         ) : (
                             <Button type="button" onClick={handleNext}>
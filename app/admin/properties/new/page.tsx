@@ -4,6 +4,8 @@
 import { useState, useEffect } from 'react'
 import { useRouter } from 'next/navigation'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { downscaleImage, uploadFile, uploadFiles } from '@/lib/utils/upload'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { useAuth } from '@/lib/auth/AuthProvider'
 import { Button } from '@/components/ui/Button'
 import { Input } from '@/components/ui/Input'
@@ -28,6 +30,7 @@ export default function NewPropertyPage() {
   const [developers, setDevelopers] = useState<any[]>([])
   const [loading, setLoading] = useState(false)
   const [uploadingImages, setUploadingImages] = useState(false)
+  const [imageProgress, setImageProgress] = useState(0)
   const [images, setImages] = useState<File[]>([])
   const [imagePreviews, setImagePreviews] = useState<string[]>([])
   const [featuredImageFile, setFeaturedImageFile] = useState<File | null>(null)
@@ -275,21 +278,13 @@ export default function NewPropertyPage() {
   async function uploadDocument(file: File, type: 'brochure' | 'floorPlan' | 'layoutPlan' | 'developerLogo') {
     try {
       setUploadingDocs(prev => ({ ...prev, [type]: true }))
-      const supabase = getSupabaseClient()
 
+      if (type === 'developerLogo') file = await downscaleImage(file, 512)
       const fileExt = file.name.split('.').pop()
       const fileName = `${type}-${Date.now()}.${fileExt}`
       const filePath = `documents/${fileName}`
 
-      const { error: uploadError } = await supabase.storage
-        .from('coventures')
-        .upload(filePath, file)
-
-      if (uploadError) throw uploadError
-
-      const { data: { publicUrl } } = supabase.storage
-        .from('coventures')
-        .getPublicUrl(filePath)
+      const { publicUrl } = await uploadFile(file, { path: filePath })
 
       // Update form data based on type
       if (type === 'brochure') {
@@ -325,9 +320,9 @@ export default function NewPropertyPage() {
       return
     }
 
-    // Validate file size (10MB max)
-    if (file.size > 10 * 1024 * 1024) {
-      toast.error('File size must be less than 10MB')
+    // Validate file size (50MB max, the coventures bucket's file_size_limit, migration 032)
+    if (file.size > 50 * 1024 * 1024) {
+      toast.error('File size must be less than 50MB')
       return
     }
 
@@ -338,43 +333,35 @@ export default function NewPropertyPage() {
     if (images.length === 0) return
 
     setUploadingImages(true)
+    setImageProgress(0)
     try {
       const supabase = getSupabaseClient()
-
-      for (let i = 0; i < images.length; i++) {
-        const file = images[i]
-        const fileExt = file.name.split('.').pop()
-        const fileName = `${propertyId}-${Date.now()}-${i}.${fileExt}`
-        const filePath = `properties/${fileName}`
-
-        // Upload to storage
-        const { error: uploadError } = await supabase.storage
-          .from('coventures')
-          .upload(filePath, file)
-
-        if (uploadError) {
-          console.error('Upload error:', uploadError)
-          throw uploadError
-        }
-
-        // Get public URL
-        const { data: { publicUrl } } = supabase.storage
-          .from('coventures')
-          .getPublicUrl(filePath)
-
-        // Insert into property_images table
-        const { error: insertError } = await supabase
-          .from('property_images')
-          // @ts-ignore
-          .insert({
-            property_id: propertyId,
-            image_url: publicUrl,
-            display_order: i,
-            is_primary: i === 0
-          })
-
-        if (insertError) throw insertError
+      const files = await Promise.all(images.map((file) => downscaleImage(file)))
+
+      const results = await uploadFiles(
+        files,
+        (file, i) => ({ path: `properties/${propertyId}-${Date.now()}-${i}.${file.name.split('.').pop()}` }),
+        ({ loaded, total }) => setImageProgress(Math.round((loaded / total) * 100))
+      )
+
+      const failed = results.find((result) => result.status === 'rejected')
+      if (failed) {
+        console.error('Upload error:', failed.reason)
+        throw failed.reason
       }
+
+      // Insert into property_images table, keeping the selected order
+      const { error: insertError } = await supabase
+        .from('property_images')
+        // @ts-ignore
+        .insert(results.map((result, i) => ({
+          property_id: propertyId,
+          image_url: result.status === 'fulfilled' ? result.value.publicUrl : null,
+          display_order: i,
+          is_primary: i === 0
+        })))
+
+      if (insertError) throw insertError
     } catch (error) {
       console.error('Error uploading images:', error)
       throw error
@@ -497,19 +484,16 @@ export default function NewPropertyPage() {
       // Upload featured image FIRST
       let uploadedFeaturedImageUrl = null
       if (featuredImageFile) {
-        const fileExt = featuredImageFile.name.split('.').pop()
+        const featured = await downscaleImage(featuredImageFile)
+        const fileExt = featured.name.split('.').pop()
         const fileName = `featured-${property.id}-${Date.now()}.${fileExt}`
         const filePath = `properties/${fileName}`
 
-        const { error: uploadError } = await supabase.storage
-          .from('coventures')
-          .upload(filePath, featuredImageFile)
-
-        if (!uploadError) {
-          const { data: { publicUrl } } = supabase.storage
-            .from('coventures')
-            .getPublicUrl(filePath)
+        try {
+          const { publicUrl } = await uploadFile(featured, { path: filePath })
           uploadedFeaturedImageUrl = publicUrl
+        } catch (uploadError) {
+          console.error('Featured image upload error:', uploadError)
         }
       }
 
@@ -564,6 +548,8 @@ export default function NewPropertyPage() {
           .eq('id', property.id)
       }
 
+      // Drops any cached "not found" page for its URLs
+      await requestRevalidation('property', property.id)
       toast.success('Property created successfully')
       router.push('/admin/properties')
     } catch (error: any) {
@@ -1514,7 +1500,7 @@ export default function NewPropertyPage() {
                       <div className="text-center">
                         <Upload className="mx-auto h-8 w-8 text-gray-400" />
                         <p className="mt-2 text-sm text-gray-600">Click to upload images</p>
-                        <p className="text-xs text-gray-500">PNG, JPG up to 5MB each</p>
+                        <p className="text-xs text-gray-500">PNG, JPG or WebP up to 50MB each; large photos are resized</p>
                       </div>
                     </div>
                     <Input
@@ -1583,7 +1569,7 @@ export default function NewPropertyPage() {
             {activeTab === 'images' ? (
               <Button type="submit" disabled={loading || uploadingImages} className="gap-2 bg-coral hover:bg-coral-dark">
                 <Save className="h-4 w-4" />
-                {loading ? 'Creating...' : uploadingImages ? 'Uploading Images...' : 'Create Property'}
+                {loading ? 'Creating...' : uploadingImages ? `Uploading Images... ${imageProgress}%` : 'Create Property'}
               </Button>
             ) : (
               <Button type="button" onClick={handleNext}>
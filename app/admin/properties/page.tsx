@@ -7,13 +7,14 @@ import { DataTable } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
 import { DropdownMenu, DropdownMenuContent, DropdownMenuItem, DropdownMenuLabel, DropdownMenuSeparator, DropdownMenuTrigger } from '@/components/ui/dropdown-menu'
-import { Plus, MoreHorizontal, Pencil, Trash2, Eye, Star, Image as ImageIcon, CheckSquare } from 'lucide-react'
+import { Plus, MoreHorizontal, Pencil, Trash2, Eye, Star, Image as ImageIcon, CheckSquare, Download } from 'lucide-react'
 import { ColumnDef } from '@tanstack/react-table'
 import { toast } from 'sonner'
 import Link from 'next/link'
 import Image from 'next/image'
 import { Checkbox } from '@/components/ui/checkbox'
-import { exportToCSV, formatPropertiesForExport } from '@/lib/utils/export'
+import { downloadServerExport } from '@/lib/utils/export'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 
 interface Property {
   id: string
@@ -110,6 +111,7 @@ export default function PropertiesPage() {
 
       if (error) throw error
 
+      requestRevalidation('property', id, properties.find(p => p.id === id)?.slug)
       toast.success('Property deleted successfully')
       fetchProperties()
     } catch (error) {
@@ -129,6 +131,7 @@ export default function PropertiesPage() {
 
       if (error) throw error
 
+      requestRevalidation('property', id)
       toast.success(currentValue ? 'Removed from featured' : 'Added to featured')
       fetchProperties()
     } catch (error) {
@@ -149,6 +152,7 @@ export default function PropertiesPage() {
 
       if (error) throw error
 
+      selectedProperties.forEach(p => requestRevalidation('property', p.id, p.slug))
       toast.success(`${selectedProperties.length} properties deleted successfully`)
       fetchProperties()
     } catch (error) {
@@ -172,6 +176,7 @@ export default function PropertiesPage() {
 
       if (error) throw error
 
+      selectedProperties.forEach(p => requestRevalidation('property', p.id))
       toast.success(`${selectedProperties.length} properties ${isFeatured ? 'featured' : 'unfeatured'}`)
       fetchProperties()
     } catch (error) {
@@ -180,10 +185,10 @@ export default function PropertiesPage() {
     }
   }
 
-  function handleExport(data: Property[]) {
-    const formatted = formatPropertiesForExport(data)
-    exportToCSV(formatted, 'properties')
-    toast.success('Properties exported successfully')
+  // Every property, streamed by the server
+  function handleExport() {
+    downloadServerExport('properties')
+    toast.success('Export started')
   }
 
   const columns: ColumnDef<Property>[] = [
@@ -362,12 +367,18 @@ export default function PropertiesPage() {
             Manage all property listings
           </p>
         </div>
-        <Link href="/admin/properties/new">
-          <Button className="gap-2">
-            <Plus className="h-4 w-4" />
-            Add Property
+        <div className="flex gap-2">
+          <Button variant="outline" className="gap-2" onClick={handleExport}>
+            <Download className="h-4 w-4" />
+            Export CSV
           </Button>
-        </Link>
+          <Link href="/admin/properties/new">
+            <Button className="gap-2">
+              <Plus className="h-4 w-4" />
+              Add Property
+            </Button>
+          </Link>
+        </div>
       </div>
 
       {/* Stats */}
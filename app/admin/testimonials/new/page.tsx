@@ -3,6 +3,7 @@
 import { useState } from 'react'
 import { useRouter } from 'next/navigation'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { Button } from '@/components/ui/Button'
 import { Input } from '@/components/ui/Input'
 import { Label } from '@/components/ui/label'
@@ -125,6 +126,7 @@ export default function NewTestimonialPage() {
 
       if (error) throw error
 
+      if (formData.is_approved) await requestRevalidation('testimonial')
       toast.success('Testimonial created successfully!')
       router.push('/admin/testimonials')
     } catch (error) {
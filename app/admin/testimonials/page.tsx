@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
+import { requestRevalidation } from '@/lib/utils/revalidate'
 import { DataTable } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
@@ -78,6 +79,7 @@ export default function TestimonialsPage() {
 
       if (error) throw error
 
+      requestRevalidation('testimonial')
       toast.success(currentValue ? 'Testimonial disapproved' : 'Testimonial approved')
       fetchTestimonials()
     } catch (error) {
@@ -97,6 +99,7 @@ export default function TestimonialsPage() {
 
       if (error) throw error
 
+      requestRevalidation('testimonial')
       toast.success(currentValue ? 'Removed from featured' : 'Added to featured')
       fetchTestimonials()
     } catch (error) {
@@ -114,6 +117,7 @@ export default function TestimonialsPage() {
 
       if (error) throw error
 
+      requestRevalidation('testimonial')
       toast.success('Testimonial deleted successfully')
       fetchTestimonials()
     } catch (error) {
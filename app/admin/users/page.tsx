@@ -1,8 +1,8 @@
 "use client"
 
-import { useState, useEffect } from 'react'
+import { useState, useCallback, useRef } from 'react'
 import { getSupabaseClient } from '@/lib/supabase/client'
-import { DataTable } from '@/components/admin/data-table'
+import { DataTable, DataTableColumnHeader, DataTableQuery } from '@/components/admin/data-table'
 import { Button } from '@/components/ui/Button'
 import { Badge } from '@/components/ui/Badge'
 import { Dialog, DialogContent, DialogDescription, DialogFooter, DialogHeader, DialogTitle, DialogTrigger } from '@/components/ui/dialog'
@@ -34,39 +34,52 @@ const roleConfig = {
 
 export default function UsersPage() {
   const [users, setUsers] = useState<User[]>([])
+  const [rowCount, setRowCount] = useState(0)
   const [loading, setLoading] = useState(true)
   const [stats, setStats] = useState({ total: 0, admins: 0, users: 0 })
+  const [query, setQuery] = useState<DataTableQuery | null>(null)
   const [editingUser, setEditingUser] = useState<User | null>(null)
   const [isDialogOpen, setIsDialogOpen] = useState(false)
+  const latestRequest = useRef(0)
 
-  useEffect(() => {
-    fetchUsers()
-  }, [])
-
-  async function fetchUsers() {
+  // Sorting, search and paging happen in /api/admin/users; only one page is loaded
+  const fetchUsers = useCallback(async (next: DataTableQuery | null = query) => {
+    if (!next) return
+    const requestId = ++latestRequest.current
+    setLoading(true)
     try {
-      const supabase = getSupabaseClient()
-      const { data, error } = await supabase
-        .from('users')
-        .select('*')
-        .order('created_at', { ascending: false })
+      const sort = next.sorting[0]
+      const params = new URLSearchParams({
+        page: String(next.pageIndex + 1),
+        limit: String(next.pageSize),
+        stats: '1',
+      })
+      if (sort) {
+        params.set('sort', sort.id)
+        params.set('order', sort.desc ? 'desc' : 'asc')
+      }
+      if (next.search) params.set('q', next.search)
 
-      if (error) throw error
+      const response = await fetch(`/api/admin/users?${params}`)
+      const result = await response.json()
+      if (!response.ok) throw new Error(result.error || 'Failed to load users')
+      // A newer page or search was requested while this one loaded
+      if (requestId !== latestRequest.current) return
 
-      setUsers(data || [])
-      
-      const total = data?.length || 0
-      // @ts-ignore
-      const admins = data?.filter(u => u.role === 'admin' || u.role === 'super_admin').length || 0
-      // @ts-ignore
-      const regularUsers = data?.filter(u => u.role === 'user').length || 0
-      setStats({ total, admins, users: regularUsers })
+      setUsers(result.data.users)
+      setRowCount(result.data.pagination.total)
+      setStats(result.data.stats)
     } catch (error) {
       console.error('Error fetching users:', error)
       toast.error('Failed to load users')
     } finally {
-      setLoading(false)
+      if (requestId === latestRequest.current) setLoading(false)
     }
+  }, [query])
+
+  function handleQueryChange(next: DataTableQuery) {
+    setQuery(next)
+    fetchUsers(next)
   }
 
   async function handleUpdateRole(userId: string, newRole: string) {
@@ -108,7 +121,7 @@ export default function UsersPage() {
   const columns: ColumnDef<User>[] = [
     {
       accessorKey: 'full_name',
-      header: 'User',
+      header: ({ column }) => <DataTableColumnHeader column={column} title="User" />,
       cell: ({ row }) => (
         <div className="flex items-center gap-3">
           <div className="h-10 w-10 rounded-full bg-gradient-to-br from-coral-400 to-coral-600 flex items-center justify-center text-white font-semibold">
@@ -124,13 +137,14 @@ export default function UsersPage() {
     {
       accessorKey: 'phone',
       header: 'Phone',
+      enableSorting: false,
       cell: ({ row }) => (
         <p className="text-sm text-gray-600">{row.original.phone || '—'}</p>
       ),
     },
     {
       accessorKey: 'role',
-      header: 'Role',
+      header: ({ column }) => <DataTableColumnHeader column={column} title="Role" />,
       cell: ({ row }) => {
         const config = roleConfig[row.original.role]
         const Icon = config.icon
@@ -144,7 +158,7 @@ export default function UsersPage() {
     },
     {
       accessorKey: 'created_at',
-      header: 'Joined',
+      header: ({ column }) => <DataTableColumnHeader column={column} title="Joined" />,
       cell: ({ row }) => (
         <p className="text-sm text-gray-600">
           {formatDistanceToNow(new Date(row.original.created_at), { addSuffix: true })}
@@ -152,8 +166,9 @@ export default function UsersPage() {
       ),
     },
     {
+      id: 'last_login_at',
       accessorKey: 'last_login',
-      header: 'Last Login',
+      header: ({ column }) => <DataTableColumnHeader column={column} title="Last Login" />,
       cell: ({ row }) => (
         <p className="text-sm text-gray-600">
           {row.original.last_login 
@@ -199,17 +214,6 @@ export default function UsersPage() {
     },
   ]
 
-  if (loading) {
-    return (
-      <div className="space-y-6">
-        <h1 className="text-3xl font-bold text-gray-900">Users</h1>
-        <div className="flex items-center justify-center h-64">
-          <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-coral-600"></div>
-        </div>
-      </div>
-    )
-  }
-
   return (
     <div className="space-y-6 px-6">
       <div className="flex items-center justify-between">
@@ -261,8 +265,10 @@ export default function UsersPage() {
         <DataTable
           columns={columns}
           data={users}
-          searchKey="full_name"
-          searchPlaceholder="Search users..."
+          searchPlaceholder="Search by name or email..."
+          onQueryChange={handleQueryChange}
+          rowCount={rowCount}
+          loading={loading}
         />
       </div>
     </div>
@@ -0,0 +1,37 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { AIService } from '@/lib/services/ai-service'
+
+/**
+ * Cached AI configuration (API keys, selected Gemini model) for this instance
+ */
+export async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        return NextResponse.json({ stats: AIService.getConfigCacheStats() })
+    } catch (error: any) {
+        console.error('Error reading AI config cache stats:', error)
+        return NextResponse.json({ error: error.message || 'Failed to read cache stats' }, { status: 500 })
+    }
+}
+
+/**
+ * Invalidate cached AI configuration after keys or agents change
+ * Other instances pick the change up when their cache TTL expires
+ */
+export async function DELETE(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        AIService.invalidateConfigCache()
+        return NextResponse.json({ success: true })
+    } catch (error: any) {
+        console.error('Error invalidating AI config cache:', error)
+        return NextResponse.json({ error: error.message || 'Failed to invalidate cache' }, { status: 500 })
+    }
+}
@@ -0,0 +1,49 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
+import { AIService } from '@/lib/services/ai-service'
+
+/**
+ * Run one agent through AIService (Gemini) against a property
+ * Lets admins check the configured API key and model end to end
+ */
+export async function POST(request: NextRequest) {
+    const startTime = Date.now()
+
+    try {
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
+
+        const user = await context.user()
+        if (!user) {
+            return NextResponse.json({ error: 'Authentication required' }, { status: 401 })
+        }
+
+        if (!(await context.isAdmin())) {
+            return NextResponse.json({ error: 'Admin access required' }, { status: 403 })
+        }
+
+        const { agentSlug, propertyId } = await request.json()
+        if (!agentSlug) {
+            return NextResponse.json({ error: 'Agent slug is required' }, { status: 400 })
+        }
+
+        const { data: property } = propertyId
+            ? await supabase.from('properties').select('*').eq('id', propertyId).single()
+            : await supabase.from('properties').select('*').limit(1).single()
+
+        if (!property) {
+            return NextResponse.json({ error: 'Property not found' }, { status: 404 })
+        }
+
+        const result = await AIService.runAgent(agentSlug, property)
+
+        return NextResponse.json({
+            ...result,
+            execution_time_ms: Date.now() - startTime,
+            cache: AIService.getConfigCacheStats()
+        }, { status: result.success ? 200 : 502 })
+    } catch (error: any) {
+        console.error('AI agent test error:', error)
+        return NextResponse.json({ error: error.message || 'Agent test failed' }, { status: 500 })
+    }
+}
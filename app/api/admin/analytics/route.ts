@@ -0,0 +1,34 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+
+export const dynamic = 'force-dynamic'
+
+/**
+ * Every admin analytics dashboard aggregate in one response
+ * Served from trigger-maintained rollups (get_admin_analytics, migration 026)
+ */
+export async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const days = Math.min(3650, Math.max(1, parseInt(request.nextUrl.searchParams.get('days') || '30') || 30))
+
+        const supabase = await context.admin()
+        // @ts-ignore
+        const { data, error } = await supabase.rpc('get_admin_analytics', { p_days: days })
+
+        if (error) throw error
+
+        const analytics: any = data
+        const sold = analytics.properties.sold
+        const totalEnquiries = analytics.enquiries.total
+        analytics.enquiries.conversion = totalEnquiries && sold ? (sold / totalEnquiries) * 100 : 0
+
+        return NextResponse.json({ analytics })
+    } catch (error: any) {
+        console.error('Error fetching analytics:', error)
+        return NextResponse.json({ error: error.message || 'Failed to fetch analytics' }, { status: 500 })
+    }
+}
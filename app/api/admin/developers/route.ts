@@ -1,20 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createServerClient } from '@supabase/ssr'
-import { cookies } from 'next/headers'
+import { getRequestContext } from '@/lib/supabase/request-context'
+import { revalidateDeveloper } from '@/lib/services/revalidation'
 
 export async function GET(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         const { data: developers, error } = await supabase
             .from('developers')
@@ -36,34 +27,19 @@ export async function GET(request: NextRequest) {
 
 export async function POST(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -92,34 +68,19 @@ export async function POST(request: NextRequest) {
 
 export async function PUT(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -137,6 +98,7 @@ export async function PUT(request: NextRequest) {
             .single()
 
         if (error) throw error
+        await revalidateDeveloper(id)
 
         return NextResponse.json({ success: true, developer })
     } catch (error: any) {
@@ -150,34 +112,19 @@ export async function PUT(request: NextRequest) {
 
 export async function DELETE(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -201,6 +148,7 @@ export async function DELETE(request: NextRequest) {
             .eq('id', id)
 
         if (error) throw error
+        await revalidateDeveloper(id)
 
         return NextResponse.json({ success: true })
     } catch (error: any) {
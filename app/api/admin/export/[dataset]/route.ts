@@ -0,0 +1,54 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { EXPORT_DATASETS, streamCsvExport } from '@/lib/api/csv-export'
+
+export const dynamic = 'force-dynamic'
+
+/**
+ * Stream an admin table as CSV: leads, contacts, properties or newsletter
+ * Filters match the admin pages (`status`, `from`, `to`, `q`, `channel`,
+ * `active`); `?columns=Email,Status` keeps only those headers
+ */
+export async function GET(
+    request: NextRequest,
+    { params }: { params: { dataset: string } }
+) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const dataset = EXPORT_DATASETS[params.dataset]
+        if (!dataset) {
+            return NextResponse.json(
+                { error: `dataset must be one of ${Object.keys(EXPORT_DATASETS).join(', ')}` },
+                { status: 404 }
+            )
+        }
+
+        const searchParams = request.nextUrl.searchParams
+        const requested = searchParams.get('columns')?.split(',').map((name) => name.trim())
+        const columns = requested
+            ? dataset.columns.filter((column) => requested.includes(column.header))
+            : dataset.columns
+        if (!columns.length) {
+            return NextResponse.json({ error: 'No matching columns' }, { status: 400 })
+        }
+
+        const supabase = await context.admin()
+        const filename = `${searchParams.get('filename') || params.dataset}-${new Date().toISOString().split('T')[0]}.csv`
+            .replace(/[^\w.-]/g, '_')
+
+        return new Response(streamCsvExport(supabase, dataset, searchParams, columns), {
+            headers: {
+                'Content-Type': 'text/csv; charset=utf-8',
+                'Content-Disposition': `attachment; filename="${filename}"`,
+                'Cache-Control': 'no-store',
+                'X-Content-Type-Options': 'nosniff',
+            },
+        })
+    } catch (error: any) {
+        console.error('Error exporting:', error)
+        return NextResponse.json({ error: error.message || 'Export failed' }, { status: 500 })
+    }
+}
@@ -1,25 +1,18 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createClient, createAdminClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
 
 export async function POST(request: NextRequest) {
     try {
-        const supabase = await createClient()
-        const adminSupabase = await createAdminClient()
+        const context = getRequestContext(request)
+        const adminSupabase = await context.admin()
 
         // 1. Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json({ error: 'Authentication required' }, { status: 401 })
         }
 
-        const { data: userData } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        // @ts-ignore
-        if (!['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json({ error: 'Admin access required' }, { status: 403 })
         }
 
@@ -0,0 +1,107 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { createPaginatedResponse, getListParams, searchFilter } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
+
+export const dynamic = 'force-dynamic'
+
+const SORT_COLUMNS = ['created_at', 'full_name', 'status', 'source']
+const CHANNELS = ['investment', 'group', 'contact', 'other']
+
+/**
+ * One page of property leads, investment enquiries and contact messages
+ * Read from the admin_lead_inbox view (migration 027)
+ *
+ * `?channel=investment|group|contact|other`, `?status=`, `?q=` (name or email),
+ * `?from=&to=` (dates), `?page=&limit=&sort=&order=`, `?stats=1` adds the
+ * status counts for the date range
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const searchParams = request.nextUrl.searchParams
+        const { page, limit, sort, ascending, search } = getListParams(request, SORT_COLUMNS)
+        const channel = searchParams.get('channel')
+        const status = searchParams.get('status')
+        const fromDate = searchParams.get('from')
+        const toDate = searchParams.get('to')
+
+        if (channel && channel !== 'all' && !CHANNELS.includes(channel)) {
+            return NextResponse.json({ error: `channel must be one of all, ${CHANNELS.join(', ')}` }, { status: 400 })
+        }
+
+        if ([fromDate, toDate].some((date) => date && isNaN(Date.parse(date)))) {
+            return NextResponse.json({ error: 'from and to must be dates' }, { status: 400 })
+        }
+
+        const from = fromDate ? new Date(fromDate).toISOString() : null
+        const to = toDate ? new Date(toDate + 'T23:59:59').toISOString() : null
+
+        const supabase = await context.admin()
+
+        let query = supabase
+            .from('admin_lead_inbox')
+            .select('*', { count: 'exact' })
+            .order(sort, { ascending })
+            .order('id', { ascending })
+
+        if (channel && channel !== 'all') query = query.eq('channel', channel)
+        if (status) query = query.eq('status', status)
+        if (from) query = query.gte('created_at', from)
+        if (to) query = query.lte('created_at', to)
+        if (search) query = query.or(searchFilter(['full_name', 'email'], search))
+
+        const offset = (page - 1) * limit
+
+        const [{ data, error, count }, statsResult] = await Promise.all([
+            query.range(offset, offset + limit - 1),
+            searchParams.get('stats') === '1'
+                // @ts-ignore
+                ? supabase.rpc('admin_lead_stats', { p_from: from, p_to: to })
+                : Promise.resolve(null),
+        ])
+
+        if (error) throw error
+        if (statsResult?.error) throw statsResult.error
+
+        const rows: any[] = data || []
+
+        // The view cannot embed relations, so the page's properties and
+        // assignees are looked up by id (at most `limit` of each)
+        const propertyIds = Array.from(new Set(rows.map((row) => row.property_id).filter(Boolean)))
+        const assigneeIds = Array.from(new Set(rows.map((row) => row.assigned_to).filter(Boolean)))
+
+        const [{ data: properties }, { data: assignees }] = await Promise.all([
+            propertyIds.length
+                ? supabase.from('properties').select('id, title, location').in('id', propertyIds)
+                : Promise.resolve({ data: [] as any[] }),
+            assigneeIds.length
+                ? supabase.from('users').select('id, full_name').in('id', assigneeIds)
+                : Promise.resolve({ data: [] as any[] }),
+        ])
+
+        const propertyById = new Map((properties || []).map((property: any) => [property.id, property]))
+        const assigneeById = new Map((assignees || []).map((assignee: any) => [assignee.id, assignee]))
+
+        const leads = rows.map(({ source_table, ...row }) => ({
+            ...row,
+            table: source_table,
+            properties: propertyById.get(row.property_id),
+            users: assigneeById.get(row.assigned_to),
+        }))
+
+        const { pagination } = createPaginatedResponse([], count || 0, page, limit)
+
+        return NextResponse.json({
+            leads,
+            pagination,
+            ...(statsResult ? { stats: statsResult.data } : {}),
+        })
+    } catch (error: any) {
+        console.error('Error fetching admin leads:', error)
+        return NextResponse.json({ error: error.message || 'Failed to fetch leads' }, { status: 500 })
+    }
+})
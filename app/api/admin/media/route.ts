@@ -0,0 +1,70 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { createCursorPaginatedResponse, decodeCursor, getListParams, keysetFilter } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
+
+export const dynamic = 'force-dynamic'
+
+const KINDS = ['image', 'video', 'audio', 'document', 'other']
+
+/**
+ * One page of the media library, newest first
+ * `?kind=image|video|audio|document|other`, `?q=` (file name),
+ * `?limit=`, `?cursor=` (`nextCursor` of the previous page)
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const searchParams = request.nextUrl.searchParams
+        const { limit, search } = getListParams(request, ['created_at'], { defaultLimit: 48, maxLimit: 200 })
+        const kind = searchParams.get('kind')
+        const cursorParam = searchParams.get('cursor')
+        const cursor = cursorParam ? decodeCursor(cursorParam) : null
+
+        if (kind && !KINDS.includes(kind)) {
+            return NextResponse.json({ error: `kind must be one of ${KINDS.join(', ')}` }, { status: 400 })
+        }
+        if (cursorParam && !cursor) {
+            return NextResponse.json({ error: 'Invalid cursor' }, { status: 400 })
+        }
+
+        const supabase = await context.admin()
+
+        // Aliased to the field names the media page uses
+        let query = supabase
+            .from('media_files')
+            .select(`
+                id,
+                file_name:name,
+                file_url:url,
+                thumbnail_url,
+                file_type:mime_type,
+                file_size,
+                media_kind,
+                uploaded_by,
+                created_at,
+                users (full_name)
+            `)
+            .order('created_at', { ascending: false })
+            .order('id', { ascending: false })
+            .limit(limit + 1)
+
+        if (kind) query = query.eq('media_kind', kind)
+        if (search) query = query.ilike('name', `%${search}%`)
+        if (cursor) query = query.or(keysetFilter(cursor))
+
+        const { data, error } = await query
+
+        if (error) throw error
+
+        const { data: files, pagination } = createCursorPaginatedResponse((data || []) as any[], limit)
+
+        return NextResponse.json({ files, pagination })
+    } catch (error: any) {
+        console.error('Error fetching media files:', error)
+        return NextResponse.json({ error: error.message || 'Failed to fetch media files' }, { status: 500 })
+    }
+})
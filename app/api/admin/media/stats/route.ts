@@ -0,0 +1,38 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+
+export const dynamic = 'force-dynamic'
+
+/**
+ * Media library totals, computed in the database (media_library_stats, migration 029)
+ */
+export async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const supabase = await context.admin()
+        // @ts-ignore
+        const { data, error } = await supabase.rpc('media_library_stats')
+
+        if (error) throw error
+
+        const stats: any = data
+        const kind = (name: string) => stats.by_kind?.[name] || { count: 0, size: 0 }
+
+        return NextResponse.json({
+            stats: {
+                total: stats.total,
+                totalSize: stats.total_size,
+                images: kind('image').count,
+                documents: kind('document').count,
+                videos: kind('video').count,
+                byKind: stats.by_kind,
+            },
+        })
+    } catch (error: any) {
+        console.error('Error fetching media stats:', error)
+        return NextResponse.json({ error: error.message || 'Failed to fetch media stats' }, { status: 500 })
+    }
+}
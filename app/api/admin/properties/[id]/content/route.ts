@@ -1,40 +1,25 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createServerClient } from '@supabase/ssr'
-import { cookies } from 'next/headers'
+import { getRequestContext } from '@/lib/supabase/request-context'
+import { revalidateProperty } from '@/lib/services/revalidation'
 
 export async function GET(
     request: NextRequest,
     { params }: { params: { id: string } }
 ) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -90,34 +75,19 @@ export async function POST(
     { params }: { params: { id: string } }
 ) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -172,6 +142,7 @@ export async function POST(
         }
 
         if (result.error) throw result.error
+        await revalidateProperty(params.id)
 
         return NextResponse.json({ success: true, data: result.data })
     } catch (error: any) {
@@ -188,34 +159,19 @@ export async function PUT(
     { params }: { params: { id: string } }
 ) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -267,6 +223,7 @@ export async function PUT(
         }
 
         if (result.error) throw result.error
+        await revalidateProperty(params.id)
 
         return NextResponse.json({ success: true, data: result.data })
     } catch (error: any) {
@@ -283,34 +240,19 @@ export async function DELETE(
     { params }: { params: { id: string } }
 ) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -362,6 +304,7 @@ export async function DELETE(
         }
 
         if (result.error) throw result.error
+        await revalidateProperty(params.id)
 
         return NextResponse.json({ success: true })
     } catch (error: any) {
@@ -0,0 +1,29 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { getRateLimitStore, MemoryRateLimitStore } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
+
+/**
+ * Rate limiter state on this instance, for checking memory stays bounded
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const store = getRateLimitStore()
+        const { heapUsed, rss } = process.memoryUsage()
+
+        const isMemory = store instanceof MemoryRateLimitStore
+
+        return NextResponse.json({
+            store: isMemory ? 'memory' : 'shared',
+            stats: isMemory ? store.getStats() : null,
+            memory: { heapUsed, rss },
+        })
+    } catch (error: any) {
+        console.error('Error reading rate limit stats:', error)
+        return NextResponse.json({ error: error.message || 'Failed to read rate limit stats' }, { status: 500 })
+    }
+})
@@ -0,0 +1,51 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import {
+    revalidateBlog,
+    revalidateDeveloper,
+    revalidateProperty,
+    revalidateTestimonials,
+} from '@/lib/services/revalidation'
+
+/**
+ * Revalidate cached public pages after an admin edit made with the browser client
+ * Body: { type: 'property', id, slug? }, { type: 'developer', id },
+ * { type: 'blog' } or { type: 'testimonial' }
+ */
+export async function POST(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const { type, id, slug } = await request.json()
+        if (!id && (type === 'property' || type === 'developer')) {
+            return NextResponse.json({ error: 'Missing id' }, { status: 400 })
+        }
+
+        switch (type) {
+            case 'property':
+                await revalidateProperty(id, slug)
+                return NextResponse.json({ success: true, revalidated: 1 })
+
+            case 'developer': {
+                const revalidated = await revalidateDeveloper(id)
+                return NextResponse.json({ success: true, revalidated })
+            }
+
+            case 'blog':
+                revalidateBlog()
+                return NextResponse.json({ success: true })
+
+            case 'testimonial':
+                revalidateTestimonials()
+                return NextResponse.json({ success: true })
+
+            default:
+                return NextResponse.json({ error: 'Invalid revalidation type' }, { status: 400 })
+        }
+    } catch (error: any) {
+        console.error('Error revalidating pages:', error)
+        return NextResponse.json({ error: error.message || 'Failed to revalidate' }, { status: 500 })
+    }
+}
@@ -0,0 +1,37 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { getReferenceCacheStats, invalidateReferenceCache } from '@/lib/api/reference-cache'
+
+/**
+ * Cached /api/search/* reference data on this instance
+ */
+export async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        return NextResponse.json({ stats: getReferenceCacheStats() })
+    } catch (error: any) {
+        console.error('Error reading search cache stats:', error)
+        return NextResponse.json({ error: error.message || 'Failed to read cache stats' }, { status: 500 })
+    }
+}
+
+/**
+ * Invalidate cached cities, locations and configurations after they are edited
+ * Bumps the cache version, so existing ETags stop matching
+ */
+export async function DELETE(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const version = invalidateReferenceCache()
+        return NextResponse.json({ success: true, version })
+    } catch (error: any) {
+        console.error('Error invalidating search cache:', error)
+        return NextResponse.json({ error: error.message || 'Failed to invalidate cache' }, { status: 500 })
+    }
+}
@@ -1,7 +1,21 @@
 import { NextRequest } from 'next/server'
 import { createAdminClient } from '@/lib/supabase/server'
-import { successResponse, errorResponse, handleApiError } from '@/lib/api/utils'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import {
+    successResponse,
+    errorResponse,
+    handleApiError,
+    createPaginatedResponse,
+    getListParams,
+    searchFilter,
+} from '@/lib/api/utils'
 import { z } from 'zod'
+import { withServerTiming } from '@/lib/api/server-timing'
+
+export const dynamic = 'force-dynamic'
+
+const SORT_COLUMNS = ['created_at', 'last_login_at', 'full_name', 'email', 'role']
+const ROLES = ['user', 'admin', 'super_admin']
 
 const createUserSchema = z.object({
     email: z.string().email(),
@@ -10,7 +24,64 @@ const createUserSchema = z.object({
     role: z.enum(['user', 'admin', 'super_admin']).default('user'),
 })
 
-export async function POST(request: NextRequest) {
+/**
+ * One page of users for /admin/users
+ * `?role=`, `?q=` (name or email), `?page=&limit=&sort=&order=`,
+ * `?stats=1` adds the total, admin and regular user counts
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    try {
+        const context = getRequestContext(request)
+        const denied = await requireAdmin(context)
+        if (denied) return denied
+
+        const searchParams = request.nextUrl.searchParams
+        const { page, limit, sort, ascending, search } = getListParams(request, SORT_COLUMNS)
+        const role = searchParams.get('role')
+
+        if (role && !ROLES.includes(role)) {
+            return errorResponse(`role must be one of ${ROLES.join(', ')}`, 400)
+        }
+
+        const supabase = await context.admin()
+
+        let query = supabase
+            .from('users')
+            .select('id, email, full_name, role, phone, avatar_url, created_at, last_login:last_login_at', { count: 'exact' })
+            .order(sort, { ascending, nullsFirst: false })
+            .order('id', { ascending })
+
+        if (role) query = query.eq('role', role)
+        if (search) query = query.or(searchFilter(['full_name', 'email'], search))
+
+        const offset = (page - 1) * limit
+        const countUsers = (roles: string[]) =>
+            supabase.from('users').select('id', { count: 'exact', head: true }).in('role', roles)
+
+        const [{ data: users, error, count }, stats] = await Promise.all([
+            query.range(offset, offset + limit - 1),
+            searchParams.get('stats') === '1'
+                ? Promise.all([countUsers(ROLES), countUsers(['admin', 'super_admin']), countUsers(['user'])])
+                : Promise.resolve(null),
+        ])
+
+        if (error) throw error
+
+        const { pagination } = createPaginatedResponse([], count || 0, page, limit)
+
+        return successResponse({
+            users: users || [],
+            pagination,
+            ...(stats
+                ? { stats: { total: stats[0].count || 0, admins: stats[1].count || 0, users: stats[2].count || 0 } }
+                : {}),
+        })
+    } catch (error) {
+        return handleApiError(error)
+    }
+})
+
+export const POST = withServerTiming(async function POST(request: NextRequest) {
     try {
         const body = await request.json()
         const { email, password, full_name, role } = createUserSchema.parse(body)
@@ -73,4 +144,4 @@ export async function POST(request: NextRequest) {
         }
         return handleApiError(error)
     }
-}
+})
@@ -1,20 +1,35 @@
-import { createClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
 import { NextResponse } from 'next/server'
 import OpenAI from 'openai'
-
+import {
+  DeadlineExceededError,
+  mapSettledWithConcurrency,
+  withDeadline,
+} from '@/lib/utils/concurrency'
+import { computeAnalysisHash, findStoredAnalysis } from '@/lib/services/analysis-store'
+import { getUsageCount } from '@/lib/services/usage-counters'
+import { timed, withServerTiming } from '@/lib/api/server-timing'
+
+// OPENAI_BASE_URL is read by the SDK, which lets benchmarks point it at a stub
 const openai = new OpenAI({
   apiKey: process.env.OPENAI_API_KEY || ''
 })
 
-export async function POST(request: Request) {
+// Agents analysed at the same time, and how long one agent may take
+// (non-numeric or non-positive values fall back to the defaults)
+const AGENT_CONCURRENCY = Math.max(0, parseInt(process.env.AI_AGENT_CONCURRENCY || '4')) || 4
+const AGENT_TIMEOUT_MS = Math.max(0, parseInt(process.env.AI_AGENT_TIMEOUT_MS || '25000')) || 25000
+
+export const POST = withServerTiming(async function POST(request: Request) {
   const startTime = Date.now()
   
   try {
-    const supabase = await createClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
     
-    const { data: { user }, error: userError } = await supabase.auth.getUser()
+    const user = await context.user()
     
-    if (userError || !user) {
+    if (!user) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -86,46 +101,75 @@ export async function POST(request: Request) {
       }
     }
 
-    // Run AI analysis with each agent
-    const analysisResults: any = {}
+    // Identical property content and agent configs produce the same analysis,
+    // so a stored one is reused instead of running the committee again
+    const contentHash = computeAnalysisHash(property, agents)
+    const adminClient = await context.admin()
+    const storedAnalysis = await findStoredAnalysis(adminClient, propertyId, contentHash)
+
+    let analysis: any
     let totalTokensUsed = 0
+    const timedOutAgents: string[] = []
+    let partial = false
+
+    if (storedAnalysis) {
+      analysis = storedAnalysis.analysis_data
+    } else {
+      // Run AI analysis with the agents in parallel, each with its own deadline,
+      // so one slow agent returns a partial committee instead of blocking the rest
+      const analysisResults: any = {}
+
+      const settled = await mapSettledWithConcurrency(agents, AGENT_CONCURRENCY, (agent: any) =>
+        withDeadline(
+          (signal) => timed('llm', () => runAgentAnalysis(agent, property, signal)),
+          AGENT_TIMEOUT_MS,
+          agent.agent_slug
+        )
+      )
 
-    for (const agent of agents) {
-      try {
-        const result = await runAgentAnalysis(agent, property)
-        // @ts-ignore
-        analysisResults[agent.agent_slug] = result
-        totalTokensUsed += result.tokensUsed || 0
-      } catch (error) {
-        // @ts-ignore
+      settled.forEach((outcome, index) => {
+        const agent: any = agents[index]
+        if (outcome.status === 'fulfilled') {
+          analysisResults[agent.agent_slug] = outcome.value
+          totalTokensUsed += outcome.value.tokensUsed || 0
+          return
+        }
+
+        const error = outcome.reason
+        const timedOut = error instanceof DeadlineExceededError
+        if (timedOut) timedOutAgents.push(agent.agent_slug)
         console.error(`Error running ${agent.agent_slug}:`, error)
-        // @ts-ignore
         analysisResults[agent.agent_slug] = {
-          error: 'Analysis failed',
-          message: error instanceof Error ? error.message : 'Unknown error'
+          error: timedOut ? 'Analysis timed out' : 'Analysis failed',
+          message: error instanceof Error ? error.message : 'Unknown error',
+          timedOut
         }
+      })
+
+      partial = settled.some((outcome) => outcome.status === 'rejected')
+
+      // Calculate overall score and recommendation
+      analysis = {
+        ...analysisResults,
+        ...synthesizeResults(analysisResults, agents)
       }
     }
 
-    // Calculate overall score and recommendation
-    const synthesizedResult = synthesizeResults(analysisResults, agents)
-
     const executionTime = Math.round((Date.now() - startTime) / 1000)
 
-    // Save analysis to database
+    // Save analysis to database; partial results are kept out of the reuse store
     const { data: savedAnalysis, error: saveError } = await supabase
       .from('ai_property_analyses')
       // @ts-ignore
       .insert({
         user_id: user.id,
         property_id: propertyId,
-        analysis_data: {
-          ...analysisResults,
-          ...synthesizedResult
-        },
+        analysis_data: analysis,
         agents_used: agentSlugs,
         execution_time_seconds: executionTime,
-        tokens_used: totalTokensUsed
+        tokens_used: totalTokensUsed,
+        content_hash: partial ? null : contentHash,
+        reused_from: storedAnalysis?.id || null
       })
       .select()
       .single()
@@ -146,21 +190,23 @@ export async function POST(request: Request) {
         metadata: {
           agents_used: agentSlugs,
           tokens_used: totalTokensUsed,
-          execution_time: executionTime
+          execution_time: executionTime,
+          cached: !!storedAnalysis
         }
       })
     }
 
     return NextResponse.json({
       success: true,
-      analysis: {
-        ...analysisResults,
-        ...synthesizedResult
-      },
+      analysis,
       metadata: {
         execution_time: executionTime,
         tokens_used: totalTokensUsed,
-        agents_used: agentSlugs
+        agents_used: agentSlugs,
+        agents_timed_out: timedOutAgents,
+        partial,
+        cached: !!storedAnalysis,
+        content_hash: contentHash
       }
     })
 
@@ -171,7 +217,7 @@ export async function POST(request: Request) {
       { status: 500 }
     )
   }
-}
+})
 
 async function getFreePlan(supabase: any) {
   const { data } = await supabase
@@ -188,19 +234,9 @@ async function checkUsageLimit(supabase: any, userId: string, plan: any): Promis
   // 0 means unlimited
   if (analysesLimit === 0) return true
 
-  // Get start of current month
-  const startOfMonth = new Date()
-  startOfMonth.setDate(1)
-  startOfMonth.setHours(0, 0, 0, 0)
-
-  const { count } = await supabase
-    .from('subscription_usage_logs')
-    .select('*', { count: 'exact', head: true })
-    .eq('user_id', userId)
-    .eq('usage_type', 'ai_analysis')
-    .gte('created_at', startOfMonth.toISOString())
+  const count = await getUsageCount(supabase, userId, 'ai_analysis')
 
-  return (count || 0) < analysesLimit
+  return count < analysesLimit
 }
 
 function checkAgentAccess(plan: any, agentSlug: string): boolean {
@@ -209,7 +245,7 @@ function checkAgentAccess(plan: any, agentSlug: string): boolean {
   return plan.agents_access.includes(agentSlug)
 }
 
-async function runAgentAnalysis(agent: any, property: any) {
+async function runAgentAnalysis(agent: any, property: any, signal?: AbortSignal) {
   const propertyContext = `
 Property Details:
 - Title: ${property.title}
@@ -238,7 +274,7 @@ Property Details:
     ],
     temperature: agent.temperature,
     max_tokens: agent.max_tokens
-  })
+  }, { signal })
 
   const response = completion.choices[0]?.message?.content || 'No analysis generated'
   
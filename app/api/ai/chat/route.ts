@@ -1,17 +1,29 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { getSupabaseClient } from '@/lib/supabase/client'
+import OpenAI from 'openai'
+import { getRequestContext } from '@/lib/supabase/request-context'
+
+// When set, replies come from this OpenAI-compatible model (OPENAI_BASE_URL
+// is honoured by the SDK); otherwise the built-in response templates are used
+const CHAT_MODEL = process.env.AI_CHAT_MODEL || ''
+
+const openai = new OpenAI({
+  apiKey: process.env.OPENAI_API_KEY || ''
+})
+
+const SYSTEM_PROMPT = 'You are a real estate investment advisor for Co-Ventures. Answer questions about the property using the details provided. Be concise and specific.'
 
-// For now, this is a placeholder. You'll need to integrate with OpenAI or another AI service
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json()
     const { messages, propertyData } = body
+    const stream = body.stream === true || (request.headers.get('accept') || '').includes('text/event-stream')
 
     // Verify user is authenticated and has subscription
-    const supabase = getSupabaseClient()
-    const { data: { user }, error: authError } = await supabase.auth.getUser()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
+    const user = await context.user()
 
-    if (authError || !user) {
+    if (!user) {
       return NextResponse.json(
         { error: 'Unauthorized' },
         { status: 401 }
@@ -19,31 +31,50 @@ export async function POST(request: NextRequest) {
     }
 
     // Check user subscription
-    const { data: profile } = await supabase
-      .from('profiles')
-      .select('subscription_plan, subscription_status')
-      .eq('id', user.id)
-      .single() as { data: { subscription_plan: string; subscription_status: string } | null }
-
-    if (!profile || profile.subscription_plan === 'free') {
+    const { data: subscription } = await supabase
+      .from('user_subscriptions')
+      .select('status, plan:subscription_plans(slug)')
+      .eq('user_id', user.id)
+      .eq('status', 'active')
+      .single()
+
+    // @ts-ignore
+    if (!subscription || !subscription.plan || subscription.plan.slug === 'free') {
       return NextResponse.json(
         { error: 'Premium subscription required' },
         { status: 403 }
       )
     }
 
-    // Get the last user message
-    const lastMessage = messages[messages.length - 1]
-    
-    // Create AI response based on property context
-    const response = generateAIResponse(lastMessage.content, propertyData)
+    if (!Array.isArray(messages) || messages.length === 0) {
+      return NextResponse.json(
+        { error: 'Messages are required' },
+        { status: 400 }
+      )
+    }
 
     // TODO: Log the interaction to ai_interactions table once created
     // await supabase.from('ai_interactions').insert({...})
 
+    if (stream) {
+      return new Response(streamChatResponse(messages, propertyData, request.signal), {
+        headers: {
+          'Content-Type': 'text/event-stream; charset=utf-8',
+          'Cache-Control': 'no-cache, no-transform',
+          'Connection': 'keep-alive',
+          'X-Accel-Buffering': 'no'
+        }
+      })
+    }
+
+    const chunks: string[] = []
+    for await (const token of generateTokens(messages, propertyData)) {
+      chunks.push(token)
+    }
+
     return NextResponse.json({
       role: 'assistant',
-      content: response
+      content: chunks.join('')
     })
 
   } catch (error) {
@@ -55,6 +86,74 @@ export async function POST(request: NextRequest) {
   }
 }
 
+/**
+ * Server-Sent Events body: one `data: {"delta": "..."}` event per token,
+ * then `data: [DONE]`. Errors after the first byte are sent as
+ * `data: {"error": "..."}` since the status code is already committed
+ */
+function streamChatResponse(messages: any[], propertyData: any, signal: AbortSignal) {
+  const encoder = new TextEncoder()
+  const send = (controller: ReadableStreamDefaultController, data: string) =>
+    controller.enqueue(encoder.encode(`data: ${data}\n\n`))
+
+  return new ReadableStream({
+    async start(controller) {
+      try {
+        for await (const token of generateTokens(messages, propertyData, signal)) {
+          send(controller, JSON.stringify({ delta: token }))
+        }
+        send(controller, '[DONE]')
+      } catch (error) {
+        if (!signal.aborted) {
+          console.error('AI Chat stream error:', error)
+          send(controller, JSON.stringify({ error: 'Failed to generate response' }))
+        }
+      } finally {
+        try {
+          controller.close()
+        } catch {
+          // Client already disconnected
+        }
+      }
+    }
+  })
+}
+
+/**
+ * Reply tokens as they are produced, from the configured model or the templates
+ */
+async function* generateTokens(messages: any[], propertyData: any, signal?: AbortSignal): AsyncGenerator<string> {
+  const lastMessage = messages[messages.length - 1]
+
+  if (!CHAT_MODEL) {
+    // Create AI response based on property context
+    const response = generateAIResponse(lastMessage.content, propertyData)
+    for (const token of response.match(/\S+\s*|\s+/g) || []) {
+      yield token
+    }
+    return
+  }
+
+  const completion = await openai.chat.completions.create({
+    model: CHAT_MODEL,
+    stream: true,
+    messages: [
+      {
+        role: 'system',
+        content: `${SYSTEM_PROMPT}\n\nProperty details: ${JSON.stringify(propertyData || {})}`
+      },
+      ...messages
+        .filter((message: any) => message.role === 'user' || message.role === 'assistant')
+        .map((message: any) => ({ role: message.role, content: String(message.content) }))
+    ]
+  }, { signal })
+
+  for await (const chunk of completion) {
+    const token = chunk.choices[0]?.delta?.content
+    if (token) yield token
+  }
+}
+
 // Temporary AI response generator (replace with OpenAI integration)
 function generateAIResponse(query: string, propertyData: any): string {
   const q = query.toLowerCase()
@@ -2,8 +2,9 @@ import { NextRequest } from 'next/server'
 import { signIn } from '@/lib/auth/auth'
 import { successResponse, errorResponse, handleApiError, validateRequest } from '@/lib/api/utils'
 import { signInSchema } from '@/lib/api/validation'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
   try {
     // Validate request body
     const { data, error } = await validateRequest(request, signInSchema)
@@ -23,4 +24,4 @@ export async function POST(request: NextRequest) {
     }
     return handleApiError(error)
   }
-}
+})
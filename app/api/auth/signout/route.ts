@@ -1,12 +1,13 @@
 import { NextRequest } from 'next/server'
 import { signOut } from '@/lib/auth/auth'
 import { successResponse, handleApiError } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
   try {
     await signOut()
     return successResponse({ message: 'Signed out successfully' })
   } catch (error) {
     return handleApiError(error)
   }
-}
+})
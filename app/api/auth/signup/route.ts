@@ -1,6 +1,7 @@
 import { NextRequest } from 'next/server'
 import { createClient } from '@supabase/supabase-js'
 import { successResponse, errorResponse, handleApiError } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
 
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!
 const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY!
@@ -13,7 +14,7 @@ const supabaseAdmin = createClient(supabaseUrl, supabaseServiceKey, {
   }
 })
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
   try {
     const { email, password, fullName } = await request.json()
 
@@ -83,4 +84,4 @@ export async function POST(request: NextRequest) {
   } catch (error: any) {
     return handleApiError(error)
   }
-}
+})
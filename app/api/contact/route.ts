@@ -8,12 +8,13 @@ import {
   getClientIp,
 } from '@/lib/api/utils'
 import { contactMessageSchema } from '@/lib/api/validation'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
   try {
     // Rate limiting
     const ip = getClientIp(request)
-    const rateLimitResult = rateLimit(ip, 3, 60000) // 3 requests per minute
+    const rateLimitResult = await rateLimit(`contact:${ip}`, 3, 60000) // 3 requests per minute
     if (!rateLimitResult.success) {
       return new Response(
         JSON.stringify({
@@ -65,4 +66,4 @@ export async function POST(request: NextRequest) {
   } catch (error) {
     return handleApiError(error)
   }
-}
+})
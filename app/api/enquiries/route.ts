@@ -1,5 +1,5 @@
 import { NextRequest } from 'next/server'
-import { createClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
 import {
   successResponse,
   handleApiError,
@@ -8,12 +8,13 @@ import {
   getClientIp,
 } from '@/lib/api/utils'
 import { createEnquirySchema } from '@/lib/api/validation'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
   try {
     // Rate limiting
     const ip = getClientIp(request)
-    const rateLimitResult = rateLimit(ip, 5, 60000) // 5 requests per minute
+    const rateLimitResult = await rateLimit(`enquiries:${ip}`, 5, 60000) // 5 requests per minute
     if (!rateLimitResult.success) {
       return new Response(
         JSON.stringify({
@@ -34,12 +35,11 @@ export async function POST(request: NextRequest) {
     const { data, error } = await validateRequest(request, createEnquirySchema)
     if (error) return error
 
-    const supabase = await createClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
 
     // Get current user if authenticated
-    const {
-      data: { user },
-    } = await supabase.auth.getUser()
+    const user = await context.user()
 
     // Create enquiry
     const { data: enquiry, error: createError } = await supabase
@@ -72,4 +72,4 @@ export async function POST(request: NextRequest) {
   } catch (error) {
     return handleApiError(error)
   }
-}
+})
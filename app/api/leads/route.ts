@@ -1,27 +1,25 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createClient, createAdminClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
+import { createPaginatedResponse, getListParams, searchFilter } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function GET(request: NextRequest) {
+const LEAD_SORT_COLUMNS = ['created_at', 'updated_at', 'full_name', 'status', 'lead_type']
+
+export const GET = withServerTiming(async function GET(request: NextRequest) {
     try {
-        const supabase = await createClient()
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        // @ts-ignore
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -33,8 +31,9 @@ export async function GET(request: NextRequest) {
         const property_id = searchParams.get('property_id')
         const lead_type = searchParams.get('lead_type')
         const status = searchParams.get('status')
+        const { page, limit, sort, ascending, search } = getListParams(request, LEAD_SORT_COLUMNS)
 
-        // Build query
+        // Build query; filtering, sorting and paging all happen in the database
         let query = supabase
             .from('property_leads')
             .select(`
@@ -49,8 +48,9 @@ export async function GET(request: NextRequest) {
           full_name,
           email
         )
-      `)
-            .order('created_at', { ascending: false })
+      `, { count: 'exact' })
+            .order(sort, { ascending })
+            .order('id', { ascending })
 
         if (property_id) {
             query = query.eq('property_id', property_id)
@@ -61,12 +61,18 @@ export async function GET(request: NextRequest) {
         if (status) {
             query = query.eq('status', status)
         }
+        if (search) {
+            query = query.or(searchFilter(['full_name', 'email', 'phone'], search))
+        }
 
-        const { data: leads, error } = await query
+        const from = (page - 1) * limit
+        const { data: leads, error, count } = await query.range(from, from + limit - 1)
 
         if (error) throw error
 
-        return NextResponse.json({ leads: leads || [] })
+        const { pagination } = createPaginatedResponse([], count || 0, page, limit)
+
+        return NextResponse.json({ leads: leads || [], pagination })
     } catch (error: any) {
         console.error('Error fetching leads:', error)
         return NextResponse.json(
@@ -74,9 +80,9 @@ export async function GET(request: NextRequest) {
             { status: 500 }
         )
     }
-}
+})
 
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
     try {
         const body = await request.json()
         const { property_id, lead_type, full_name, email, phone, message } = body
@@ -89,12 +95,13 @@ export async function POST(request: NextRequest) {
             )
         }
 
-        const supabase = await createClient()
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
         // Use admin client to bypass RLS for public leads
-        const adminSupabase = await createAdminClient()
+        const adminSupabase = await context.admin()
 
         // Get current user (optional for leads)
-        const { data: { user } } = await supabase.auth.getUser()
+        const user = await context.user()
 
         // Create lead using admin client
         const { data: lead, error } = await adminSupabase
@@ -123,29 +130,23 @@ export async function POST(request: NextRequest) {
             { status: 500 }
         )
     }
-}
+})
 
-export async function PUT(request: NextRequest) {
+export const PUT = withServerTiming(async function PUT(request: NextRequest) {
     try {
-        const supabase = await createClient()
+        const context = getRequestContext(request)
+        const supabase = await context.supabase()
 
         // Check if user is admin
-        const { data: { user }, error: authError } = await supabase.auth.getUser()
-        if (authError || !user) {
+        const user = await context.user()
+        if (!user) {
             return NextResponse.json(
                 { error: 'Authentication required' },
                 { status: 401 }
             )
         }
 
-        const { data: userData, error: userError } = await supabase
-            .from('users')
-            .select('role')
-            .eq('id', user.id)
-            .single()
-
-        // @ts-ignore
-        if (userError || !['admin', 'super_admin'].includes(userData?.role)) {
+        if (!(await context.isAdmin())) {
             return NextResponse.json(
                 { error: 'Admin access required' },
                 { status: 403 }
@@ -179,4 +180,4 @@ export async function PUT(request: NextRequest) {
             { status: 500 }
         )
     }
-}
+})
@@ -1,35 +1,39 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createClient } from '@/lib/supabase/server'
+import { createClient as createSupabaseClient } from '@supabase/supabase-js'
+import { getRequestContext, requireAdmin } from '@/lib/supabase/request-context'
+import { drainEmailOutbox, enqueueEmail } from '@/lib/services/email-outbox'
+import { z } from 'zod'
+
+// One plain address; the recipient goes into SMTP commands and headers
+const recipientSchema = z.string().trim().email().max(254)
 
 /**
  * Email Notification API
- * Sends email notifications for various events
- * 
- * In production, integrate with:
- * - SendGrid
- * - AWS SES
- * - Resend
- * - Postmark
+ * Queues email notifications for various events in the outbox
+ * (lib/services/email-outbox.ts), which sends them in batches.
+ * Admins only: the message goes out from the site's sender to any address
  */
 
 export async function POST(request: NextRequest) {
   try {
-    const supabase = await createClient()
-    
-    // Verify authentication
-    const { data: { user }, error: authError } = await supabase.auth.getUser()
-    if (authError || !user) {
-      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
-    }
+    const context = getRequestContext(request)
+    const denied = await requireAdmin(context)
+    if (denied) return denied
+    const user = (await context.adminUser())!
 
     const body = await request.json()
-    const { type, to, data } = body
+    const { type, to, data = {} } = body
 
     // Validate inputs
     if (!type || !to) {
       return NextResponse.json({ error: 'Missing required fields' }, { status: 400 })
     }
 
+    const recipient = recipientSchema.safeParse(to)
+    if (!recipient.success) {
+      return NextResponse.json({ error: 'to must be a single email address' }, { status: 400 })
+    }
+
     // Generate email content based on type
     let subject = ''
     let html = ''
@@ -70,70 +74,28 @@ export async function POST(request: NextRequest) {
         return NextResponse.json({ error: 'Invalid notification type' }, { status: 400 })
     }
 
-    // Store notification in database (table needs to be created first)
-    // Uncomment after creating email_notifications table
-    /*
-    const { error: insertError } = await supabase
-      .from('email_notifications')
-      .insert({
-        type,
-        recipient: to,
-        subject,
-        html_content: html,
-        text_content: text,
-        metadata: data,
-        status: 'pending'
-      })
-
-    if (insertError) {
-      console.error('Error storing notification:', insertError)
-    }
-    */
-
-    // In production, send actual email using your email service
-    // For now, we'll just log it
-    console.log('📧 Email Notification:', { type, to, subject })
-
-    // Example: Using SendGrid (uncomment and configure in production)
-    /*
-    const sgMail = require('@sendgrid/mail')
-    sgMail.setApiKey(process.env.SENDGRID_API_KEY)
-    
-    await sgMail.send({
-      to,
-      from: process.env.SENDER_EMAIL,
+    // Queue and return; delivery runs in the outbox worker. Not tied to the
+    // request's cookies, since the worker outlives the request
+    const admin = createSupabaseClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.SUPABASE_SERVICE_ROLE_KEY!,
+      { auth: { autoRefreshToken: false, persistSession: false } }
+    )
+    const { id } = await enqueueEmail(admin, {
+      type,
+      recipient: recipient.data,
       subject,
-      text,
       html,
+      text,
+      metadata: data,
+      createdBy: user.id,
     })
-    */
-
-    // Example: Using AWS SES (uncomment and configure in production)
-    /*
-    const AWS = require('aws-sdk')
-    const ses = new AWS.SES({
-      accessKeyId: process.env.AWS_ACCESS_KEY_ID,
-      secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY,
-      region: process.env.AWS_REGION,
-    })
-
-    await ses.sendEmail({
-      Source: process.env.SENDER_EMAIL,
-      Destination: { ToAddresses: [to] },
-      Message: {
-        Subject: { Data: subject },
-        Body: {
-          Text: { Data: text },
-          Html: { Data: html },
-        },
-      },
-    }).promise()
-    */
+    drainEmailOutbox(admin)
 
     return NextResponse.json({ 
       success: true,
       message: 'Email notification queued successfully',
-      data: { type, to, subject }
+      data: { type, to: recipient.data, subject, id }
     })
 
   } catch (error) {
@@ -146,6 +108,26 @@ export async function POST(request: NextRequest) {
 }
 
 // Email Templates
+// Every value from the request body is escaped; it comes from the caller
+
+function escapeHtml(value: unknown) {
+  return String(value ?? '')
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;')
+}
+
+// Only http(s) image links
+function safeUrl(value: unknown) {
+  try {
+    const url = new URL(String(value))
+    return ['http:', 'https:'].includes(url.protocol) ? url.toString() : ''
+  } catch {
+    return ''
+  }
+}
 
 function generateNewEnquiryEmail(data: any) {
   return `
@@ -169,18 +151,18 @@ function generateNewEnquiryEmail(data: any) {
         <div class="content">
           <p>You have received a new enquiry:</p>
           <div class="detail">
-            <strong>Name:</strong> ${data.full_name}
+            <strong>Name:</strong> ${escapeHtml(data.full_name)}
           </div>
           <div class="detail">
-            <strong>Email:</strong> ${data.email}
+            <strong>Email:</strong> ${escapeHtml(data.email)}
           </div>
           <div class="detail">
-            <strong>Phone:</strong> ${data.phone || 'Not provided'}
+            <strong>Phone:</strong> ${escapeHtml(data.phone || 'Not provided')}
           </div>
           <div class="detail">
-            <strong>Message:</strong><br>${data.message}
+            <strong>Message:</strong><br>${escapeHtml(data.message)}
           </div>
-          ${data.property ? `<div class="detail"><strong>Property:</strong> ${data.property.title}</div>` : ''}
+          ${data.property ? `<div class="detail"><strong>Property:</strong> ${escapeHtml(data.property.title)}</div>` : ''}
           <p style="margin-top: 20px;">
             <a href="${process.env.NEXT_PUBLIC_SITE_URL}/admin/enquiries" 
                style="background: #FF6B6B; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block;">
@@ -220,14 +202,14 @@ function generateEnquiryStatusEmail(data: any) {
           <h1>📬 Enquiry Status Update</h1>
         </div>
         <div class="content">
-          <p>Dear ${data.full_name},</p>
+          <p>Dear ${escapeHtml(data.full_name)},</p>
           <p>Your enquiry status has been updated:</p>
           <p>
-            <span class="status-badge status-${data.status}">
-              ${data.status.toUpperCase()}
+            <span class="status-badge status-${escapeHtml(data.status)}">
+              ${escapeHtml(String(data.status).toUpperCase())}
             </span>
           </p>
-          ${data.notes ? `<p><strong>Notes:</strong> ${data.notes}</p>` : ''}
+          ${data.notes ? `<p><strong>Notes:</strong> ${escapeHtml(data.notes)}</p>` : ''}
           <p>Thank you for your interest in Co-Housing Ventures.</p>
           <p>If you have any questions, please don't hesitate to contact us.</p>
         </div>
@@ -262,23 +244,23 @@ function generateNewPropertyEmail(data: any) {
           <h1>🏠 New Property Listed</h1>
         </div>
         <div class="content">
-          <h2>${data.title}</h2>
-          ${data.image ? `<img src="${data.image}" alt="${data.title}" class="property-image" />` : ''}
-          <p class="price">₹${(data.price / 100000).toFixed(2)}L</p>
-          <p>📍 ${data.location}, ${data.city}</p>
+          <h2>${escapeHtml(data.title)}</h2>
+          ${data.image ? `<img src="${escapeHtml(safeUrl(data.image))}" alt="${escapeHtml(data.title)}" class="property-image" />` : ''}
+          <p class="price">₹${(Number(data.price) / 100000).toFixed(2)}L</p>
+          <p>📍 ${escapeHtml(data.location)}, ${escapeHtml(data.city)}</p>
           <div class="features">
             <div class="feature">
-              <strong>${data.bedrooms}</strong><br>Bedrooms
+              <strong>${escapeHtml(data.bedrooms)}</strong><br>Bedrooms
             </div>
             <div class="feature">
-              <strong>${data.bathrooms}</strong><br>Bathrooms
+              <strong>${escapeHtml(data.bathrooms)}</strong><br>Bathrooms
             </div>
             <div class="feature">
-              <strong>${data.area_sqft}</strong><br>Sq. Ft
+              <strong>${escapeHtml(data.area_sqft)}</strong><br>Sq. Ft
             </div>
           </div>
           <p>
-            <a href="${process.env.NEXT_PUBLIC_SITE_URL}/properties/${data.slug}" 
+            <a href="${process.env.NEXT_PUBLIC_SITE_URL}/properties/${encodeURIComponent(data.slug || '')}" 
                style="background: #FF6B6B; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block;">
               View Property
             </a>
@@ -312,10 +294,10 @@ function generatePropertyUpdateEmail(data: any) {
         </div>
         <div class="content">
           <p>The property you're interested in has been updated:</p>
-          <h2>${data.title}</h2>
-          <p>📍 ${data.location}, ${data.city}</p>
+          <h2>${escapeHtml(data.title)}</h2>
+          <p>📍 ${escapeHtml(data.location)}, ${escapeHtml(data.city)}</p>
           <p>
-            <a href="${process.env.NEXT_PUBLIC_SITE_URL}/properties/${data.slug}" 
+            <a href="${process.env.NEXT_PUBLIC_SITE_URL}/properties/${encodeURIComponent(data.slug || '')}" 
                style="background: #FF6B6B; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block;">
               View Updated Details
             </a>
@@ -348,7 +330,7 @@ function generateSubscriptionReminderEmail(data: any) {
           <h1>⏰ Subscription Reminder</h1>
         </div>
         <div class="content">
-          <p>Dear ${data.name},</p>
+          <p>Dear ${escapeHtml(data.name)},</p>
           <p>Your subscription is expiring soon. Renew now to continue enjoying premium features.</p>
           <p>
             <a href="${process.env.NEXT_PUBLIC_SITE_URL}/admin/settings" 
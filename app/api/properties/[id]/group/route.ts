@@ -1,12 +1,13 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createClient, createAdminClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
 
 export async function GET(
   request: NextRequest,
   { params }: { params: { id: string } }
 ) {
   try {
-    const supabase = await createClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
 
     // Resolve property ID if it's a slug
     let propertyId = params.id
@@ -59,12 +60,13 @@ export async function POST(
   { params }: { params: { id: string } }
 ) {
   try {
-    const supabase = await createClient()
-    const adminSupabase = await createAdminClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
+    const adminSupabase = await context.admin()
 
     // Get current user
-    const { data: { user }, error: authError } = await supabase.auth.getUser()
-    if (authError || !user) {
+    const user = await context.user()
+    if (!user) {
       return NextResponse.json(
         { error: 'Authentication required' },
         { status: 401 }
@@ -1,8 +1,9 @@
 import { NextRequest } from 'next/server'
 import { createClient } from '@/lib/supabase/server'
 import { successResponse, errorResponse, handleApiError } from '@/lib/api/utils'
+import { withServerTiming } from '@/lib/api/server-timing'
 
-export async function GET(
+export const GET = withServerTiming(async function GET(
   request: NextRequest,
   { params }: { params: { id: string } }
 ) {
@@ -36,4 +37,4 @@ export async function GET(
   } catch (error) {
     return handleApiError(error)
   }
-}
+})
@@ -2,62 +2,132 @@ import { NextRequest } from 'next/server'
 import { createClient } from '@/lib/supabase/server'
 import {
   successResponse,
+  errorResponse,
   handleApiError,
   getPaginationParams,
   createPaginatedResponse,
+  createCursorPaginatedResponse,
+  decodeCursor,
+  keysetFilter,
 } from '@/lib/api/utils'
+import { processCache } from '@/lib/utils/ttl-cache'
+import { withServerTiming } from '@/lib/api/server-timing'
 
 export const dynamic = 'force-dynamic'
 
-export async function GET(request: NextRequest) {
+// How long `count=cached` totals are reused per filter combination
+const COUNT_CACHE_TTL_MS = parseInt(process.env.PROPERTY_COUNT_CACHE_TTL_MS || '60000')
+
+const countCache = processCache<string, number>('properties-count', COUNT_CACHE_TTL_MS)
+
+type CountMode = 'exact' | 'estimated' | 'cached' | 'none'
+
+const COUNT_MODES: CountMode[] = ['exact', 'estimated', 'cached', 'none']
+
+/**
+ * GET /api/properties
+ *
+ * Offset mode (default): `?page=&limit=`, exact total
+ * Cursor mode: `?cursor=` (empty for the first page, then `nextCursor`)
+ * `?count=exact|estimated|cached|none` picks how the total is computed;
+ * cursor mode defaults to none, which offset mode does not allow
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
   try {
     const supabase = await createClient()
     const searchParams = request.nextUrl.searchParams
     const { page = 1, limit = 10 } = getPaginationParams(request)
 
+    const cursorParam = searchParams.get('cursor')
+    const useCursor = cursorParam !== null
+    const cursor = cursorParam ? decodeCursor(cursorParam) : null
+    if (cursorParam && !cursor) {
+      return errorResponse('Invalid cursor', 400)
+    }
+
+    const countMode = (searchParams.get('count') || (useCursor ? 'none' : 'exact')) as CountMode
+    if (!COUNT_MODES.includes(countMode)) {
+      return errorResponse(`count must be one of ${COUNT_MODES.join(', ')}`, 400)
+    }
+    if (countMode === 'none' && !useCursor) {
+      return errorResponse('count=none requires cursor pagination', 400)
+    }
+
     // Get filters from query params
-    const categoryId = searchParams.get('categoryId')
-    const location = searchParams.get('location')
-    const minPrice = searchParams.get('minPrice')
-    const maxPrice = searchParams.get('maxPrice')
-    const bedrooms = searchParams.get('bedrooms')
-    const propertyType = searchParams.get('propertyType')
-    const status = searchParams.get('status') || 'available'
+    const filters = {
+      categoryId: searchParams.get('categoryId'),
+      location: searchParams.get('location'),
+      minPrice: searchParams.get('minPrice'),
+      maxPrice: searchParams.get('maxPrice'),
+      bedrooms: searchParams.get('bedrooms'),
+      propertyType: searchParams.get('propertyType'),
+      status: searchParams.get('status') || 'available',
+    }
+
+    const applyFilters = (query: any) => {
+      query = query.eq('status', filters.status)
+      if (filters.categoryId) query = query.eq('category_id', filters.categoryId)
+      // Served by the trigram index on location
+      if (filters.location) query = query.ilike('location', `%${filters.location}%`)
+      if (filters.minPrice) query = query.gte('price', parseFloat(filters.minPrice))
+      if (filters.maxPrice) query = query.lte('price', parseFloat(filters.maxPrice))
+      if (filters.bedrooms) query = query.eq('bedrooms', parseInt(filters.bedrooms))
+      if (filters.propertyType) query = query.eq('property_type', filters.propertyType)
+      return query
+    }
+
+    const inlineCount = countMode === 'exact' || countMode === 'estimated'
 
     // Build query
-    let query = supabase
-      .from('properties')
-      .select(
-        `
-        *,
-        category:categories(*),
-        images:property_images(*)
-      `,
-        { count: 'exact' }
-      )
-      .eq('status', status)
+    let query = applyFilters(
+      supabase
+        .from('properties')
+        .select(
+          `
+          *,
+          category:categories(*),
+          images:property_images(*)
+        `,
+          inlineCount ? { count: countMode } : undefined
+        )
+    )
       .order('created_at', { ascending: false })
-
-    // Apply filters
-    if (categoryId) query = query.eq('category_id', categoryId)
-    if (location) query = query.ilike('location', `%${location}%`)
-    if (minPrice) query = query.gte('price', parseFloat(minPrice))
-    if (maxPrice) query = query.lte('price', parseFloat(maxPrice))
-    if (bedrooms) query = query.eq('bedrooms', parseInt(bedrooms))
-    if (propertyType) query = query.eq('property_type', propertyType)
+      .order('id', { ascending: false })
 
     // Apply pagination
-    const from = (page - 1) * limit
-    const to = from + limit - 1
-    query = query.range(from, to)
+    if (useCursor) {
+      if (cursor) query = query.or(keysetFilter(cursor))
+      query = query.limit(limit + 1)
+    } else {
+      const from = (page - 1) * limit
+      const to = from + limit - 1
+      query = query.range(from, to)
+    }
 
-    const { data, error, count } = await query
+    const [{ data, error, count }, cachedTotal] = await Promise.all([
+      query,
+      countMode === 'cached'
+        ? countCache.get(JSON.stringify(filters), async () => {
+            const { count: total, error: countError } = await applyFilters(
+              supabase.from('properties').select('id', { count: 'exact', head: true })
+            )
+            if (countError) throw countError
+            return total || 0
+          })
+        : Promise.resolve(null),
+    ])
 
     if (error) throw error
 
+    const total = countMode === 'none' ? null : inlineCount ? count : cachedTotal
+
+    if (useCursor) {
+      return successResponse(createCursorPaginatedResponse(data || [], limit, total))
+    }
+
     const paginatedResponse = createPaginatedResponse(
       data || [],
-      count || 0,
+      total || 0,
       page,
       limit
     )
@@ -66,4 +136,4 @@ export async function GET(request: NextRequest) {
   } catch (error) {
     return handleApiError(error)
   }
-}
+})
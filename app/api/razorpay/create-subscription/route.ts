@@ -1,4 +1,4 @@
-import { createClient } from '@/lib/supabase/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
 import { NextResponse } from 'next/server'
 import Razorpay from 'razorpay'
 
@@ -17,11 +17,12 @@ function getRazorpay() {
 export async function POST(request: Request) {
   try {
     const razorpay = getRazorpay()
-    const supabase = await createClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
     
-    const { data: { user }, error: userError } = await supabase.auth.getUser()
+    const user = await context.user()
     
-    if (userError || !user) {
+    if (!user) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -0,0 +1,39 @@
+import { createClient } from '@supabase/supabase-js'
+import { NextResponse } from 'next/server'
+import { processWebhookEvents } from '@/lib/services/razorpay-webhooks'
+
+export const dynamic = 'force-dynamic'
+
+/**
+ * Drain the Razorpay webhook queue
+ * For a scheduler (cron) or where background work after a response is not
+ * kept alive; also picks up events whose retry backoff has passed.
+ * Requires `Authorization: Bearer $API_SECRET_KEY`.
+ */
+async function handler(request: Request) {
+  const secret = process.env.API_SECRET_KEY
+  if (!secret || request.headers.get('authorization') !== `Bearer ${secret}`) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+  }
+
+  try {
+    const supabase = createClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.SUPABASE_SERVICE_ROLE_KEY!,
+      { auth: { autoRefreshToken: false, persistSession: false } }
+    )
+    const result = await processWebhookEvents(supabase, 50)
+    return NextResponse.json(result)
+  } catch (error: any) {
+    console.error('Error processing webhook queue:', error)
+    return NextResponse.json({ error: error.message || 'Processing failed' }, { status: 500 })
+  }
+}
+
+export async function GET(request: Request) {
+  return handler(request)
+}
+
+export async function POST(request: Request) {
+  return handler(request)
+}
@@ -1,6 +1,6 @@
-import { createClient, SupabaseClient } from '@supabase/supabase-js'
+import { createClient } from '@supabase/supabase-js'
 import { NextResponse } from 'next/server'
-import crypto from 'crypto'
+import { drainWebhookQueue, enqueueWebhookEvent, verifyWebhookSignature } from '@/lib/services/razorpay-webhooks'
 
 // Lazy initialize Supabase to avoid build-time errors
 function getSupabaseAdmin() {
@@ -19,15 +19,11 @@ function getSupabaseAdmin() {
   })
 }
 
-function verifyWebhookSignature(body: string, signature: string, secret: string): boolean {
-  const expectedSignature = crypto
-    .createHmac('sha256', secret)
-    .update(body)
-    .digest('hex')
-  
-  return expectedSignature === signature
-}
-
+/**
+ * Verify, store and acknowledge; events are applied by the queue worker
+ * (lib/services/razorpay-webhooks.ts), so Razorpay gets its 200 quickly and
+ * redeliveries are no-ops
+ */
 export async function POST(request: Request) {
   try {
     const supabase = getSupabaseAdmin()
@@ -46,167 +42,21 @@ export async function POST(request: Request) {
       return NextResponse.json({ error: 'Invalid signature' }, { status: 401 })
     }
 
-    const event = JSON.parse(body)
-    const { event: eventType, payload } = event
-
-    console.log(`Razorpay webhook: ${eventType}`)
-
-    switch (eventType) {
-      case 'subscription.activated':
-        await handleSubscriptionActivated(supabase, payload.subscription.entity)
-        break
-
-      case 'subscription.charged':
-        await handleSubscriptionCharged(supabase, payload.payment.entity, payload.subscription.entity)
-        break
-
-      case 'subscription.cancelled':
-        await handleSubscriptionCancelled(supabase, payload.subscription.entity)
-        break
-
-      case 'subscription.completed':
-        await handleSubscriptionCompleted(supabase, payload.subscription.entity)
-        break
-
-      case 'subscription.paused':
-        await handleSubscriptionPaused(supabase, payload.subscription.entity)
-        break
-
-      case 'subscription.resumed':
-        await handleSubscriptionResumed(supabase, payload.subscription.entity)
-        break
-
-      case 'payment.failed':
-        await handlePaymentFailed(payload.payment.entity)
-        break
+    const { duplicate } = await enqueueWebhookEvent(
+      supabase,
+      body,
+      request.headers.get('x-razorpay-event-id')
+    )
 
-      default:
-        console.log(`Unhandled event type: ${eventType}`)
-    }
+    if (!duplicate) drainWebhookQueue(supabase)
 
-    return NextResponse.json({ received: true })
+    return NextResponse.json({ received: true, duplicate })
   } catch (error) {
     console.error('Webhook error:', error)
+    // Not stored, so Razorpay should retry
     return NextResponse.json(
       { error: 'Webhook processing failed' },
       { status: 500 }
     )
   }
 }
-
-async function handleSubscriptionActivated(supabase: SupabaseClient, subscription: any) {
-  try {
-    const { data, error } = await supabase
-      .from('user_subscriptions')
-      .update({
-        status: 'active',
-        current_period_start: new Date(subscription.start_at * 1000).toISOString(),
-        current_period_end: new Date(subscription.end_at * 1000).toISOString(),
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    if (error) throw error
-    console.log('Subscription activated:', subscription.id)
-  } catch (error) {
-    console.error('Error activating subscription:', error)
-  }
-}
-
-async function handleSubscriptionCharged(supabase: SupabaseClient, payment: any, subscription: any) {
-  try {
-    // Update subscription period dates
-    await supabase
-      .from('user_subscriptions')
-      .update({
-        current_period_start: new Date(subscription.current_start * 1000).toISOString(),
-        current_period_end: new Date(subscription.current_end * 1000).toISOString(),
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    console.log('Subscription charged:', subscription.id, 'Payment:', payment.id)
-  } catch (error) {
-    console.error('Error processing subscription charge:', error)
-  }
-}
-
-async function handleSubscriptionCancelled(supabase: SupabaseClient, subscription: any) {
-  try {
-    const { data, error } = await supabase
-      .from('user_subscriptions')
-      .update({
-        status: 'cancelled',
-        cancelled_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    if (error) throw error
-    console.log('Subscription cancelled:', subscription.id)
-  } catch (error) {
-    console.error('Error cancelling subscription:', error)
-  }
-}
-
-async function handleSubscriptionCompleted(supabase: SupabaseClient, subscription: any) {
-  try {
-    const { data, error } = await supabase
-      .from('user_subscriptions')
-      .update({
-        status: 'expired',
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    if (error) throw error
-    console.log('Subscription completed:', subscription.id)
-  } catch (error) {
-    console.error('Error completing subscription:', error)
-  }
-}
-
-async function handleSubscriptionPaused(supabase: SupabaseClient, subscription: any) {
-  try {
-    const { data, error } = await supabase
-      .from('user_subscriptions')
-      .update({
-        status: 'suspended',
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    if (error) throw error
-    console.log('Subscription paused:', subscription.id)
-  } catch (error) {
-    console.error('Error pausing subscription:', error)
-  }
-}
-
-async function handleSubscriptionResumed(supabase: SupabaseClient, subscription: any) {
-  try {
-    const { data, error } = await supabase
-      .from('user_subscriptions')
-      .update({
-        status: 'active',
-        updated_at: new Date().toISOString()
-      })
-      .eq('razorpay_subscription_id', subscription.id)
-
-    if (error) throw error
-    console.log('Subscription resumed:', subscription.id)
-  } catch (error) {
-    console.error('Error resuming subscription:', error)
-  }
-}
-
-async function handlePaymentFailed(payment: any) {
-  try {
-    console.log('Payment failed:', payment.id, 'for subscription:', payment.subscription_id)
-    
-    // Optionally update subscription status or send notification
-    // You might want to suspend the subscription after multiple failed payments
-  } catch (error) {
-    console.error('Error handling payment failure:', error)
-  }
-}
@@ -1,32 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createServerClient } from '@supabase/ssr'
-import { cookies } from 'next/headers'
+import { cachedJsonResponse, getReferenceClient } from '@/lib/api/reference-cache'
 
+// Cached in-process with ETag / stale-while-revalidate (see lib/api/reference-cache)
 export const dynamic = 'force-dynamic'
 
 export async function GET(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
-
-        const { data: cities, error } = await supabase
-            .from('cities')
-            .select('id, name, state')
-            .eq('is_active', true)
-            .order('display_order')
+        return await cachedJsonResponse(request, 'cities', async () => {
+            const { data: cities, error } = await getReferenceClient()
+                .from('cities')
+                .select('id, name, state')
+                .eq('is_active', true)
+                .order('display_order')
 
-        if (error) throw error
+            if (error) throw error
 
-        return NextResponse.json({ cities: cities || [] })
+            return { cities: cities || [] }
+        })
     } catch (error: any) {
         console.error('Error fetching cities:', error)
         return NextResponse.json(
@@ -1,32 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createServerClient } from '@supabase/ssr'
-import { cookies } from 'next/headers'
+import { cachedJsonResponse, getReferenceClient } from '@/lib/api/reference-cache'
 
+// Cached in-process with ETag / stale-while-revalidate (see lib/api/reference-cache)
 export const dynamic = 'force-dynamic'
 
 export async function GET(request: NextRequest) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
-
-        const { data: configurations, error } = await supabase
-            .from('property_configurations')
-            .select('id, name')
-            .eq('is_active', true)
-            .order('display_order')
+        return await cachedJsonResponse(request, 'configurations', async () => {
+            const { data: configurations, error } = await getReferenceClient()
+                .from('property_configurations')
+                .select('id, name')
+                .eq('is_active', true)
+                .order('display_order')
 
-        if (error) throw error
+            if (error) throw error
 
-        return NextResponse.json({ configurations: configurations || [] })
+            return { configurations: configurations || [] }
+        })
     } catch (error: any) {
         console.error('Error fetching configurations:', error)
         return NextResponse.json(
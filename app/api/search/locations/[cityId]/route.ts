@@ -1,34 +1,30 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { createServerClient } from '@supabase/ssr'
-import { cookies } from 'next/headers'
+import { cachedJsonResponse, getReferenceClient } from '@/lib/api/reference-cache'
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
 
 export async function GET(
     request: NextRequest,
     { params }: { params: { cityId: string } }
 ) {
     try {
-        const supabase = createServerClient(
-            process.env.NEXT_PUBLIC_SUPABASE_URL!,
-            process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-            {
-                cookies: {
-                    get(name: string) {
-                        return cookies().get(name)?.value
-                    },
-                },
-            }
-        )
+        // Only well-formed ids reach the cache, so arbitrary paths cannot grow it
+        if (!UUID_PATTERN.test(params.cityId)) {
+            return NextResponse.json({ error: 'Invalid city id' }, { status: 400 })
+        }
 
-        const { data: locations, error } = await supabase
-            .from('city_locations')
-            .select('id, name')
-            .eq('city_id', params.cityId)
-            .eq('is_active', true)
-            .order('display_order')
+        return await cachedJsonResponse(request, `locations:${params.cityId}`, async () => {
+            const { data: locations, error } = await getReferenceClient()
+                .from('city_locations')
+                .select('id, name')
+                .eq('city_id', params.cityId)
+                .eq('is_active', true)
+                .order('display_order')
 
-        if (error) throw error
+            if (error) throw error
 
-        return NextResponse.json({ locations: locations || [] })
+            return { locations: locations || [] }
+        })
     } catch (error: any) {
         console.error('Error fetching locations:', error)
         return NextResponse.json(
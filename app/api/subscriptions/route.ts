@@ -1,15 +1,17 @@
-import { createClient } from '@/lib/supabase/server'
-import { NextResponse } from 'next/server'
+import { getRequestContext } from '@/lib/supabase/request-context'
+import { NextRequest, NextResponse } from 'next/server'
+import { getUsageCount } from '@/lib/services/usage-counters'
 
 export const dynamic = 'force-dynamic'
 
-export async function GET() {
+export async function GET(request: NextRequest) {
   try {
-    const supabase = await createClient()
+    const context = getRequestContext(request)
+    const supabase = await context.supabase()
 
-    const { data: { user }, error: userError } = await supabase.auth.getUser()
+    const user = await context.user()
 
-    if (userError || !user) {
+    if (!user) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -42,17 +44,8 @@ export async function GET() {
       })
     }
 
-    // Calculate current month usage
-    const startOfMonth = new Date()
-    startOfMonth.setDate(1)
-    startOfMonth.setHours(0, 0, 0, 0)
-
-    const { count: analysesCount } = await supabase
-      .from('subscription_usage_logs')
-      .select('*', { count: 'exact', head: true })
-      .eq('user_id', user.id)
-      .eq('usage_type', 'ai_analysis')
-      .gte('created_at', startOfMonth.toISOString())
+    // Current month usage
+    const analysesCount = await getUsageCount(supabase, user.id, 'ai_analysis')
 
     const { count: propertiesCount } = await supabase
       .from('user_ai_assistant')
@@ -64,7 +57,7 @@ export async function GET() {
       // @ts-ignore
       plan: subscription.plan,
       usage: {
-        analyses_used: analysesCount || 0,
+        analyses_used: analysesCount,
         // @ts-ignore
         analyses_limit: subscription.plan.analyses_per_month,
         properties_in_comparison: propertiesCount || 0,
@@ -11,8 +11,26 @@ import { TestimonialsMarquee } from '@/components/home/TestimonialsMarquee';
 import { ByTheNumbersSection } from '@/components/home/ByTheNumbersSection';
 import { BlogInsightsSection } from '@/components/home/BlogInsightsSection';
 import { CTASection } from '@/components/home/CTASection';
+import { getApprovedTestimonials, getPublishedPosts } from '@/lib/services/content-pages';
+
+// Served from the route cache; publishing or editing testimonials and blog
+// posts revalidates it (lib/services/revalidation.ts)
+export const revalidate = 3600;
+
+// A failed read hides the section, as before, rather than failing the page
+function orEmpty(section: string) {
+  return (error: unknown) => {
+    console.error(`Error loading home page ${section}:`, error);
+    return [];
+  };
+}
+
+export default async function HomePage() {
+  const [testimonials, posts] = await Promise.all([
+    getApprovedTestimonials().catch(orEmpty('testimonials')),
+    getPublishedPosts(3).catch(orEmpty('blog posts')),
+  ]);
 
-export default function HomePage() {
   return (
     <>
       <Header />
@@ -26,9 +44,9 @@ export default function HomePage() {
         <AICommitteeSection />
         <HowItWorksSection />
         <ServicesSection />
-        <TestimonialsMarquee />
+        <TestimonialsMarquee testimonials={testimonials} />
         <ByTheNumbersSection />
-        <BlogInsightsSection />
+        <BlogInsightsSection posts={posts} />
         <CTASection />
       </main>
       <Footer />
@@ -11,11 +11,13 @@ import {
   getFilteredRowModel,
   getPaginationRowModel,
   getSortedRowModel,
+  PaginationState,
   useReactTable,
 } from "@tanstack/react-table"
 import { ChevronDown, ChevronUp, ChevronsUpDown } from "lucide-react"
 
 import { cn } from "@/lib/utils/cn"
+import { useDebounce } from "@/lib/hooks/useDebounce"
 import { Button } from "@/components/ui/Button"
 import {
   Table,
@@ -32,12 +34,64 @@ import {
   DropdownMenuTrigger,
 } from "@/components/ui/dropdown-menu"
 
+// Page, sort and search requested from the server in server-side mode
+export interface DataTableQuery {
+  pageIndex: number
+  pageSize: number
+  sorting: SortingState
+  search: string
+}
+
 interface DataTableProps<TData, TValue> {
   columns: ColumnDef<TData, TValue>[]
   data: TData[]
   searchKey?: string
   searchPlaceholder?: string
   onRowClick?: (row: TData) => void
+  // Server-side mode: `data` is the current page and the caller refetches
+  // whenever the query changes; `rowCount` is the total across all pages
+  onQueryChange?: (query: DataTableQuery) => void
+  rowCount?: number
+  loading?: boolean
+  pageSizeOptions?: number[]
+  // Pages longer than this only render the rows scrolled into view
+  virtualizeAfter?: number
+  estimatedRowHeight?: number
+}
+
+const VIRTUAL_OVERSCAN = 8
+
+/**
+ * Rows of a fixed-height list that intersect the scroll container's viewport
+ */
+function useVisibleRange(
+  container: React.RefObject<HTMLDivElement>,
+  count: number,
+  rowHeight: number,
+  enabled: boolean
+) {
+  const [viewport, setViewport] = React.useState({ scrollTop: 0, height: 800 })
+
+  React.useEffect(() => {
+    const element = container.current
+    if (!enabled || !element) return
+
+    const update = () => setViewport({ scrollTop: element.scrollTop, height: element.clientHeight })
+
+    update()
+    element.addEventListener("scroll", update, { passive: true })
+    window.addEventListener("resize", update)
+    return () => {
+      element.removeEventListener("scroll", update)
+      window.removeEventListener("resize", update)
+    }
+  }, [container, enabled])
+
+  if (!enabled) return { start: 0, end: count }
+
+  const start = Math.max(0, Math.floor(viewport.scrollTop / rowHeight) - VIRTUAL_OVERSCAN)
+  const end = Math.min(count, start + Math.ceil(viewport.height / rowHeight) + VIRTUAL_OVERSCAN * 2)
+  return { start, end }
 }
 
 export function DataTable<TData, TValue>({
@@ -46,21 +100,55 @@ export function DataTable<TData, TValue>({
   searchKey,
   searchPlaceholder = "Search...",
   onRowClick,
+  onQueryChange,
+  rowCount,
+  loading = false,
+  pageSizeOptions,
+  virtualizeAfter = 100,
+  estimatedRowHeight = 64,
 }: DataTableProps<TData, TValue>) {
+  const serverSide = !!onQueryChange
+  const sizes = pageSizeOptions || (serverSide ? [50, 100, 250, 500] : [10, 20, 30, 40, 50])
+
   const [sorting, setSorting] = React.useState<SortingState>([])
   const [columnFilters, setColumnFilters] = React.useState<ColumnFiltersState>([])
   const [columnVisibility, setColumnVisibility] = React.useState<VisibilityState>({})
   const [rowSelection, setRowSelection] = React.useState({})
+  const [pagination, setPagination] = React.useState<PaginationState>({
+    pageIndex: 0,
+    pageSize: sizes[0],
+  })
+  const [search, setSearch] = React.useState("")
+  const [searchQuery, setSearchQuery] = React.useState("")
+  const debouncedSearch = useDebounce(search, 300)
+
+  // A new search or sort order starts again from the first page
+  const firstPage = () => setPagination((current) => ({ ...current, pageIndex: 0 }))
+
+  React.useEffect(() => {
+    setSearchQuery(debouncedSearch)
+    firstPage()
+  }, [debouncedSearch])
+
+  const handleSortingChange: typeof setSorting = (updater) => {
+    setSorting(updater)
+    if (serverSide) firstPage()
+  }
 
   const table = useReactTable({
     data,
     columns,
-    onSortingChange: setSorting,
+    onSortingChange: handleSortingChange,
     onColumnFiltersChange: setColumnFilters,
+    onPaginationChange: setPagination,
     getCoreRowModel: getCoreRowModel(),
-    getPaginationRowModel: getPaginationRowModel(),
-    getSortedRowModel: getSortedRowModel(),
-    getFilteredRowModel: getFilteredRowModel(),
+    getPaginationRowModel: serverSide ? undefined : getPaginationRowModel(),
+    getSortedRowModel: serverSide ? undefined : getSortedRowModel(),
+    getFilteredRowModel: serverSide ? undefined : getFilteredRowModel(),
+    manualPagination: serverSide,
+    manualSorting: serverSide,
+    manualFiltering: serverSide,
+    rowCount: serverSide ? rowCount ?? data.length : undefined,
     onColumnVisibilityChange: setColumnVisibility,
     onRowSelectionChange: setRowSelection,
     state: {
@@ -68,14 +156,46 @@ export function DataTable<TData, TValue>({
       columnFilters,
       columnVisibility,
       rowSelection,
+      pagination,
     },
   })
 
+  React.useEffect(() => {
+    onQueryChange?.({
+      pageIndex: pagination.pageIndex,
+      pageSize: pagination.pageSize,
+      sorting,
+      search: searchQuery,
+    })
+    // onQueryChange is usually an inline callback; only the query matters
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [pagination.pageIndex, pagination.pageSize, sorting, searchQuery])
+
+  const rows = table.getRowModel().rows
+  const scrollRef = React.useRef<HTMLDivElement>(null)
+  const virtualize = rows.length > virtualizeAfter
+  const { start, end } = useVisibleRange(scrollRef, rows.length, estimatedRowHeight, virtualize)
+  const visibleRows = virtualize ? rows.slice(start, end) : rows
+  const paddingTop = virtualize ? start * estimatedRowHeight : 0
+  const paddingBottom = virtualize ? (rows.length - end) * estimatedRowHeight : 0
+
+  // Each new page starts at its first row
+  React.useEffect(() => {
+    if (scrollRef.current) scrollRef.current.scrollTop = 0
+  }, [data])
+
   return (
     <div className="space-y-4">
       {/* Toolbar */}
       <div className="flex items-center justify-between">
-        {searchKey && (
+        {serverSide ? (
+          <input
+            placeholder={searchPlaceholder}
+            value={search}
+            onChange={(event) => setSearch(event.target.value)}
+            className="h-11 w-[280px] rounded-lg border border-gray-300 bg-white px-4 py-2 text-sm focus:outline-none focus:ring-2 focus:ring-coral focus:border-coral placeholder:text-gray-400"
+          />
+        ) : searchKey && (
           <input
             placeholder={searchPlaceholder}
             value={(table.getColumn(searchKey)?.getFilterValue() as string) ?? ""}
@@ -114,7 +234,14 @@ export function DataTable<TData, TValue>({
       </div>
 
       {/* Table */}
-      <div className="rounded-xl border border-gray-200 bg-white overflow-hidden shadow-sm">
+      <div
+        ref={scrollRef}
+        className={cn(
+          "rounded-xl border border-gray-200 bg-white overflow-hidden shadow-sm",
+          virtualize && "max-h-[70vh] overflow-y-auto",
+          loading && "opacity-60"
+        )}
+      >
         <Table>
           <TableHeader>
             {table.getHeaderGroups().map((headerGroup) => (
@@ -135,8 +262,11 @@ export function DataTable<TData, TValue>({
             ))}
           </TableHeader>
           <TableBody>
-            {table.getRowModel().rows?.length ? (
-              table.getRowModel().rows.map((row) => (
+            {paddingTop > 0 && (
+              <tr aria-hidden style={{ height: paddingTop }} />
+            )}
+            {rows.length ? (
+              visibleRows.map((row) => (
                 <TableRow
                   key={row.id}
                   data-state={row.getIsSelected() && "selected"}
@@ -159,10 +289,13 @@ export function DataTable<TData, TValue>({
                   colSpan={columns.length}
                   className="h-24 text-center"
                 >
-                  No results.
+                  {loading ? "Loading..." : "No results."}
                 </TableCell>
               </TableRow>
             )}
+            {paddingBottom > 0 && (
+              <tr aria-hidden style={{ height: paddingBottom }} />
+            )}
           </TableBody>
         </Table>
       </div>
@@ -171,8 +304,14 @@ export function DataTable<TData, TValue>({
       <div className="bg-white border border-gray-200 rounded-xl p-4">
         <div className="flex items-center justify-between">
           <div className="flex items-center text-sm text-gray-600">
-            {table.getFilteredSelectedRowModel().rows.length} of{" "}
-            {table.getFilteredRowModel().rows.length} row(s) selected.
+            {serverSide ? (
+              <>{table.getRowCount().toLocaleString()} row(s)</>
+            ) : (
+              <>
+                {table.getFilteredSelectedRowModel().rows.length} of{" "}
+                {table.getFilteredRowModel().rows.length} row(s) selected.
+              </>
+            )}
           </div>
           <div className="flex items-center space-x-6">
             <div className="flex items-center space-x-2">
@@ -184,7 +323,7 @@ export function DataTable<TData, TValue>({
                 }}
                 className="h-9 w-[70px] rounded-lg border border-gray-300 bg-white px-2 text-sm focus:outline-none focus:ring-2 focus:ring-coral focus:border-coral"
               >
-                {[10, 20, 30, 40, 50].map((pageSize) => (
+                {sizes.map((pageSize) => (
                   <option key={pageSize} value={pageSize}>
                     {pageSize}
                   </option>
@@ -194,7 +333,7 @@ export function DataTable<TData, TValue>({
           </div>
           <div className="flex items-center justify-center text-sm font-medium text-gray-700 min-w-[100px]">
             Page {table.getState().pagination.pageIndex + 1} of{" "}
-            {table.getPageCount()}
+            {Math.max(1, table.getPageCount())}
           </div>
           <div className="flex items-center space-x-2">
             <Button
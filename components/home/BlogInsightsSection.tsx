@@ -1,16 +1,15 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React from 'react';
 import Image from 'next/image';
 import Link from 'next/link';
 import { ArrowRight, Clock } from 'lucide-react';
 import { Section } from '../ui/Section';
 import { Card } from '../ui/Card';
 import { Badge } from '../ui/Badge';
-import { getSupabaseClient } from '@/lib/supabase/client';
 import { formatDate } from '@/lib/utils';
 
-interface BlogPost {
+export interface BlogPost {
   id: string;
   title: string;
   slug: string;
@@ -21,44 +20,11 @@ interface BlogPost {
   users: { full_name?: string };
 }
 
-export const BlogInsightsSection: React.FC = () => {
-  const [posts, setPosts] = useState<BlogPost[]>([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    fetchPosts();
-  }, []);
-
-  async function fetchPosts() {
-    try {
-      const supabase = getSupabaseClient();
-      const { data, error } = await supabase
-        .from('blog_posts')
-        .select('*, users(full_name)')
-        .eq('status', 'published')
-        .not('published_at', 'is', null)
-        .order('published_at', { ascending: false })
-        .limit(3);
-
-      if (error) throw error;
-      setPosts(data || []);
-    } catch (error) {
-      console.error('Error fetching posts:', error);
-    } finally {
-      setLoading(false);
-    }
-  }
-
-  if (loading) {
-    return (
-      <Section background="peach" className="py-24 lg:py-32">
-        <div className="flex justify-center items-center h-64">
-          <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-coral"></div>
-        </div>
-      </Section>
-    );
-  }
-
+/**
+ * Latest published posts, loaded on the server with the home page
+ * (lib/services/content-pages.ts) and cached with it
+ */
+export const BlogInsightsSection: React.FC<{ posts: BlogPost[] }> = ({ posts }) => {
   if (posts.length === 0) return null;
 
   const featuredPost = posts[0];
@@ -1,11 +1,10 @@
 'use client'
 
-import React, { useEffect, useState } from 'react'
+import React from 'react'
 import { motion } from 'framer-motion'
 import { Star, Quote } from 'lucide-react'
-import { getSupabaseClient } from '@/lib/supabase/client'
 
-interface Testimonial {
+export interface Testimonial {
   id: string
   full_name: string
   role: string | null
@@ -16,46 +15,13 @@ interface Testimonial {
   is_featured: boolean
 }
 
-export const TestimonialsMarquee: React.FC = () => {
-  const [testimonials, setTestimonials] = useState<Testimonial[]>([])
-  const [loading, setLoading] = useState(true)
-
-  useEffect(() => {
-    fetchTestimonials()
-  }, [])
-
-  async function fetchTestimonials() {
-    try {
-      const supabase = getSupabaseClient()
-      const { data, error } = await supabase
-        .from('testimonials')
-        .select('*')
-        .eq('is_approved', true)
-        .order('display_order', { ascending: true })
-
-      if (error) throw error
-      
-      // Duplicate testimonials for seamless loop
-      setTestimonials(data ? [...data, ...data] : [])
-    } catch (error) {
-      console.error('Error fetching testimonials:', error)
-    } finally {
-      setLoading(false)
-    }
-  }
-
-  if (loading) {
-    return (
-      <section className="py-16 bg-gray-50 overflow-hidden">
-        <div className="text-center mb-12">
-          <div className="inline-flex items-center gap-2 px-4 py-2 bg-black rounded-full mb-6">
-            <Star className="w-4 h-4 text-yellow-400 fill-yellow-400" />
-            <span className="text-white text-sm font-medium">Loading testimonials...</span>
-          </div>
-        </div>
-      </section>
-    )
-  }
+/**
+ * Approved testimonials, loaded on the server with the home page
+ * (lib/services/content-pages.ts) and cached with it
+ */
+export const TestimonialsMarquee: React.FC<{ testimonials: Testimonial[] }> = ({ testimonials: approved }) => {
+  // Duplicate testimonials for seamless loop
+  const testimonials = [...approved, ...approved]
 
   if (testimonials.length === 0) {
     return null
@@ -0,0 +1,237 @@
+import { SupabaseClient } from '@supabase/supabase-js'
+import { Cursor, keysetFilter, searchFilter } from '@/lib/api/utils'
+
+/**
+ * Streaming CSV exports for admin tables
+ *
+ * Rows are read in keyset-paginated chunks and written to the response as
+ * they arrive. The next chunk is only fetched once the client has consumed
+ * the previous one, so memory stays at one chunk whatever the export size.
+ */
+
+const CHUNK_SIZE = parseInt(process.env.EXPORT_CHUNK_SIZE || '5000')
+
+interface ExportColumn {
+  header: string
+  value: (row: any) => unknown
+}
+
+interface ExportDataset {
+  table: string
+  select: string
+  // Timestamp the export is ordered by, newest first, with id as tiebreaker
+  orderColumn: string
+  columns: ExportColumn[]
+  filter?: (query: any, params: URLSearchParams) => any
+  // Adds related fields to each chunk before it is written
+  enrich?: (supabase: SupabaseClient, rows: any[]) => Promise<any[]>
+}
+
+const LEAD_CHANNELS = ['investment', 'group', 'contact', 'other']
+
+function dateRange(query: any, params: URLSearchParams, column: string) {
+  const from = params.get('from')
+  const to = params.get('to')
+  if (from && !isNaN(Date.parse(from))) query = query.gte(column, new Date(from).toISOString())
+  if (to && !isNaN(Date.parse(to))) query = query.lte(column, new Date(to + 'T23:59:59').toISOString())
+  return query
+}
+
+function search(query: any, params: URLSearchParams, columns: string[]) {
+  const term = (params.get('q') || '').replace(/[%_*,()"\\]/g, ' ').trim().slice(0, 100)
+  return term ? query.or(searchFilter(columns, term)) : query
+}
+
+/**
+ * Property title and location, and assignee name, for a chunk of leads
+ * The lead inbox view cannot embed relations, so they are looked up by id
+ * as in /api/admin/leads (at most one chunk of each)
+ */
+async function withLeadRelations(supabase: SupabaseClient, rows: any[]) {
+  const propertyIds = Array.from(new Set(rows.map((row) => row.property_id).filter(Boolean)))
+  const assigneeIds = Array.from(new Set(rows.map((row) => row.assigned_to).filter(Boolean)))
+
+  const [properties, assignees] = await Promise.all([
+    propertyIds.length
+      ? supabase.from('properties').select('id, title, location').in('id', propertyIds)
+      : Promise.resolve({ data: [] as any[], error: null }),
+    assigneeIds.length
+      ? supabase.from('users').select('id, full_name').in('id', assigneeIds)
+      : Promise.resolve({ data: [] as any[], error: null }),
+  ])
+  if (properties.error) throw properties.error
+  if (assignees.error) throw assignees.error
+
+  const propertyById = new Map((properties.data || []).map((property: any) => [property.id, property]))
+  const assigneeById = new Map((assignees.data || []).map((assignee: any) => [assignee.id, assignee]))
+
+  return rows.map((row) => ({
+    ...row,
+    property: propertyById.get(row.property_id),
+    assignee: assigneeById.get(row.assigned_to),
+  }))
+}
+
+export const EXPORT_DATASETS: Record<string, ExportDataset> = {
+  leads: {
+    table: 'admin_lead_inbox',
+    select: 'id, source, full_name, email, phone, status, message, property_id, assigned_to, created_at',
+    orderColumn: 'created_at',
+    columns: [
+      { header: 'ID', value: (row) => row.id },
+      { header: 'Name', value: (row) => row.full_name },
+      { header: 'Email', value: (row) => row.email },
+      { header: 'Phone', value: (row) => row.phone },
+      { header: 'Property', value: (row) => row.property?.title },
+      { header: 'Location', value: (row) => row.property?.location },
+      { header: 'Source', value: (row) => row.source },
+      { header: 'Status', value: (row) => row.status },
+      { header: 'Assigned To', value: (row) => row.assignee?.full_name },
+      { header: 'Message', value: (row) => row.message },
+      { header: 'Created At', value: (row) => row.created_at },
+    ],
+    filter: (query, params) => {
+      const channel = params.get('channel')
+      if (channel && LEAD_CHANNELS.includes(channel)) query = query.eq('channel', channel)
+      if (params.get('status')) query = query.eq('status', params.get('status'))
+      return search(dateRange(query, params, 'created_at'), params, ['full_name', 'email'])
+    },
+    enrich: withLeadRelations,
+  },
+  contacts: {
+    table: 'contact_messages',
+    select: 'id, full_name, email, phone, subject, message, status, created_at',
+    orderColumn: 'created_at',
+    columns: [
+      { header: 'Name', value: (row) => row.full_name },
+      { header: 'Email', value: (row) => row.email },
+      { header: 'Phone', value: (row) => row.phone || 'N/A' },
+      { header: 'Subject', value: (row) => row.subject },
+      { header: 'Message', value: (row) => row.message },
+      { header: 'Status', value: (row) => row.status },
+      { header: 'Received At', value: (row) => row.created_at },
+    ],
+    filter: (query, params) => {
+      if (params.get('status')) query = query.eq('status', params.get('status'))
+      return search(dateRange(query, params, 'created_at'), params, ['full_name', 'email'])
+    },
+  },
+  properties: {
+    table: 'properties',
+    select:
+      'id, title, location, city, state, bhk_type, property_type, price, area_sqft, bedrooms, bathrooms, status, is_featured, views, created_at',
+    orderColumn: 'created_at',
+    columns: [
+      { header: 'ID', value: (row) => row.id },
+      { header: 'Title', value: (row) => row.title },
+      { header: 'Location', value: (row) => row.location },
+      { header: 'City', value: (row) => row.city },
+      { header: 'State', value: (row) => row.state },
+      { header: 'BHK Type', value: (row) => row.bhk_type },
+      { header: 'Property Type', value: (row) => row.property_type },
+      { header: 'Price', value: (row) => row.price },
+      { header: 'Area (sqft)', value: (row) => row.area_sqft },
+      { header: 'Bedrooms', value: (row) => row.bedrooms },
+      { header: 'Bathrooms', value: (row) => row.bathrooms },
+      { header: 'Status', value: (row) => row.status },
+      { header: 'Featured', value: (row) => (row.is_featured ? 'Yes' : 'No') },
+      { header: 'Views', value: (row) => row.views || 0 },
+      { header: 'Created At', value: (row) => row.created_at },
+    ],
+    filter: (query, params) => {
+      if (params.get('status')) query = query.eq('status', params.get('status'))
+      return dateRange(query, params, 'created_at')
+    },
+  },
+  newsletter: {
+    table: 'newsletter_subscribers',
+    select: 'id, email, is_active, subscribed_at',
+    orderColumn: 'subscribed_at',
+    columns: [
+      { header: 'Email', value: (row) => row.email },
+      { header: 'Status', value: (row) => (row.is_active ? 'Active' : 'Inactive') },
+      { header: 'Subscribed At', value: (row) => row.subscribed_at },
+    ],
+    filter: (query, params) => {
+      if (params.get('active') === '1') query = query.eq('is_active', true)
+      return dateRange(query, params, 'subscribed_at')
+    },
+  },
+}
+
+/**
+ * One CSV field. Text a spreadsheet would read as a formula (leading `=`, `+`,
+ * `-`, `@`, tab or CR; names and messages come from public forms) is prefixed
+ * with `'` and quoted so it stays text. Numbers are written as they are.
+ */
+export function csvCell(value: unknown): string {
+  if (value === null || value === undefined) return ''
+  if (typeof value === 'number') return String(value)
+  let text = typeof value === 'object' ? JSON.stringify(value) : String(value)
+  const formula = /^[=+\-@\t\r]/.test(text)
+  if (formula) text = `'${text}`
+  return formula || /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text
+}
+
+function csvLine(values: unknown[]): string {
+  return values.map(csvCell).join(',') + '\r\n'
+}
+
+/**
+ * CSV body for `dataset`, filtered by the request's query parameters
+ * `columns` narrows the output to the named headers, in that order
+ */
+export function streamCsvExport(
+  supabase: SupabaseClient,
+  dataset: ExportDataset,
+  params: URLSearchParams,
+  columns = dataset.columns
+): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoder()
+  const { table, select, orderColumn, filter, enrich } = dataset
+  let cursor: Cursor | null = null
+  let headerSent = false
+
+  return new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        if (!headerSent) {
+          headerSent = true
+          // Byte order mark, so Excel reads the file as UTF-8
+          controller.enqueue(encoder.encode('\ufeff' + csvLine(columns.map((column) => column.header))))
+          return
+        }
+
+        let query: any = supabase
+          .from(table)
+          .select(select)
+          .not(orderColumn, 'is', null)
+          .order(orderColumn, { ascending: false })
+          .order('id', { ascending: false })
+          .limit(CHUNK_SIZE)
+        if (filter) query = filter(query, params)
+        if (cursor) query = query.or(keysetFilter(cursor, orderColumn))
+
+        const { data, error } = await query
+        if (error) throw error
+
+        const rows: any[] = data || []
+        if (rows.length) {
+          const written = enrich ? await enrich(supabase, rows) : rows
+          const body = written.map((row) => csvLine(columns.map((column) => column.value(row)))).join('')
+          controller.enqueue(encoder.encode(body))
+        }
+
+        if (rows.length < CHUNK_SIZE) {
+          controller.close()
+          return
+        }
+        const last = rows[rows.length - 1]
+        cursor = { createdAt: last[orderColumn], id: last.id }
+      } catch (error) {
+        console.error(`Error exporting ${table}:`, error)
+        controller.error(error)
+      }
+    },
+  })
+}
@@ -0,0 +1,39 @@
+import { createClient, SupabaseClient } from '@supabase/supabase-js'
+import type { RateLimitResult, RateLimitStore } from './utils'
+
+/**
+ * Rate limit counters shared by every instance, kept in Postgres
+ * (`rate_limit_consume`, migration 025). Enable with RATE_LIMIT_STORE=supabase.
+ * Costs one RPC per limited request, so it suits low-volume form endpoints.
+ */
+export class SupabaseRateLimitStore implements RateLimitStore {
+  private client: SupabaseClient | null = null
+
+  private getClient() {
+    if (!this.client) {
+      this.client = createClient(
+        process.env.NEXT_PUBLIC_SUPABASE_URL!,
+        process.env.SUPABASE_SERVICE_ROLE_KEY!,
+        { auth: { persistSession: false, autoRefreshToken: false } }
+      )
+    }
+    return this.client
+  }
+
+  async consume(key: string, maxRequests: number, windowMs: number, now: number): Promise<RateLimitResult> {
+    const { data, error } = await this.getClient().rpc('rate_limit_consume', {
+      p_key: key,
+      p_max_requests: maxRequests,
+      p_window_ms: windowMs,
+    })
+
+    if (error) throw error
+
+    const row = Array.isArray(data) ? data[0] : data
+    return {
+      success: !!row?.allowed,
+      remaining: row?.remaining ?? 0,
+      resetTime: row?.reset_at ? new Date(row.reset_at).getTime() : now + windowMs,
+    }
+  }
+}
@@ -0,0 +1,97 @@
+import { createHash } from 'crypto'
+import { NextRequest, NextResponse } from 'next/server'
+import { createClient as createSupabaseClient, SupabaseClient } from '@supabase/supabase-js'
+import { processCache } from '@/lib/utils/ttl-cache'
+import { timedFetch } from './server-timing'
+
+/**
+ * Cache for slow-changing public reference data (/api/search/*)
+ *
+ * Responses are cached in-process per key and version. Invalidating bumps the
+ * version, which drops cached bodies and changes every ETag, so clients
+ * revalidating with an old ETag get a fresh 200 instead of a 304.
+ */
+
+const TTL_MS = parseInt(process.env.SEARCH_CACHE_TTL_MS || '300000')
+const MAX_AGE_S = parseInt(process.env.SEARCH_CACHE_MAX_AGE_S || '60')
+const STALE_WHILE_REVALIDATE_S = parseInt(process.env.SEARCH_CACHE_SWR_S || '600')
+
+interface CachedBody {
+  body: string
+  etag: string
+}
+
+const cache = processCache<string, CachedBody>('search-reference', TTL_MS)
+
+const versionState = ((globalThis as any).__referenceCacheVersion ??= { version: 1 }) as { version: number }
+
+let anonClient: SupabaseClient | null = null
+
+/**
+ * Shared anon client for public data; no cookies, so it can be reused across requests
+ */
+export function getReferenceClient() {
+  if (!anonClient) {
+    anonClient = createSupabaseClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+      { auth: { persistSession: false, autoRefreshToken: false }, global: { fetch: timedFetch } }
+    )
+  }
+  return anonClient
+}
+
+export function getReferenceCacheVersion(): number {
+  return versionState.version
+}
+
+/**
+ * Drop cached reference data after an admin edits cities, locations or configurations
+ * Other instances pick the change up when their TTL expires
+ */
+export function invalidateReferenceCache(): number {
+  versionState.version++
+  cache.invalidate()
+  return versionState.version
+}
+
+export function getReferenceCacheStats() {
+  return { ...cache.getStats(), version: versionState.version }
+}
+
+function etagMatches(header: string | null, etag: string): boolean {
+  if (!header) return false
+  if (header.trim() === '*') return true
+  return header.split(',').some((tag) => tag.trim().replace(/^W\//, '') === etag.replace(/^W\//, ''))
+}
+
+/**
+ * JSON response for `key`, served from the cache with ETag / 304 support
+ * `loader` runs only on a miss and should throw on errors (they are not cached)
+ */
+export async function cachedJsonResponse(
+  request: NextRequest,
+  key: string,
+  loader: () => Promise<unknown>
+): Promise<NextResponse> {
+  const version = versionState.version
+  const { body, etag } = await cache.get(`${version}:${key}`, async () => {
+    const body = JSON.stringify(await loader())
+    const hash = createHash('sha1').update(body).digest('base64url').slice(0, 16)
+    return { body, etag: `W/"${version}-${hash}"` }
+  })
+
+  const headers = {
+    'ETag': etag,
+    'Cache-Control': `public, max-age=${MAX_AGE_S}, stale-while-revalidate=${STALE_WHILE_REVALIDATE_S}`,
+  }
+
+  if (etagMatches(request.headers.get('if-none-match'), etag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+
+  return new NextResponse(body, {
+    status: 200,
+    headers: { ...headers, 'Content-Type': 'application/json' },
+  })
+}
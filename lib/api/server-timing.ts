@@ -0,0 +1,118 @@
+import { AsyncLocalStorage } from 'async_hooks'
+
+/**
+ * Server-Timing phases for API responses
+ *
+ * A route wrapped in `withServerTiming` gets a per-request timer. Phases are
+ * recorded into it from anywhere the handler awaits: `timed('llm', ...)`
+ * around model calls, the Supabase clients' fetch (`db`, `storage`), the
+ * request context's user lookup (`auth`), and `successResponse` /
+ * `errorResponse` for JSON serialization (`serialize`). The response gets
+ * `Server-Timing: auth;dur=..;desc="1 call", db;dur=.., ..., total;dur=..`.
+ *
+ * Durations of a phase are summed, so concurrent queries can add up to more
+ * than `total`. Outside a wrapped route every helper here is a pass-through.
+ */
+
+interface Phase {
+  dur: number
+  count: number
+}
+
+export class ServerTiming {
+  private readonly started = performance.now()
+  private readonly phases = new Map<string, Phase>()
+
+  add(name: string, dur: number) {
+    const phase = this.phases.get(name)
+    if (phase) {
+      phase.dur += dur
+      phase.count++
+    } else {
+      this.phases.set(name, { dur, count: 1 })
+    }
+  }
+
+  header(): string {
+    const entries = Array.from(this.phases, ([name, { dur, count }]) =>
+      `${name};dur=${dur.toFixed(2)};desc="${count} ${count === 1 ? 'call' : 'calls'}"`
+    )
+    entries.push(`total;dur=${(performance.now() - this.started).toFixed(2)}`)
+    return entries.join(', ')
+  }
+}
+
+const storage = new AsyncLocalStorage<ServerTiming>()
+
+/**
+ * Timer of the current request, if its route is wrapped
+ */
+export function currentTiming(): ServerTiming | undefined {
+  return storage.getStore()
+}
+
+/**
+ * Run `task` and add its duration to phase `name`, also when it throws
+ */
+export async function timed<T>(name: string, task: () => Promise<T>): Promise<T> {
+  const timing = storage.getStore()
+  if (!timing) return task()
+
+  const started = performance.now()
+  try {
+    return await task()
+  } finally {
+    timing.add(name, performance.now() - started)
+  }
+}
+
+export function timedSync<T>(name: string, task: () => T): T {
+  const timing = storage.getStore()
+  if (!timing) return task()
+
+  const started = performance.now()
+  try {
+    return task()
+  } finally {
+    timing.add(name, performance.now() - started)
+  }
+}
+
+/**
+ * Set `Server-Timing` on `response` from the current request's timer
+ */
+export function applyServerTiming<R extends Response>(response: R): R {
+  const timing = storage.getStore()
+  if (timing) response.headers.set('Server-Timing', timing.header())
+  return response
+}
+
+/**
+ * Time a route handler: `export const GET = withServerTiming(async (request) => ...)`
+ * Responses built with successResponse/errorResponse carry the header already;
+ * any other response gets it here.
+ */
+export function withServerTiming<A extends unknown[], R extends Response>(
+  handler: (...args: A) => Promise<R>
+): (...args: A) => Promise<R> {
+  return (...args: A) =>
+    storage.run(new ServerTiming(), async () => {
+      const response = await handler(...args)
+      return response.headers.has('Server-Timing') ? response : applyServerTiming(response)
+    })
+}
+
+// Supabase services by URL path; Auth is timed by the request context instead
+const FETCH_PHASES: [string, string][] = [
+  ['/rest/v1/', 'db'],
+  ['/storage/v1/', 'storage'],
+]
+
+/**
+ * fetch for Supabase clients: REST calls count as `db`, Storage as `storage`
+ */
+export const timedFetch: typeof fetch = (input, init) => {
+  const url = typeof input === 'string' ? input : input instanceof URL ? input.href : input.url
+  const phase = FETCH_PHASES.find(([path]) => url.includes(path))?.[1]
+  return phase ? timed(phase, () => fetch(input, init)) : fetch(input, init)
+}
@@ -1,5 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { ZodError, ZodSchema } from 'zod'
+import { SupabaseRateLimitStore } from './rate-limit-supabase'
+import { applyServerTiming, timedSync } from './server-timing'
 
 export interface ApiResponse<T = any> {
   success: boolean
@@ -8,16 +10,27 @@ export interface ApiResponse<T = any> {
   errors?: Record<string, string[]>
 }
 
+/**
+ * JSON response with serialization timed and the request's Server-Timing header
+ * (lib/api/server-timing.ts)
+ */
+function jsonResponse<T>(body: T, status: number): NextResponse<T> {
+  const payload = timedSync('serialize', () => JSON.stringify(body))
+  return applyServerTiming(
+    new NextResponse(payload, { status, headers: { 'Content-Type': 'application/json' } })
+  ) as NextResponse<T>
+}
+
 /**
  * Create a successful API response
  */
 export function successResponse<T>(data: T, status = 200): NextResponse<ApiResponse<T>> {
-  return NextResponse.json(
+  return jsonResponse<ApiResponse<T>>(
     {
       success: true,
       data,
     },
-    { status }
+    status
   )
 }
 
@@ -29,13 +42,13 @@ export function errorResponse(
   status = 400,
   errors?: Record<string, string[]>
 ): NextResponse<ApiResponse> {
-  return NextResponse.json(
+  return jsonResponse<ApiResponse>(
     {
       success: false,
       error,
       errors,
     },
-    { status }
+    status
   )
 }
 
@@ -76,6 +89,7 @@ export async function validateRequest<T>(
 
 /**
  * Handle API errors consistently
+ * Like every response built here, it carries the request's Server-Timing
  */
 export function handleApiError(error: unknown): NextResponse<ApiResponse> {
   console.error('API Error:', error)
@@ -88,33 +102,138 @@ export function handleApiError(error: unknown): NextResponse<ApiResponse> {
 }
 
 /**
- * Rate limiting (simple in-memory implementation)
+ * Rate limiting
+ *
+ * Sliding window counter: the previous fixed window's count is weighted by how
+ * much of it still overlaps the sliding window, so bursts straddling a window
+ * edge cannot double the limit. Only allowed requests are counted.
  */
-const rateLimitMap = new Map<string, { count: number; resetTime: number }>()
+export interface RateLimitResult {
+  success: boolean
+  remaining: number
+  resetTime: number
+}
 
-export function rateLimit(
-  identifier: string,
-  maxRequests = 100,
-  windowMs = 60000
-): { success: boolean; remaining: number; resetTime: number } {
-  const now = Date.now()
-  const record = rateLimitMap.get(identifier)
+/**
+ * Where rate limit counters live
+ * `consume` must check and count atomically for the key
+ */
+export interface RateLimitStore {
+  consume(key: string, maxRequests: number, windowMs: number, now: number): Promise<RateLimitResult>
+}
 
-  if (!record || now > record.resetTime) {
-    const resetTime = now + windowMs
-    rateLimitMap.set(identifier, { count: 1, resetTime })
-    return { success: true, remaining: maxRequests - 1, resetTime }
+interface RateLimitEntry {
+  windowStart: number
+  current: number
+  previous: number
+}
+
+/**
+ * Sliding-window decision for one key; mutates `entry`
+ */
+export function slidingWindowConsume(
+  entry: RateLimitEntry,
+  maxRequests: number,
+  windowMs: number,
+  now: number
+): RateLimitResult {
+  const windowStart = Math.floor(now / windowMs) * windowMs
+  if (entry.windowStart !== windowStart) {
+    entry.previous = windowStart - entry.windowStart === windowMs ? entry.current : 0
+    entry.current = 0
+    entry.windowStart = windowStart
   }
 
-  if (record.count >= maxRequests) {
-    return { success: false, remaining: 0, resetTime: record.resetTime }
+  const overlap = 1 - (now - windowStart) / windowMs
+  const estimated = entry.previous * overlap + entry.current
+
+  if (estimated + 1 > maxRequests) {
+    // When the weighted previous window has decayed enough to admit one more
+    const resetTime =
+      entry.previous > 0 && entry.current < maxRequests
+        ? windowStart + Math.ceil(windowMs * (1 - (maxRequests - 1 - entry.current) / entry.previous))
+        : windowStart + windowMs
+    return { success: false, remaining: 0, resetTime }
   }
 
-  record.count++
+  entry.current++
   return {
     success: true,
-    remaining: maxRequests - record.count,
-    resetTime: record.resetTime,
+    remaining: Math.max(0, Math.floor(maxRequests - estimated - 1)),
+    resetTime: windowStart + windowMs,
+  }
+}
+
+/**
+ * Per-instance store with a bounded number of keys
+ * Least recently used keys are evicted first, so a flood of distinct IPs
+ * cannot grow memory without limit
+ */
+export class MemoryRateLimitStore implements RateLimitStore {
+  private entries = new Map<string, RateLimitEntry>()
+  private evictions = 0
+
+  constructor(private maxKeys = 10000) {}
+
+  async consume(key: string, maxRequests: number, windowMs: number, now: number): Promise<RateLimitResult> {
+    let entry = this.entries.get(key)
+    if (entry) {
+      // Re-insert to mark as most recently used
+      this.entries.delete(key)
+    } else {
+      entry = { windowStart: Math.floor(now / windowMs) * windowMs, current: 0, previous: 0 }
+    }
+    this.entries.set(key, entry)
+
+    while (this.entries.size > this.maxKeys) {
+      this.entries.delete(this.entries.keys().next().value as string)
+      this.evictions++
+    }
+
+    return slidingWindowConsume(entry, maxRequests, windowMs, now)
+  }
+
+  getStats() {
+    return { keys: this.entries.size, maxKeys: this.maxKeys, evictions: this.evictions }
+  }
+}
+
+const rateLimitState = ((globalThis as any).__rateLimitStore ??= {
+  store: null as RateLimitStore | null,
+}) as { store: RateLimitStore | null }
+
+/**
+ * Replace the store used by `rateLimit`, e.g. with a shared one
+ */
+export function setRateLimitStore(store: RateLimitStore) {
+  rateLimitState.store = store
+}
+
+export function getRateLimitStore(): RateLimitStore {
+  if (!rateLimitState.store) {
+    rateLimitState.store =
+      process.env.RATE_LIMIT_STORE === 'supabase'
+        ? new SupabaseRateLimitStore()
+        : new MemoryRateLimitStore(parseInt(process.env.RATE_LIMIT_MAX_KEYS || '10000'))
+  }
+  return rateLimitState.store
+}
+
+/**
+ * Allow at most `maxRequests` per sliding `windowMs` for `identifier`
+ * Fails open if a shared store is unreachable
+ */
+export async function rateLimit(
+  identifier: string,
+  maxRequests = 100,
+  windowMs = 60000
+): Promise<RateLimitResult> {
+  const now = Date.now()
+  try {
+    return await getRateLimitStore().consume(identifier, maxRequests, windowMs, now)
+  } catch (error) {
+    console.error('Rate limit store error:', error)
+    return { success: true, remaining: maxRequests, resetTime: now + windowMs }
   }
 }
 
@@ -177,3 +296,110 @@ export function createPaginatedResponse<T>(
     },
   }
 }
+
+/**
+ * Page, sort and search parameters for admin listings
+ * `sort` is always one of `sortable`, so it can be passed to .order() as is
+ */
+export interface ListParams {
+  page: number
+  limit: number
+  sort: string
+  ascending: boolean
+  search: string
+}
+
+export function getListParams(
+  request: NextRequest,
+  sortable: string[],
+  { defaultSort = 'created_at', defaultLimit = 50, maxLimit = 500 } = {}
+): ListParams {
+  const searchParams = request.nextUrl.searchParams
+  const page = parseInt(searchParams.get('page') || '1') || 1
+  const limit = parseInt(searchParams.get('limit') || String(defaultLimit)) || defaultLimit
+  const sort = searchParams.get('sort') || defaultSort
+
+  return {
+    page: Math.max(1, page),
+    limit: Math.min(maxLimit, Math.max(1, limit)),
+    sort: sortable.includes(sort) ? sort : defaultSort,
+    ascending: searchParams.get('order') === 'asc',
+    // Characters with meaning in PostgREST filters or LIKE patterns are dropped
+    search: (searchParams.get('q') || '').replace(/[%_*,()"\\]/g, ' ').trim().slice(0, 100),
+  }
+}
+
+/**
+ * PostgREST `or` filter matching `search` anywhere in any of `columns`
+ */
+export function searchFilter(columns: string[], search: string): string {
+  return columns.map((column) => `${column}.ilike.%${search}%`).join(',')
+}
+
+/**
+ * Keyset (cursor) pagination on (created_at, id)
+ * Deep pages cost the same as the first one, unlike offset pagination
+ */
+export interface Cursor {
+  createdAt: string
+  id: string
+}
+
+export interface CursorPaginatedResponse<T> {
+  data: T[]
+  pagination: {
+    limit: number
+    nextCursor: string | null
+    hasMore: boolean
+    total?: number | null
+  }
+}
+
+export function encodeCursor(cursor: Cursor): string {
+  return Buffer.from(JSON.stringify([cursor.createdAt, cursor.id])).toString('base64url')
+}
+
+export function decodeCursor(value: string): Cursor | null {
+  try {
+    const [createdAt, id] = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'))
+    if (typeof createdAt !== 'string' || typeof id !== 'string' || isNaN(Date.parse(createdAt))) {
+      return null
+    }
+    return { createdAt, id }
+  } catch {
+    return null
+  }
+}
+
+/**
+ * PostgREST filter for rows after `cursor` in (created_at desc, id desc) order
+ * `column` replaces created_at for tables ordered by another timestamp
+ */
+export function keysetFilter(cursor: Cursor, column = 'created_at'): string {
+  const createdAt = `"${cursor.createdAt}"`
+  const id = `"${cursor.id}"`
+  return `${column}.lt.${createdAt},and(${column}.eq.${createdAt},id.lt.${id})`
+}
+
+/**
+ * Build a cursor page from `limit + 1` fetched rows
+ */
+export function createCursorPaginatedResponse<T extends { created_at: string; id: string }>(
+  rows: T[],
+  limit: number,
+  total?: number | null
+): CursorPaginatedResponse<T> {
+  const hasMore = rows.length > limit
+  const data = hasMore ? rows.slice(0, limit) : rows
+  const last = data[data.length - 1]
+
+  return {
+    data,
+    pagination: {
+      limit,
+      nextCursor: hasMore && last ? encodeCursor({ createdAt: last.created_at, id: last.id }) : null,
+      hasMore,
+      ...(total !== undefined ? { total } : {}),
+    },
+  }
+}
@@ -2,6 +2,7 @@
 
 import { useEffect, useState, useCallback, useMemo } from 'react'
 import { createClient } from '@/lib/supabase/client'
+import { getUsageCount } from '@/lib/services/usage-counters'
 import type {
   SubscriptionPlan,
   UserSubscription,
@@ -21,18 +22,8 @@ export function useSubscription() {
     plan: SubscriptionPlan
   ): Promise<SubscriptionUsage> => {
     try {
-      // Get start of current month
-      const startOfMonth = new Date()
-      startOfMonth.setDate(1)
-      startOfMonth.setHours(0, 0, 0, 0)
-
-      // Count AI analyses this month
-      const { count: analysesCount } = await supabase
-        .from('subscription_usage_logs')
-        .select('*', { count: 'exact', head: true })
-        .eq('user_id', userId)
-        .eq('usage_type', 'ai_analysis')
-        .gte('created_at', startOfMonth.toISOString())
+      // AI analyses this month
+      const analysesCount = await getUsageCount(supabase, userId, 'ai_analysis')
 
       // Count properties in comparison list
       const { count: propertiesCount } = await supabase
@@ -40,7 +31,7 @@ export function useSubscription() {
         .select('*', { count: 'exact', head: true })
         .eq('user_id', userId)
 
-      const analyses_used = analysesCount || 0
+      const analyses_used = analysesCount
       const analyses_limit = plan.analyses_per_month
       const properties_in_comparison = propertiesCount || 0
       const properties_limit = plan.max_properties_comparison
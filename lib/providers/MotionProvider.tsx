@@ -0,0 +1,13 @@
+'use client'
+
+import { MotionConfig } from 'framer-motion'
+
+/**
+ * Global Framer Motion configuration
+ * Honours the OS "reduce motion" setting, so transform animations such as the
+ * testimonials marquee and section entrances are skipped for those users
+ * (and for test runs that emulate prefers-reduced-motion)
+ */
+export function MotionProvider({ children }: { children: React.ReactNode }) {
+  return <MotionConfig reducedMotion="user">{children}</MotionConfig>
+}
@@ -1,5 +1,14 @@
 import { createAdminClient } from '@/lib/supabase/server'
 import { GoogleGenerativeAI } from '@google/generative-ai'
+import { processCache } from '@/lib/utils/ttl-cache'
+
+// Overridable so benchmarks can point Gemini calls at a local stub
+const GEMINI_API_BASE_URL = process.env.GEMINI_API_BASE_URL || 'https://generativelanguage.googleapis.com'
+
+// API keys and the discovered model rarely change; cache them per process
+const AI_CONFIG_CACHE_TTL_MS = parseInt(process.env.AI_CONFIG_CACHE_TTL_MS || '300000')
+const apiKeyCache = processCache<string, string | null>('ai-api-keys', AI_CONFIG_CACHE_TTL_MS)
+const modelCache = processCache<string, string>('ai-gemini-models', AI_CONFIG_CACHE_TTL_MS)
 
 interface AIResponse {
   success: boolean
@@ -10,30 +19,28 @@ interface AIResponse {
 }
 
 export class AIService {
+  /**
+   * Drop cached API keys and model selections
+   * Called when AI configuration changes in the admin panel
+   */
+  static invalidateConfigCache() {
+    apiKeyCache.invalidate()
+    modelCache.invalidate()
+  }
+
+  static getConfigCacheStats() {
+    return {
+      apiKeys: apiKeyCache.getStats(),
+      models: modelCache.getStats(),
+    }
+  }
+
   /**
    * Get API key for a specific provider from database or env
    */
   static async getApiKey(provider: 'gemini'): Promise<string | null> {
     try {
-      // First try to get from database (dynamic config) using Admin Client to bypass RLS
-      const supabase = await createAdminClient()
-      const { data, error } = await supabase
-        .from('ai_api_keys')
-        .select('api_key')
-        .eq('provider', provider)
-        .eq('is_active', true)
-        .single()
-
-      if (data && (data as any).api_key) {
-        return (data as any).api_key
-      }
-
-      // Fallback to environment variables
-      if (provider === 'gemini') {
-        return process.env.GEMINI_API_KEY || null
-      }
-
-      return null
+      return await apiKeyCache.get(provider, () => this.loadApiKey(provider))
     } catch (error) {
       console.error('Error fetching API key:', error)
       // Fallback to environment variables on error
@@ -45,57 +52,93 @@ export class AIService {
   }
 
   /**
-   * Fetch available models from Gemini API and select the best one
+   * Read the active API key from the database, falling back to env
+   * Throws on database errors so the failure is not cached
    */
-  private static async getBestAvailableModel(apiKey: string): Promise<string> {
-    try {
-      // Use the REST API to list models because the SDK doesn't always make it easy to list without init
-      const response = await fetch(`https://generativelanguage.googleapis.com/v1beta/models?key=${apiKey}`)
+  private static async loadApiKey(provider: 'gemini'): Promise<string | null> {
+    // First try to get from database (dynamic config) using Admin Client to bypass RLS
+    const supabase = await createAdminClient()
+    const { data, error } = await supabase
+      .from('ai_api_keys')
+      .select('api_key')
+      .eq('provider', provider)
+      .eq('is_active', true)
+      .single()
+
+    // PGRST116 = no active key row, which is a valid (cacheable) answer
+    if (error && error.code !== 'PGRST116') throw error
+
+    if (data && (data as any).api_key) {
+      return (data as any).api_key
+    }
 
-      if (!response.ok) {
-        console.warn('Failed to fetch models list, defaulting to gemini-1.5-flash')
-        return 'gemini-1.5-flash'
-      }
+    // Fallback to environment variables
+    if (provider === 'gemini') {
+      return process.env.GEMINI_API_KEY || null
+    }
 
-      const data = await response.json()
-      const models = data.models || []
-
-      // Detailed logging for debugging
-      console.log('Available Gemini Models:', models.map((m: any) => m.name))
-
-      // Priority list of models to look for
-      const priorityModels = [
-        'gemini-3-pro-preview',
-        'gemini-3-flash-preview',
-        'deep-research-pro-preview-12-2025',
-        'gemini-2.5-pro',
-        'gemini-2.5-flash',
-        'gemini-2.0-flash',
-        'gemini-exp-1206',
-        'gemini-2.0-flash-exp',
-        'gemini-1.5-pro',
-        'gemini-1.5-flash',
-        'gemini-pro'
-      ]
-
-      for (const priorityModel of priorityModels) {
-        // Check if any available model name ends with the priority model name
-        // The API returns names like "models/gemini-1.5-flash"
-        const found = models.find((m: any) => m.name.endsWith(priorityModel) && m.supportedGenerationMethods?.includes('generateContent'))
-        if (found) {
-          // Return the clean model name (without 'models/' prefix usually, but SDK handles both)
-          return found.name.replace('models/', '')
-        }
-      }
+    return null
+  }
 
-      // If no priority model found, just return a fallback
-      return 'gemini-1.5-flash'
+  /**
+   * Select the best available Gemini model, cached per API key
+   */
+  private static async getBestAvailableModel(apiKey: string): Promise<string> {
+    try {
+      return await modelCache.get(apiKey, () => this.discoverBestModel(apiKey))
     } catch (error) {
       console.error('Error fetching models:', error)
       return 'gemini-1.5-flash'
     }
   }
 
+  /**
+   * Fetch available models from Gemini API and select the best one
+   * Throws when the list cannot be fetched so the fallback is not cached
+   */
+  private static async discoverBestModel(apiKey: string): Promise<string> {
+    // Use the REST API to list models because the SDK doesn't always make it easy to list without init
+    const response = await fetch(`${GEMINI_API_BASE_URL}/v1beta/models?key=${apiKey}`)
+
+    if (!response.ok) {
+      throw new Error(`Failed to fetch models list (${response.status})`)
+    }
+
+    const data = await response.json()
+    const models = data.models || []
+
+    // Detailed logging for debugging
+    console.log('Available Gemini Models:', models.map((m: any) => m.name))
+
+    // Priority list of models to look for
+    const priorityModels = [
+      'gemini-3-pro-preview',
+      'gemini-3-flash-preview',
+      'deep-research-pro-preview-12-2025',
+      'gemini-2.5-pro',
+      'gemini-2.5-flash',
+      'gemini-2.0-flash',
+      'gemini-exp-1206',
+      'gemini-2.0-flash-exp',
+      'gemini-1.5-pro',
+      'gemini-1.5-flash',
+      'gemini-pro'
+    ]
+
+    for (const priorityModel of priorityModels) {
+      // Check if any available model name ends with the priority model name
+      // The API returns names like "models/gemini-1.5-flash"
+      const found = models.find((m: any) => m.name.endsWith(priorityModel) && m.supportedGenerationMethods?.includes('generateContent'))
+      if (found) {
+        // Return the clean model name (without 'models/' prefix usually, but SDK handles both)
+        return found.name.replace('models/', '')
+      }
+    }
+
+    // If no priority model found, just return a fallback
+    return 'gemini-1.5-flash'
+  }
+
   /**
    * Generate content using Google Gemini
    */
@@ -120,7 +163,7 @@ export class AIService {
         modelName = await this.getBestAvailableModel(apiKey)
       }
 
-      const genModel = genAI.getGenerativeModel({ model: modelName })
+      const genModel = genAI.getGenerativeModel({ model: modelName }, { baseUrl: GEMINI_API_BASE_URL })
 
       // Gemini doesn't have a strict "system" role in the same way as OpenAI for chat
       // but we can prepend it or use systemInstruction if supported by specific models.
@@ -149,7 +192,7 @@ export class AIService {
         // RETRY LOGIC: If the specific model fails (likely 404 Not Found), try the legacy 'gemini-pro' as a last resort
         if (genError.message && (genError.message.includes('404') || genError.message.includes('not found'))) {
           console.warn(`Model ${modelName} failed with 404. Retrying with legacy 'gemini-pro'...`)
-          const legacyModel = genAI.getGenerativeModel({ model: 'gemini-pro' })
+          const legacyModel = genAI.getGenerativeModel({ model: 'gemini-pro' }, { baseUrl: GEMINI_API_BASE_URL })
           const result = await legacyModel.generateContent({
             contents: [{ role: 'user', parts: [{ text: prompt }] }],
             generationConfig: { temperature, maxOutputTokens: maxTokens }
@@ -211,7 +254,7 @@ export class AIService {
         modelName = await this.getBestAvailableModel(apiKey)
       }
 
-      const genModel = genAI.getGenerativeModel({ model: modelName })
+      const genModel = genAI.getGenerativeModel({ model: modelName }, { baseUrl: GEMINI_API_BASE_URL })
 
       const chat = genModel.startChat({
         history: history,
@@ -246,7 +289,7 @@ export class AIService {
 
           console.warn(`Chat Model ${modelName} failed with 404. Retrying with fallback '${fallbackModelName}'...`)
 
-          const legacyModel = genAI.getGenerativeModel({ model: fallbackModelName })
+          const legacyModel = genAI.getGenerativeModel({ model: fallbackModelName }, { baseUrl: GEMINI_API_BASE_URL })
           // Re-create the chat session with the fallback model
           const legacyChat = legacyModel.startChat({
             history: history,
@@ -0,0 +1,59 @@
+import { createHash } from 'crypto'
+
+// Property fields that end up in the agent prompt (see runAgentAnalysis)
+const ANALYSED_PROPERTY_FIELDS = [
+  'title',
+  'location',
+  'price',
+  'size',
+  'size_unit',
+  'property_type',
+  'bedrooms',
+  'bathrooms',
+  'status',
+  'description',
+  'amenities',
+] as const
+
+// Agent configuration that changes what an agent produces
+const AGENT_CONFIG_FIELDS = ['agent_slug', 'version', 'model', 'temperature', 'max_tokens', 'system_prompt'] as const
+
+function pick(row: any, fields: readonly string[]) {
+  return fields.map((field) => [field, row?.[field] ?? null])
+}
+
+/**
+ * Content hash for an analysis request
+ * Same property content + same agent configs => same hash, regardless of user
+ */
+export function computeAnalysisHash(property: any, agents: any[]): string {
+  const agentConfigs = [...agents]
+    .sort((a, b) => String(a.agent_slug).localeCompare(String(b.agent_slug)))
+    .map((agent) => pick(agent, AGENT_CONFIG_FIELDS))
+
+  return createHash('sha256')
+    .update(JSON.stringify({ v: 1, property: pick(property, ANALYSED_PROPERTY_FIELDS), agents: agentConfigs }))
+    .digest('hex')
+}
+
+/**
+ * Latest stored analysis for this property and hash, if any
+ * Needs a client that can read other users' analyses (service role)
+ */
+export async function findStoredAnalysis(supabase: any, propertyId: string, contentHash: string) {
+  const { data, error } = await supabase
+    .from('ai_property_analyses')
+    .select('id, analysis_data, agents_used, tokens_used, created_at')
+    .eq('property_id', propertyId)
+    .eq('content_hash', contentHash)
+    .order('created_at', { ascending: false })
+    .limit(1)
+    .maybeSingle()
+
+  if (error) {
+    console.error('Error looking up stored analysis:', error)
+    return null
+  }
+
+  return data
+}
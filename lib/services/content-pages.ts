@@ -0,0 +1,75 @@
+import { cache } from 'react'
+import { getReferenceClient } from '@/lib/api/reference-cache'
+
+/**
+ * Data for the cached public content pages: /blog, /blog/[slug] and the home
+ * page's blog and testimonial sections
+ *
+ * Read with the shared anon client (no cookies) so the pages can be served
+ * from the route cache; admin publishes, edits and deletes revalidate them
+ * through lib/services/revalidation.ts.
+ */
+
+const POST_FIELDS = '*, users(full_name)'
+const RELATED_FIELDS = 'id, title, slug, excerpt, featured_image, published_at, read_time'
+
+/**
+ * Published posts, newest first
+ */
+export async function getPublishedPosts(limit?: number) {
+  let query = getReferenceClient()
+    .from('blog_posts')
+    .select(POST_FIELDS)
+    .eq('status', 'published')
+    .not('published_at', 'is', null)
+    .order('published_at', { ascending: false })
+
+  if (limit) query = query.limit(limit)
+
+  const { data, error } = await query
+  if (error) throw error
+  return data || []
+}
+
+/**
+ * One published post with the three latest others; null when not found
+ * Deduplicated per render, so metadata and the page share one read.
+ */
+export const getPublishedPost = cache(async (slug: string) => {
+  const supabase = getReferenceClient()
+
+  const { data: post, error } = await supabase
+    .from('blog_posts')
+    .select('*, users(full_name, avatar_url)')
+    .eq('slug', slug)
+    .eq('status', 'published')
+    .maybeSingle()
+
+  if (error) throw error
+  if (!post) return null
+
+  const { data: related } = await supabase
+    .from('blog_posts')
+    .select(RELATED_FIELDS)
+    .eq('status', 'published')
+    .neq('id', post.id)
+    .not('published_at', 'is', null)
+    .order('published_at', { ascending: false })
+    .limit(3)
+
+  return { post, relatedPosts: related || [] }
+})
+
+/**
+ * Approved testimonials in display order
+ */
+export async function getApprovedTestimonials() {
+  const { data, error } = await getReferenceClient()
+    .from('testimonials')
+    .select('*')
+    .eq('is_approved', true)
+    .order('display_order', { ascending: true })
+
+  if (error) throw error
+  return data || []
+}
@@ -0,0 +1,253 @@
+import { SupabaseClient } from '@supabase/supabase-js'
+import { runInBackground } from '@/lib/utils/concurrency'
+import { MailMessage, SmtpConnection, SmtpError } from '@/lib/services/smtp-client'
+
+/**
+ * Email outbox (email_notifications, migration 031)
+ *
+ * /api/notifications/email stores the rendered message and returns; the
+ * worker claims due rows in batches with claim_email_notifications(), sends
+ * them over one provider connection at EMAIL_RATE_LIMIT messages per second
+ * and reschedules failures with exponential backoff.
+ *
+ * EMAIL_TRANSPORT picks the provider: `smtp` (SMTP_*), `sendgrid`
+ * (SENDGRID_API_KEY) or `log`, which only prints the message.
+ */
+
+const TRANSPORT = process.env.EMAIL_TRANSPORT || 'log'
+const BATCH_SIZE = parseInt(process.env.EMAIL_BATCH_SIZE || '50')
+const RATE_LIMIT = parseInt(process.env.EMAIL_RATE_LIMIT || '10')
+const LEASE_SECONDS = 120
+const MAX_ATTEMPTS = 6
+
+interface OutboxEmail {
+  id: string
+  type: string
+  recipient: string
+  subject: string
+  html_content: string | null
+  text_content: string | null
+  metadata: Record<string, unknown>
+  attempts: number
+}
+
+interface Transport {
+  // Resolves with the provider's message id
+  send(message: MailMessage): Promise<string | null>
+  close(): Promise<void>
+}
+
+class DeliveryError extends Error {
+  constructor(message: string, public temporary: boolean) {
+    super(message)
+  }
+}
+
+// Sender address and name, shared by every transport
+function fromAddress() {
+  return {
+    email: process.env.EMAIL_FROM || 'noreply@cohousingventures.com',
+    name: process.env.EMAIL_FROM_NAME?.replace(/"/g, '') || undefined,
+  }
+}
+
+function sender() {
+  const { email, name } = fromAddress()
+  return name ? `"${name}" <${email}>` : email
+}
+
+async function openTransport(): Promise<Transport> {
+  switch (TRANSPORT) {
+    case 'smtp': {
+      const port = parseInt(process.env.SMTP_PORT || '587')
+      const connection = await SmtpConnection.open({
+        host: process.env.SMTP_HOST || 'localhost',
+        port,
+        secure: process.env.SMTP_SECURE ? process.env.SMTP_SECURE === 'true' : port === 465,
+        user: process.env.SMTP_USER || undefined,
+        pass: process.env.SMTP_PASS,
+        allowInsecureAuth: process.env.SMTP_ALLOW_INSECURE_AUTH === 'true',
+      })
+      return {
+        send: async (message) => {
+          try {
+            return await connection.send(message)
+          } catch (error: any) {
+            throw new DeliveryError(error.message, !(error instanceof SmtpError) || error.temporary)
+          }
+        },
+        close: () => connection.close(),
+      }
+    }
+
+    case 'sendgrid':
+      return {
+        send: async (message) => {
+          const response = await fetch('https://api.sendgrid.com/v3/mail/send', {
+            method: 'POST',
+            headers: {
+              Authorization: `Bearer ${process.env.SENDGRID_API_KEY}`,
+              'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+              personalizations: [{ to: [{ email: message.to }] }],
+              from: fromAddress(),
+              subject: message.subject,
+              content: [
+                ...(message.text ? [{ type: 'text/plain', value: message.text }] : []),
+                ...(message.html ? [{ type: 'text/html', value: message.html }] : []),
+              ],
+            }),
+          })
+          if (!response.ok) {
+            const temporary = response.status === 429 || response.status >= 500
+            throw new DeliveryError(`SendGrid ${response.status}: ${await response.text()}`, temporary)
+          }
+          return response.headers.get('x-message-id')
+        },
+        close: async () => {},
+      }
+
+    default:
+      return {
+        send: async (message) => {
+          console.log('📧 Email Notification:', { to: message.to, subject: message.subject })
+          return null
+        },
+        close: async () => {},
+      }
+  }
+}
+
+/**
+ * Queue one message; the caller starts delivery with drainEmailOutbox()
+ */
+export async function enqueueEmail(
+  supabase: SupabaseClient,
+  email: {
+    type: string
+    recipient: string
+    subject: string
+    html: string
+    text: string
+    metadata?: Record<string, unknown>
+    createdBy?: string
+  }
+): Promise<{ id: string }> {
+  const { data, error } = await supabase
+    .from('email_notifications')
+    .insert({
+      type: email.type,
+      recipient: email.recipient,
+      subject: email.subject,
+      html_content: email.html,
+      text_content: email.text,
+      metadata: email.metadata || {},
+      created_by: email.createdBy || null,
+    })
+    .select('id')
+    .single()
+
+  if (error) throw error
+  return data
+}
+
+async function markSent(supabase: SupabaseClient, email: OutboxEmail, messageId: string | null) {
+  const { error } = await supabase
+    .from('email_notifications')
+    .update({ status: 'sent', sent_at: new Date().toISOString(), provider_message_id: messageId, last_error: null })
+    .eq('id', email.id)
+  // Sent but not recorded: the lease expires and the message goes out again
+  if (error) console.error(`Error recording sent email ${email.id}:`, error)
+}
+
+async function markFailed(supabase: SupabaseClient, email: OutboxEmail, error: any, temporary: boolean) {
+  const final = !temporary || email.attempts >= MAX_ATTEMPTS
+  const backoffMs = Math.min(2 ** email.attempts * 30 * 1000, 60 * 60 * 1000)
+  const { error: updateError } = await supabase
+    .from('email_notifications')
+    .update({
+      status: final ? 'failed' : 'pending',
+      last_error: error.message || String(error),
+      next_attempt_at: new Date(Date.now() + (final ? 0 : backoffMs)).toISOString(),
+    })
+    .eq('id', email.id)
+  if (updateError) console.error(`Error rescheduling email ${email.id}:`, updateError)
+}
+
+/**
+ * Claim and send due messages until none are left or `maxBatches` ran
+ */
+export async function processEmailOutbox(
+  supabase: SupabaseClient,
+  maxBatches = 10
+): Promise<{ sent: number; failed: number; batches: number }> {
+  const interval = 1000 / Math.max(1, RATE_LIMIT)
+  let sent = 0
+  let failed = 0
+  let batches = 0
+
+  while (batches < maxBatches) {
+    const { data, error } = await supabase.rpc('claim_email_notifications', {
+      p_limit: BATCH_SIZE,
+      p_lease_seconds: LEASE_SECONDS,
+    })
+    if (error) throw error
+
+    const claimed: OutboxEmail[] = data || []
+    if (!claimed.length) break
+    batches++
+
+    let transport: Transport
+    try {
+      transport = await openTransport()
+    } catch (error: any) {
+      // Provider unreachable: the whole batch backs off
+      console.error('Error connecting to email provider:', error)
+      await Promise.all(claimed.map((email) => markFailed(supabase, email, error, true)))
+      failed += claimed.length
+      break
+    }
+
+    // Recorded while the next message goes out
+    const recorded: Promise<void>[] = []
+    let nextSendAt = Date.now()
+    try {
+      for (const email of claimed) {
+        const wait = nextSendAt - Date.now()
+        if (wait > 0) await new Promise((resolve) => setTimeout(resolve, wait))
+        nextSendAt = Math.max(nextSendAt, Date.now()) + interval
+
+        try {
+          const messageId = await transport.send({
+            from: sender(),
+            to: email.recipient,
+            subject: email.subject,
+            text: email.text_content,
+            html: email.html_content,
+          })
+          recorded.push(markSent(supabase, email, messageId))
+          sent++
+        } catch (error: any) {
+          console.error(`Error sending email ${email.id}:`, error)
+          await markFailed(supabase, email, error, !(error instanceof DeliveryError) || error.temporary)
+          failed++
+        }
+      }
+    } finally {
+      await transport.close().catch(() => undefined)
+      await Promise.all(recorded)
+    }
+  }
+
+  return { sent, failed, batches }
+}
+
+/**
+ * Start draining the outbox in the background, at most once per instance
+ * Where the platform freezes functions after responding,
+ * /api/notifications/email/process drains instead.
+ */
+export function drainEmailOutbox(supabase: SupabaseClient) {
+  runInBackground('Email outbox worker', () => processEmailOutbox(supabase))
+}
@@ -0,0 +1,88 @@
+import { cache } from 'react'
+import { getReferenceClient } from '@/lib/api/reference-cache'
+
+/**
+ * Data for the public property detail page (/properties/[id])
+ *
+ * Read with the shared anon client (no cookies), so the page can be
+ * pre-rendered and served from the full route cache; admin edits revalidate
+ * it through lib/services/revalidation.ts.
+ */
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+export interface PropertyContent {
+  highlights: any[]
+  amenities: any[]
+  specifications: any[]
+  nearbyPlaces: any[]
+  reraInfo: any
+  developer: any
+}
+
+export const EMPTY_PROPERTY_CONTENT: PropertyContent = {
+  highlights: [],
+  amenities: [],
+  specifications: [],
+  nearbyPlaces: [],
+  reraInfo: null,
+  developer: null,
+}
+
+/**
+ * Property (by id or slug) with its images and content; null when not found
+ * Deduplicated per render, so metadata and the page share one read.
+ */
+export const getPropertyPage = cache(async (idOrSlug: string) => {
+  const supabase = getReferenceClient()
+
+  const { data: property, error } = await supabase
+    .from('properties')
+    .select('*, property_images(image_url, is_primary, display_order)')
+    .eq(UUID_PATTERN.test(idOrSlug) ? 'id' : 'slug', idOrSlug)
+    .maybeSingle()
+
+  if (error) throw error
+  if (!property) return null
+
+  property.property_images?.sort((a: any, b: any) => a.display_order - b.display_order)
+
+  // Content tables may be missing on older databases; errors leave the section empty
+  const [highlights, amenities, specifications, nearbyPlaces, reraInfo, developer] = await Promise.all([
+    supabase.from('property_highlights').select('*').eq('property_id', property.id).order('display_order'),
+    supabase.from('property_amenities').select('*').eq('property_id', property.id).order('display_order'),
+    supabase.from('property_specifications').select('*').eq('property_id', property.id).order('category, display_order'),
+    supabase.from('nearby_places').select('*').eq('property_id', property.id),
+    supabase.from('property_rera_info').select('*').eq('property_id', property.id).maybeSingle(),
+    property.developer_id
+      ? supabase.from('developers').select('*').eq('id', property.developer_id).maybeSingle()
+      : Promise.resolve({ data: null }),
+  ])
+
+  const content: PropertyContent = {
+    highlights: highlights.data || [],
+    amenities: amenities.data || [],
+    specifications: specifications.data || [],
+    nearbyPlaces: nearbyPlaces.data || [],
+    reraInfo: reraInfo.data || null,
+    developer: developer.data || null,
+  }
+
+  return { property, content }
+})
+
+/**
+ * Featured properties to pre-render at build time, by id and by slug
+ * (both URL forms are linked); the rest render on first request
+ */
+export async function getPrerenderedPropertyIds(limit: number): Promise<string[]> {
+  const { data, error } = await getReferenceClient()
+    .from('properties')
+    .select('id, slug')
+    .eq('is_featured', true)
+    .order('created_at', { ascending: false })
+    .limit(limit)
+
+  if (error) throw error
+  return (data || []).flatMap((property) => [property.id, property.slug].filter(Boolean))
+}
@@ -0,0 +1,228 @@
+import { SupabaseClient } from '@supabase/supabase-js'
+import crypto from 'crypto'
+import { mapSettledWithConcurrency, runInBackground } from '@/lib/utils/concurrency'
+
+/**
+ * Razorpay webhook queue (razorpay_webhook_events, migration 030)
+ *
+ * The webhook route only verifies, stores and acknowledges an event; a
+ * redelivered event hits the unique event_id and is dropped. Workers claim
+ * batches with claim_razorpay_webhook_events() and apply each subscription's
+ * events sequentially, oldest first, with retries and backoff.
+ */
+
+const BATCH_SIZE = parseInt(process.env.WEBHOOK_BATCH_SIZE || '100')
+const CONCURRENCY = parseInt(process.env.WEBHOOK_CONCURRENCY || '8')
+const LEASE_SECONDS = 60
+const MAX_ATTEMPTS = 8
+
+interface QueuedEvent {
+  id: number
+  event_id: string
+  event_type: string
+  subscription_key: string
+  event_created_at: number
+  payload: any
+  attempts: number
+}
+
+export function verifyWebhookSignature(body: string, signature: string, secret: string): boolean {
+  const expected = Buffer.from(crypto.createHmac('sha256', secret).update(body).digest('hex'))
+  const received = Buffer.from(signature)
+  return expected.length === received.length && crypto.timingSafeEqual(expected, received)
+}
+
+/**
+ * Store a verified event; `duplicate` when its idempotency key was seen before
+ */
+export async function enqueueWebhookEvent(
+  supabase: SupabaseClient,
+  body: string,
+  eventId: string | null
+): Promise<{ duplicate: boolean }> {
+  const event = JSON.parse(body)
+  const subscriptionId =
+    event.payload?.subscription?.entity?.id || event.payload?.payment?.entity?.subscription_id
+
+  const key = eventId || crypto.createHash('sha256').update(body).digest('hex')
+  const { data, error } = await supabase
+    .from('razorpay_webhook_events')
+    .upsert(
+      {
+        event_id: key,
+        event_type: event.event,
+        subscription_key: subscriptionId || key,
+        event_created_at: event.created_at || Math.floor(Date.now() / 1000),
+        payload: event.payload || {},
+      },
+      { onConflict: 'event_id', ignoreDuplicates: true }
+    )
+    .select('id')
+
+  if (error) throw error
+  return { duplicate: !data?.length }
+}
+
+function toIso(seconds: number | null | undefined) {
+  return seconds ? new Date(seconds * 1000).toISOString() : null
+}
+
+/**
+ * Apply one event to user_subscriptions
+ * Updates are skipped when a newer event was already applied
+ */
+async function applyEvent(supabase: SupabaseClient, event: QueuedEvent) {
+  const subscription = event.payload.subscription?.entity
+  const now = new Date().toISOString()
+  let changes: Record<string, unknown> | null = null
+
+  switch (event.event_type) {
+    case 'subscription.activated':
+      changes = {
+        status: 'active',
+        current_period_start: toIso(subscription.start_at),
+        current_period_end: toIso(subscription.end_at),
+      }
+      break
+
+    case 'subscription.charged':
+      changes = {
+        current_period_start: toIso(subscription.current_start),
+        current_period_end: toIso(subscription.current_end),
+      }
+      break
+
+    case 'subscription.cancelled':
+      changes = { status: 'cancelled', cancelled_at: now }
+      break
+
+    case 'subscription.completed':
+      changes = { status: 'expired' }
+      break
+
+    case 'subscription.paused':
+      changes = { status: 'suspended' }
+      break
+
+    case 'subscription.resumed':
+      changes = { status: 'active' }
+      break
+
+    case 'payment.failed': {
+      const payment = event.payload.payment?.entity
+      console.log('Payment failed:', payment?.id, 'for subscription:', payment?.subscription_id)
+      return
+    }
+
+    default:
+      console.log(`Unhandled event type: ${event.event_type}`)
+      return
+  }
+
+  const { error } = await supabase
+    .from('user_subscriptions')
+    .update({ ...changes, razorpay_event_at: event.event_created_at, updated_at: now })
+    .eq('razorpay_subscription_id', subscription.id)
+    .or(`razorpay_event_at.is.null,razorpay_event_at.lte.${event.event_created_at}`)
+
+  if (error) throw error
+}
+
+// Events of one subscription, in order; stops at the first failure so later
+// events wait for the retry
+async function applySubscriptionEvents(supabase: SupabaseClient, events: QueuedEvent[]) {
+  for (let i = 0; i < events.length; i++) {
+    const event = events[i]
+    try {
+      await applyEvent(supabase, event)
+      const { error } = await supabase
+        .from('razorpay_webhook_events')
+        .update({ status: 'done', processed_at: new Date().toISOString(), locked_until: null, last_error: null })
+        .eq('id', event.id)
+      if (error) throw error
+    } catch (error: any) {
+      console.error(`Error applying Razorpay event ${event.event_id}:`, error)
+      const backoffMs = Math.min(2 ** event.attempts * 1000, 10 * 60 * 1000)
+      await supabase
+        .from('razorpay_webhook_events')
+        .update({
+          status: event.attempts >= MAX_ATTEMPTS ? 'failed' : 'pending',
+          last_error: error.message || String(error),
+          locked_until: event.attempts >= MAX_ATTEMPTS ? null : new Date(Date.now() + backoffMs).toISOString(),
+        })
+        .eq('id', event.id)
+
+      // Hand the rest back; the backoff above holds the subscription until the retry.
+      // They were never applied, so undo the attempt the claim counted for them
+      // (one update per distinct attempts value, usually just one)
+      const rest = new Map<number, number[]>()
+      for (const later of events.slice(i + 1)) {
+        rest.set(later.attempts, [...(rest.get(later.attempts) || []), later.id])
+      }
+      await Promise.all(
+        Array.from(rest, ([attempts, ids]) =>
+          supabase
+            .from('razorpay_webhook_events')
+            .update({ status: 'pending', locked_until: null, attempts: Math.max(0, attempts - 1) })
+            .in('id', ids)
+        )
+      )
+      return false
+    }
+  }
+  return true
+}
+
+/**
+ * Claim and apply queued events until the queue is empty or `maxBatches` ran
+ * `failed` counts subscriptions whose events stopped at an error
+ */
+export async function processWebhookEvents(
+  supabase: SupabaseClient,
+  maxBatches = 10
+): Promise<{ processed: number; failed: number; batches: number }> {
+  let processed = 0
+  let failed = 0
+  let batches = 0
+
+  while (batches < maxBatches) {
+    const { data, error } = await supabase.rpc('claim_razorpay_webhook_events', {
+      p_limit: BATCH_SIZE,
+      p_lease_seconds: LEASE_SECONDS,
+    })
+    if (error) throw error
+
+    const claimed: QueuedEvent[] = data || []
+    if (!claimed.length) break
+    batches++
+
+    const bySubscription = new Map<string, QueuedEvent[]>()
+    for (const event of claimed) {
+      const events = bySubscription.get(event.subscription_key) || []
+      events.push(event)
+      bySubscription.set(event.subscription_key, events)
+    }
+    const groups = Array.from(bySubscription.values()).map((events) =>
+      events.sort((a, b) => a.event_created_at - b.event_created_at || a.id - b.id)
+    )
+
+    const results = await mapSettledWithConcurrency(groups, CONCURRENCY, (events) =>
+      applySubscriptionEvents(supabase, events)
+    )
+    results.forEach((result, index) => {
+      if (result.status === 'fulfilled' && result.value) processed += groups[index].length
+      else failed++
+    })
+  }
+
+  return { processed, failed, batches }
+}
+
+/**
+ * Start draining the queue in the background, at most once per instance
+ * Where the platform freezes functions after responding,
+ * /api/razorpay/webhook/process drains instead.
+ */
+export function drainWebhookQueue(supabase: SupabaseClient) {
+  runInBackground('Razorpay webhook worker', () => processWebhookEvents(supabase))
+}
@@ -0,0 +1,64 @@
+import { revalidatePath } from 'next/cache'
+import { getReferenceClient } from '@/lib/api/reference-cache'
+
+/**
+ * On-demand revalidation of cached public pages
+ *
+ * Admin edits call these (directly from API routes, or through
+ * /api/admin/revalidate from pages that write with the browser client), so
+ * cached pages are regenerated on their next request instead of waiting for
+ * their revalidate interval.
+ */
+
+// /properties/[id] is linked by id and by slug; each is its own cache entry
+function revalidatePropertyPaths(property: { id: string; slug?: string | null }) {
+  revalidatePath(`/properties/${property.id}`)
+  if (property.slug) revalidatePath(`/properties/${property.slug}`)
+}
+
+/**
+ * After the property, its images or its content change
+ * `slug` is the previous slug when it was edited, so the old URL drops too
+ */
+export async function revalidateProperty(propertyId: string, slug?: string | null) {
+  const { data, error } = await getReferenceClient()
+    .from('properties')
+    .select('id, slug')
+    .eq('id', propertyId)
+    .maybeSingle()
+
+  // The id path is enough to go on; the slug path then waits for its interval
+  if (error) console.error('Error looking up property slug for revalidation:', error)
+  revalidatePropertyPaths({ id: propertyId, slug: data?.slug })
+  if (slug && slug !== data?.slug) revalidatePath(`/properties/${slug}`)
+}
+
+/**
+ * After a developer changes: every property page showing its profile
+ */
+export async function revalidateDeveloper(developerId: string): Promise<number> {
+  const { data, error } = await getReferenceClient()
+    .from('properties')
+    .select('id, slug')
+    .eq('developer_id', developerId)
+
+  if (error) throw error
+  for (const property of data || []) revalidatePropertyPaths(property)
+  return data?.length || 0
+}
+
+/**
+ * After a post is published, edited, unpublished or deleted: the listing,
+ * every article (each lists the latest posts) and the home page section
+ */
+export function revalidateBlog() {
+  revalidatePath('/blog', 'layout')
+  revalidatePath('/')
+}
+
+/**
+ * After a testimonial is added, approved, featured or deleted: the home page
+ */
+export function revalidateTestimonials() {
+  revalidatePath('/')
+}
@@ -0,0 +1,236 @@
+import crypto from 'crypto'
+import net from 'net'
+import tls from 'tls'
+
+/**
+ * Minimal SMTP client for the email outbox
+ *
+ * One connection sends a whole batch (EHLO, STARTTLS and AUTH happen once),
+ * which is most of the saving over a connection per message. Supports
+ * implicit TLS (port 465), STARTTLS and AUTH PLAIN. Credentials are only sent
+ * over TLS unless `allowInsecureAuth` is set.
+ */
+
+export interface SmtpConfig {
+  host: string
+  port: number
+  secure: boolean
+  user?: string
+  pass?: string
+  timeoutMs?: number
+  // Send AUTH over a plaintext connection (local relays only)
+  allowInsecureAuth?: boolean
+}
+
+export interface MailMessage {
+  from: string
+  to: string
+  subject: string
+  text?: string | null
+  html?: string | null
+}
+
+export class SmtpError extends Error {
+  constructor(message: string, public code: number) {
+    super(message)
+    this.name = 'SmtpError'
+  }
+
+  // 4xx replies and dropped connections are worth retrying; 5xx are not
+  get temporary() {
+    return this.code < 500
+  }
+}
+
+interface Reply {
+  code: number
+  text: string
+}
+
+function encodeHeader(value: string) {
+  return /^[\x20-\x7e]*$/.test(value) ? value : `=?UTF-8?B?${Buffer.from(value).toString('base64')}?=`
+}
+
+function base64Lines(value: string) {
+  return (Buffer.from(value).toString('base64').match(/.{1,76}/g) || []).join('\r\n')
+}
+
+/**
+ * Address from `addr` or `Name <addr>`
+ * CR or LF would let the value inject SMTP commands or headers and a stray
+ * angle bracket another address, so such values are refused (permanently:
+ * a retry cannot fix them)
+ */
+function address(value: string): string {
+  const match = value.match(/^[^<>\r\n]*<([^<>\s]+)>\s*$/) || value.match(/^\s*([^<>\s]+)\s*$/)
+  if (!match) throw new SmtpError(`Invalid address ${JSON.stringify(value)}`, 553)
+  return match[1]
+}
+
+// Header value for an address, checked the same way
+function mailbox(value: string) {
+  address(value)
+  return value.trim()
+}
+
+export function formatMessage(message: MailMessage, domain: string): string {
+  const boundary = `=_${crypto.randomBytes(12).toString('hex')}`
+  const headers = [
+    `From: ${mailbox(message.from)}`,
+    `To: ${mailbox(message.to)}`,
+    `Subject: ${encodeHeader(message.subject)}`,
+    `Date: ${new Date().toUTCString()}`,
+    `Message-ID: <${crypto.randomUUID()}@${domain}>`,
+    'MIME-Version: 1.0',
+    `Content-Type: multipart/alternative; boundary="${boundary}"`,
+  ]
+  const parts = [
+    ['text/plain', message.text || ''],
+    ['text/html', message.html || ''],
+  ].filter(([, body]) => body)
+
+  return [
+    ...headers,
+    '',
+    ...parts.flatMap(([type, body]) => [
+      `--${boundary}`,
+      `Content-Type: ${type}; charset=utf-8`,
+      'Content-Transfer-Encoding: base64',
+      '',
+      base64Lines(body),
+    ]),
+    `--${boundary}--`,
+  ].join('\r\n')
+}
+
+export class SmtpConnection {
+  private socket!: net.Socket
+  private buffered: string[] = []
+  private partial = ''
+  private waiting: { resolve: (line: string) => void; reject: (error: Error) => void } | null = null
+  private failure: Error | null = null
+
+  private constructor(private config: SmtpConfig) {}
+
+  static async open(config: SmtpConfig): Promise<SmtpConnection> {
+    const connection = new SmtpConnection(config)
+    await connection.connect()
+    return connection
+  }
+
+  private attach(socket: net.Socket) {
+    this.socket = socket
+    socket.setEncoding('utf8')
+    socket.setTimeout(this.config.timeoutMs || 30000, () => socket.destroy(new SmtpError('SMTP timeout', 421)))
+    socket.on('data', (chunk: string) => this.onData(chunk))
+    socket.on('error', (error) => this.fail(error))
+    socket.on('close', () => this.fail(new SmtpError('SMTP connection closed', 421)))
+  }
+
+  private onData(chunk: string) {
+    this.partial += chunk
+    let end: number
+    while ((end = this.partial.indexOf('\r\n')) !== -1) {
+      const line = this.partial.slice(0, end)
+      this.partial = this.partial.slice(end + 2)
+      if (this.waiting) {
+        const { resolve } = this.waiting
+        this.waiting = null
+        resolve(line)
+      } else {
+        this.buffered.push(line)
+      }
+    }
+  }
+
+  private fail(error: Error) {
+    this.failure ??= error
+    if (this.waiting) {
+      const { reject } = this.waiting
+      this.waiting = null
+      reject(this.failure)
+    }
+  }
+
+  private nextLine(): Promise<string> {
+    if (this.buffered.length) return Promise.resolve(this.buffered.shift()!)
+    if (this.failure) return Promise.reject(this.failure)
+    return new Promise((resolve, reject) => {
+      this.waiting = { resolve, reject }
+    })
+  }
+
+  private async reply(): Promise<Reply> {
+    const lines: string[] = []
+    let line: string
+    do {
+      line = await this.nextLine()
+      lines.push(line.slice(4))
+    } while (line[3] === '-')
+    return { code: parseInt(line.slice(0, 3)), text: lines.join('\n') }
+  }
+
+  private async command(line: string | null, expected: number[]): Promise<Reply> {
+    if (line !== null) this.socket.write(line + '\r\n')
+    const reply = await this.reply()
+    if (!expected.includes(reply.code)) {
+      throw new SmtpError(`${line?.split(' ')[0] || 'greeting'}: ${reply.code} ${reply.text}`, reply.code)
+    }
+    return reply
+  }
+
+  private async connect() {
+    const { host, port, secure } = this.config
+    const socket = secure ? tls.connect({ host, port, servername: host }) : net.connect({ host, port })
+    this.attach(socket)
+    await this.command(null, [220])
+
+    let encrypted = secure
+    let hello = await this.command('EHLO co-ventures', [250])
+    if (!secure && /\bSTARTTLS\b/i.test(hello.text)) {
+      await this.command('STARTTLS', [220])
+      socket.removeAllListeners('data')
+      socket.removeAllListeners('close')
+      this.attach(tls.connect({ socket, servername: host }))
+      hello = await this.command('EHLO co-ventures', [250])
+      encrypted = true
+    }
+
+    if (this.config.user) {
+      if (!encrypted && !this.config.allowInsecureAuth) {
+        throw new SmtpError(`${host} does not offer STARTTLS; refusing to send credentials in cleartext`, 530)
+      }
+      const token = Buffer.from(`\0${this.config.user}\0${this.config.pass || ''}`).toString('base64')
+      await this.command(`AUTH PLAIN ${token}`, [235])
+    }
+  }
+
+  /**
+   * Send one message; resolves with the server's acceptance reply
+   */
+  async send(message: MailMessage): Promise<string> {
+    // Built before the session is touched, so a refused address sends nothing
+    const from = address(message.from)
+    const to = address(message.to)
+    const body = formatMessage(message, from.split('@')[1] || 'localhost')
+    try {
+      await this.command(`MAIL FROM:<${from}>`, [250])
+      await this.command(`RCPT TO:<${to}>`, [250, 251])
+      await this.command('DATA', [354])
+      // Dot-stuffing; base64 bodies never start a line with "." but headers could
+      const { text } = await this.command(body.replace(/^\./gm, '..') + '\r\n.', [250])
+      return text
+    } catch (error) {
+      // Leave the session ready for the next message
+      if (error instanceof SmtpError && !this.failure) {
+        await this.command('RSET', [250]).catch(() => undefined)
+      }
+      throw error
+    }
+  }
+
+  async close() {
+    if (!this.failure) await this.command('QUIT', [221]).catch(() => undefined)
+    this.socket.destroy()
+  }
+}
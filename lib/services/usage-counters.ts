@@ -0,0 +1,34 @@
+/**
+ * Monthly usage counters (subscription_usage_counters)
+ * Maintained by a trigger on subscription_usage_logs, so reads are a single
+ * primary-key lookup instead of a count over the log
+ */
+
+export type UsageType = 'ai_analysis' | 'property_comparison' | 'export_report'
+
+/**
+ * First day of the current usage period (calendar month, UTC) as YYYY-MM-DD
+ */
+export function currentPeriodStart(now: Date = new Date()): string {
+  return new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth(), 1)).toISOString().slice(0, 10)
+}
+
+/**
+ * Usage of one type in the current period for a user
+ */
+export async function getUsageCount(supabase: any, userId: string, usageType: UsageType): Promise<number> {
+  const { data, error } = await supabase
+    .from('subscription_usage_counters')
+    .select('count')
+    .eq('user_id', userId)
+    .eq('usage_type', usageType)
+    .eq('period_start', currentPeriodStart())
+    .maybeSingle()
+
+  if (error) {
+    console.error('Error reading usage counter:', error)
+    return 0
+  }
+
+  return data?.count || 0
+}
@@ -0,0 +1,169 @@
+/**
+ * Local verification of Supabase session JWTs (Edge-compatible, Web Crypto only)
+ *
+ * Middleware uses this to accept a valid, unexpired access token without a
+ * round trip to Supabase Auth. Projects on asymmetric signing keys are
+ * verified against the project's JWKS (cached); legacy HS256 projects need
+ * SUPABASE_JWT_SECRET. Anything that cannot be verified locally returns null
+ * and the caller falls back to `auth.getUser()`.
+ */
+
+export interface JwtPayload {
+  sub?: string
+  exp?: number
+  aud?: string | string[]
+  iss?: string
+  role?: string
+  [claim: string]: unknown
+}
+
+const JWKS_CACHE_TTL_MS = parseInt(process.env.AUTH_JWKS_CACHE_TTL_MS || '600000')
+// Minimum gap between JWKS refetches triggered by an unknown key id
+const JWKS_REFETCH_MIN_MS = 30000
+
+const ALGORITHMS: Record<string, { import: any; verify: any }> = {
+  HS256: {
+    import: { name: 'HMAC', hash: 'SHA-256' },
+    verify: { name: 'HMAC' },
+  },
+  RS256: {
+    import: { name: 'RSASSA-PKCS1-v1_5', hash: 'SHA-256' },
+    verify: { name: 'RSASSA-PKCS1-v1_5' },
+  },
+  ES256: {
+    import: { name: 'ECDSA', namedCurve: 'P-256' },
+    verify: { name: 'ECDSA', hash: 'SHA-256' },
+  },
+}
+
+const encoder = new TextEncoder()
+
+let jwks: { keys: Map<string, CryptoKey>; fetchedAt: number } | null = null
+let jwksPending: Promise<void> | null = null
+let hmacKey: Promise<CryptoKey> | null = null
+
+function base64UrlDecode(value: string): Uint8Array {
+  const base64 = value.replace(/-/g, '+').replace(/_/g, '/').padEnd(Math.ceil(value.length / 4) * 4, '=')
+  const binary = atob(base64)
+  const bytes = new Uint8Array(binary.length)
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
+  return bytes
+}
+
+function decodeJson(segment: string): any {
+  return JSON.parse(new TextDecoder().decode(base64UrlDecode(segment)))
+}
+
+async function loadJwks() {
+  const url = `${process.env.NEXT_PUBLIC_SUPABASE_URL}/auth/v1/.well-known/jwks.json`
+  const response = await fetch(url, { cache: 'no-store' })
+  if (!response.ok) throw new Error(`JWKS fetch failed: ${response.status}`)
+
+  const { keys = [] } = await response.json()
+  const imported = new Map<string, CryptoKey>()
+  for (const jwk of keys) {
+    const algorithm = ALGORITHMS[jwk.alg]
+    if (!algorithm || !jwk.kid || jwk.alg === 'HS256') continue
+    imported.set(jwk.kid, await crypto.subtle.importKey('jwk', jwk, algorithm.import, false, ['verify']))
+  }
+  jwks = { keys: imported, fetchedAt: Date.now() }
+}
+
+async function getJwk(kid: string): Promise<CryptoKey | null> {
+  const age = jwks ? Date.now() - jwks.fetchedAt : Infinity
+  const stale = age > JWKS_CACHE_TTL_MS
+  const unknown = !jwks?.keys.has(kid) && age > JWKS_REFETCH_MIN_MS
+
+  if (stale || unknown) {
+    jwksPending ??= loadJwks().finally(() => {
+      jwksPending = null
+    })
+    try {
+      await jwksPending
+    } catch (error) {
+      console.error('Error loading JWKS:', error)
+    }
+  }
+
+  return jwks?.keys.get(kid) || null
+}
+
+// Issuer of the project's tokens; SUPABASE_JWT_ISSUER overrides it when the
+// app reaches Supabase through another URL (a proxy)
+function expectedIssuer() {
+  return process.env.SUPABASE_JWT_ISSUER || `${(process.env.NEXT_PUBLIC_SUPABASE_URL || '').replace(/\/+$/, '')}/auth/v1`
+}
+
+// Signed-in user session from this project: anon and service-role keys and
+// tokens of other projects signed with a shared key are not sessions
+function isSessionToken(payload: JwtPayload) {
+  const audiences = Array.isArray(payload.aud) ? payload.aud : [payload.aud]
+  return audiences.includes('authenticated') && payload.iss === expectedIssuer() && typeof payload.sub === 'string'
+}
+
+function getHmacKey(): Promise<CryptoKey> | null {
+  const secret = process.env.SUPABASE_JWT_SECRET
+  if (!secret) return null
+  hmacKey ??= crypto.subtle.importKey('raw', encoder.encode(secret), ALGORITHMS.HS256.import, false, ['verify'])
+  return hmacKey
+}
+
+/**
+ * Verified, unexpired payload of a signed-in user's `token`, or null
+ */
+export async function verifySupabaseJwt(token: string): Promise<JwtPayload | null> {
+  try {
+    const [headerSegment, payloadSegment, signatureSegment] = token.split('.')
+    if (!headerSegment || !payloadSegment || !signatureSegment) return null
+
+    const header = decodeJson(headerSegment)
+    const algorithm = ALGORITHMS[header.alg]
+    if (!algorithm) return null
+
+    const key = header.alg === 'HS256' ? await getHmacKey() : header.kid ? await getJwk(header.kid) : null
+    if (!key) return null
+
+    const valid = await crypto.subtle.verify(
+      algorithm.verify,
+      key,
+      base64UrlDecode(signatureSegment),
+      encoder.encode(`${headerSegment}.${payloadSegment}`)
+    )
+    if (!valid) return null
+
+    const payload: JwtPayload = decodeJson(payloadSegment)
+    if (typeof payload.exp !== 'number' || payload.exp * 1000 <= Date.now()) return null
+    if (!isSessionToken(payload)) return null
+
+    return payload
+  } catch {
+    return null
+  }
+}
+
+/**
+ * Access token from the @supabase/ssr session cookie (`sb-<ref>-auth-token`,
+ * possibly split into `.0`, `.1`, ... chunks and `base64-` encoded)
+ */
+export function readSessionAccessToken(cookies: { name: string; value: string }[]): string | null {
+  const session = cookies.filter((cookie) => /^sb-.+-auth-token(\.\d+)?$/.test(cookie.name))
+  if (session.length === 0) return null
+
+  const chunkIndex = (name: string) => parseInt(name.match(/\.(\d+)$/)?.[1] || '-1')
+  const raw = session
+    .sort((a, b) => chunkIndex(a.name) - chunkIndex(b.name))
+    .map((cookie) => cookie.value)
+    .join('')
+
+  try {
+    const text = raw.startsWith('base64-')
+      ? new TextDecoder().decode(base64UrlDecode(raw.slice('base64-'.length)))
+      : decodeURIComponent(raw)
+    const value = JSON.parse(text)
+    // Older @supabase/ssr versions stored [access_token, refresh_token, ...]
+    const token = Array.isArray(value) ? value[0] : value?.access_token
+    return typeof token === 'string' ? token : null
+  } catch {
+    return null
+  }
+}
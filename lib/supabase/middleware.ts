@@ -1,6 +1,67 @@
 import { createServerClient, type CookieOptions } from '@supabase/ssr'
 import { NextResponse, type NextRequest } from 'next/server'
 import type { Database } from '../types/database.types'
+import { readSessionAccessToken, verifySupabaseJwt } from './jwt'
+
+// `local` verifies the session JWT in middleware and only calls Supabase Auth
+// when it cannot (missing key, expired or about to expire); `remote` always calls it
+export const AUTH_MIDDLEWARE_MODE = process.env.AUTH_MIDDLEWARE_MODE === 'remote' ? 'remote' : 'local'
+
+// Refresh through Supabase Auth when the access token expires within this window
+const REFRESH_MARGIN_MS = parseInt(process.env.AUTH_REFRESH_MARGIN_MS || '60000')
+
+/**
+ * Routes that never need the session in middleware
+ * These pages render on the client, where the browser client refreshes its own session
+ */
+export const PUBLIC_ROUTES = [
+  '/',
+  '/about',
+  '/blog',
+  '/contact',
+  '/faqs',
+  '/how-it-works',
+  '/privacy-policy',
+  '/services',
+  '/terms-and-conditions',
+  '/properties',
+  '/api/razorpay/webhook',
+]
+
+export function isPublicRoute(pathname: string): boolean {
+  return PUBLIC_ROUTES.some((route) =>
+    route === '/' ? pathname === '/' : pathname === route || pathname.startsWith(`${route}/`)
+  )
+}
+
+export type SessionOutcome = 'public' | 'anonymous' | 'local' | 'remote'
+
+/**
+ * Refresh the session only when it is needed
+ * Public routes and requests without a session cookie skip Supabase entirely;
+ * a locally verified token with time left passes straight through
+ */
+export async function handleSession(
+  request: NextRequest
+): Promise<{ response: NextResponse; outcome: SessionOutcome }> {
+  if (isPublicRoute(request.nextUrl.pathname)) {
+    return { response: NextResponse.next(), outcome: 'public' }
+  }
+
+  if (AUTH_MIDDLEWARE_MODE === 'local') {
+    const token = readSessionAccessToken(request.cookies.getAll())
+    if (!token) {
+      return { response: NextResponse.next(), outcome: 'anonymous' }
+    }
+
+    const payload = await verifySupabaseJwt(token)
+    if (payload?.exp && payload.exp * 1000 - Date.now() > REFRESH_MARGIN_MS) {
+      return { response: NextResponse.next(), outcome: 'local' }
+    }
+  }
+
+  return { response: await updateSession(request), outcome: 'remote' }
+}
 
 /**
  * Create a Supabase client for use in Middleware
@@ -0,0 +1,148 @@
+import type { User } from '@supabase/supabase-js'
+import { cookies } from 'next/headers'
+import { NextResponse } from 'next/server'
+import { createAdminClient, createClient } from './server'
+import { readSessionAccessToken, verifySupabaseJwt, type JwtPayload } from './jwt'
+import { AUTH_MIDDLEWARE_MODE } from './middleware'
+import { timed } from '../api/server-timing'
+
+/**
+ * Supabase clients and the signed-in user, built once per request
+ *
+ * Route handlers used to create a cookie client in every helper, often a
+ * service-role client as well, and call `auth.getUser()` in each, so one
+ * request could make several Auth round trips. `getRequestContext(request)`
+ * returns the same context for the whole request: clients are created on
+ * first use, the user is resolved once and the role is read once.
+ *
+ * A locally verified session JWT (`AUTH_MIDDLEWARE_MODE=local`) is still
+ * valid after the user signs out, until it expires; only `auth.getUser()`
+ * notices. `AUTH_API_MODE` sets where routes may rely on it:
+ * - `reads` (default): GET/HEAD requests; writes and admin checks ask Auth
+ * - `local`: everywhere
+ * - `remote`: nowhere (always the case with `AUTH_MIDDLEWARE_MODE=remote`)
+ */
+
+type ServerClient = Awaited<ReturnType<typeof createClient>>
+
+export interface RequestContext {
+  /** Cookie client; queries run as the signed-in user under RLS */
+  supabase(): Promise<ServerClient>
+  /** Service-role client; bypasses RLS */
+  admin(): Promise<ServerClient>
+  /** Signed-in user, or null */
+  user(): Promise<User | null>
+  /** Signed-in user as admin checks see it: confirmed with Auth unless AUTH_API_MODE=local */
+  adminUser(): Promise<User | null>
+  /** `users.role` of adminUser(), or null */
+  role(): Promise<string | null>
+  /** Signed in with the admin or super_admin role */
+  isAdmin(): Promise<boolean>
+}
+
+const ADMIN_ROLES = ['admin', 'super_admin']
+
+const AUTH_API_MODE =
+  AUTH_MIDDLEWARE_MODE === 'remote' || process.env.AUTH_API_MODE === 'remote'
+    ? 'remote'
+    : process.env.AUTH_API_MODE === 'local'
+      ? 'local'
+      : 'reads'
+
+const READ_METHODS = ['GET', 'HEAD']
+
+const contexts = new WeakMap<Request, RequestContext>()
+
+function once<T>(load: () => Promise<T>): () => Promise<T> {
+  let pending: Promise<T> | null = null
+  return () => (pending ??= load())
+}
+
+function userFromClaims(payload: JwtPayload): User | null {
+  if (!payload.sub) return null
+
+  return {
+    id: payload.sub,
+    aud: 'authenticated',
+    role: payload.role,
+    email: payload.email as string | undefined,
+    phone: payload.phone as string | undefined,
+    app_metadata: (payload.app_metadata as User['app_metadata']) || {},
+    user_metadata: (payload.user_metadata as User['user_metadata']) || {},
+    created_at: '',
+  }
+}
+
+async function verifiedUser(): Promise<User | null> {
+  const cookieStore = await cookies()
+  const token = readSessionAccessToken(cookieStore.getAll())
+  if (!token) return null
+
+  const payload = await verifySupabaseJwt(token)
+  return payload ? userFromClaims(payload) : null
+}
+
+export function getRequestContext(request: Request): RequestContext {
+  const existing = contexts.get(request)
+  if (existing) return existing
+
+  const supabase = once(() => createClient())
+  const admin = once(() => createAdminClient())
+
+  const confirmedUser = once(() =>
+    timed('auth', async () => {
+      const { data: { user }, error } = await (await supabase()).auth.getUser()
+      return error ? null : user
+    })
+  )
+
+  const trustsClaims =
+    AUTH_API_MODE === 'local' || (AUTH_API_MODE === 'reads' && READ_METHODS.includes(request.method))
+
+  const user = once(async () => {
+    if (trustsClaims) {
+      const local = await timed('auth', verifiedUser)
+      if (local) return local
+    }
+    return confirmedUser()
+  })
+
+  const adminUser = AUTH_API_MODE === 'local' ? user : confirmedUser
+
+  const role = once(async () => {
+    const current = await adminUser()
+    if (!current) return null
+
+    const { data } = await (await supabase())
+      .from('users')
+      .select('role')
+      .eq('id', current.id)
+      .single()
+
+    // @ts-ignore
+    return data?.role ?? null
+  })
+
+  const isAdmin = async () => ADMIN_ROLES.includes((await role()) || '')
+
+  const context: RequestContext = { supabase, admin, user, adminUser, role, isAdmin }
+  contexts.set(request, context)
+  return context
+}
+
+/**
+ * 401 or 403 response unless the request is from an admin, else null
+ * `const denied = await requireAdmin(context); if (denied) return denied`
+ */
+export async function requireAdmin(context: RequestContext) {
+  const user = await context.adminUser()
+  if (!user) {
+    return NextResponse.json({ error: 'Authentication required' }, { status: 401 })
+  }
+
+  if (!(await context.isAdmin())) {
+    return NextResponse.json({ error: 'Admin access required' }, { status: 403 })
+  }
+
+  return null
+}
@@ -1,6 +1,7 @@
 import { createServerClient, type CookieOptions } from '@supabase/ssr'
 import { cookies } from 'next/headers'
 import type { Database } from '../types/database.types'
+import { timedFetch } from '../api/server-timing'
 
 /**
  * Create a Supabase client for use in Server Components
@@ -13,6 +14,8 @@ export async function createClient() {
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
     process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
     {
+      // Query time shows up in Server-Timing as `db` (lib/api/server-timing.ts)
+      global: { fetch: timedFetch },
       cookies: {
         get(name: string) {
           return cookieStore.get(name)?.value
@@ -51,6 +54,7 @@ export async function createAdminClient() {
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
     process.env.SUPABASE_SERVICE_ROLE_KEY!,
     {
+      global: { fetch: timedFetch },
       cookies: {
         get(name: string) {
           return cookieStore.get(name)?.value
@@ -0,0 +1,108 @@
+/**
+ * Error raised when a task does not finish before its deadline
+ */
+export class DeadlineExceededError extends Error {
+  constructor(label: string, ms: number) {
+    super(`${label} did not finish within ${ms}ms`)
+    this.name = 'DeadlineExceededError'
+  }
+}
+
+/**
+ * Run a task with a deadline
+ * The task receives an AbortSignal that fires when the deadline passes so
+ * the underlying request (fetch, OpenAI SDK call, ...) is cancelled too
+ */
+export async function withDeadline<T>(
+  task: (signal: AbortSignal) => Promise<T>,
+  ms: number,
+  label = 'Task'
+): Promise<T> {
+  const controller = new AbortController()
+  let timer: ReturnType<typeof setTimeout> | undefined
+
+  const deadline = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => {
+      controller.abort()
+      reject(new DeadlineExceededError(label, ms))
+    }, ms)
+  })
+
+  try {
+    return await Promise.race([task(controller.signal), deadline])
+  } finally {
+    clearTimeout(timer)
+  }
+}
+
+export type SettledResult<T> =
+  | { status: 'fulfilled'; value: T }
+  | { status: 'rejected'; reason: unknown }
+
+/**
+ * Map over items with at most `limit` tasks in flight
+ * Like Promise.allSettled: results keep input order and one failure does not
+ * stop the others
+ */
+export async function mapSettledWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<SettledResult<R>[]> {
+  const results: SettledResult<R>[] = new Array(items.length)
+  let next = 0
+
+  async function worker() {
+    while (next < items.length) {
+      const index = next++
+      try {
+        results[index] = { status: 'fulfilled', value: await fn(items[index], index) }
+      } catch (reason) {
+        results[index] = { status: 'rejected', reason }
+      }
+    }
+  }
+
+  // A NaN or non-positive limit (e.g. from a bad env value) still runs one worker
+  const size = Number.isFinite(limit) ? Math.floor(limit) : 1
+  const workers = Array.from({ length: Math.max(1, Math.min(size, items.length)) }, worker)
+  await Promise.all(workers)
+  return results
+}
+
+const backgroundRuns = ((globalThis as any).__backgroundRuns ??= new Map()) as Map<
+  string,
+  { running: boolean; again: boolean }
+>
+
+/**
+ * Run `task` in the background, at most once at a time per `name` and instance
+ * A call while it runs makes it go round once more, so work queued in the
+ * meantime is picked up. Errors are logged, never thrown.
+ */
+export function runInBackground(name: string, task: () => Promise<unknown>) {
+  let state = backgroundRuns.get(name)
+  if (!state) {
+    state = { running: false, again: false }
+    backgroundRuns.set(name, state)
+  }
+  if (state.running) {
+    state.again = true
+    return
+  }
+
+  const run = state
+  run.running = true
+  ;(async () => {
+    try {
+      do {
+        run.again = false
+        await task()
+      } while (run.again)
+    } catch (error) {
+      console.error(`${name} error:`, error)
+    } finally {
+      run.running = false
+    }
+  })()
+}
@@ -42,6 +42,30 @@ export function exportToCSV(data: any[], filename: string) {
   document.body.removeChild(link)
 }
 
+/**
+ * Download a CSV streamed by /api/admin/export/[dataset]
+ * The browser writes the response straight to disk, so the export is not
+ * limited to rows already loaded and is never held in memory by the page
+ */
+export function downloadServerExport(
+  dataset: 'leads' | 'contacts' | 'properties' | 'newsletter',
+  params: Record<string, string | null | undefined> = {}
+) {
+  const query = new URLSearchParams()
+  Object.entries(params).forEach(([key, value]) => {
+    if (value) query.set(key, value)
+  })
+
+  const link = document.createElement('a')
+  link.setAttribute('href', `/api/admin/export/${dataset}?${query}`)
+  link.setAttribute('download', '')
+  link.style.visibility = 'hidden'
+
+  document.body.appendChild(link)
+  link.click()
+  document.body.removeChild(link)
+}
+
 export function exportToExcel(data: any[], filename: string) {
   // For now, use CSV format (can be opened in Excel)
   // In future, can integrate xlsx library for true Excel format
@@ -0,0 +1,21 @@
+/**
+ * Ask the server to regenerate cached public pages after an admin edit
+ * (/api/admin/revalidate). Never throws: the edit itself succeeded, and the
+ * pages still refresh on their revalidate interval.
+ */
+export async function requestRevalidation(
+  type: 'property' | 'developer' | 'blog' | 'testimonial',
+  id?: string,
+  slug?: string | null
+) {
+  try {
+    const response = await fetch('/api/admin/revalidate', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ type, id, slug }),
+    })
+    if (!response.ok) console.error('Revalidation failed:', response.status)
+  } catch (error) {
+    console.error('Revalidation failed:', error)
+  }
+}
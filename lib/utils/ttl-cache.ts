@@ -0,0 +1,84 @@
+/**
+ * Small in-process cache with per-entry TTL and single-flight loading
+ *
+ * Concurrent `get` calls for a missing or expired key share one loader call.
+ * Loader errors are not cached, so the next caller retries.
+ */
+
+interface Entry<V> {
+  value: V
+  expiresAt: number
+}
+
+export interface CacheStats {
+  hits: number
+  misses: number
+  loads: number
+  size: number
+}
+
+export class TtlCache<K, V> {
+  private entries = new Map<K, Entry<V>>()
+  private inflight = new Map<K, Promise<V>>()
+  private stats = { hits: 0, misses: 0, loads: 0 }
+
+  constructor(private ttlMs: number) {}
+
+  async get(key: K, loader: () => Promise<V>): Promise<V> {
+    const entry = this.entries.get(key)
+    if (entry && entry.expiresAt > Date.now()) {
+      this.stats.hits++
+      return entry.value
+    }
+
+    this.stats.misses++
+    const pending = this.inflight.get(key)
+    if (pending) return pending
+
+    const load = (async () => {
+      this.stats.loads++
+      try {
+        const value = await loader()
+        // A ttl of 0 disables caching but keeps single-flight
+        if (this.ttlMs > 0 && this.inflight.get(key) === load) {
+          this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs })
+        }
+        return value
+      } finally {
+        if (this.inflight.get(key) === load) this.inflight.delete(key)
+      }
+    })()
+
+    this.inflight.set(key, load)
+    return load
+  }
+
+  /**
+   * Drop one key, or everything when called without a key
+   * In-flight loads started before the call will not repopulate the cache
+   */
+  invalidate(key?: K) {
+    if (key === undefined) {
+      this.entries.clear()
+      this.inflight.clear()
+    } else {
+      this.entries.delete(key)
+      this.inflight.delete(key)
+    }
+  }
+
+  getStats(): CacheStats {
+    return { ...this.stats, size: this.entries.size }
+  }
+}
+
+/**
+ * Keep one cache instance per process, surviving Next.js dev hot reloads
+ */
+export function processCache<K, V>(name: string, ttlMs: number): TtlCache<K, V> {
+  const registry = ((globalThis as any).__ttlCaches ??= new Map<string, TtlCache<any, any>>())
+  if (!registry.has(name)) {
+    registry.set(name, new TtlCache<K, V>(ttlMs))
+  }
+  return registry.get(name)
+}
@@ -0,0 +1,302 @@
+import { getSupabaseClient } from '@/lib/supabase/client'
+import { mapSettledWithConcurrency, SettledResult } from '@/lib/utils/concurrency'
+
+/**
+ * Chunked, resumable uploads to Supabase Storage
+ *
+ * Files go through Storage's TUS endpoint in fixed-size chunks. A failed
+ * chunk is retried from the offset the server reports, so a dropped
+ * connection costs at most one chunk instead of the whole file, and the
+ * upload URL is remembered in localStorage so picking the same file again
+ * after a reload continues where it stopped. TUS appends to an upload in
+ * order, so parallelism is across files rather than within one.
+ */
+
+const UPLOAD_ENDPOINT =
+  process.env.NEXT_PUBLIC_STORAGE_UPLOAD_URL ||
+  `${process.env.NEXT_PUBLIC_SUPABASE_URL}/storage/v1/upload/resumable`
+
+// Supabase Storage requires exactly 6MB for every chunk but the last
+export const UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+export const UPLOAD_CONCURRENCY = 3
+
+// Wait before each retry of a failed chunk; the upload fails after the last
+const RETRY_DELAYS_MS = [500, 1000, 3000, 5000, 10000]
+
+// Storage forgets unfinished uploads after a day
+const RESUME_TTL_MS = 23 * 60 * 60 * 1000
+const RESUME_PREFIX = 'upload:'
+
+export interface UploadProgress {
+  loaded: number
+  total: number
+}
+
+export interface UploadOptions {
+  bucket?: string
+  // Object path for a new upload; a resumed upload keeps its original path
+  path: string
+  contentType?: string
+  upsert?: boolean
+  signal?: AbortSignal
+  onProgress?: (progress: UploadProgress) => void
+}
+
+export interface UploadResult {
+  path: string
+  publicUrl: string
+  // Bytes that were already on the server from an earlier attempt
+  resumedFrom: number
+}
+
+class UploadError extends Error {
+  constructor(message: string, public status?: number) {
+    super(message)
+    this.name = 'UploadError'
+  }
+}
+
+interface ResumeEntry {
+  url: string
+  path: string
+  createdAt: number
+}
+
+function fingerprint(file: File, bucket: string): string {
+  return `${RESUME_PREFIX}${bucket}:${file.name}:${file.size}:${file.lastModified}`
+}
+
+function readResume(key: string): ResumeEntry | null {
+  try {
+    const entry: ResumeEntry | null = JSON.parse(localStorage.getItem(key) || 'null')
+    if (entry && Date.now() - entry.createdAt < RESUME_TTL_MS) return entry
+    localStorage.removeItem(key)
+  } catch {
+    // Storage unavailable (private mode) or corrupt: start a new upload
+  }
+  return null
+}
+
+function writeResume(key: string, entry: ResumeEntry | null) {
+  try {
+    if (entry) localStorage.setItem(key, JSON.stringify(entry))
+    else localStorage.removeItem(key)
+  } catch {
+    // Resuming across reloads is best effort
+  }
+}
+
+function encodeMetadata(metadata: Record<string, string>): string {
+  return Object.entries(metadata)
+    .map(([key, value]) => `${key} ${btoa(unescape(encodeURIComponent(value)))}`)
+    .join(',')
+}
+
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(resolve, ms)
+    signal?.addEventListener('abort', () => {
+      clearTimeout(timer)
+      reject(signal.reason)
+    }, { once: true })
+  })
+}
+
+async function authHeaders(): Promise<Record<string, string>> {
+  const supabase = getSupabaseClient()
+  const { data: { session } } = await supabase.auth.getSession()
+  const token = session?.access_token || process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
+  return {
+    authorization: `Bearer ${token}`,
+    apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    'Tus-Resumable': '1.0.0',
+  }
+}
+
+async function createUpload(
+  file: File,
+  bucket: string,
+  options: UploadOptions,
+  headers: Record<string, string>
+): Promise<string> {
+  const response = await fetch(UPLOAD_ENDPOINT, {
+    method: 'POST',
+    headers: {
+      ...headers,
+      'Upload-Length': String(file.size),
+      'Upload-Metadata': encodeMetadata({
+        bucketName: bucket,
+        objectName: options.path,
+        contentType: options.contentType || file.type || 'application/octet-stream',
+        cacheControl: '3600',
+      }),
+      'x-upsert': options.upsert ? 'true' : 'false',
+    },
+    signal: options.signal,
+  })
+  const location = response.headers.get('Location')
+  if (response.status !== 201 || !location) {
+    throw new UploadError(`Could not start upload (${response.status})`, response.status)
+  }
+  return new URL(location, UPLOAD_ENDPOINT).toString()
+}
+
+// Upload-Offset of a tus response; a missing or malformed one is an error
+// rather than 0, which would restart the upload from the first byte
+function responseOffset(response: Response): number {
+  const offset = Number(response.headers.get('Upload-Offset') ?? NaN)
+  if (!Number.isInteger(offset) || offset < 0) {
+    throw new UploadError('Server did not report the upload offset')
+  }
+  return offset
+}
+
+// Bytes the server has for `url`, or null if it no longer knows the upload
+async function serverOffset(url: string, headers: Record<string, string>, signal?: AbortSignal) {
+  const response = await fetch(url, { method: 'HEAD', headers, signal })
+  if (response.status === 404 || response.status === 410) return null
+  if (!response.ok) throw new UploadError(`Could not check upload (${response.status})`, response.status)
+  return responseOffset(response)
+}
+
+async function sendChunk(
+  url: string,
+  file: File,
+  offset: number,
+  headers: Record<string, string>,
+  signal?: AbortSignal
+): Promise<number> {
+  const response = await fetch(url, {
+    method: 'PATCH',
+    headers: {
+      ...headers,
+      'Upload-Offset': String(offset),
+      'Content-Type': 'application/offset+octet-stream',
+    },
+    body: file.slice(offset, Math.min(offset + UPLOAD_CHUNK_SIZE, file.size)),
+    signal,
+  })
+  if (response.status !== 204) {
+    throw new UploadError(`Chunk at ${offset} failed (${response.status})`, response.status)
+  }
+  return responseOffset(response)
+}
+
+/**
+ * Upload one file in chunks, retrying failed chunks and resuming an earlier
+ * unfinished upload of the same file
+ */
+export async function uploadFile(file: File, options: UploadOptions): Promise<UploadResult> {
+  const bucket = options.bucket || 'coventures'
+  const { signal, onProgress } = options
+  const key = fingerprint(file, bucket)
+  const headers = await authHeaders()
+
+  let entry = readResume(key)
+  let offset = entry ? await serverOffset(entry.url, headers, signal).catch(() => null) : null
+  if (!entry || offset === null) {
+    entry = { url: await createUpload(file, bucket, options, headers), path: options.path, createdAt: Date.now() }
+    writeResume(key, entry)
+    offset = 0
+  }
+  const resumedFrom = offset
+  onProgress?.({ loaded: offset, total: file.size })
+
+  let attempt = 0
+  while (offset < file.size) {
+    try {
+      offset = await sendChunk(entry.url, file, offset, headers, signal)
+      attempt = 0
+      onProgress?.({ loaded: offset, total: file.size })
+    } catch (error) {
+      // 4xx other than an offset mismatch will not succeed on retry
+      const status = error instanceof UploadError ? error.status : undefined
+      if (signal?.aborted || attempt >= RETRY_DELAYS_MS.length || (status && status < 500 && status !== 409)) {
+        throw error
+      }
+      await sleep(RETRY_DELAYS_MS[attempt++], signal)
+      // Continue from what actually reached the server
+      const known = await serverOffset(entry.url, headers, signal).catch(() => offset)
+      if (known === null) {
+        writeResume(key, null)
+        throw new UploadError('Upload expired on the server, please try again')
+      }
+      offset = known
+    }
+  }
+
+  writeResume(key, null)
+  const { data: { publicUrl } } = getSupabaseClient().storage.from(bucket).getPublicUrl(entry.path)
+  return { path: entry.path, publicUrl, resumedFrom }
+}
+
+/**
+ * Upload several files, `concurrency` at a time
+ * Results keep input order; `onProgress` reports bytes across all files
+ */
+export async function uploadFiles(
+  files: File[],
+  options: (file: File, index: number) => UploadOptions,
+  onProgress?: (progress: UploadProgress) => void,
+  concurrency = UPLOAD_CONCURRENCY
+): Promise<SettledResult<UploadResult>[]> {
+  const total = files.reduce((sum, file) => sum + file.size, 0)
+  const loaded = new Array(files.length).fill(0)
+
+  return mapSettledWithConcurrency(files, concurrency, (file, index) =>
+    uploadFile(file, {
+      ...options(file, index),
+      onProgress: (progress) => {
+        loaded[index] = progress.loaded
+        onProgress?.({ loaded: loaded.reduce((sum, value) => sum + value, 0), total })
+      },
+    })
+  )
+}
+
+/**
+ * Shrink a photo to at most `maxDimension` pixels on its longer side
+ * Returns the original file for non-images, SVG/GIF, small images, or when
+ * re-encoding would not make it smaller
+ */
+export async function downscaleImage(file: File, maxDimension = 2560, quality = 0.85): Promise<File> {
+  if (!/^image\/(jpeg|png|webp)$/.test(file.type) || typeof createImageBitmap === 'undefined') {
+    return file
+  }
+
+  let bitmap: ImageBitmap
+  try {
+    bitmap = await createImageBitmap(file)
+  } catch {
+    return file
+  }
+
+  const scale = Math.min(1, maxDimension / Math.max(bitmap.width, bitmap.height))
+  if (scale === 1 && file.size < 1024 * 1024) {
+    bitmap.close()
+    return file
+  }
+
+  const canvas = document.createElement('canvas')
+  canvas.width = Math.round(bitmap.width * scale)
+  canvas.height = Math.round(bitmap.height * scale)
+  canvas.getContext('2d')?.drawImage(bitmap, 0, 0, canvas.width, canvas.height)
+  bitmap.close()
+
+  const blob = await new Promise<Blob | null>((resolve) => canvas.toBlob(resolve, 'image/webp', quality))
+  if (!blob || blob.size >= file.size) return file
+
+  // Browsers without WebP encoding fall back to PNG
+  const extension = blob.type === 'image/webp' ? 'webp' : 'png'
+  const name = file.name.replace(/\.[^.]+$/, '') + `.${extension}`
+  return new File([blob], name, { type: blob.type, lastModified: file.lastModified })
+}
+
+/**
+ * Object path inside `bucket` for one of its public URLs
+ */
+export function storagePathFromUrl(url: string, bucket = 'coventures'): string | null {
+  const marker = `/storage/v1/object/public/${bucket}/`
+  const index = url.indexOf(marker)
+  return index === -1 ? null : decodeURIComponent(url.slice(index + marker.length))
+}
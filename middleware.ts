@@ -1,8 +1,17 @@
-import { updateSession } from '@/lib/supabase/middleware'
+import { handleSession } from '@/lib/supabase/middleware'
 import { type NextRequest } from 'next/server'
 
 export async function middleware(request: NextRequest) {
-  return await updateSession(request)
+  const started = performance.now()
+  const { response, outcome } = await handleSession(request)
+
+  // Lets benchmarks and browser devtools see what auth cost this request
+  response.headers.append(
+    'Server-Timing',
+    `middleware;dur=${(performance.now() - started).toFixed(2)};desc="${outcome}"`
+  )
+
+  return response
 }
 
 export const config = {
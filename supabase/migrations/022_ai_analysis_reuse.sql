@@ -0,0 +1,43 @@
+-- Migration: Content-addressed reuse of AI committee analyses
+-- Analyses are keyed by a hash of the property fields the agents see plus the
+-- agent configuration (prompt, model, version). A repeat request with the same
+-- hash is served from ai_property_analyses instead of calling the LLM again.
+
+ALTER TABLE public.ai_property_analyses ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE public.ai_property_analyses ADD COLUMN IF NOT EXISTS reused_from UUID
+    REFERENCES public.ai_property_analyses(id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS idx_ai_property_analyses_content_hash
+    ON public.ai_property_analyses(property_id, content_hash, created_at DESC)
+    WHERE content_hash IS NOT NULL;
+
+-- Editing a property in the admin panel retires its stored analyses.
+-- The hash already changes when analysed fields change; this also covers
+-- edits to fields outside the hash and keeps the index small. Columns kept
+-- up to date by the app and other triggers (view counter, ratings, filled
+-- slots, updated_at) are ignored, so viewing a property does not retire them.
+CREATE OR REPLACE FUNCTION public.invalidate_property_analyses()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE public.ai_property_analyses
+    SET content_hash = NULL
+    WHERE property_id = NEW.id
+      AND content_hash IS NOT NULL;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_invalidate_property_analyses ON public.properties;
+CREATE TRIGGER trigger_invalidate_property_analyses
+AFTER UPDATE ON public.properties
+FOR EACH ROW
+WHEN (
+    (to_jsonb(OLD) - 'views' - 'average_rating' - 'total_reviews' - 'filled_slots' - 'updated_at')
+    IS DISTINCT FROM
+    (to_jsonb(NEW) - 'views' - 'average_rating' - 'total_reviews' - 'filled_slots' - 'updated_at')
+)
+EXECUTE FUNCTION public.invalidate_property_analyses();
@@ -0,0 +1,94 @@
+-- Migration: Per-user, per-period usage counters
+-- Usage limits used to count subscription_usage_logs on every request, which
+-- slows down as the log grows. Counters are kept in step with the log by
+-- triggers and read with a single primary-key lookup. The log stays the
+-- source of truth: rebuild_usage_counters() recomputes counters from it.
+
+CREATE TABLE IF NOT EXISTS public.subscription_usage_counters (
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    usage_type VARCHAR(50) NOT NULL,
+    -- First day of the calendar month (UTC) the usage belongs to
+    period_start DATE NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (user_id, usage_type, period_start)
+);
+
+ALTER TABLE public.subscription_usage_counters ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own usage counters" ON public.subscription_usage_counters;
+CREATE POLICY "Users can view own usage counters"
+    ON public.subscription_usage_counters FOR SELECT
+    USING (auth.uid() = user_id);
+
+CREATE OR REPLACE FUNCTION public.usage_period_start(ts TIMESTAMP WITH TIME ZONE)
+RETURNS DATE
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT date_trunc('month', ts AT TIME ZONE 'UTC')::DATE;
+$$;
+
+-- Keep counters in step with the log; the upsert is a single atomic statement,
+-- so concurrent inserts for the same user and period cannot lose increments
+CREATE OR REPLACE FUNCTION public.track_usage_counter()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO public.subscription_usage_counters (user_id, usage_type, period_start, count)
+        VALUES (NEW.user_id, NEW.usage_type, public.usage_period_start(COALESCE(NEW.created_at, NOW())), 1)
+        ON CONFLICT (user_id, usage_type, period_start)
+        DO UPDATE SET count = subscription_usage_counters.count + 1,
+                      updated_at = NOW();
+        RETURN NEW;
+    END IF;
+
+    UPDATE public.subscription_usage_counters
+    SET count = GREATEST(count - 1, 0),
+        updated_at = NOW()
+    WHERE user_id = OLD.user_id
+      AND usage_type = OLD.usage_type
+      AND period_start = public.usage_period_start(COALESCE(OLD.created_at, NOW()));
+    RETURN OLD;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_track_usage_counter ON public.subscription_usage_logs;
+CREATE TRIGGER trigger_track_usage_counter
+AFTER INSERT OR DELETE ON public.subscription_usage_logs
+FOR EACH ROW
+EXECUTE FUNCTION public.track_usage_counter();
+
+-- Recompute counters from the log, for one user or everyone
+CREATE OR REPLACE FUNCTION public.rebuild_usage_counters(p_user_id UUID DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    DELETE FROM public.subscription_usage_counters
+    WHERE p_user_id IS NULL OR user_id = p_user_id;
+
+    INSERT INTO public.subscription_usage_counters (user_id, usage_type, period_start, count)
+    SELECT user_id, usage_type, public.usage_period_start(created_at), COUNT(*)
+    FROM public.subscription_usage_logs
+    WHERE p_user_id IS NULL OR user_id = p_user_id
+    GROUP BY user_id, usage_type, public.usage_period_start(created_at);
+
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+    RETURN rebuilt;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.rebuild_usage_counters(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.rebuild_usage_counters(UUID) TO service_role;
+
+-- Backfill from the existing log
+SELECT public.rebuild_usage_counters();
@@ -0,0 +1,17 @@
+-- Migration: Keyset pagination and trigram location search for properties
+-- GET /api/properties can page on (created_at, id) instead of OFFSET, and its
+-- location filter (ILIKE '%...%') can use a trigram index instead of a scan.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Listing order with a unique tiebreaker, so a cursor resumes exactly where
+-- the previous page ended
+CREATE INDEX IF NOT EXISTS idx_properties_status_created_id
+  ON public.properties(status, created_at DESC, id DESC);
+
+-- Substring location search
+CREATE INDEX IF NOT EXISTS idx_properties_location_trgm
+  ON public.properties USING gin (location gin_trgm_ops);
+
+-- Keep planner estimates fresh for count=estimated
+ANALYZE public.properties;
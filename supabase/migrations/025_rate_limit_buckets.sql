@@ -0,0 +1,77 @@
+-- Migration: Shared sliding-window rate limit counters
+-- Used by RATE_LIMIT_STORE=supabase so every app instance enforces the same
+-- limit. Same algorithm as the in-memory store in lib/api/utils.ts: the
+-- previous window's count is weighted by its overlap with the sliding window.
+
+CREATE TABLE IF NOT EXISTS public.rate_limit_buckets (
+    key TEXT PRIMARY KEY,
+    window_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    current_count INTEGER NOT NULL DEFAULT 0,
+    previous_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_updated_at
+    ON public.rate_limit_buckets(updated_at);
+
+-- Only the service role touches this table
+ALTER TABLE public.rate_limit_buckets ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.rate_limit_consume(
+    p_key TEXT,
+    p_max_requests INTEGER,
+    p_window_ms INTEGER
+)
+RETURNS TABLE (allowed BOOLEAN, remaining INTEGER, reset_at TIMESTAMP WITH TIME ZONE)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    now_ms DOUBLE PRECISION := EXTRACT(EPOCH FROM clock_timestamp()) * 1000;
+    window_start_ms DOUBLE PRECISION := floor(now_ms / p_window_ms) * p_window_ms;
+    bucket public.rate_limit_buckets%ROWTYPE;
+    estimated DOUBLE PRECISION;
+BEGIN
+    INSERT INTO public.rate_limit_buckets (key, window_start)
+    VALUES (p_key, to_timestamp(window_start_ms / 1000))
+    ON CONFLICT (key) DO NOTHING;
+
+    -- Row lock serialises concurrent requests for the same key
+    SELECT * INTO bucket FROM public.rate_limit_buckets WHERE key = p_key FOR UPDATE;
+
+    IF EXTRACT(EPOCH FROM bucket.window_start) * 1000 <> window_start_ms THEN
+        bucket.previous_count := CASE
+            WHEN window_start_ms - EXTRACT(EPOCH FROM bucket.window_start) * 1000 = p_window_ms
+            THEN bucket.current_count ELSE 0 END;
+        bucket.current_count := 0;
+        bucket.window_start := to_timestamp(window_start_ms / 1000);
+    END IF;
+
+    estimated := bucket.previous_count * (1 - (now_ms - window_start_ms) / p_window_ms) + bucket.current_count;
+    allowed := estimated + 1 <= p_max_requests;
+    IF allowed THEN
+        bucket.current_count := bucket.current_count + 1;
+    END IF;
+
+    UPDATE public.rate_limit_buckets
+    SET window_start = bucket.window_start,
+        current_count = bucket.current_count,
+        previous_count = bucket.previous_count,
+        updated_at = NOW()
+    WHERE key = p_key;
+
+    -- Occasionally drop keys idle for more than two windows
+    IF random() < 0.01 THEN
+        DELETE FROM public.rate_limit_buckets
+        WHERE updated_at < NOW() - make_interval(secs => 2 * p_window_ms / 1000.0);
+    END IF;
+
+    remaining := CASE WHEN allowed THEN GREATEST(0, floor(p_max_requests - estimated - 1))::INTEGER ELSE 0 END;
+    reset_at := to_timestamp((window_start_ms + p_window_ms) / 1000);
+    RETURN NEXT;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.rate_limit_consume(TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.rate_limit_consume(TEXT, INTEGER, INTEGER) TO service_role;
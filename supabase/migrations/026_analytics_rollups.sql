@@ -0,0 +1,243 @@
+-- Migration: Incrementally maintained rollups for the admin analytics dashboard
+-- The dashboard used to run 14 queries from the browser and sum sold prices
+-- client-side. Triggers now keep per-day counts and amounts plus current
+-- property status totals, and get_admin_analytics() assembles every dashboard
+-- aggregate from them in one call. Days are UTC.
+
+CREATE TABLE IF NOT EXISTS public.analytics_daily_rollups (
+    day DATE NOT NULL,
+    -- properties_created, properties_sold, enquiries_created, users_created
+    metric TEXT NOT NULL,
+    count BIGINT NOT NULL DEFAULT 0,
+    amount NUMERIC(20, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, day)
+);
+
+CREATE TABLE IF NOT EXISTS public.analytics_totals (
+    -- e.g. property_status:available
+    key TEXT PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+-- Read through get_admin_analytics() (service role) only
+ALTER TABLE public.analytics_daily_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.analytics_totals ENABLE ROW LEVEL SECURITY;
+
+CREATE INDEX IF NOT EXISTS idx_properties_views
+    ON public.properties(views DESC);
+
+CREATE OR REPLACE FUNCTION public.bump_analytics_rollup(p_at TIMESTAMPTZ, p_metric TEXT, p_count BIGINT, p_amount NUMERIC)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO public.analytics_daily_rollups (day, metric, count, amount)
+    VALUES ((COALESCE(p_at, NOW()) AT TIME ZONE 'UTC')::DATE, p_metric, p_count, COALESCE(p_amount, 0))
+    ON CONFLICT (metric, day)
+    DO UPDATE SET count = analytics_daily_rollups.count + EXCLUDED.count,
+                  amount = analytics_daily_rollups.amount + EXCLUDED.amount;
+$$;
+
+CREATE OR REPLACE FUNCTION public.bump_analytics_total(p_key TEXT, p_count BIGINT)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO public.analytics_totals (key, count)
+    VALUES (p_key, p_count)
+    ON CONFLICT (key)
+    DO UPDATE SET count = analytics_totals.count + EXCLUDED.count;
+$$;
+
+CREATE OR REPLACE FUNCTION public.track_property_analytics()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.bump_analytics_rollup(OLD.created_at, 'properties_created', -1, 0);
+        PERFORM public.bump_analytics_total('property_status:' || OLD.status, -1);
+        IF OLD.status = 'sold' THEN
+            PERFORM public.bump_analytics_rollup(OLD.created_at, 'properties_sold', -1, -OLD.price);
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM public.bump_analytics_rollup(NEW.created_at, 'properties_created', 1, 0);
+        PERFORM public.bump_analytics_total('property_status:' || NEW.status, 1);
+        IF NEW.status = 'sold' THEN
+            PERFORM public.bump_analytics_rollup(NEW.created_at, 'properties_sold', 1, NEW.price);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_property_analytics ON public.properties;
+CREATE TRIGGER trigger_property_analytics
+AFTER INSERT OR DELETE OR UPDATE OF status, price, created_at ON public.properties
+FOR EACH ROW
+EXECUTE FUNCTION public.track_property_analytics();
+
+-- Enquiries and users only contribute creation counts
+CREATE OR REPLACE FUNCTION public.track_created_analytics()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_analytics_rollup(OLD.created_at, TG_ARGV[0], -1, 0);
+    ELSE
+        PERFORM public.bump_analytics_rollup(NEW.created_at, TG_ARGV[0], 1, 0);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_enquiry_analytics ON public.enquiries;
+CREATE TRIGGER trigger_enquiry_analytics
+AFTER INSERT OR DELETE ON public.enquiries
+FOR EACH ROW
+EXECUTE FUNCTION public.track_created_analytics('enquiries_created');
+
+DROP TRIGGER IF EXISTS trigger_user_analytics ON public.users;
+CREATE TRIGGER trigger_user_analytics
+AFTER INSERT OR DELETE ON public.users
+FOR EACH ROW
+EXECUTE FUNCTION public.track_created_analytics('users_created');
+
+-- Recompute every rollup from the source tables
+CREATE OR REPLACE FUNCTION public.rebuild_analytics_rollups()
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    LOCK TABLE public.analytics_daily_rollups, public.analytics_totals IN EXCLUSIVE MODE;
+    DELETE FROM public.analytics_daily_rollups;
+    DELETE FROM public.analytics_totals;
+
+    INSERT INTO public.analytics_daily_rollups (day, metric, count, amount)
+    SELECT (created_at AT TIME ZONE 'UTC')::DATE, 'properties_created', COUNT(*), 0
+    FROM public.properties GROUP BY 1
+    UNION ALL
+    SELECT (created_at AT TIME ZONE 'UTC')::DATE, 'properties_sold', COUNT(*), COALESCE(SUM(price), 0)
+    FROM public.properties WHERE status = 'sold' GROUP BY 1
+    UNION ALL
+    SELECT (created_at AT TIME ZONE 'UTC')::DATE, 'enquiries_created', COUNT(*), 0
+    FROM public.enquiries GROUP BY 1
+    UNION ALL
+    SELECT (created_at AT TIME ZONE 'UTC')::DATE, 'users_created', COUNT(*), 0
+    FROM public.users GROUP BY 1;
+
+    INSERT INTO public.analytics_totals (key, count)
+    SELECT 'property_status:' || status, COUNT(*)
+    FROM public.properties GROUP BY status;
+END;
+$$;
+
+-- Every aggregate the dashboard shows, for a trailing window of p_days
+CREATE OR REPLACE FUNCTION public.get_admin_analytics(p_days INTEGER DEFAULT 30)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    today DATE := (NOW() AT TIME ZONE 'UTC')::DATE;
+    prev_start DATE := today - 2 * p_days;
+    month_start DATE := date_trunc('month', NOW() AT TIME ZONE 'UTC')::DATE;
+    r RECORD;
+BEGIN
+    SELECT
+        COALESCE(SUM(count) FILTER (WHERE metric = 'properties_created'), 0) AS properties_total,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'properties_created' AND day < prev_start), 0) AS properties_prev,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'enquiries_created'), 0) AS enquiries_total,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'enquiries_created' AND day < prev_start), 0) AS enquiries_prev,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'enquiries_created' AND day >= month_start), 0) AS enquiries_month,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'users_created'), 0) AS users_total,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'users_created' AND day < prev_start), 0) AS users_prev,
+        COALESCE(SUM(count) FILTER (WHERE metric = 'users_created' AND day >= month_start), 0) AS users_month,
+        COALESCE(SUM(amount) FILTER (WHERE metric = 'properties_sold'), 0) AS revenue_total,
+        COALESCE(SUM(amount) FILTER (WHERE metric = 'properties_sold' AND day < prev_start), 0) AS revenue_prev,
+        COALESCE(SUM(amount) FILTER (WHERE metric = 'properties_sold' AND day >= month_start), 0) AS revenue_month
+    INTO r
+    FROM public.analytics_daily_rollups;
+
+    RETURN jsonb_build_object(
+        'properties', jsonb_build_object(
+            'total', r.properties_total,
+            'available', COALESCE((SELECT count FROM public.analytics_totals WHERE key = 'property_status:available'), 0),
+            'sold', COALESCE((SELECT count FROM public.analytics_totals WHERE key = 'property_status:sold'), 0),
+            'growth', CASE WHEN r.properties_prev > 0
+                THEN (r.properties_total - r.properties_prev)::NUMERIC / r.properties_prev * 100 ELSE 0 END
+        ),
+        'enquiries', jsonb_build_object(
+            'total', r.enquiries_total,
+            'thisMonth', r.enquiries_month,
+            'growth', CASE WHEN r.enquiries_prev > 0
+                THEN (r.enquiries_total - r.enquiries_prev)::NUMERIC / r.enquiries_prev * 100 ELSE 0 END
+        ),
+        'users', jsonb_build_object(
+            'total', r.users_total,
+            'newThisMonth', r.users_month,
+            'growth', CASE WHEN r.users_prev > 0
+                THEN (r.users_total - r.users_prev)::NUMERIC / r.users_prev * 100 ELSE 0 END
+        ),
+        'revenue', jsonb_build_object(
+            'total', r.revenue_total,
+            'thisMonth', r.revenue_month,
+            'growth', CASE WHEN r.revenue_prev > 0
+                THEN (r.revenue_total - r.revenue_prev) / r.revenue_prev * 100 ELSE 0 END
+        ),
+        'topProperties', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', p.id,
+                'title', p.title,
+                'views', COALESCE(p.views, 0),
+                'enquiries', (SELECT COUNT(*) FROM public.enquiries e WHERE e.property_id = p.id)
+            ) ORDER BY p.views DESC NULLS LAST)
+            FROM (
+                SELECT id, title, views FROM public.properties
+                ORDER BY views DESC NULLS LAST LIMIT 5
+            ) p
+        ), '[]'::JSONB),
+        'revenueByMonth', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'month', to_char(m.month, 'Mon YYYY'),
+                'revenue', m.revenue,
+                'properties', m.properties
+            ) ORDER BY m.month)
+            FROM (
+                SELECT date_trunc('month', day)::DATE AS month, SUM(amount) AS revenue, SUM(count) AS properties
+                FROM public.analytics_daily_rollups
+                WHERE metric = 'properties_sold'
+                GROUP BY 1
+                HAVING SUM(count) > 0
+                ORDER BY 1 DESC
+                LIMIT 6
+            ) m
+        ), '[]'::JSONB)
+    );
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.get_admin_analytics(INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_admin_analytics(INTEGER) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.rebuild_analytics_rollups() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.rebuild_analytics_rollups() TO service_role;
+-- Only called from the tracking triggers above, which run as the owner
+REVOKE EXECUTE ON FUNCTION public.bump_analytics_rollup(TIMESTAMPTZ, TEXT, BIGINT, NUMERIC) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.bump_analytics_total(TEXT, BIGINT) FROM PUBLIC, anon, authenticated;
+
+-- Backfill from existing data
+SELECT public.rebuild_analytics_rollups();
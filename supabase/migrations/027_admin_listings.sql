@@ -0,0 +1,149 @@
+-- Migration: Server-side pagination, sorting and search for admin listings
+-- The admin leads and users pages used to download every row and filter in
+-- the browser. They now request one page at a time, so the listing order and
+-- the name/email search need indexes, and the three lead sources are merged
+-- in the database instead of on the client.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ========================================
+-- LISTING ORDER (created_at with a unique tiebreaker)
+-- ========================================
+CREATE INDEX IF NOT EXISTS idx_property_leads_created_id
+  ON public.property_leads(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_enquiries_created_id
+  ON public.enquiries(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_contact_messages_created_id
+  ON public.contact_messages(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_users_created_id
+  ON public.users(created_at DESC, id DESC);
+
+-- ========================================
+-- SUBSTRING SEARCH
+-- ========================================
+-- Every column in a search has to be indexed, or the OR falls back to a scan
+CREATE INDEX IF NOT EXISTS idx_property_leads_full_name_trgm
+  ON public.property_leads USING gin (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_property_leads_email_trgm
+  ON public.property_leads USING gin (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_property_leads_phone_trgm
+  ON public.property_leads USING gin (phone gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_enquiries_full_name_trgm
+  ON public.enquiries USING gin (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_enquiries_email_trgm
+  ON public.enquiries USING gin (email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_contact_messages_full_name_trgm
+  ON public.contact_messages USING gin (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contact_messages_email_trgm
+  ON public.contact_messages USING gin (email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_full_name_trgm
+  ON public.users USING gin (full_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm
+  ON public.users USING gin (email gin_trgm_ops);
+
+-- ========================================
+-- LEAD INBOX
+-- ========================================
+-- Property leads, investment enquiries and contact messages in one shape.
+-- Every branch exposes plain created_at/id columns, so ordering by them is a
+-- merge of the three index scans above rather than a sort of every lead.
+CREATE OR REPLACE VIEW public.admin_lead_inbox
+WITH (security_invoker = true) AS
+SELECT
+  id,
+  'property_leads'::TEXT AS source_table,
+  CASE WHEN lead_type = 'join_group' THEN 'group' ELSE 'other' END AS channel,
+  CASE lead_type
+    WHEN 'join_group' THEN 'Group Buying'
+    WHEN 'callback_request' THEN 'Callback'
+    WHEN 'live_tour' THEN 'Live Tour'
+    WHEN 'book_visit' THEN 'Site Visit'
+    ELSE 'Lead'
+  END AS source,
+  property_id,
+  user_id,
+  full_name,
+  email,
+  COALESCE(phone, '') AS phone,
+  message,
+  status,
+  assigned_to,
+  created_at
+FROM public.property_leads
+UNION ALL
+SELECT
+  id,
+  'enquiries'::TEXT,
+  'investment'::TEXT,
+  'Investment'::TEXT,
+  property_id,
+  user_id,
+  full_name,
+  email,
+  phone,
+  message,
+  status,
+  assigned_to,
+  created_at
+FROM public.enquiries
+UNION ALL
+SELECT
+  id,
+  'contact_messages'::TEXT,
+  'contact'::TEXT,
+  'Contact Form'::TEXT,
+  NULL::UUID,
+  NULL::UUID,
+  full_name,
+  email,
+  COALESCE(phone, ''),
+  message,
+  CASE WHEN status = 'resolved' THEN 'converted' ELSE status END,
+  assigned_to,
+  created_at
+FROM public.contact_messages;
+
+-- Read through the service role by /api/admin/leads after its admin check
+REVOKE ALL ON public.admin_lead_inbox FROM PUBLIC, anon, authenticated;
+GRANT SELECT ON public.admin_lead_inbox TO service_role;
+
+-- ========================================
+-- LEAD STATUS COUNTS
+-- ========================================
+-- The stat cards on /admin/leads, over every source in the date range
+CREATE OR REPLACE FUNCTION public.admin_lead_stats(
+  p_from TIMESTAMPTZ DEFAULT NULL,
+  p_to TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT jsonb_build_object(
+    'total', count(*),
+    'new', count(*) FILTER (WHERE status = 'new'),
+    'contacted', count(*) FILTER (WHERE status IN ('contacted', 'in_progress')),
+    'qualified', count(*) FILTER (WHERE status = 'qualified'),
+    'converted', count(*) FILTER (WHERE status IN ('converted', 'closed')),
+    'lost', count(*) FILTER (WHERE status = 'lost')
+  )
+  FROM public.admin_lead_inbox
+  WHERE (p_from IS NULL OR created_at >= p_from)
+    AND (p_to IS NULL OR created_at <= p_to);
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_lead_stats(TIMESTAMPTZ, TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.admin_lead_stats(TIMESTAMPTZ, TIMESTAMPTZ) TO service_role;
+
+ANALYZE public.property_leads;
+ANALYZE public.enquiries;
+ANALYZE public.contact_messages;
+ANALYZE public.users;
@@ -0,0 +1,9 @@
+-- Migration: Keyset order indexes for streamed admin CSV exports
+-- /api/admin/export/* reads each table newest first in (timestamp, id) chunks.
+-- Leads and contact messages are covered by migration 027.
+
+CREATE INDEX IF NOT EXISTS idx_properties_created_id
+  ON public.properties(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_newsletter_subscribers_subscribed_id
+  ON public.newsletter_subscribers(subscribed_at DESC, id DESC);
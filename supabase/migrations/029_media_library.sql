@@ -0,0 +1,63 @@
+-- Migration: Paginated media library listing and database-side stats
+-- /admin/media used to load every media_files row and count images,
+-- documents and total size in the browser. The listing is now paged through
+-- /api/admin/media and the stat cards come from media_library_stats().
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- The page's filter buttons, derived once per row instead of per query
+ALTER TABLE public.media_files ADD COLUMN IF NOT EXISTS media_kind TEXT
+  GENERATED ALWAYS AS (
+    CASE
+      WHEN mime_type LIKE 'image/%' THEN 'image'
+      WHEN mime_type LIKE 'video/%' THEN 'video'
+      WHEN mime_type LIKE 'audio/%' THEN 'audio'
+      WHEN mime_type LIKE '%pdf%' OR mime_type LIKE '%document%' THEN 'document'
+      ELSE 'other'
+    END
+  ) STORED;
+
+-- ========================================
+-- INDEXES
+-- ========================================
+-- Newest first, all files or one kind
+CREATE INDEX IF NOT EXISTS idx_media_created_id
+  ON public.media_files(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_media_kind_created_id
+  ON public.media_files(media_kind, created_at DESC, id DESC);
+
+-- Stats can be answered from this index alone (index-only scan once vacuumed)
+CREATE INDEX IF NOT EXISTS idx_media_kind_size
+  ON public.media_files(media_kind) INCLUDE (file_size);
+
+-- File name search
+CREATE INDEX IF NOT EXISTS idx_media_name_trgm
+  ON public.media_files USING gin (name gin_trgm_ops);
+
+-- ========================================
+-- STATS
+-- ========================================
+CREATE OR REPLACE FUNCTION public.media_library_stats()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT jsonb_build_object(
+    'total', COALESCE(sum(files), 0),
+    'total_size', COALESCE(sum(bytes), 0),
+    'by_kind', COALESCE(jsonb_object_agg(media_kind, jsonb_build_object('count', files, 'size', bytes)), '{}'::JSONB)
+  )
+  FROM (
+    SELECT media_kind, count(*) AS files, sum(file_size)::BIGINT AS bytes
+    FROM public.media_files
+    GROUP BY media_kind
+  ) kinds;
+$$;
+
+REVOKE ALL ON FUNCTION public.media_library_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.media_library_stats() TO service_role;
+
+ANALYZE public.media_files;
@@ -0,0 +1,87 @@
+-- Migration: Idempotent Razorpay webhook queue
+-- /api/razorpay/webhook used to apply every event inline and twice if
+-- Razorpay redelivered it. It now stores the event under its idempotency key
+-- and acknowledges; lib/services/razorpay-webhooks.ts applies queued events
+-- in order per subscription.
+
+CREATE TABLE IF NOT EXISTS public.razorpay_webhook_events (
+    id BIGSERIAL PRIMARY KEY,
+    -- x-razorpay-event-id, or a hash of the body when the header is missing
+    event_id TEXT NOT NULL UNIQUE,
+    event_type TEXT NOT NULL,
+    -- Events sharing a key are applied one at a time, oldest first
+    subscription_key TEXT NOT NULL,
+    -- Razorpay's created_at for the event (epoch seconds)
+    event_created_at BIGINT NOT NULL,
+    payload JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'processing', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    -- Lease while processing, or retry backoff while pending
+    locked_until TIMESTAMP WITH TIME ZONE,
+    received_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    processed_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_razorpay_events_unfinished
+    ON public.razorpay_webhook_events(event_created_at, id)
+    WHERE status IN ('pending', 'processing');
+
+CREATE INDEX IF NOT EXISTS idx_razorpay_events_locked
+    ON public.razorpay_webhook_events(subscription_key)
+    WHERE locked_until IS NOT NULL;
+
+-- Only the service role touches this table
+ALTER TABLE public.razorpay_webhook_events ENABLE ROW LEVEL SECURITY;
+
+-- Newest event applied to the subscription, so a late redelivery of an
+-- older event cannot undo a newer status
+ALTER TABLE public.user_subscriptions ADD COLUMN IF NOT EXISTS razorpay_event_at BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_user_subscriptions_razorpay_id
+    ON public.user_subscriptions(razorpay_subscription_id);
+
+-- ========================================
+-- CLAIM
+-- ========================================
+-- Lease up to p_limit unfinished events, oldest first, from subscriptions
+-- that have no leased or backing-off event. Claims are serialised, so two
+-- workers never hold events of the same subscription.
+CREATE OR REPLACE FUNCTION public.claim_razorpay_webhook_events(
+    p_limit INTEGER DEFAULT 100,
+    p_lease_seconds INTEGER DEFAULT 60
+)
+RETURNS SETOF public.razorpay_webhook_events
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('claim_razorpay_webhook_events'));
+
+    RETURN QUERY
+    WITH ready AS (
+        SELECT e.id
+        FROM public.razorpay_webhook_events e
+        WHERE e.status IN ('pending', 'processing')
+          AND NOT EXISTS (
+              SELECT 1 FROM public.razorpay_webhook_events busy
+              WHERE busy.subscription_key = e.subscription_key
+                AND busy.locked_until > NOW()
+          )
+        ORDER BY e.event_created_at, e.id
+        LIMIT p_limit
+    )
+    UPDATE public.razorpay_webhook_events e
+    SET status = 'processing',
+        attempts = e.attempts + 1,
+        locked_until = NOW() + make_interval(secs => p_lease_seconds)
+    FROM ready
+    WHERE e.id = ready.id
+    RETURNING e.*;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.claim_razorpay_webhook_events(INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.claim_razorpay_webhook_events(INTEGER, INTEGER) TO service_role;
@@ -0,0 +1,66 @@
+-- Migration: Email outbox
+-- /api/notifications/email stores the rendered message here and returns;
+-- lib/services/email-outbox.ts sends pending rows in batches, with retries,
+-- backoff and the provider's rate limit.
+
+CREATE TABLE IF NOT EXISTS public.email_notifications (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    type TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    html_content TEXT,
+    text_content TEXT,
+    metadata JSONB DEFAULT '{}'::JSONB,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'sending', 'sent', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    -- Not before this time: retry backoff while pending, lease while sending
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    provider_message_id TEXT,
+    created_by UUID REFERENCES public.users(id) ON DELETE SET NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    sent_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_email_notifications_due
+    ON public.email_notifications(next_attempt_at)
+    WHERE status IN ('pending', 'sending');
+
+CREATE INDEX IF NOT EXISTS idx_email_notifications_created
+    ON public.email_notifications(created_at DESC);
+
+-- Only the service role touches this table
+ALTER TABLE public.email_notifications ENABLE ROW LEVEL SECURITY;
+
+-- Lease up to p_limit due messages, oldest first; a worker that dies leaves
+-- its lease to expire and the rows are claimed again
+CREATE OR REPLACE FUNCTION public.claim_email_notifications(
+    p_limit INTEGER DEFAULT 50,
+    p_lease_seconds INTEGER DEFAULT 120
+)
+RETURNS SETOF public.email_notifications
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH due AS (
+        SELECT id
+        FROM public.email_notifications
+        WHERE status IN ('pending', 'sending')
+          AND next_attempt_at <= NOW()
+        ORDER BY next_attempt_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.email_notifications e
+    SET status = 'sending',
+        attempts = e.attempts + 1,
+        next_attempt_at = NOW() + make_interval(secs => p_lease_seconds)
+    FROM due
+    WHERE e.id = due.id
+    RETURNING e.*;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.claim_email_notifications(INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.claim_email_notifications(INTEGER, INTEGER) TO service_role;
@@ -0,0 +1,9 @@
+-- Migration: Upload size limit for the coventures bucket
+-- Admin uploads are resumable and chunked (lib/utils/upload.ts), so brochures
+-- and floor plans up to 50MB go through; the property forms check the same
+-- limit before uploading. A bucket limit cannot exceed the project's global
+-- file size limit (Storage settings), which must be at least this much.
+
+UPDATE storage.buckets
+SET file_size_limit = 52428800 -- 50MB
+WHERE id = 'coventures';
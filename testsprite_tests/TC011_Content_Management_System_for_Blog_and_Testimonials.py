@@ -1,6 +1,45 @@
 import asyncio
+import base64
+import os
+import time
 from playwright import async_api
 
+BASE_URL = os.environ.get("TC_BASE_URL", "http://localhost:3000")
+ADMIN_EMAIL = os.environ.get("TC_ADMIN_EMAIL", "admin@example.com")
+ADMIN_PASSWORD = os.environ.get("TC_ADMIN_PASSWORD", "password123")
+# Published or deleted content must reach the cached public pages within this many seconds
+MAX_DELAY_S = float(os.environ.get("TC011_MAX_DELAY_S", "10"))
+# 1x1 PNG for the featured image the blog form requires
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+# Served from the full route cache (STALE is served from it while regenerating)
+CACHED = ("HIT", "STALE")
+
+
+async def fetch_page(context, path):
+    response = await context.request.get(BASE_URL + path)
+    return await response.text(), response.headers.get("x-nextjs-cache")
+
+
+async def wait_for_page(context, path, title, present):
+    """Seconds until ``title`` is (or is no longer) on ``path``; None if MAX_DELAY_S passes."""
+    started = time.perf_counter()
+    while time.perf_counter() - started < MAX_DELAY_S:
+        body, _ = await fetch_page(context, path)
+        if (title in body) == present:
+            return time.perf_counter() - started
+        await asyncio.sleep(0.5)
+    return None
+
+
+async def assert_cache_served(context, path):
+    # Warm once, then the page must come from the route cache
+    await fetch_page(context, path)
+    _, cache = await fetch_page(context, path)
+    assert cache in CACHED, f"{path} is not served from the route cache (x-nextjs-cache={cache}); run a production build"
+
+
 async def run_test():
     pw = None
     browser = None
@@ -23,70 +62,85 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
-        context.set_default_timeout(5000)
+        context.set_default_timeout(15000)
 
         # Open a new page in the browser context
         page = await context.new_page()
+        page.on("dialog", lambda dialog: asyncio.ensure_future(dialog.accept()))
+
+        # -> Sign in as admin
+        await page.goto(f"{BASE_URL}/auth/login", wait_until="domcontentloaded", timeout=30000)
+        await page.locator('input[type="email"]').fill(ADMIN_EMAIL)
+        await page.locator('input[type="password"]').fill(ADMIN_PASSWORD)
+        await page.locator('button[type="submit"]').click()
+        await page.wait_for_url("**/admin**", timeout=30000)
+
+        # -> The public pages are cache-served before the change
+        for path in ("/blog", "/"):
+            await assert_cache_served(context, path)
+
+        # -> Publish a new post from the admin blog editor
+        title = f"TC011 cache check {int(time.time())}"
+        await page.goto(f"{BASE_URL}/admin/blog/new", wait_until="domcontentloaded", timeout=30000)
+        await page.locator("#title").fill(title)
+        await page.locator("#excerpt").fill("Checks that publishing revalidates the cached blog pages.")
+        await page.get_by_placeholder("Write your blog post content here", exact=False).fill(
+            "Published by TC011 and deleted again at the end of the test."
+        )
+        await page.locator("#image-upload").set_input_files(
+            files=[{"name": "tc011.png", "mimeType": "image/png", "buffer": PIXEL_PNG}]
+        )
+        await page.get_by_text("Image uploaded successfully").wait_for()
+        await page.get_by_role("button", name="Publish").click()
+        await page.wait_for_url("**/admin/blog", timeout=30000)
+
+        # -> The post appears on the listing and the home page within the bound
+        for path in ("/blog", "/"):
+            delay = await wait_for_page(context, path, title, present=True)
+            assert delay is not None, f"Published post not on {path} after {MAX_DELAY_S}s"
+            print(f"{path}: published post visible after {delay:.1f}s")
+            await assert_cache_served(context, path)
+
+        # -> Delete the post again from the admin list
+        await page.goto(f"{BASE_URL}/admin/blog", wait_until="domcontentloaded", timeout=30000)
+        row = page.locator("tr", has_text=title)
+        await row.locator("button").last.click()
+        await page.get_by_role("menuitem", name="Delete").click()
+        await page.get_by_text("Blog post deleted successfully").wait_for()
+
+        # -> ... and it disappears within the same bound
+        for path in ("/blog", "/"):
+            delay = await wait_for_page(context, path, title, present=False)
+            assert delay is not None, f"Deleted post still on {path} after {MAX_DELAY_S}s"
+            print(f"{path}: deleted post gone after {delay:.1f}s")
+            await assert_cache_served(context, path)
+
+        # -> Add an approved testimonial; it must reach the home page marquee within the bound
+        name = f"TC011 Tester {int(time.time())}"
+        await page.goto(f"{BASE_URL}/admin/testimonials/new", wait_until="domcontentloaded", timeout=30000)
+        await page.locator("#full_name").fill(name)
+        await page.get_by_placeholder("Write the testimonial content here", exact=False).fill(
+            "Added by TC011 to check that the cached home page is revalidated."
+        )
+        await page.get_by_role("button", name="Save Testimonial").click()
+        await page.wait_for_url("**/admin/testimonials", timeout=30000)
+
+        delay = await wait_for_page(context, "/", name, present=True)
+        assert delay is not None, f"Approved testimonial not on / after {MAX_DELAY_S}s"
+        print(f"/: approved testimonial visible after {delay:.1f}s")
+        await assert_cache_served(context, "/")
+
+        # -> Delete it again
+        await page.goto(f"{BASE_URL}/admin/testimonials", wait_until="domcontentloaded", timeout=30000)
+        row = page.locator("tr", has_text=name)
+        await row.locator("button").last.click()
+        await page.get_by_role("menuitem", name="Delete").click()
+        await page.get_by_text("Testimonial deleted successfully").wait_for()
 
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Admin' button to open the admin login/dashboard so admin authentication can begin.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/header/div/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Input admin credentials and submit the login form to authenticate and access the admin dashboard.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div/div/form/div[1]/div[1]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('example@gmail.com')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div/div/form/div[1]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Try alternate admin credentials by entering admin@example.com as email and password123 as password, then click Sign In.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div/div/form/div[1]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@example.com')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div/div/form/div[1]/div[3]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password123')
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await asyncio.sleep(5)
+        delay = await wait_for_page(context, "/", name, present=False)
+        assert delay is not None, f"Deleted testimonial still on / after {MAX_DELAY_S}s"
+        print(f"/: deleted testimonial gone after {delay:.1f}s")
+        await assert_cache_served(context, "/")
 
     finally:
         if context:
@@ -97,4 +151,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
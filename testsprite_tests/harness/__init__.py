@@ -0,0 +1,14 @@
+"""Performance harness for the TestSprite Playwright flows.
+
+The generated ``TC*.py`` scripts in ``testsprite_tests/`` stay untouched; the
+harness drives the running app (``npm run dev`` / ``npm start``) directly and
+stores its measurements per build under ``testsprite_tests/results/``.
+
+Run it from the ``testsprite_tests`` directory::
+
+    python -m harness cache-bench
+"""
+
+from .config import BASE_URL, RESULTS_DIR, build_id
+
+__all__ = ["BASE_URL", "RESULTS_DIR", "build_id"]
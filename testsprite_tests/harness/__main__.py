@@ -0,0 +1,163 @@
+"""Command line entry point: ``python -m harness <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+
+
+def _cache_bench(args: argparse.Namespace) -> int:
+    from . import cache_bench
+
+    return cache_bench.main(args.routes or None, args.settle_ms)
+
+
+def _tests(args: argparse.Namespace) -> list[str]:
+    from . import tc
+
+    tests = list(args.tests)
+    if args.plan:
+        tests.extend(tc.from_plan(args.plan))
+    return tests
+
+
+def _phone_auth(args: argparse.Namespace) -> int:
+    from . import phone_auth
+
+    return phone_auth.main(args.phone)
+
+
+BENCHMARKS = {
+    "analyze-property": "AI committee latency against the stub LLM",
+    "ai-config-cache": "saving from cached Gemini key lookup and model discovery",
+    "analysis-reuse": "repeat AI analyses served from the content-addressed store",
+    "chat-stream": "time to first token and tokens/s for the streamed AI chat",
+    "usage-counters": "usage-limit lookup cost as the usage log grows (needs psql)",
+    "properties-pagination": "offset vs cursor paging, count modes and location search on 100k+ properties",
+    "search-cache": "throughput of the cached /api/search/* endpoints, with and without ETags",
+    "middleware-auth": "auth middleware overhead per request for public, signed-out and signed-in routes",
+    "rate-limit": "sliding-window limiter accuracy, window-edge bursts and memory under a flood of IPs",
+    "analytics-rollups": "admin analytics from rollups vs the old per-load queries at scale (needs psql)",
+    "admin-listings": "page size, latency and render cost of the admin lead and user listings at 200k leads",
+    "csv-export": "rows/s and server memory of streamed admin CSV exports up to 1M rows",
+    "media-library": "stats and one page of /admin/media vs loading every file, up to 1M files",
+    "chunked-upload": "throughput and recovery time of chunked, resumable admin uploads against a local storage stand-in",
+    "razorpay-webhook": "signed Razorpay webhook replay with duplicates: intake latency and queue lag (needs psql)",
+    "email-outbox": "notification request latency and outbox delivery throughput against a local SMTP stand-in",
+    "property-page": "TTFB of /properties/[id] cold, from the route cache and after on-demand revalidation",
+    "supabase-round-trips": "Supabase Auth and REST round trips per API request, through a counting proxy",
+}
+
+
+def _bench(args: argparse.Namespace) -> int:
+    if not args.timings:
+        return args.bench_module.main(args)
+
+    from . import results, timings
+
+    collector = timings.collect_http()
+    status = args.bench_module.main(args)
+    routes = collector.report()
+    print(timings.format_report(routes))
+    print(f"Saved {results.save(f'server-timing-{args.benchmark}', {'routes': routes})}")
+    return status
+
+
+def _options(args: argparse.Namespace) -> dict:
+    """RunOptions fields shared by every profile of a run."""
+    return {"clock": args.clock, "firebase_stub": args.firebase_stub, "server_timing": args.timings}
+
+
+def _run(args: argparse.Namespace) -> int:
+    from . import profiles, runner
+
+    names = profiles.expand(args.profile)
+    return runner.main(_tests(args), [runner.RunOptions(profile=name, **_options(args)) for name in names])
+
+
+def _daemon(args: argparse.Namespace) -> int:
+    if args.stop:
+        from . import client
+
+        return client.shutdown()
+    from . import daemon
+
+    return daemon.main()
+
+
+def _submit(args: argparse.Namespace) -> int:
+    from . import client
+
+    return client.submit(_tests(args), args.profile or [], _options(args))
+
+
+def _add_flow_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("tests", nargs="*", help="TC ids or paths (default: every TC script)")
+    parser.add_argument("--plan", help="JSON test plan listing TC ids, e.g. testsprite_frontend_test_plan.json")
+    parser.add_argument(
+        "--profile", action="append",
+        help="emulation profile, repeatable; 'all' runs every profile (default: desktop)",
+    )
+    parser.add_argument(
+        "--clock", action="store_true",
+        help="virtual clock + reduced motion: fast-forward the scripts' fixed waits",
+    )
+    parser.add_argument(
+        "--firebase-stub", action="store_true",
+        help="answer reCAPTCHA and Firebase phone auth locally with fixed OTP codes",
+    )
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="per-route Server-Timing phase breakdown of every response the flow receives",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache = commands.add_parser("cache-bench", help="cold vs warm cache navigation per route")
+    cache.add_argument("routes", nargs="*", help="routes to visit (default: key public routes)")
+    cache.add_argument("--settle-ms", type=int, default=5000, help="max wait for network idle")
+    cache.set_defaults(func=_cache_bench)
+
+    run = commands.add_parser("run", help="run TC flows with timings and Web Vitals")
+    _add_flow_arguments(run)
+    run.set_defaults(func=_run)
+
+    daemon = commands.add_parser("daemon", help="keep Playwright and Chromium warm for `submit`")
+    daemon.add_argument("--stop", action="store_true", help="shut down a running daemon")
+    daemon.set_defaults(func=_daemon)
+
+    submit = commands.add_parser("submit", help="run TC flows on the warm daemon")
+    _add_flow_arguments(submit)
+    submit.set_defaults(func=_submit)
+
+    phone = commands.add_parser("phone-auth", help="timed phone signup/login against the Firebase stand-in")
+    phone.add_argument("--phone", default="+911234567890", help="registered number for the login flow")
+    phone.set_defaults(func=_phone_auth)
+
+    bench = commands.add_parser("bench", help="API benchmarks against local stubs")
+    bench.add_argument(
+        "--timings", action="store_true",
+        help="also report per-route Server-Timing phases of every response the benchmark receives",
+    )
+    benches = bench.add_subparsers(dest="benchmark", required=True)
+    for name, help_text in BENCHMARKS.items():
+        module = importlib.import_module(f".benchmarks.{name.replace('-', '_')}", __package__)
+        sub = benches.add_parser(name, help=help_text, description=module.__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+        module.add_arguments(sub)
+        sub.set_defaults(func=_bench, bench_module=module)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
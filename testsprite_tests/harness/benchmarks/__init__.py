@@ -0,0 +1 @@
+"""API-level benchmarks. Each module exposes ``add_arguments`` and ``main``."""
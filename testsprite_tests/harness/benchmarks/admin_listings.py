@@ -0,0 +1,203 @@
+"""Server-side paging, sorting and search for the admin lead and user listings.
+
+Seed a large lead inbox first (committed; every seeded lead has an
+``@harness-seed.invalid`` email and is removed by ``--cleanup``)::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench admin-listings --seed 200000
+    HARNESS_COOKIE='<admin session>' python -m harness bench admin-listings --render
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench admin-listings --cleanup
+
+Every scenario records latency and the response size, which should stay flat
+as the table grows: the routes return one page. With the database URL the
+report also includes the size of the unpaginated payload the pages used to
+download. ``--render`` opens ``/admin/leads`` in Chromium with the same cookie,
+switches to the largest page size and records how long the rows take to
+appear and how many ``<tr>`` the virtualized body actually rendered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+from .. import results
+from ..config import url
+from ..db import DATABASE_URL, literal, psql
+from ..httpclient import SESSION_COOKIE, get
+from ..stats import format_summary, summarize
+
+SUITE = "bench-admin-listings"
+
+EMAIL_DOMAIN = "@harness-seed.invalid"
+LEAD_TYPES = ["coupon_download", "join_group", "book_visit", "callback_request", "live_tour"]
+STATUSES = ["new", "contacted", "qualified", "converted", "closed"]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seed", type=int, help="insert this many synthetic property leads and exit")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded leads and exit")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--pages", default="1,100,1000", help="page numbers to fetch")
+    parser.add_argument("--search", default="Lead 1234", help="name/email search term")
+    parser.add_argument("--repeats", type=int, default=5, help="requests per scenario")
+    parser.add_argument("--render", action="store_true", help="also time /admin/leads in Chromium")
+
+
+def seed(count: int) -> None:
+    types = "ARRAY[" + ",".join(literal(name) for name in LEAD_TYPES) + "]"
+    statuses = "ARRAY[" + ",".join(literal(name) for name in STATUSES) + "]"
+    psql(f"""
+SET session_replication_role = replica;
+INSERT INTO public.property_leads (lead_type, full_name, email, phone, message, status, created_at)
+SELECT
+    ({types})[1 + i % {len(LEAD_TYPES)}],
+    'Harness Lead ' || i,
+    'lead' || i || {literal(EMAIL_DOMAIN)},
+    '+91' || lpad((9000000000 + i)::TEXT, 10, '0'),
+    'Synthetic lead for listing benchmarks',
+    ({statuses})[1 + (i / 7) % {len(STATUSES)}],
+    now() - (i % 730) * INTERVAL '1 day' - (i % 86400) * INTERVAL '1 second'
+FROM generate_series(1, {count}) AS i;
+ANALYZE public.property_leads;
+""")
+
+
+def cleanup() -> None:
+    psql(f"""
+SET session_replication_role = replica;
+DELETE FROM public.property_leads WHERE email LIKE {literal('%' + EMAIL_DOMAIN)};
+ANALYZE public.property_leads;
+""")
+
+
+def unpaginated_bytes() -> dict[str, int] | None:
+    """Rows and JSON size of what the admin pages used to fetch in one go."""
+    if not DATABASE_URL:
+        return None
+    rows = psql("""
+SELECT
+    (SELECT count(*) FROM public.admin_lead_inbox),
+    (SELECT COALESCE(sum(length(row_to_json(l)::TEXT)), 0) FROM public.admin_lead_inbox l),
+    (SELECT count(*) FROM public.users),
+    (SELECT COALESCE(sum(length(row_to_json(u)::TEXT)), 0) FROM public.users u);
+""")
+    leads, lead_bytes, users, user_bytes = (int(value) for value in rows[0])
+    return {"leads": leads, "lead_bytes": lead_bytes, "users": users, "user_bytes": user_bytes}
+
+
+def timed(route: str, params: dict[str, Any], repeats: int) -> dict[str, Any]:
+    path = f"{route}?{urlencode(params)}"
+    latencies, sizes, total = [], [], None
+    for _ in range(repeats):
+        response = get(path)
+        if not response.ok:
+            raise RuntimeError(f"GET {path} -> {response.status}: {response.body[:200]!r}")
+        latencies.append(response.elapsed_ms)
+        sizes.append(len(response.body))
+        body = response.json()
+        total = (body.get("data") or body)["pagination"]["total"]
+    return {**summarize(latencies), "bytes": max(sizes), "total": total}
+
+
+def scenarios(args: argparse.Namespace) -> dict[str, tuple[str, dict[str, Any]]]:
+    limit = args.limit
+    found: dict[str, tuple[str, dict[str, Any]]] = {}
+    for page in (int(value) for value in args.pages.split(",")):
+        found[f"inbox page {page}"] = ("/api/admin/leads", {"page": page, "limit": limit})
+    found["inbox group tab"] = ("/api/admin/leads", {"channel": "group", "limit": limit})
+    found["inbox search"] = ("/api/admin/leads", {"q": args.search, "limit": limit})
+    found["inbox sort by name"] = ("/api/admin/leads", {"sort": "full_name", "order": "asc", "limit": limit})
+    found["inbox with stats"] = ("/api/admin/leads", {"limit": limit, "stats": 1})
+    found["/api/leads page 1"] = ("/api/leads", {"limit": limit})
+    found["/api/leads search"] = ("/api/leads", {"q": args.search, "limit": limit})
+    found["users page 1"] = ("/api/admin/users", {"limit": limit, "stats": 1})
+    found["users search"] = ("/api/admin/users", {"q": "harness", "limit": limit})
+    return found
+
+
+def _browser_cookies() -> list[dict[str, str]]:
+    cookies = []
+    for part in SESSION_COOKIE.split(";"):
+        name, _, value = part.strip().partition("=")
+        if name:
+            cookies.append({"name": name, "value": value, "url": url("/")})
+    return cookies
+
+
+async def render(page_size: int) -> dict[str, Any]:
+    from playwright import async_api
+
+    from ..browser import launch
+
+    async with async_api.async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            context = await browser.new_context()
+            await context.add_cookies(_browser_cookies())
+            page = await context.new_page()
+
+            started = time.perf_counter()
+            await page.goto(url("/admin/leads"))
+            await page.wait_for_function(
+                "() => document.querySelectorAll('tbody tr td').length > 1 && !document.querySelector('.opacity-60')"
+            )
+            first_page_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            async with page.expect_response(lambda r: "/api/admin/leads" in r.url and f"limit={page_size}" in r.url):
+                await page.select_option(f"select:has(option[value='{page_size}'])", str(page_size))
+            await page.wait_for_function("() => !document.querySelector('.opacity-60')")
+            large_page_ms = (time.perf_counter() - started) * 1000
+            rendered_rows = await page.evaluate("document.querySelectorAll('tbody tr').length")
+        finally:
+            await browser.close()
+
+    return {
+        "first_page_ms": round(first_page_ms, 1),
+        "page_size": page_size,
+        "large_page_ms": round(large_page_ms, 1),
+        "rendered_rows": rendered_rows,
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {"limit": args.limit, "scenarios": {}}
+    for name, (route, params) in scenarios(args).items():
+        report["scenarios"][name] = timed(route, params, args.repeats)
+    report["unpaginated"] = unpaginated_bytes()
+    if args.render:
+        report["render"] = asyncio.run(render(500))
+    return report
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.seed:
+        seed(args.seed)
+        print(f"Seeded {args.seed} property leads (*{EMAIL_DOMAIN})")
+        return 0
+    if args.cleanup:
+        cleanup()
+        print("Removed seeded leads")
+        return 0
+    if not SESSION_COOKIE:
+        print("admin-listings: set HARNESS_COOKIE to an admin session")
+        return 2
+
+    data = run(args)
+    print(f"page size {data['limit']}")
+    for name, summary in data["scenarios"].items():
+        print(format_summary(f"{name:<20} {summary['bytes']:>9,} B  total {summary['total']:>9,}", summary))
+    if data["unpaginated"]:
+        full = data["unpaginated"]
+        print(f"unpaginated inbox: {full['leads']:,} rows, {full['lead_bytes']:,} B of JSON")
+        print(f"unpaginated users: {full['users']:,} rows, {full['user_bytes']:,} B of JSON")
+    if "render" in data:
+        render_report = data["render"]
+        print(f"/admin/leads first page visible after {render_report['first_page_ms']:.0f} ms")
+        print(f"  {render_report['page_size']}-row page in {render_report['large_page_ms']:.0f} ms, "
+              f"{render_report['rendered_rows']} <tr> in the DOM")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
@@ -0,0 +1,80 @@
+"""Per-request saving from caching the Gemini API key and model selection.
+
+``AIService`` used to read ``ai_api_keys`` and list Gemini models on every
+generation. Both are now cached per process. This benchmark calls the admin
+agent test route (``POST /api/admin/ai-configuration/test``), which goes
+through ``AIService.runAgent``, in two modes:
+
+``cold``
+    the cache is invalidated (``DELETE /api/admin/ai-configuration/cache``)
+    before every request, i.e. the old behaviour
+``warm``
+    the cache is left alone
+
+Run the app with ``GEMINI_API_BASE_URL=http://127.0.0.1:8788`` and an admin
+session in ``HARNESS_COOKIE``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+from .. import results
+from ..httpclient import request, post
+from ..stats import format_summary, summarize
+from ..stubs import serve
+from ..stubs.gemini import GeminiHandler, GeminiStub
+
+SUITE = "bench-ai-config-cache"
+CACHE_ROUTE = "/api/admin/ai-configuration/cache"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--agent", default="market_pulse")
+    parser.add_argument("--property", help="property id (default: any)")
+    parser.add_argument("--requests", type=int, default=20, help="requests per mode")
+    parser.add_argument("--models-delay", type=float, default=150, help="stub models-list latency (ms)")
+    parser.add_argument("--generate-delay", type=float, default=300, help="stub generation latency (ms)")
+    parser.add_argument("--stub-port", type=int, default=8788)
+
+
+def _measure(stub: GeminiStub, args: argparse.Namespace, cold: bool) -> dict[str, Any]:
+    stub.reset()
+    latencies, failures = [], 0
+    body = {"agentSlug": args.agent, "propertyId": args.property}
+    for _ in range(args.requests):
+        if cold:
+            request("DELETE", CACHE_ROUTE)
+        response = post("/api/admin/ai-configuration/test", body)
+        if response.ok:
+            latencies.append(response.elapsed_ms)
+        else:
+            failures += 1
+    return {
+        "latency_ms": summarize(latencies),
+        "failures": failures,
+        "models_calls_per_request": round(stub.calls["models"] / args.requests, 2),
+        "generate_calls": stub.calls["generateContent"],
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    stub = GeminiStub(models_delay_ms=args.models_delay, generate_delay_ms=args.generate_delay)
+    with serve(GeminiHandler, stub, port=args.stub_port):
+        cold = _measure(stub, args, cold=True)
+        # Prime once so every measured warm request is a hit
+        post("/api/admin/ai-configuration/test", {"agentSlug": args.agent, "propertyId": args.property})
+        warm = _measure(stub, args, cold=False)
+    saved = cold["latency_ms"].get("p50", 0) - warm["latency_ms"].get("p50", 0)
+    return {"cold": cold, "warm": warm, "p50_saved_ms": round(saved, 1)}
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    for mode in ("cold", "warm"):
+        stats = data[mode]
+        print(format_summary(mode, stats["latency_ms"]) + f"  models calls/request={stats['models_calls_per_request']}")
+    print(f"p50 saving per request: {data['p50_saved_ms']} ms")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if data["cold"]["failures"] or data["warm"]["failures"] else 0
@@ -0,0 +1,92 @@
+"""Repeat ``POST /api/ai/analyze-property`` calls served from stored analyses.
+
+Start the app against the stub LLM (see ``analyze-property``), then::
+
+    HARNESS_COOKIE='sb-...-auth-token=...' python -m harness bench analysis-reuse \\
+        --property <uuid> --repeats 10
+
+The first request runs the committee (unless an analysis with the same content
+hash already exists); every repeat should report ``metadata.cached`` and leave
+the stub's call count untouched. Between the first request and the repeats the
+property is viewed (``GET /api/properties/<id>`` bumps its view counter), which
+must not invalidate the stored analysis. Editing the property in the admin
+panel does, so the next run starts cold again.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+from .. import results
+from ..httpclient import get, post
+from ..stats import format_summary, summarize
+from ..stubs import serve
+from ..stubs.llm import AGENT_MARKERS, LLMHandler, LLMStub
+
+SUITE = "bench-analysis-reuse"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--property", required=True, help="property id to analyse")
+    parser.add_argument("--agents", nargs="+", default=list(AGENT_MARKERS), help="agent slugs to request")
+    parser.add_argument("--default-delay", type=float, default=1500, help="stub delay per agent (ms)")
+    parser.add_argument("--repeats", type=int, default=10, help="requests after the first one")
+    parser.add_argument("--views", type=int, default=1,
+                        help="property views between the first request and the repeats")
+    parser.add_argument("--stub-port", type=int, default=8787)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    stub = LLMStub(default_delay_ms=args.default_delay)
+    body = {"propertyId": args.property, "agentSlugs": args.agents}
+    first: dict[str, Any] = {}
+    repeat_latencies, repeat_cached, failures = [], 0, 0
+    with serve(LLMHandler, stub, port=args.stub_port):
+        response = post("/api/ai/analyze-property", body)
+        metadata = response.json().get("metadata", {}) if response.ok else {}
+        first = {
+            "ok": response.ok,
+            "latency_ms": response.elapsed_ms,
+            "cached": bool(metadata.get("cached")),
+            "llm_calls": len(stub.calls),
+            "content_hash": metadata.get("content_hash"),
+        }
+        calls_after_first = len(stub.calls)
+
+        views_ok = 0
+        for _ in range(args.views):
+            views_ok += get(f"/api/properties/{args.property}").ok
+
+        for _ in range(args.repeats):
+            response = post("/api/ai/analyze-property", body)
+            repeat_latencies.append(response.elapsed_ms)
+            if not response.ok:
+                failures += 1
+                continue
+            repeat_cached += bool(response.json().get("metadata", {}).get("cached"))
+
+    return {
+        "agents": args.agents,
+        "first": first,
+        "repeat_latency_ms": summarize(repeat_latencies),
+        "repeat_cached": repeat_cached,
+        "repeat_llm_calls": len(stub.calls) - calls_after_first,
+        "views": {"requested": args.views, "ok": views_ok},
+        "failures": failures + (not first["ok"]) + (args.views - views_ok),
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    first = data["first"]
+    print(f"first request {first['latency_ms']:.0f} ms, cached={first['cached']}, "
+          f"{first['llm_calls']} LLM call(s)")
+    print(f"property viewed {data['views']['ok']}/{args.views} time(s) before the repeats")
+    print(format_summary("repeats", data["repeat_latency_ms"]))
+    print(f"repeats served from store {data['repeat_cached']}/{args.repeats}, "
+          f"LLM calls during repeats {data['repeat_llm_calls']}")
+    if data["failures"]:
+        print(f"{data['failures']} request(s) failed; check HARNESS_COOKIE and the user's plan")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if data["failures"] or data["repeat_llm_calls"] else 0
@@ -0,0 +1,145 @@
+"""Admin analytics: the old 14 dashboard queries vs ``get_admin_analytics()``.
+
+Grows ``properties``, ``enquiries`` and ``users`` to each ``--sizes`` value
+inside one transaction (rolled back at the end), rebuilds the rollups, and
+times both ways of producing the dashboard::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench analytics-rollups \\
+        --sizes 10000,100000,1000000
+
+The legacy queries are the ones ``app/admin/analytics/page.tsx`` used to send
+from the browser; row-returning ones are wrapped so every row is materialised,
+approximating the cost of serialising them (network transfer and client-side
+``reduce`` are not included, so the real gap was larger). Seeding runs with
+``session_replication_role = replica`` so notification triggers and foreign
+keys are skipped; the rollups are then rebuilt once, and that time is reported
+too.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from typing import Any
+
+from .. import results
+from ..db import TIMING_FUNCTION, DatabaseUnavailable, literal, psql
+from ..stats import format_summary, summarize
+
+SUITE = "bench-analytics-rollups"
+
+PREV = "now() - INTERVAL '60 days'"
+MONTH = "date_trunc('month', now())"
+
+LEGACY_QUERIES = [
+    "SELECT count(*) FROM public.properties",
+    "SELECT count(*) FROM public.properties WHERE status = 'available'",
+    "SELECT count(*) FROM public.properties WHERE status = 'sold'",
+    f"SELECT count(*) FROM public.properties WHERE created_at < {PREV}",
+    "SELECT count(*) FROM public.enquiries",
+    f"SELECT count(*) FROM public.enquiries WHERE created_at >= {MONTH}",
+    f"SELECT count(*) FROM public.enquiries WHERE created_at < {PREV}",
+    "SELECT count(*) FROM public.users",
+    f"SELECT count(*) FROM public.users WHERE created_at >= {MONTH}",
+    f"SELECT count(*) FROM public.users WHERE created_at < {PREV}",
+    "SELECT price FROM public.properties WHERE status = 'sold'",
+    f"SELECT price FROM public.properties WHERE status = 'sold' AND created_at < {PREV}",
+    "SELECT id, title, views FROM public.properties ORDER BY views DESC LIMIT 5",
+    "SELECT price, created_at FROM public.properties WHERE status = 'sold' ORDER BY created_at",
+]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated row counts per table")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per method and size")
+
+
+def materialised(query: str) -> str:
+    return f"SELECT count(*) || ':' || COALESCE(sum(length(q::TEXT)), 0) FROM ({query}) q"
+
+
+def grow(size: int, previous: int) -> str:
+    count = size - previous
+    return f"""
+SET LOCAL session_replication_role = replica;
+INSERT INTO public.users (id, email, full_name, role, created_at)
+SELECT gen_random_uuid(), 'harness-' || gen_random_uuid() || '@example.invalid', 'Harness user', 'user',
+       now() - random() * INTERVAL '1095 days'
+FROM generate_series(1, {count});
+INSERT INTO public.properties (user_id, category_id, title, slug, description, location, city, price,
+    bedrooms, bathrooms, area_sqft, bhk_type, property_type, featured_image, status, views, created_at)
+SELECT (SELECT id FROM public.users ORDER BY created_at LIMIT 1), (SELECT id FROM public.categories LIMIT 1),
+       'Harness property', 'harness-analytics-' || gen_random_uuid(), 'Synthetic', 'Whitefield, Bengaluru',
+       'Bengaluru', 2500000 + (random() * 20000000)::INTEGER, 2, 2, 1200, '2BHK', 'apartment',
+       '/images/placeholder.jpg', (ARRAY['available', 'sold', 'pending', 'draft'])[1 + (i % 4)],
+       (random() * 10000)::INTEGER, now() - random() * INTERVAL '1095 days'
+FROM generate_series(1, {count}) AS i;
+INSERT INTO public.enquiries (full_name, email, phone, message, created_at)
+SELECT 'Harness', 'enquiry@example.invalid', '+910000000000', 'Synthetic', now() - random() * INTERVAL '1095 days'
+FROM generate_series(1, {count});
+SET LOCAL session_replication_role = origin;
+ANALYZE public.users, public.properties, public.enquiries;
+INSERT INTO harness_timings
+SELECT {size}, 'rebuild', ms, result FROM pg_temp.harness_time('SELECT public.rebuild_analytics_rollups()::TEXT', 1);
+"""
+
+
+def script(sizes: list[int], repeats: int) -> str:
+    parts = [
+        "BEGIN;",
+        TIMING_FUNCTION,
+        "CREATE TEMP TABLE harness_timings (size BIGINT, method TEXT, ms DOUBLE PRECISION, result TEXT) ON COMMIT DROP;",
+    ]
+    previous = 0
+    for size in sizes:
+        parts.append(grow(size, previous))
+        for index, query in enumerate(LEGACY_QUERIES):
+            parts.append(
+                f"INSERT INTO harness_timings SELECT {size}, 'legacy:{index}', ms, result "
+                f"FROM pg_temp.harness_time({literal(materialised(query))}, {repeats});"
+            )
+        parts.append(
+            f"INSERT INTO harness_timings SELECT {size}, 'rollup', ms, result "
+            f"FROM pg_temp.harness_time({literal('SELECT public.get_admin_analytics(30)::TEXT')}, {repeats});"
+        )
+        previous = size
+    parts += ["SELECT size, method, ms, result FROM harness_timings ORDER BY size, method;", "ROLLBACK;"]
+    return "\n".join(parts)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    rows = psql(script(sizes, args.repeats))
+
+    per_size: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    for size, method, ms, _ in rows:
+        per_size[int(size)][method].append(float(ms))
+
+    report = {}
+    for size, methods in per_size.items():
+        # Legacy total per run: the 14 queries summed (the browser ran them in parallel,
+        # but the database still did all of the work)
+        legacy = [sum(run_ms) for run_ms in zip(*(methods[f"legacy:{i}"] for i in range(len(LEGACY_QUERIES))))]
+        report[size] = {
+            "legacy_ms": summarize(legacy),
+            "slowest_legacy_query": max(range(len(LEGACY_QUERIES)),
+                                        key=lambda i: sum(methods[f"legacy:{i}"])),
+            "rollup_ms": summarize(methods["rollup"]),
+            "rebuild_ms": methods["rebuild"][0] if methods["rebuild"] else None,
+        }
+    return {"sizes": sizes, "repeats": args.repeats, "by_size": report}
+
+
+def main(args: argparse.Namespace) -> int:
+    try:
+        data = run(args)
+    except DatabaseUnavailable as exc:
+        print(f"analytics-rollups: {exc}")
+        return 2
+    for size, report in data["by_size"].items():
+        print(f"{size:,} rows per table (rollup rebuild {report['rebuild_ms']:.0f} ms)")
+        print("  " + format_summary("14 legacy queries", report["legacy_ms"]))
+        print("  " + format_summary("get_admin_analytics", report["rollup_ms"]))
+        print(f"  slowest legacy query: {LEGACY_QUERIES[report['slowest_legacy_query']]}")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
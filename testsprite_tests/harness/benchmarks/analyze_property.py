@@ -0,0 +1,80 @@
+"""Latency of ``POST /api/ai/analyze-property`` against the stub LLM.
+
+Start the app pointed at the stub port, e.g.::
+
+    OPENAI_BASE_URL=http://127.0.0.1:8787/v1 OPENAI_API_KEY=stub \\
+    AI_AGENT_TIMEOUT_MS=10000 npm run dev
+
+then::
+
+    HARNESS_COOKIE='sb-...-auth-token=...' python -m harness bench analyze-property \\
+        --property <uuid> --delay legal_regulatory=15000
+
+The route needs a logged-in user whose plan covers the requested agents. The
+report compares observed latency with what a sequential committee would take
+(sum of the agent delays) and a fully concurrent one (max delay, capped by the
+deadline), and lists which agents came back partial.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+from .. import results
+from ..httpclient import post
+from ..stats import format_summary, summarize
+from ..stubs import serve
+from ..stubs.llm import AGENT_MARKERS, LLMHandler, LLMStub, parse_delays
+
+SUITE = "bench-analyze-property"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--property", required=True, help="property id to analyse")
+    parser.add_argument("--agents", nargs="+", default=list(AGENT_MARKERS), help="agent slugs to request")
+    parser.add_argument("--delay", action="append", help="per-agent stub delay, e.g. market_pulse=3000")
+    parser.add_argument("--default-delay", type=float, default=1500, help="stub delay for other agents (ms)")
+    parser.add_argument("--requests", type=int, default=5, help="number of sequential requests")
+    parser.add_argument("--stub-port", type=int, default=8787)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    stub = LLMStub(delays_ms=parse_delays(args.delay), default_delay_ms=args.default_delay)
+    latencies, partial, timed_out, failures = [], 0, {}, 0
+    with serve(LLMHandler, stub, port=args.stub_port):
+        for _ in range(args.requests):
+            response = post("/api/ai/analyze-property", {"propertyId": args.property, "agentSlugs": args.agents})
+            latencies.append(response.elapsed_ms)
+            if not response.ok:
+                failures += 1
+                continue
+            metadata = response.json().get("metadata", {})
+            partial += bool(metadata.get("partial"))
+            for slug in metadata.get("agents_timed_out", []):
+                timed_out[slug] = timed_out.get(slug, 0) + 1
+
+    delays = [stub.delay_for(slug) for slug in args.agents]
+    return {
+        "agents": args.agents,
+        "stub_delays_ms": {slug: stub.delay_for(slug) for slug in args.agents},
+        "sequential_estimate_ms": sum(delays),
+        "concurrent_estimate_ms": max(delays) if delays else 0,
+        "latency_ms": summarize(latencies),
+        "failures": failures,
+        "partial_responses": partial,
+        "timed_out": timed_out,
+        "llm_calls": len(stub.calls),
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    print(format_summary("analyze-property", data["latency_ms"]))
+    print(f"sequential estimate {data['sequential_estimate_ms']:.0f} ms, "
+          f"concurrent estimate {data['concurrent_estimate_ms']:.0f} ms (before deadline)")
+    print(f"partial responses {data['partial_responses']}/{args.requests}, timed out {data['timed_out']}")
+    if data["failures"]:
+        print(f"{data['failures']} request(s) failed; check HARNESS_COOKIE and the user's plan")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if data["failures"] else 0
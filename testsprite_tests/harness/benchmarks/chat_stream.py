@@ -0,0 +1,106 @@
+"""Time to first token and token rate for ``POST /api/ai/chat``.
+
+Start the app with the chat pointed at the stub model::
+
+    AI_CHAT_MODEL=stub OPENAI_BASE_URL=http://127.0.0.1:8787/v1 OPENAI_API_KEY=stub npm run dev
+
+then::
+
+    HARNESS_COOKIE='sb-...-auth-token=...' python -m harness bench chat-stream \\
+        --first-token-delay 400 --token-interval 30
+
+Each round sends the same question streamed (``text/event-stream``) and
+buffered (one JSON body). For the streamed reply, time to first token is when
+the first non-empty ``delta`` event arrives; tokens per second covers the
+events after it. Without ``AI_CHAT_MODEL`` the route streams its template
+replies, which measures the framework overhead alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+
+from .. import results
+from ..httpclient import post, stream
+from ..stats import format_summary, summarize
+from ..stubs import serve
+from ..stubs.llm import LLMHandler, LLMStub
+
+SUITE = "bench-chat-stream"
+
+PROPERTY = {"title": "Harness Residency", "location": "Whitefield, Bengaluru", "price": 8500000}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--question", default="What is the expected ROI?", help="user message to send")
+    parser.add_argument("--first-token-delay", type=float, default=400, help="stub delay before the first token (ms)")
+    parser.add_argument("--token-interval", type=float, default=30, help="stub delay between tokens (ms)")
+    parser.add_argument("--requests", type=int, default=5, help="rounds of streamed + buffered requests")
+    parser.add_argument("--stub-port", type=int, default=8787)
+
+
+def deltas(events: list[tuple[float, str]]) -> list[tuple[float, str]]:
+    """``(ms, text)`` for each token event, stopping at ``[DONE]``."""
+    tokens = []
+    for at, data in events:
+        if data == "[DONE]":
+            break
+        payload = json.loads(data)
+        if payload.get("error"):
+            raise RuntimeError(payload["error"])
+        if payload.get("delta"):
+            tokens.append((at, payload["delta"]))
+    return tokens
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    stub = LLMStub(default_delay_ms=args.first_token_delay, token_interval_ms=args.token_interval)
+    body = {"messages": [{"role": "user", "content": args.question}], "propertyData": PROPERTY}
+    ttft, rates, streamed_total, buffered_total, failures = [], [], [], [], 0
+    with serve(LLMHandler, stub, port=args.stub_port):
+        for _ in range(args.requests):
+            response = stream("POST", "/api/ai/chat", {**body, "stream": True})
+            try:
+                tokens = deltas(response.events) if response.ok else []
+            except RuntimeError:
+                tokens = []
+            if not tokens:
+                failures += 1
+            else:
+                ttft.append(tokens[0][0])
+                streamed_total.append(response.elapsed_ms)
+                span_s = (tokens[-1][0] - tokens[0][0]) / 1000
+                if len(tokens) > 1 and span_s > 0:
+                    rates.append((len(tokens) - 1) / span_s)
+
+            buffered = post("/api/ai/chat", body)
+            if buffered.ok:
+                buffered_total.append(buffered.elapsed_ms)
+            else:
+                failures += 1
+
+    return {
+        "stub": {"first_token_delay_ms": args.first_token_delay, "token_interval_ms": args.token_interval},
+        "time_to_first_token_ms": summarize(ttft),
+        "tokens_per_second": summarize(rates),
+        "streamed_total_ms": summarize(streamed_total),
+        "buffered_total_ms": summarize(buffered_total),
+        "model_calls": len(stub.calls),
+        "failures": failures,
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    print(format_summary("time to first token", data["time_to_first_token_ms"]))
+    print(format_summary("tokens/s", data["tokens_per_second"], unit=""))
+    print(format_summary("streamed total", data["streamed_total_ms"]))
+    print(format_summary("buffered total", data["buffered_total_ms"]))
+    if not data["model_calls"]:
+        print("The stub saw no calls; the app is using its template replies (set AI_CHAT_MODEL)")
+    if data["failures"]:
+        print(f"{data['failures']} request(s) failed; check HARNESS_COOKIE and the user's subscription")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if data["failures"] else 0
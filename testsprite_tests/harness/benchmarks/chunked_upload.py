@@ -0,0 +1,191 @@
+"""Chunked upload throughput and recovery time against a local storage stand-in.
+
+Uploads generated files through the ``/admin/media`` upload button, with the
+app's resumable uploads pointed at ``stubs.storage`` instead of Supabase::
+
+    NEXT_PUBLIC_STORAGE_UPLOAD_URL=http://127.0.0.1:8790/upload/resumable npm run dev
+    HARNESS_COOKIE='<admin session>' python -m harness bench chunked-upload --size-mb 60 --bandwidth-mbps 40
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench chunked-upload --cleanup
+
+Scenarios:
+
+``clean``
+    one file, no faults
+``drop``
+    the connection dies halfway through the chunk that crosses 50% of the file
+``outage``
+    storage answers 503 for ``--outage-ms`` from 50% of the file
+``images``
+    ``--images`` large photos at once (parallel across files, downscaled in
+    the browser before upload)
+
+``recovery_ms`` is the extra time over ``clean``; ``resent_mb`` is what was
+sent twice. A single-request upload would have resent everything sent before
+the fault (``restart_cost_mb``). The media rows the page inserts are named
+``harness-upload-*``; ``--cleanup`` deletes them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import struct
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .. import results
+from ..config import url
+from ..db import DatabaseUnavailable, psql
+from ..httpclient import SESSION_COOKIE
+from ..stubs import serve
+from ..stubs.storage import StorageHandler, StorageStub
+
+SUITE = "bench-chunked-upload"
+NAME_PREFIX = "harness-upload-"
+MB = 1024 * 1024
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size-mb", type=float, default=60, help="size of the single-file scenarios")
+    parser.add_argument("--bandwidth-mbps", type=float, help="throttle the stand-in's reads to this many Mbit/s")
+    parser.add_argument("--outage-ms", type=float, default=5000, help="length of the storage outage")
+    parser.add_argument("--images", type=int, default=6, help="photos in the parallel image scenario")
+    parser.add_argument("--image-px", type=int, default=4000, help="longer side of the generated photos")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds to wait for a scenario")
+    parser.add_argument("--stub-port", type=int, default=8790)
+    parser.add_argument("--cleanup", action="store_true", help="delete harness-upload media rows and exit")
+
+
+def noise_png(path: Path, width: int, height: int) -> None:
+    """Write an RGB PNG of random pixels (photos barely compress either)."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + os.urandom(width * 3) for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+                     + chunk(b"IDAT", zlib.compress(rows, 1)) + chunk(b"IEND", b""))
+
+
+def _browser_cookies() -> list[dict[str, str]]:
+    cookies = []
+    for part in SESSION_COOKIE.split(";"):
+        name, _, value = part.strip().partition("=")
+        if name:
+            cookies.append({"name": name, "value": value, "url": url("/")})
+    return cookies
+
+
+async def upload(page: Any, stub: StorageStub, files: list[Path], timeout: float) -> dict[str, Any]:
+    started = time.perf_counter()
+    await page.set_input_files("input[type=file]", [str(path) for path in files])
+    deadline = started + timeout
+    while len(stub.completed()) < len(files):
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"{len(stub.completed())}/{len(files)} uploads finished in {timeout:.0f} s")
+        await asyncio.sleep(0.05)
+
+    finished = max(item.finished_at for item in stub.completed())
+    stored = sum(item.offset for item in stub.completed())
+    original = sum(path.stat().st_size for path in files)
+    fired = stub.faults_fired[0] if stub.faults_fired else None
+    return {
+        "files": len(files),
+        "original_mb": round(original / MB, 2),
+        "stored_mb": round(stored / MB, 2),
+        "elapsed_ms": round((finished - started) * 1000, 1),
+        "mb_per_s": round(stored / MB / (finished - started), 2),
+        "resent_mb": round(max(0, stub.bytes_received - stored) / MB, 2),
+        "restart_cost_mb": round(fired["offset"] / MB, 2) if fired else None,
+        "requests": dict(stub.calls),
+    }
+
+
+async def scenarios(args: argparse.Namespace, stub: StorageStub, workdir: Path) -> dict[str, Any]:
+    from playwright import async_api
+
+    from ..browser import launch
+
+    single = workdir / f"{NAME_PREFIX}single.bin"
+    single.write_bytes(os.urandom(int(args.size_mb * MB)))
+    photos = []
+    for index in range(args.images):
+        photo = workdir / f"{NAME_PREFIX}photo-{index}.png"
+        noise_png(photo, args.image_px, args.image_px * 3 // 4)
+        photos.append(photo)
+
+    plan = [
+        ("clean", None, [single]),
+        ("drop", "drop", [single]),
+        ("outage", "outage", [single]),
+        ("images", None, photos),
+    ]
+
+    report: dict[str, Any] = {}
+    async with async_api.async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            context = await browser.new_context()
+            await context.add_cookies(_browser_cookies())
+            page = await context.new_page()
+            for name, fault, files in plan:
+                # A fresh page each time, so nothing resumes from the previous scenario
+                await page.goto(url("/admin/media"))
+                await page.evaluate("() => localStorage.clear()")
+                await page.wait_for_selector("input[type=file]", state="attached")
+                stub.reset()
+                stub.arm(fault, at=0.5, outage_ms=args.outage_ms)
+                report[name] = await upload(page, stub, files, args.timeout)
+        finally:
+            await browser.close()
+
+    for name in ("drop", "outage"):
+        report[name]["recovery_ms"] = round(report[name]["elapsed_ms"] - report["clean"]["elapsed_ms"], 1)
+    return report
+
+
+def cleanup() -> None:
+    psql(f"DELETE FROM public.media_files WHERE name LIKE '{NAME_PREFIX}%';")
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="harness-upload-") as tmp:
+        workdir = Path(tmp)
+        stub = StorageStub(root=workdir / "storage", bandwidth_mbps=args.bandwidth_mbps)
+        with serve(StorageHandler, stub, port=args.stub_port):
+            data = asyncio.run(scenarios(args, stub, workdir))
+    return {"size_mb": args.size_mb, "bandwidth_mbps": args.bandwidth_mbps, "outage_ms": args.outage_ms,
+            "scenarios": data}
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.cleanup:
+        try:
+            cleanup()
+        except DatabaseUnavailable as exc:
+            print(f"chunked-upload: {exc}")
+            return 2
+        print("Removed harness-upload media rows")
+        return 0
+    if not SESSION_COOKIE:
+        print("chunked-upload: set HARNESS_COOKIE to an admin session")
+        return 2
+
+    data = run(args)
+    print(f"{'scenario':>9} {'files':>5} {'input MB':>8} {'stored MB':>9} {'ms':>8} {'MB/s':>6} "
+          f"{'resent MB':>9} {'recovery ms':>11}")
+    for name, stats in data["scenarios"].items():
+        recovery = stats.get("recovery_ms")
+        print(f"{name:>9} {stats['files']:>5} {stats['original_mb']:>8} {stats['stored_mb']:>9} "
+              f"{stats['elapsed_ms']:>8.0f} {stats['mb_per_s']:>6} {stats['resent_mb']:>9} "
+              f"{'-' if recovery is None else f'{recovery:.0f}':>11}")
+    for name in ("drop", "outage"):
+        cost = data["scenarios"][name]["restart_cost_mb"]
+        if cost is not None:
+            print(f"{name}: a single-request upload would have resent {cost} MB")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
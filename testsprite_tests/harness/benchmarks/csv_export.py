@@ -0,0 +1,110 @@
+"""Streaming CSV export throughput and server memory at up to 1M rows.
+
+Seeds the same synthetic leads as ``admin-listings`` (spread over two years),
+then downloads ``/api/admin/export/leads`` for growing date ranges, so each
+run exports a larger share of them::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench csv-export --seed 1000000
+    HARNESS_COOKIE='<admin session>' python -m harness bench csv-export --server-pid <next-server pid>
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench csv-export --cleanup
+
+The body is read in chunks and only counted, so the harness itself stays
+small. With ``--server-pid`` (Linux) the server's resident memory is sampled
+while the export streams; its peak should not grow with the row count. Under
+``next dev`` pass the pid of the worker that serves requests, not the parent.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from .. import results
+from ..httpclient import SESSION_COOKIE, DownloadResponse, download
+from . import admin_listings
+
+SUITE = "bench-csv-export"
+
+# Seeded leads span this many days back from today
+SEEDED_DAYS = 730
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seed", type=int, help="insert this many synthetic leads and exit")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded leads and exit")
+    parser.add_argument("--fractions", default="0.01,0.1,1", help="shares of the seeded date range to export")
+    parser.add_argument("--dataset", default="leads", help="export dataset (leads, contacts, properties, newsletter)")
+    parser.add_argument("--server-pid", type=int, help="sample this process's RSS during each export")
+
+
+def rss_kb(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    return 0
+
+
+def export(dataset: str, params: dict[str, str], pid: int | None) -> dict[str, Any]:
+    before = rss_kb(pid) if pid else None
+    peak = before or 0
+
+    def sample(_: DownloadResponse) -> None:
+        nonlocal peak
+        peak = max(peak, rss_kb(pid))
+
+    path = f"/api/admin/export/{dataset}?{urlencode(params)}"
+    response = download(path, on_chunk=sample if pid else None)
+    if not response.ok:
+        raise RuntimeError(f"GET {path} -> {response.status}: {response.head!r}")
+
+    rows = max(0, response.lines - 1)
+    seconds = response.elapsed_ms / 1000
+    return {
+        "rows": rows,
+        "bytes": response.bytes,
+        "ttfb_ms": round(response.ttfb_ms, 1),
+        "elapsed_ms": round(response.elapsed_ms, 1),
+        "rows_per_s": round(rows / seconds) if seconds else None,
+        "mb_per_s": round(response.bytes / 1e6 / seconds, 2) if seconds else None,
+        "rss_before_kb": before,
+        "rss_peak_kb": peak if pid else None,
+        "content_type": response.headers.get("content-type"),
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {"dataset": args.dataset, "exports": {}}
+    for fraction in (float(value) for value in args.fractions.split(",")):
+        since = date.today() - timedelta(days=round(SEEDED_DAYS * fraction))
+        params = {"from": since.isoformat(), "to": date.today().isoformat()}
+        report["exports"][str(fraction)] = export(args.dataset, params, args.server_pid)
+    return report
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.seed:
+        admin_listings.seed(args.seed)
+        print(f"Seeded {args.seed} property leads (*{admin_listings.EMAIL_DOMAIN})")
+        return 0
+    if args.cleanup:
+        admin_listings.cleanup()
+        print("Removed seeded leads")
+        return 0
+    if not SESSION_COOKIE:
+        print("csv-export: set HARNESS_COOKIE to an admin session")
+        return 2
+
+    data = run(args)
+    print(f"{'range':>6} {'rows':>10} {'MB':>8} {'ttfb ms':>8} {'rows/s':>9} {'MB/s':>6} {'peak RSS MB':>12}")
+    for fraction, stats in data["exports"].items():
+        peak = f"{stats['rss_peak_kb'] / 1024:.0f}" if stats["rss_peak_kb"] else "-"
+        print(f"{float(fraction):>6.0%} {stats['rows']:>10,} {stats['bytes'] / 1e6:>8.1f} {stats['ttfb_ms']:>8.0f} "
+              f"{stats['rows_per_s'] or 0:>9,} {stats['mb_per_s'] or 0:>6} {peak:>12}")
+    peaks = [stats["rss_peak_kb"] for stats in data["exports"].values() if stats["rss_peak_kb"]]
+    if len(peaks) > 1:
+        print(f"peak RSS spread across ranges: {(max(peaks) - min(peaks)) / 1024:.0f} MB")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
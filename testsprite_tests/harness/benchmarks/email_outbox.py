@@ -0,0 +1,142 @@
+"""Email outbox: request latency of /api/notifications/email and delivery throughput.
+
+The route used to call the mail provider inside the request; it now queues
+into ``email_notifications`` and returns, and the outbox worker delivers.
+This benchmark starts an SMTP stand-in (``stubs/smtp.py``), posts
+``--messages`` notifications concurrently and then waits for the stand-in to
+receive them::
+
+    EMAIL_TRANSPORT=smtp SMTP_HOST=127.0.0.1 SMTP_PORT=2525 SMTP_USER= npm run dev
+    HARNESS_COOKIE='<admin session>' python -m harness bench email-outbox --delay-ms 200
+    HARNESS_DATABASE_URL=... python -m harness bench email-outbox --cleanup
+
+Request latency is what a form submission now waits for, and should not
+move with ``--delay-ms``. Throughput and queued-to-delivered lag show the
+worker's batching and its ``EMAIL_RATE_LIMIT`` pacing; with ``--fail-rate``
+some deliveries only land after their retry backoff. ``--drain`` also calls
+``/api/notifications/email/process`` (``HARNESS_API_SECRET``) while waiting,
+for deployments that do not keep background work alive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import uuid
+from typing import Any
+
+from .. import results
+from ..db import DatabaseUnavailable, psql
+from ..httpclient import Response, hammer, post
+from ..stats import format_summary, summarize
+from ..stubs.smtp import SmtpStub, serve_smtp
+
+SUITE = "bench-email-outbox"
+ROUTE = "/api/notifications/email"
+RECIPIENT_PREFIX = "harness-mail-"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--delay-ms", type=float, default=200, help="stand-in processing time per message")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of messages answered with 451")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="stand-in throttles (421) above this many messages/s (default: no limit)")
+    parser.add_argument("--drain", action="store_true", help="also call the outbox's process route while waiting")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds to wait for deliveries")
+    parser.add_argument("--stub-port", type=int, default=2525)
+    parser.add_argument("--cleanup", action="store_true", help="delete queued harness messages and exit")
+
+
+def cleanup() -> None:
+    psql(f"DELETE FROM public.email_notifications WHERE recipient LIKE '{RECIPIENT_PREFIX}%';")
+
+
+def notification(run_id: str, index: int) -> dict[str, Any]:
+    return {
+        "type": "new_enquiry",
+        "to": f"{RECIPIENT_PREFIX}{run_id}-{index}@example.invalid",
+        "data": {
+            "full_name": f"Harness Enquirer {index}",
+            "email": f"enquirer-{index}@example.invalid",
+            "phone": "+91 90000 00000",
+            "message": "Is the 3BHK unit still available for co-ownership?",
+        },
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    run_id = uuid.uuid4().hex[:8]
+    stub = SmtpStub(delay_ms=args.delay_ms, fail_rate=args.fail_rate, rate_per_s=args.rate)
+    api_secret = os.environ.get("HARNESS_API_SECRET", "")
+    # Wall-clock time each message was acknowledged, by recipient
+    queued_at: dict[str, float] = {}
+
+    def send(index: int) -> Response:
+        body = notification(run_id, index)
+        response = post(ROUTE, body)
+        if response.ok:
+            queued_at[body["to"]] = time.time()
+        return response
+
+    with serve_smtp(stub, port=args.stub_port):
+        responses, wall = hammer(send, args.messages, args.concurrency)
+        fired_at = time.perf_counter()
+        deadline = fired_at + args.timeout
+        while time.perf_counter() < deadline:
+            mine = [message for message in stub.messages if message.recipient in queued_at]
+            if len(mine) >= len(queued_at):
+                break
+            if args.drain:
+                post("/api/notifications/email/process", headers={"Authorization": f"Bearer {api_secret}"})
+            time.sleep(0.25)
+        drained_s = time.perf_counter() - fired_at
+        delivered = [message for message in stub.messages if message.recipient in queued_at]
+
+    accepted = [response for response in responses if response.ok]
+    span = (max(m.received_at for m in delivered) - min(m.received_at for m in delivered)) if delivered else 0.0
+    return {
+        "run_id": run_id,
+        "messages": args.messages,
+        "request": {
+            "latency_ms": summarize(response.elapsed_ms for response in accepted),
+            "errors": len(responses) - len(accepted),
+            "statuses": sorted({response.status for response in responses}),
+            "per_s": round(args.messages / wall, 1),
+        },
+        "delivery": {
+            "delivered": len(delivered),
+            "lost": len(queued_at) - len({m.recipient for m in delivered}),
+            "duplicates": len(delivered) - len({m.recipient for m in delivered}),
+            "per_s": round(len(delivered) / span, 1) if span else None,
+            "connections": len({m.connection for m in delivered}),
+            "lag_ms": summarize((m.received_at - queued_at[m.recipient]) * 1000 for m in delivered),
+            "drained_after_s": round(drained_s, 2),
+        },
+        "smtp": {"temporary_failures": stub.calls["failed"], "throttled": stub.calls["throttled"]},
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.cleanup:
+        try:
+            cleanup()
+        except DatabaseUnavailable as exc:
+            print(f"email-outbox: {exc}")
+            return 2
+        print("Removed harness messages from email_notifications")
+        return 0
+
+    data = run(args)
+    request, delivery, smtp = data["request"], data["delivery"], data["smtp"]
+    print(f"{data['messages']} notifications at {request['per_s']}/s, {request['errors']} errors")
+    print(format_summary("request", request["latency_ms"]))
+    print(f"delivered {delivery['delivered']} over {delivery['connections']} SMTP connections "
+          f"at {delivery['per_s']}/s, {delivery['lost']} missing, {delivery['duplicates']} duplicates, "
+          f"drained {delivery['drained_after_s']} s after the last request")
+    print(format_summary("queued -> delivered", delivery["lag_ms"]))
+    print(f"stand-in: {smtp['temporary_failures']} temporary failures, {smtp['throttled']} throttled")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0 if not request["errors"] and not delivery["lost"] else 1
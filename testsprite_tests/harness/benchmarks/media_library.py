@@ -0,0 +1,119 @@
+"""Media library: loading every file vs ``media_library_stats()`` and one page.
+
+Grows ``media_files`` to each ``--sizes`` value inside one transaction (rolled
+back at the end) and times what ``/admin/media`` needs on first load::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench media-library \\
+        --sizes 10000,100000,1000000
+
+``legacy`` is the query the page used to send from the browser (every row,
+joined to its uploader) with all rows materialised; the stat cards were then
+counted client-side, which is not included. ``stats`` and the page queries are
+what ``/api/admin/media/stats`` and ``/api/admin/media`` run now.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from typing import Any
+
+from .. import results
+from ..db import TIMING_FUNCTION, DatabaseUnavailable, literal, psql
+from ..stats import format_summary, summarize
+
+SUITE = "bench-media-library"
+
+PAGE = 48
+
+# Mime types the seeded files cycle through
+MIME_TYPES = ["image/jpeg", "image/png", "image/webp", "application/pdf", "video/mp4", "audio/mpeg", "text/plain"]
+
+QUERIES = {
+    "legacy": "SELECT m.*, u.full_name FROM public.media_files m "
+              "LEFT JOIN public.users u ON u.id = m.uploaded_by ORDER BY m.created_at DESC",
+    "stats": "SELECT public.media_library_stats()",
+    "first_page": f"SELECT m.*, u.full_name FROM public.media_files m LEFT JOIN public.users u ON u.id = m.uploaded_by "
+                  f"ORDER BY m.created_at DESC, m.id DESC LIMIT {PAGE + 1}",
+    "image_page": f"SELECT m.*, u.full_name FROM public.media_files m LEFT JOIN public.users u ON u.id = m.uploaded_by "
+                  f"WHERE m.media_kind = 'image' ORDER BY m.created_at DESC, m.id DESC LIMIT {PAGE + 1}",
+    "search_page": f"SELECT m.*, u.full_name FROM public.media_files m LEFT JOIN public.users u ON u.id = m.uploaded_by "
+                   f"WHERE m.name ILIKE '%floor-plan%' ORDER BY m.created_at DESC, m.id DESC LIMIT {PAGE + 1}",
+}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated media_files row counts")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per query and size")
+
+
+def materialised(query: str) -> str:
+    return f"SELECT count(*) || ':' || COALESCE(sum(length(q::TEXT)), 0) FROM ({query}) q"
+
+
+def grow(size: int, previous: int) -> str:
+    mime_types = "ARRAY[" + ", ".join(literal(mime) for mime in MIME_TYPES) + "]"
+    return f"""
+SET LOCAL session_replication_role = replica;
+INSERT INTO public.media_files (name, url, file_size, mime_type, uploaded_by, folder, created_at)
+SELECT (ARRAY['photo', 'floor-plan', 'brochure', 'walkthrough'])[1 + (i % 4)] || '-' || i,
+       'https://example.invalid/media/harness-' || i, (random() * 5000000)::INTEGER,
+       ({mime_types})[1 + (i % {len(MIME_TYPES)})],
+       (SELECT id FROM public.users ORDER BY created_at LIMIT 1), 'harness',
+       now() - random() * INTERVAL '1095 days'
+FROM generate_series({previous + 1}, {size}) AS i;
+SET LOCAL session_replication_role = origin;
+ANALYZE public.media_files;
+"""
+
+
+def script(sizes: list[int], repeats: int) -> str:
+    parts = [
+        "BEGIN;",
+        TIMING_FUNCTION,
+        "CREATE TEMP TABLE harness_timings (size BIGINT, method TEXT, ms DOUBLE PRECISION, result TEXT) ON COMMIT DROP;",
+    ]
+    previous = 0
+    for size in sizes:
+        parts.append(grow(size, previous))
+        for method, query in QUERIES.items():
+            parts.append(
+                f"INSERT INTO harness_timings SELECT {size}, {literal(method)}, ms, result "
+                f"FROM pg_temp.harness_time({literal(materialised(query))}, {repeats});"
+            )
+        previous = size
+    parts += ["SELECT size, method, ms, result FROM harness_timings ORDER BY size, method;", "ROLLBACK;"]
+    return "\n".join(parts)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    rows = psql(script(sizes, args.repeats))
+
+    per_size: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    payload: dict[int, dict[str, int]] = defaultdict(dict)
+    for size, method, ms, result in rows:
+        per_size[int(size)][method].append(float(ms))
+        # result is "<rows>:<bytes>" of the materialised query
+        payload[int(size)][method] = int(result.split(":")[1])
+
+    report = {
+        size: {f"{method}_ms": summarize(timings) for method, timings in methods.items()}
+        | {"bytes": payload[size]}
+        for size, methods in per_size.items()
+    }
+    return {"sizes": sizes, "repeats": args.repeats, "page": PAGE, "by_size": report}
+
+
+def main(args: argparse.Namespace) -> int:
+    try:
+        data = run(args)
+    except DatabaseUnavailable as exc:
+        print(f"media-library: {exc}")
+        return 2
+    for size, report in data["by_size"].items():
+        print(f"{size:,} media files")
+        for method in QUERIES:
+            print(f"  {format_summary(method, report[f'{method}_ms'])}  ({report['bytes'][method] / 1e6:.2f} MB)")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
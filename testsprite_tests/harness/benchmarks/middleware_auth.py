@@ -0,0 +1,84 @@
+"""Per-request cost of the auth middleware, by outcome.
+
+Middleware reports its own time in ``Server-Timing: middleware;dur=..;desc=..``
+where ``desc`` is how the request was handled:
+
+``public``     route listed in ``PUBLIC_ROUTES``, Supabase skipped
+``anonymous``  no session cookie, Supabase skipped
+``local``      session JWT verified in middleware
+``remote``     ``auth.getUser()`` called (``AUTH_MIDDLEWARE_MODE=remote``, or the
+               token could not be verified locally or is about to expire)
+
+Signed-in requests use ``HARNESS_COOKIE``. Record a baseline with the old
+behaviour and compare::
+
+    AUTH_MIDDLEWARE_MODE=remote npm run dev
+    HARNESS_BUILD_ID=auth-remote python -m harness bench middleware-auth
+    npm run dev
+    python -m harness bench middleware-auth --baseline auth-remote
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from typing import Any
+
+from .. import results
+from ..httpclient import SESSION_COOKIE, get, server_timing
+from ..stats import format_summary, summarize
+
+SUITE = "bench-middleware-auth"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--requests", type=int, default=50, help="requests per scenario")
+    parser.add_argument("--public-path", default="/about")
+    parser.add_argument("--protected-path", default="/api/subscriptions")
+    parser.add_argument("--baseline", help="build id of a run to compare against (default: previous build)")
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    scenarios = {
+        "public page": (args.public_path, ""),
+        "protected, signed out": (args.protected_path, ""),
+    }
+    if SESSION_COOKIE:
+        scenarios["protected, signed in"] = (args.protected_path, SESSION_COOKIE)
+
+    report: dict[str, Any] = {}
+    for name, (path, cookie) in scenarios.items():
+        middleware_ms, total_ms, outcomes = [], [], defaultdict(int)
+        for _ in range(args.requests):
+            response = get(path, cookie=cookie)
+            metric = server_timing(response.headers).get("middleware")
+            total_ms.append(response.elapsed_ms)
+            if metric is None:
+                outcomes["missing"] += 1
+                continue
+            middleware_ms.append(metric.get("dur", 0.0))
+            outcomes[metric.get("desc", "unknown")] += 1
+        report[name] = {
+            "path": path,
+            "outcomes": dict(outcomes),
+            "middleware_ms": summarize(middleware_ms),
+            "total_ms": summarize(total_ms),
+        }
+    return {"requests": args.requests, "scenarios": report}
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    baseline = results.load(SUITE, args.baseline) if args.baseline else results.previous(SUITE)
+    for name, report in data["scenarios"].items():
+        outcomes = ", ".join(f"{desc}={count}" for desc, count in report["outcomes"].items())
+        print(f"{name} ({report['path']}): {outcomes}")
+        print("  " + format_summary("middleware", report["middleware_ms"]))
+        print("  " + format_summary("request", report["total_ms"]))
+        before = ((baseline or {}).get("scenarios", {}).get(name) or {}).get("middleware_ms", {})
+        if before.get("p50") and report["middleware_ms"].get("p50") is not None:
+            print(f"  middleware p50 {before['p50']} ms -> {report['middleware_ms']['p50']} ms vs {baseline['build']}")
+    if not SESSION_COOKIE:
+        print("HARNESS_COOKIE not set; signed-in scenario skipped")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
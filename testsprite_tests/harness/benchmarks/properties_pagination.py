@@ -0,0 +1,151 @@
+"""Offset vs keyset pagination, count modes and location search on ``GET /api/properties``.
+
+Needs a large catalogue, so seed one first (committed; tagged with the
+``harness-seed-`` slug prefix and removed by ``--cleanup``)::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench properties-pagination --seed 100000
+    python -m harness bench properties-pagination
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench properties-pagination --cleanup
+
+Seeding runs with ``session_replication_role = replica`` so the new-property
+notification trigger does not fan out to every user. The measurement itself
+only needs the app. Deep cursor pages are requested directly with cursors built
+from the row at the same depth as the offset page, which needs the database
+URL too; without it only the first cursor pages are timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from typing import Any
+
+from .. import results
+from ..db import DATABASE_URL, literal, psql
+from ..httpclient import get
+from ..stats import format_summary, summarize
+
+SUITE = "bench-properties-pagination"
+
+SLUG_PREFIX = "harness-seed-"
+LOCALITIES = ["Whitefield", "Koramangala", "Indiranagar", "Hebbal", "Electronic City", "Sarjapur Road",
+              "Yelahanka", "Jayanagar", "HSR Layout", "Bellandur"]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--seed", type=int, help="insert this many synthetic properties and exit")
+    parser.add_argument("--cleanup", action="store_true", help="delete seeded properties and exit")
+    parser.add_argument("--limit", type=int, default=20, help="page size")
+    parser.add_argument("--depths", default="0,1000,10000,50000,100000", help="row offsets to fetch pages at")
+    parser.add_argument("--repeats", type=int, default=5, help="requests per scenario")
+    parser.add_argument("--location", default="Koramangala", help="location search term")
+
+
+def seed(count: int) -> None:
+    localities = "ARRAY[" + ",".join(literal(name) for name in LOCALITIES) + "]"
+    psql(f"""
+SET session_replication_role = replica;
+INSERT INTO public.properties (user_id, category_id, title, slug, description, location, city, price,
+    bedrooms, bathrooms, area_sqft, bhk_type, property_type, featured_image, status, created_at)
+SELECT
+    (SELECT id FROM public.users ORDER BY created_at LIMIT 1),
+    (SELECT id FROM public.categories ORDER BY created_at LIMIT 1),
+    'Harness property ' || i,
+    {literal(SLUG_PREFIX)} || i || '-' || substr(md5(random()::TEXT), 1, 6),
+    'Synthetic listing for pagination benchmarks',
+    ({localities})[1 + i % {len(LOCALITIES)}] || ', Bengaluru',
+    'Bengaluru',
+    2500000 + (i % 400) * 50000,
+    1 + i % 4, 1 + i % 3, 600 + (i % 30) * 50, (1 + i % 4) || 'BHK', 'apartment',
+    '/images/placeholder.jpg',
+    CASE WHEN i % 10 = 0 THEN 'sold' ELSE 'available' END,
+    now() - (i % 1095) * INTERVAL '1 day' - (i % 86400) * INTERVAL '1 second'
+FROM generate_series(1, {count}) AS i;
+ANALYZE public.properties;
+""")
+
+
+def cleanup() -> None:
+    psql(f"""
+SET session_replication_role = replica;
+DELETE FROM public.properties WHERE slug LIKE {literal(SLUG_PREFIX + '%')};
+ANALYZE public.properties;
+""")
+
+
+def cursor_at(depth: int) -> str | None:
+    """Cursor whose next page starts at row ``depth`` of the default listing."""
+    if depth == 0:
+        return ""
+    if not DATABASE_URL:
+        return None
+    rows = psql(f"""
+SELECT to_json(created_at)#>>'{{}}', id FROM public.properties WHERE status = 'available'
+ORDER BY created_at DESC, id DESC OFFSET {depth - 1} LIMIT 1;
+""")
+    if not rows:
+        return None
+    created_at, row_id = rows[0]
+    return base64.urlsafe_b64encode(json.dumps([created_at, row_id]).encode()).decode().rstrip("=")
+
+
+def timed(path: str, repeats: int) -> tuple[dict[str, float], Any]:
+    latencies, last = [], None
+    for _ in range(repeats):
+        response = get(path)
+        if not response.ok:
+            raise RuntimeError(f"GET {path} -> {response.status}: {response.body[:200]!r}")
+        latencies.append(response.elapsed_ms)
+        last = response.json()["data"]
+    return summarize(latencies), last
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    limit, repeats = args.limit, args.repeats
+    report: dict[str, Any] = {"limit": limit, "offset": {}, "cursor": {}, "count": {}, "location": {}}
+
+    total = timed("/api/properties?limit=1&count=exact", 1)[1]["pagination"]["total"]
+    report["total_available"] = total
+
+    for depth in (int(value) for value in args.depths.split(",")):
+        if depth >= total:
+            continue
+        page = depth // limit + 1
+        report["offset"][depth], _ = timed(f"/api/properties?limit={limit}&page={page}", repeats)
+        cursor = cursor_at(depth)
+        if cursor is not None:
+            report["cursor"][depth], _ = timed(f"/api/properties?limit={limit}&cursor={cursor}", repeats)
+
+    for mode in ("exact", "estimated", "cached", "none"):
+        report["count"][mode], data = timed(f"/api/properties?limit={limit}&cursor=&count={mode}", repeats)
+        report["count"][mode]["total"] = data["pagination"].get("total")
+
+    term = args.location
+    report["location"]["offset_exact"], _ = timed(f"/api/properties?limit={limit}&location={term}", repeats)
+    report["location"]["cursor_no_count"], _ = timed(f"/api/properties?limit={limit}&cursor=&location={term}", repeats)
+    return report
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.seed:
+        seed(args.seed)
+        print(f"Seeded {args.seed} properties ({SLUG_PREFIX}*)")
+        return 0
+    if args.cleanup:
+        cleanup()
+        print("Removed seeded properties")
+        return 0
+
+    data = run(args)
+    print(f"{data['total_available']:,} available properties, page size {data['limit']}")
+    for depth, summary in data["offset"].items():
+        print(format_summary(f"offset   @ row {depth:>7,}", summary))
+        if depth in data["cursor"]:
+            print(format_summary(f"cursor   @ row {depth:>7,}", data["cursor"][depth]))
+    for mode, summary in data["count"].items():
+        print(format_summary(f"count={mode:<9} (total {summary.get('total')})", summary))
+    for name, summary in data["location"].items():
+        print(format_summary(f"location {name}", summary))
+    print(f"Saved {results.save(SUITE, data)}")
+    return 0
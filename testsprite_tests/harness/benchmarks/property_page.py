@@ -0,0 +1,95 @@
+"""TTFB of ``/properties/[id]`` served cold, from the route cache and just after revalidation.
+
+The detail page used to be a client component that fetched the property in
+the browser. It now renders on the server from cached data
+(``export const revalidate``) and admin edits revalidate it on demand through
+``lib/services/revalidation.ts``. For each of ``--properties`` properties
+taken from ``GET /api/properties`` the benchmark times:
+
+``cold``
+    the first request for the page since the server started (pages of
+    featured properties are pre-rendered at build time and show up as hits)
+``cached``
+    ``--repeats`` further requests, served from the full route cache
+``revalidated``
+    the first request after ``POST /api/admin/revalidate``, the same call the
+    admin pages make after an edit; it regenerates the page
+
+The route cache only exists in a production build, and the revalidation call
+needs an admin session::
+
+    npm run build && npm start
+    HARNESS_COOKIE='<admin session>' python -m harness bench property-page
+
+``x-nextjs-cache`` (HIT, STALE or MISS) is recorded for every response, so a
+run against ``next dev`` shows up as all misses rather than as a result.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from typing import Any
+
+from .. import results
+from ..httpclient import Response, get, post
+from ..stats import format_summary, summarize
+
+SUITE = "bench-property-page"
+MODES = ("cold", "cached", "revalidated")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--properties", type=int, default=10, help="properties to measure")
+    parser.add_argument("--repeats", type=int, default=10, help="cached requests per property")
+    parser.add_argument("--by", choices=("id", "slug"), default="id", help="URL form to request")
+
+
+def page(key: str) -> Response:
+    # No session: the cached page is the same for every visitor
+    return get(f"/properties/{key}", cookie="", headers={"Accept": "text/html"})
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    listing = get(f"/api/properties?limit={args.properties}", cookie="")
+    if not listing.ok:
+        raise RuntimeError(f"/api/properties -> {listing.status}")
+    properties = [row for row in listing.json()["data"]["data"] if row.get(args.by)]
+
+    samples: dict[str, list[Response]] = {mode: [] for mode in MODES}
+    revalidate_errors = 0
+    for row in properties:
+        key = row[args.by]
+        samples["cold"].append(page(key))
+        samples["cached"].extend(page(key) for _ in range(args.repeats))
+        if not post("/api/admin/revalidate", {"type": "property", "id": row["id"]}).ok:
+            revalidate_errors += 1
+        samples["revalidated"].append(page(key))
+
+    report: dict[str, Any] = {"properties": len(properties), "by": args.by, "revalidate_errors": revalidate_errors}
+    for mode, responses in samples.items():
+        ok = [response for response in responses if response.ok]
+        report[mode] = {
+            "ttfb_ms": summarize(response.ttfb_ms for response in ok),
+            "total_ms": summarize(response.elapsed_ms for response in ok),
+            "cache": dict(Counter(response.headers.get("x-nextjs-cache", "none") for response in ok)),
+            "errors": len(responses) - len(ok),
+        }
+    cached, cold = report["cached"]["ttfb_ms"], report["cold"]["ttfb_ms"]
+    report["p50_saved_ms"] = round(cold.get("p50", 0) - cached.get("p50", 0), 1)
+    return report
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    print(f"{data['properties']} properties by {data['by']}")
+    for mode in MODES:
+        stats = data[mode]
+        cache = ", ".join(f"{name}={count}" for name, count in sorted(stats["cache"].items()))
+        print(format_summary(f"{mode} ttfb", stats["ttfb_ms"]) + f"  x-nextjs-cache: {cache or '-'}")
+    print(f"p50 TTFB saved by the route cache: {data['p50_saved_ms']} ms")
+    if data["revalidate_errors"]:
+        print(f"revalidation failed {data['revalidate_errors']} times (is HARNESS_COOKIE an admin session?)")
+    print(f"Saved {results.save(SUITE, data)}")
+    errors = sum(data[mode]["errors"] for mode in MODES) + data["revalidate_errors"]
+    return 1 if errors else 0
@@ -0,0 +1,138 @@
+"""Accuracy and memory bounds of the sliding-window rate limiter.
+
+Drives a rate-limited form route with an invalid body, so nothing is written:
+a 400 means the limiter let the request through, a 429 means it was limited.
+Client IPs are varied through ``X-Forwarded-For``. Three phases:
+
+``burst``     ``--ips`` fresh IPs each send ``--burst`` requests at once; every IP
+              should get exactly ``--limit`` through
+``boundary``  one IP uses its limit just before a window edge and bursts again
+              just after; a fixed window would let a second full limit through,
+              the sliding window should let (almost) none through
+``flood``     ``--distinct`` IPs (default one million) send one request each;
+              with an admin ``HARNESS_COOKIE`` the limiter's key count, evictions
+              and heap are read from ``/api/admin/rate-limit`` before and after
+
+``--limit`` and ``--window-ms`` must match the route (newsletter: 3 per 60 s)::
+
+    HARNESS_COOKIE='<admin session>' python -m harness bench rate-limit --distinct 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .. import results
+from ..httpclient import SESSION_COOKIE, get, post
+
+SUITE = "bench-rate-limit"
+STATS_ROUTE = "/api/admin/rate-limit"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--path", default="/api/newsletter/subscribe")
+    parser.add_argument("--limit", type=int, default=3)
+    parser.add_argument("--window-ms", type=int, default=60000)
+    parser.add_argument("--ips", type=int, default=200, help="IPs in the burst phase")
+    parser.add_argument("--burst", type=int, default=10, help="requests per IP in the burst phase")
+    parser.add_argument("--distinct", type=int, default=1_000_000, help="IPs in the flood phase (0 to skip)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--skip-boundary", action="store_true", help="skip the window-edge phase (waits up to a window)")
+
+
+def ip_for(index: int, prefix: int) -> str:
+    return f"{prefix}.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+
+
+def status_for(path: str, ip: str) -> int:
+    # Empty session cookie: the limiter keys on the IP only
+    return post(path, {}, headers={"X-Forwarded-For": ip}, cookie="", timeout=30).status
+
+
+def statuses(path: str, ips: list[str], concurrency: int) -> list[int]:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(lambda ip: status_for(path, ip), ips))
+
+
+def burst(args: argparse.Namespace, prefix: int) -> dict[str, Any]:
+    ips = [ip_for(i, prefix) for i in range(args.ips)]
+    sent = [ip for ip in ips for _ in range(args.burst)]
+    codes = statuses(args.path, sent, args.concurrency)
+    allowed = Counter(ip for ip, code in zip(sent, codes) if code != 429)
+    wrong = {ip: allowed[ip] for ip in ips if allowed[ip] != min(args.limit, args.burst)}
+    return {"ips": args.ips, "burst": args.burst, "ips_off_limit": len(wrong), "examples": dict(list(wrong.items())[:5]),
+            "statuses": dict(Counter(codes))}
+
+
+def boundary(args: argparse.Namespace, prefix: int) -> dict[str, Any]:
+    window_s = args.window_ms / 1000
+    ip = ip_for(0, prefix)
+    # Spend the limit in the last 10% of a window...
+    time.sleep((window_s - time.time() % window_s - window_s * 0.1) % window_s)
+    first = sum(status_for(args.path, ip) != 429 for _ in range(args.limit))
+    # ...and burst again 2% into the next one
+    time.sleep(window_s - time.time() % window_s + window_s * 0.02)
+    second = sum(status_for(args.path, ip) != 429 for _ in range(args.limit * 2))
+    return {"before_edge": first, "after_edge": second, "fixed_window_would_allow": args.limit}
+
+
+def flood(args: argparse.Namespace, prefix: int) -> dict[str, Any]:
+    before = get(STATS_ROUTE) if SESSION_COOKIE else None
+    started = time.perf_counter()
+    codes: Counter[int] = Counter()
+    chunk = 10_000
+    for offset in range(0, args.distinct, chunk):
+        ips = [ip_for(i, prefix) for i in range(offset, min(offset + chunk, args.distinct))]
+        codes.update(statuses(args.path, ips, args.concurrency))
+    elapsed = time.perf_counter() - started
+    after = get(STATS_ROUTE) if SESSION_COOKIE else None
+
+    report: dict[str, Any] = {
+        "distinct_ips": args.distinct,
+        "requests_per_s": round(args.distinct / elapsed, 1) if elapsed else 0.0,
+        "statuses": dict(codes),
+        "limited": codes.get(429, 0),
+    }
+    if before is not None and after is not None and before.ok and after.ok:
+        start, end = before.json(), after.json()
+        report["limiter_before"] = start
+        report["limiter_after"] = end
+        report["heap_growth_mb"] = round((end["memory"]["heapUsed"] - start["memory"]["heapUsed"]) / 2**20, 1)
+    return report
+
+
+def main(args: argparse.Namespace) -> int:
+    # A fresh first octet per run so earlier runs' counters do not interfere
+    prefix = 11 + int(time.time()) % 200
+    data: dict[str, Any] = {"path": args.path, "limit": args.limit, "window_ms": args.window_ms}
+    failed = False
+
+    data["burst"] = burst(args, prefix)
+    print(f"burst: {data['burst']['ips_off_limit']}/{args.ips} IPs not held to exactly {args.limit}")
+    failed |= bool(data["burst"]["ips_off_limit"])
+
+    if not args.skip_boundary:
+        data["boundary"] = boundary(args, prefix + 1)
+        b = data["boundary"]
+        print(f"boundary: {b['before_edge']} before the edge, {b['after_edge']} right after "
+              f"(fixed window would allow {b['fixed_window_would_allow']})")
+        failed |= b["after_edge"] > max(1, args.limit // 10)
+
+    if args.distinct:
+        data["flood"] = flood(args, prefix + 2)
+        f = data["flood"]
+        print(f"flood: {args.distinct:,} IPs at {f['requests_per_s']} req/s, {f['limited']} wrongly limited")
+        if "limiter_after" in f:
+            stats = f["limiter_after"].get("stats") or {}
+            print(f"  limiter keys {stats.get('keys')} / max {stats.get('maxKeys')}, "
+                  f"evictions {stats.get('evictions')}, heap growth {f['heap_growth_mb']} MB")
+        else:
+            print("  set an admin HARNESS_COOKIE to read limiter memory from /api/admin/rate-limit")
+        failed |= bool(f["limited"])
+
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if failed else 0
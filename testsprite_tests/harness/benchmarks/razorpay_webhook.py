@@ -0,0 +1,222 @@
+"""Razorpay webhook replay: intake latency, deduplication and end-to-end lag.
+
+Builds a realistic event history for ``--subscriptions`` synthetic
+subscriptions (activated, charged, paused, resumed, ..., cancelled), signs
+every body with the local webhook secret exactly as Razorpay does, and fires
+them at ``/api/razorpay/webhook`` concurrently, slightly out of order and
+with ``--duplicates`` of them redelivered::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench razorpay-webhook --seed 500
+    RAZORPAY_WEBHOOK_SECRET=... HARNESS_DATABASE_URL=... python -m harness bench razorpay-webhook
+    HARNESS_DATABASE_URL=... python -m harness bench razorpay-webhook --cleanup
+
+Intake latency is what Razorpay waits for. End-to-end lag (received to
+applied) and the dedup/ordering checks are read from
+``razorpay_webhook_events`` and ``user_subscriptions``. With ``--drain`` the
+tool also calls ``/api/razorpay/webhook/process`` (``HARNESS_API_SECRET``)
+while it waits, for deployments that do not keep background work alive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import random
+import time
+import uuid
+from typing import Any
+
+from .. import results
+from ..db import DatabaseUnavailable, psql
+from ..httpclient import Response, hammer, post, request
+from ..stats import format_summary, summarize
+
+SUITE = "bench-razorpay-webhook"
+WEBHOOK = "/api/razorpay/webhook"
+EVENT_PREFIX = "evt_harness_"
+SUBSCRIPTION_PREFIX = "sub_harness_"
+EMAIL_DOMAIN = "@harness-billing.invalid"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--subscriptions", type=int, default=200, help="synthetic subscriptions per run")
+    parser.add_argument("--events", type=int, default=10, help="events per subscription")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="share of events delivered twice")
+    parser.add_argument("--reorder", type=int, default=8, help="shuffle deliveries within windows of this size")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--secret", default=os.environ.get("RAZORPAY_WEBHOOK_SECRET", ""),
+                        help="webhook secret the app verifies with (default: $RAZORPAY_WEBHOOK_SECRET)")
+    parser.add_argument("--drain", action="store_true", help="also call the queue's process route while waiting")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds to wait for the queue to drain")
+    parser.add_argument("--seed", type=int, help="create this many subscriptions to apply events to, and exit")
+    parser.add_argument("--cleanup", action="store_true", help="delete replayed events and seeded subscriptions")
+
+
+def seed(count: int) -> None:
+    psql(f"""
+SET session_replication_role = replica;
+INSERT INTO public.users (id, email, full_name, role)
+SELECT gen_random_uuid(), 'harness-sub-' || i || '{EMAIL_DOMAIN}', 'Harness subscriber', 'user'
+FROM generate_series(1, {count}) AS i
+ON CONFLICT DO NOTHING;
+INSERT INTO public.user_subscriptions (user_id, plan_id, status, razorpay_subscription_id)
+SELECT u.id, (SELECT id FROM public.subscription_plans ORDER BY created_at LIMIT 1), 'active',
+       '{SUBSCRIPTION_PREFIX}' || split_part(split_part(u.email, '@', 1), '-', 3)
+FROM public.users u
+WHERE u.email LIKE '%{EMAIL_DOMAIN}'
+ON CONFLICT (user_id) DO NOTHING;
+SET session_replication_role = origin;
+""")
+
+
+def cleanup() -> None:
+    psql(f"""
+DELETE FROM public.razorpay_webhook_events WHERE event_id LIKE '{EVENT_PREFIX}%';
+DELETE FROM public.users WHERE email LIKE '%{EMAIL_DOMAIN}';
+""")
+
+
+def history(subscription: str, count: int, start: int) -> list[tuple[str, dict[str, Any]]]:
+    """Event types and entities for one subscription, one second apart, ending cancelled."""
+    middle = ["subscription.charged", "subscription.paused", "subscription.resumed", "payment.failed"]
+    kinds = ["subscription.activated"] + [middle[i % len(middle)] for i in range(max(0, count - 2))]
+    kinds.append("subscription.cancelled")
+    events = []
+    for offset, kind in enumerate(kinds if count > 1 else kinds[-1:]):
+        at = start + offset
+        entity = {"id": subscription, "status": kind.split(".")[1], "start_at": start, "end_at": start + 365 * 86400,
+                  "current_start": at, "current_end": at + 30 * 86400}
+        payload: dict[str, Any] = {"subscription": {"entity": entity}}
+        if kind in ("subscription.charged", "payment.failed"):
+            payload["payment"] = {"entity": {"id": f"pay_{uuid.uuid4().hex[:14]}", "subscription_id": subscription,
+                                             "amount": 99900, "currency": "INR"}}
+        events.append((kind, {"entity": "event", "event": kind, "contains": list(payload), "payload": payload,
+                              "created_at": at}))
+    return events
+
+
+def deliveries(args: argparse.Namespace, run_id: str) -> list[tuple[str, bytes]]:
+    """(event id, body) in delivery order, duplicates included."""
+    start = int(time.time()) - args.events
+    events = []
+    for index in range(args.subscriptions):
+        subscription = f"{SUBSCRIPTION_PREFIX}{index + 1}"
+        for number, (_, event) in enumerate(history(subscription, args.events, start)):
+            events.append((f"{EVENT_PREFIX}{run_id}_{index + 1}_{number}", json.dumps(event).encode()))
+
+    rng = random.Random(run_id)
+    # Subscriptions interleave, as they would in real traffic
+    rng.shuffle(events)
+    events.sort(key=lambda item: json.loads(item[1])["created_at"])
+    events += rng.sample(events, int(len(events) * args.duplicates))
+    for window in range(0, len(events), max(1, args.reorder)):
+        chunk = events[window:window + args.reorder]
+        rng.shuffle(chunk)
+        events[window:window + args.reorder] = chunk
+    return events
+
+
+def sign(body: bytes, secret: str) -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def wait_for_queue(run_id: str, expected: int, args: argparse.Namespace) -> dict[str, int]:
+    api_secret = os.environ.get("HARNESS_API_SECRET", "")
+    deadline = time.perf_counter() + args.timeout
+    while True:
+        if args.drain:
+            post("/api/razorpay/webhook/process", headers={"Authorization": f"Bearer {api_secret}"})
+        rows = psql(f"""
+SELECT count(*), count(*) FILTER (WHERE status = 'done'), count(*) FILTER (WHERE status = 'failed')
+FROM public.razorpay_webhook_events WHERE event_id LIKE '{EVENT_PREFIX}{run_id}%';
+""")
+        stored, done, failed = (int(value) for value in rows[0])
+        if (stored >= expected and done + failed >= stored) or time.perf_counter() > deadline:
+            return {"stored": stored, "done": done, "failed": failed}
+        time.sleep(0.5)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    run_id = uuid.uuid4().hex[:8]
+    plan = deliveries(args, run_id)
+    unique = len({event_id for event_id, _ in plan})
+
+    def deliver(index: int) -> Response:
+        event_id, body = plan[index]
+        return request("POST", WEBHOOK, body, cookie="", headers={
+            "X-Razorpay-Signature": sign(body, args.secret),
+            "X-Razorpay-Event-Id": event_id,
+        })
+
+    responses, wall = hammer(deliver, len(plan), args.concurrency)
+    fired_at = time.perf_counter()
+    accepted = [response for response in responses if response.ok]
+    flagged = sum(1 for response in accepted if response.json().get("duplicate"))
+
+    queue = wait_for_queue(run_id, unique, args)
+    drained_s = time.perf_counter() - fired_at
+    lag = [float(row[0]) for row in psql(f"""
+SELECT EXTRACT(EPOCH FROM processed_at - received_at) * 1000
+FROM public.razorpay_webhook_events
+WHERE event_id LIKE '{EVENT_PREFIX}{run_id}%' AND processed_at IS NOT NULL;
+""")]
+    final = psql(f"""
+SELECT count(*), count(*) FILTER (WHERE status = 'cancelled')
+FROM public.user_subscriptions
+WHERE razorpay_subscription_id LIKE '{SUBSCRIPTION_PREFIX}%'
+  AND split_part(razorpay_subscription_id, '_', 3)::INTEGER <= {args.subscriptions};
+""")[0]
+
+    return {
+        "run_id": run_id,
+        "deliveries": len(plan),
+        "unique_events": unique,
+        "intake": {
+            "latency_ms": summarize(response.elapsed_ms for response in accepted),
+            "errors": len(responses) - len(accepted),
+            "statuses": sorted({response.status for response in responses}),
+            "per_s": round(len(plan) / wall, 1),
+            "flagged_duplicate": flagged,
+        },
+        "queue": queue,
+        "stored_duplicates": queue["stored"] - unique,
+        "lag_ms": summarize(lag),
+        "drained_after_s": round(drained_s, 2),
+        "subscriptions": {"seeded": int(final[0]), "final_cancelled": int(final[1])},
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    try:
+        if args.seed:
+            seed(args.seed)
+            print(f"Seeded {args.seed} subscriptions ({SUBSCRIPTION_PREFIX}1..{args.seed})")
+            return 0
+        if args.cleanup:
+            cleanup()
+            print("Removed replayed events and seeded subscriptions")
+            return 0
+        if not args.secret:
+            print("razorpay-webhook: set RAZORPAY_WEBHOOK_SECRET (or --secret) to the app's webhook secret")
+            return 2
+        data = run(args)
+    except DatabaseUnavailable as exc:
+        print(f"razorpay-webhook: {exc}")
+        return 2
+
+    intake, queue = data["intake"], data["queue"]
+    print(f"{data['deliveries']} deliveries of {data['unique_events']} events at {intake['per_s']}/s, "
+          f"{intake['errors']} errors")
+    print(format_summary("intake", intake["latency_ms"]))
+    print(f"duplicates: {intake['flagged_duplicate']} acknowledged as such, {data['stored_duplicates']} stored")
+    print(f"queue: {queue['done']} applied, {queue['failed']} failed, drained {data['drained_after_s']} s after the last delivery")
+    print(format_summary("received -> applied", data["lag_ms"]))
+    subscriptions = data["subscriptions"]
+    if subscriptions["seeded"]:
+        print(f"final status cancelled: {subscriptions['final_cancelled']}/{subscriptions['seeded']} subscriptions")
+    print(f"Saved {results.save(SUITE, data)}")
+    ordered = subscriptions["final_cancelled"] == subscriptions["seeded"]
+    return 0 if not intake["errors"] and not data["stored_duplicates"] and ordered else 1
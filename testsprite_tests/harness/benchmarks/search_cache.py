@@ -0,0 +1,88 @@
+"""Throughput of the ``/api/search/*`` reference endpoints.
+
+Each endpoint is hammered with ``--concurrency`` clients twice: plain GETs,
+and conditional GETs carrying the ETag from the first response (which the
+cache answers with 304). To compare with the uncached behaviour, record a run
+against the app started with ``SEARCH_CACHE_TTL_MS=0`` under its own build id,
+then one with the cache on::
+
+    SEARCH_CACHE_TTL_MS=0 npm run dev
+    HARNESS_BUILD_ID=search-uncached python -m harness bench search-cache
+    npm run dev
+    python -m harness bench search-cache --baseline search-uncached
+
+No session is needed; the endpoints are public.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any
+
+from .. import results
+from ..httpclient import get, hammer
+from ..stats import format_summary, summarize
+
+SUITE = "bench-search-cache"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint and mode")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--city", help="city id for the locations endpoint (default: first city)")
+    parser.add_argument("--baseline", help="build id of a run to compare against (default: previous build)")
+
+
+def _measure(path: str, total: int, concurrency: int, etag: str | None) -> dict[str, Any]:
+    headers = {"If-None-Match": etag} if etag else None
+    responses, wall_s = hammer(lambda _: get(path, headers=headers, cookie=""), total, concurrency)
+    ok = [r for r in responses if r.status in (200, 304)]
+    return {
+        "requests_per_s": round(len(ok) / wall_s, 1) if wall_s else 0.0,
+        "latency_ms": summarize([r.elapsed_ms for r in ok]),
+        "not_modified": sum(r.status == 304 for r in responses),
+        "errors": len(responses) - len(ok),
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    first = get("/api/search/cities", cookie="")
+    if not first.ok:
+        raise RuntimeError(f"/api/search/cities -> {first.status}")
+    city = args.city or next(iter(first.json().get("cities", [])), {}).get("id")
+
+    paths = ["/api/search/cities", "/api/search/configurations"]
+    if city:
+        paths.append(f"/api/search/locations/{city}")
+
+    endpoints = {}
+    for path in paths:
+        probe = get(path, cookie="")
+        etag = probe.headers.get("etag")
+        endpoints[path] = {
+            "etag": etag,
+            "cache_control": probe.headers.get("cache-control"),
+            "plain": _measure(path, args.requests, args.concurrency, None),
+            "conditional": _measure(path, args.requests, args.concurrency, etag) if etag else None,
+        }
+    return {"requests": args.requests, "concurrency": args.concurrency, "endpoints": endpoints}
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    baseline = results.load(SUITE, args.baseline) if args.baseline else results.previous(SUITE)
+    errors = 0
+    for path, report in data["endpoints"].items():
+        print(f"{path}  (ETag {report['etag'] or 'none'})")
+        for mode in ("plain", "conditional"):
+            measured = report[mode]
+            if not measured:
+                continue
+            errors += measured["errors"]
+            line = f"  {mode:<11} {measured['requests_per_s']:>8} req/s  " + format_summary("", measured["latency_ms"])
+            before = ((baseline or {}).get("endpoints", {}).get(path) or {}).get("plain")
+            if mode == "plain" and before and before["requests_per_s"]:
+                line += f"  ({measured['requests_per_s'] / before['requests_per_s']:.1f}x vs {baseline['build']})"
+            print(line)
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if errors else 0
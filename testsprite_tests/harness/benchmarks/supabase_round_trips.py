@@ -0,0 +1,117 @@
+"""Supabase Auth and REST round trips per API request.
+
+API routes used to build a cookie client in each helper, often a service-role
+client too, and call ``auth.getUser()`` (one Auth round trip) before reading
+the user's role, sometimes several times per request. They now share one
+request-scoped context (``lib/supabase/request-context.ts``) that resolves
+the user once, from the locally verified session JWT on reads (admin checks
+still make one Auth call). This
+benchmark runs a counting proxy (``stubs/supabase_proxy.py``) in front of the
+real project and records, for each route, the Supabase calls made while
+serving each of ``--requests`` sequential requests::
+
+    NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54330 \\
+        SUPABASE_JWT_ISSUER=https://<ref>.supabase.co/auth/v1 npm run dev
+    HARNESS_SUPABASE_URL=https://<ref>.supabase.co HARNESS_COOKIE='<admin session>' \\
+        python -m harness bench supabase-round-trips
+
+Run it once on the build before the change with ``HARNESS_BUILD_ID=before``
+and compare with ``--baseline before``. The session cookie is renamed to the
+key supabase-js derives from the proxy's URL (``sb-127-auth-token``), so
+``HARNESS_COOKIE`` can be copied from the real site.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import time
+from typing import Any
+
+from .. import results
+from ..httpclient import SESSION_COOKIE, get
+from ..stats import summarize
+from ..stubs import serve
+from ..stubs.supabase_proxy import SupabaseProxy, SupabaseProxyHandler
+
+SUITE = "bench-supabase-round-trips"
+SERVICES = ("auth", "rest", "storage")
+# Read-only routes that check the session; admin routes also read the role
+ROUTES = [
+    "/api/subscriptions",
+    "/api/leads?limit=10",
+    "/api/admin/developers",
+    "/api/admin/analytics",
+    "/api/admin/leads?limit=10",
+    "/api/admin/media/stats",
+    "/api/admin/rate-limit",
+]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--route", action="append", dest="routes", help="GET route to measure (repeatable)")
+    parser.add_argument("--requests", type=int, default=10, help="sequential requests per route")
+    parser.add_argument("--upstream", default=os.environ.get("HARNESS_SUPABASE_URL", ""),
+                        help="real Supabase URL (default: HARNESS_SUPABASE_URL)")
+    parser.add_argument("--proxy-port", type=int, default=54330)
+    parser.add_argument("--settle-ms", type=float, default=50,
+                        help="wait after each response for calls still in flight")
+    parser.add_argument("--baseline", help="build id of a run to compare against (default: previous build)")
+
+
+def proxy_cookie(cookie: str) -> str:
+    """``HARNESS_COOKIE`` with the session cookie renamed for a client on 127.0.0.1."""
+    return re.sub(r"\bsb-[^=;\s]+?-auth-token", "sb-127-auth-token", cookie)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    if not args.upstream:
+        raise SystemExit("Set HARNESS_SUPABASE_URL (or --upstream) to the real Supabase URL")
+
+    proxy = SupabaseProxy(args.upstream)
+    cookie = proxy_cookie(SESSION_COOKIE)
+    report: dict[str, Any] = {}
+    with serve(SupabaseProxyHandler, proxy, port=args.proxy_port):
+        for route in args.routes or ROUTES:
+            # One unmeasured request warms the route and the app's JWKS cache
+            get(route, cookie=cookie)
+            time.sleep(args.settle_ms / 1000)
+
+            counts: dict[str, list[int]] = {name: [] for name in SERVICES}
+            statuses: dict[str, int] = {}
+            for _ in range(args.requests):
+                before = proxy.snapshot()
+                response = get(route, cookie=cookie)
+                time.sleep(args.settle_ms / 1000)
+                made = proxy.snapshot() - before
+                for name in SERVICES:
+                    counts[name].append(made[name])
+                statuses[str(response.status)] = statuses.get(str(response.status), 0) + 1
+
+            report[route] = {
+                "statuses": statuses,
+                **{name: summarize(values) for name, values in counts.items()},
+            }
+    return {"requests": args.requests, "routes": report, "paths": dict(proxy.paths.most_common(20))}
+
+
+def main(args: argparse.Namespace) -> int:
+    data = run(args)
+    baseline = results.load(SUITE, args.baseline) if args.baseline else results.previous(SUITE)
+    errors = 0
+    for route, report in data["routes"].items():
+        statuses = ", ".join(f"{status}={count}" for status, count in sorted(report["statuses"].items()))
+        calls = "  ".join(f"{name}={report[name].get('mean', 0)}" for name in SERVICES)
+        print(f"{route} ({statuses}): per request {calls}")
+        before = ((baseline or {}).get("routes", {}).get(route)) or {}
+        if before:
+            change = "  ".join(
+                f"{name} {before.get(name, {}).get('mean', 0)} -> {report[name].get('mean', 0)}" for name in SERVICES
+            )
+            print(f"  vs {baseline['build']}: {change}")
+        errors += sum(count for status, count in report["statuses"].items() if not status.startswith("2"))
+    if errors:
+        print(f"{errors} requests failed (is HARNESS_COOKIE an admin session?)")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if errors else 0
@@ -0,0 +1,117 @@
+"""Usage-limit lookup cost as ``subscription_usage_logs`` grows.
+
+Compares the old per-request ``count(*)`` over the log with the counter row
+read from ``subscription_usage_counters`` (migration ``023_usage_counters.sql``)::
+
+    HARNESS_DATABASE_URL=postgresql://... python -m harness bench usage-counters \\
+        --sizes 10000,100000,1000000,3000000
+
+Rows are inserted for one user (``--user``, default: the first user with a
+subscription) spread over the last three years, growing the log to each size
+in turn. Both lookups run ``--repeats`` times per size and their answers are
+checked against each other. Everything happens in one transaction that is
+rolled back at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from typing import Any
+
+from .. import results
+from ..db import TIMING_FUNCTION, DatabaseUnavailable, literal, psql
+from ..stats import format_summary, summarize
+
+SUITE = "bench-usage-counters"
+
+COUNT_QUERY = (
+    "SELECT count(*) FROM public.subscription_usage_logs WHERE user_id = {user} "
+    "AND usage_type = 'ai_analysis' AND created_at >= date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+)
+COUNTER_QUERY = (
+    "SELECT COALESCE((SELECT count FROM public.subscription_usage_counters WHERE user_id = {user} "
+    "AND usage_type = 'ai_analysis' AND period_start = public.usage_period_start(now())), 0)"
+)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma-separated log sizes to measure at")
+    parser.add_argument("--repeats", type=int, default=20, help="lookups per method and size")
+    parser.add_argument("--user", help="user id to attribute seeded usage to")
+
+
+def script(sizes: list[int], repeats: int, user: str | None) -> str:
+    pick = (
+        f"SELECT id, user_id FROM public.user_subscriptions WHERE user_id = {literal(user)} LIMIT 1"
+        if user else "SELECT id, user_id FROM public.user_subscriptions ORDER BY created_at LIMIT 1"
+    )
+    parts = [
+        "BEGIN;",
+        TIMING_FUNCTION,
+        f"CREATE TEMP TABLE harness_target ON COMMIT DROP AS {pick};",
+        "CREATE TEMP TABLE harness_timings (size BIGINT, method TEXT, ms DOUBLE PRECISION, result TEXT) ON COMMIT DROP;",
+    ]
+    user_expr = "(SELECT user_id FROM harness_target)"
+    previous = 0
+    for size in sizes:
+        parts.append(f"""
+INSERT INTO public.subscription_usage_logs (user_id, subscription_id, usage_type, metadata, created_at)
+SELECT t.user_id, t.id, 'ai_analysis', '{{"harness": true}}'::JSONB, now() - random() * INTERVAL '1095 days'
+FROM harness_target t, generate_series(1, {size - previous});
+ANALYZE public.subscription_usage_logs;
+INSERT INTO harness_timings
+SELECT {size}, 'count', ms, result FROM pg_temp.harness_time({literal(COUNT_QUERY.format(user=user_expr))}, {repeats});
+INSERT INTO harness_timings
+SELECT {size}, 'counter', ms, result FROM pg_temp.harness_time({literal(COUNTER_QUERY.format(user=user_expr))}, {repeats});
+""")
+        previous = size
+    parts += [
+        "SELECT (SELECT count(*) FROM harness_target), '', 0, '';",
+        "SELECT size, method, ms, result FROM harness_timings ORDER BY size, method;",
+        "ROLLBACK;",
+    ]
+    return "\n".join(parts)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    rows = psql(script(sizes, args.repeats, args.user))
+    if not rows or rows[0][0] == "0":
+        raise DatabaseUnavailable("no user_subscriptions row to attribute usage to (pass --user)")
+
+    timings: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+    answers: dict[int, dict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
+    for size, method, ms, result in rows[1:]:
+        timings[int(size)][method].append(float(ms))
+        answers[int(size)][method].add(result)
+
+    return {
+        "sizes": sizes,
+        "repeats": args.repeats,
+        "by_size": {
+            size: {
+                method: summarize(values) for method, values in methods.items()
+            } | {"answers_match": answers[size]["count"] == answers[size]["counter"]}
+            for size, methods in timings.items()
+        },
+    }
+
+
+def main(args: argparse.Namespace) -> int:
+    try:
+        data = run(args)
+    except DatabaseUnavailable as exc:
+        print(f"usage-counters: {exc}")
+        return 2
+    mismatched = []
+    for size, report in data["by_size"].items():
+        print(f"log rows {size:,}")
+        print("  " + format_summary("count(*) over log", report["count"]))
+        print("  " + format_summary("counter row", report["counter"]))
+        if not report["answers_match"]:
+            mismatched.append(size)
+    if mismatched:
+        print(f"counter disagrees with the log at sizes {mismatched}")
+    print(f"Saved {results.save(SUITE, data)}")
+    return 1 if mismatched else 0
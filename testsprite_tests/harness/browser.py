@@ -0,0 +1,14 @@
+"""Browser launch helpers shared by the harness commands."""
+
+from __future__ import annotations
+
+from playwright import async_api
+
+from .config import HEADLESS, LAUNCH_ARGS
+
+
+async def launch(pw: async_api.Playwright, **kwargs) -> async_api.Browser:
+    """Launch Chromium the same way the generated TC scripts do."""
+    options = {"headless": HEADLESS, "args": list(LAUNCH_ARGS)}
+    options.update(kwargs)
+    return await pw.chromium.launch(**options)
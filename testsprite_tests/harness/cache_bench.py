@@ -0,0 +1,237 @@
+"""Cold-versus-warm cache navigation benchmark.
+
+Each key route is loaded twice: first in a brand-new browser context (empty
+HTTP cache, no cookies) and then again in that same context. Network activity
+is recorded through the Chrome DevTools Protocol, because Playwright's own
+``Response`` object does not say whether a response came from the memory or
+disk cache.
+
+Every request ends up in exactly one cache bucket:
+
+``network``
+    fetched from the server with a full body
+``revalidated``
+    conditional request answered with ``304 Not Modified``
+``memory`` / ``disk``
+    served by Chromium's memory or disk cache without touching the server
+``service_worker``
+    answered by a service worker
+
+and in one resource class (``document``, ``static`` for ``/_next/static``
+chunks, ``api``, ``image``, ``other``) so the report shows *what* is or is not
+cacheable, e.g. whether ``/api/search/cities`` or ``next/image`` responses are
+ever reused on a repeat visit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+from . import results
+from .browser import launch
+from .config import KEY_ROUTES, url
+
+SUITE = "cache-bench"
+
+CACHE_BUCKETS = ("network", "revalidated", "memory", "disk", "service_worker")
+
+
+@dataclass
+class _Entry:
+    url: str
+    resource_type: str = "Other"
+    status: int = 0
+    bucket: str = "network"
+    transferred: int = 0
+
+
+@dataclass
+class NetworkRecorder:
+    """Collects CDP ``Network.*`` events for a single page."""
+
+    entries: dict[str, _Entry] = field(default_factory=dict)
+    memory_hits: set[str] = field(default_factory=set)
+
+    async def attach(self, context: async_api.BrowserContext, page: async_api.Page) -> None:
+        cdp = await context.new_cdp_session(page)
+        cdp.on("Network.requestWillBeSent", self._on_request)
+        cdp.on("Network.requestServedFromCache", self._on_served_from_cache)
+        cdp.on("Network.responseReceived", self._on_response)
+        cdp.on("Network.loadingFinished", self._on_finished)
+        await cdp.send("Network.enable")
+
+    def reset(self) -> None:
+        self.entries.clear()
+        self.memory_hits.clear()
+
+    def _on_request(self, event: dict[str, Any]) -> None:
+        request_id = event["requestId"]
+        # Redirects reuse the request id; keep the final hop only
+        self.entries[request_id] = _Entry(
+            url=event["request"]["url"],
+            resource_type=event.get("type", "Other"),
+        )
+
+    def _on_served_from_cache(self, event: dict[str, Any]) -> None:
+        self.memory_hits.add(event["requestId"])
+
+    def _on_response(self, event: dict[str, Any]) -> None:
+        entry = self.entries.get(event["requestId"])
+        if entry is None:
+            return
+        response = event["response"]
+        entry.status = response.get("status", 0)
+        entry.resource_type = event.get("type", entry.resource_type)
+        if event["requestId"] in self.memory_hits:
+            entry.bucket = "memory"
+        elif response.get("fromServiceWorker"):
+            entry.bucket = "service_worker"
+        elif response.get("fromDiskCache") or response.get("fromPrefetchCache"):
+            entry.bucket = "disk"
+        elif entry.status == 304:
+            entry.bucket = "revalidated"
+        else:
+            entry.bucket = "network"
+
+    def _on_finished(self, event: dict[str, Any]) -> None:
+        entry = self.entries.get(event["requestId"])
+        if entry is not None:
+            entry.transferred = int(event.get("encodedDataLength", 0))
+
+    def summary(self) -> dict[str, Any]:
+        by_bucket: dict[str, int] = {bucket: 0 for bucket in CACHE_BUCKETS}
+        by_class: dict[str, dict[str, Any]] = defaultdict(
+            lambda: {"requests": 0, "transferred": 0, **{b: 0 for b in CACHE_BUCKETS}}
+        )
+        transferred = 0
+        for request_id, entry in self.entries.items():
+            # requestServedFromCache may arrive after responseReceived
+            if request_id in self.memory_hits:
+                entry.bucket = "memory"
+            resource_class = classify(entry.url, entry.resource_type)
+            by_bucket[entry.bucket] += 1
+            transferred += entry.transferred
+            bucket_stats = by_class[resource_class]
+            bucket_stats["requests"] += 1
+            bucket_stats["transferred"] += entry.transferred
+            bucket_stats[entry.bucket] += 1
+
+        total = len(self.entries)
+        cached = by_bucket["memory"] + by_bucket["disk"] + by_bucket["service_worker"]
+        return {
+            "requests": total,
+            "transferred": transferred,
+            "cache": by_bucket,
+            "hit_ratio": round(cached / total, 3) if total else 0.0,
+            "by_class": dict(by_class),
+        }
+
+
+def classify(request_url: str, resource_type: str) -> str:
+    path = urlparse(request_url).path
+    if resource_type == "Document":
+        return "document"
+    if path.startswith("/_next/static/"):
+        return "static"
+    if path.startswith("/api/"):
+        return "api"
+    if resource_type == "Image" or path.startswith("/_next/image"):
+        return "image"
+    return "other"
+
+
+async def _visit(page: async_api.Page, recorder: NetworkRecorder, route: str, settle_ms: int) -> dict[str, Any]:
+    recorder.reset()
+    await page.goto(url(route), wait_until="load", timeout=30000)
+    try:
+        await page.wait_for_load_state("networkidle", timeout=settle_ms)
+    except async_api.Error:
+        pass
+    return recorder.summary()
+
+
+async def bench_route(browser: async_api.Browser, route: str, settle_ms: int = 5000) -> dict[str, Any]:
+    """Load ``route`` cold, then warm, in one fresh context."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        recorder = NetworkRecorder()
+        await recorder.attach(context, page)
+        cold = await _visit(page, recorder, route, settle_ms)
+        warm = await _visit(page, recorder, route, settle_ms)
+    finally:
+        await context.close()
+
+    saved = cold["transferred"] - warm["transferred"]
+    return {
+        "cold": cold,
+        "warm": warm,
+        "bytes_saved": saved,
+        "bytes_saved_ratio": round(saved / cold["transferred"], 3) if cold["transferred"] else 0.0,
+    }
+
+
+async def run(routes: list[str] | None = None, settle_ms: int = 5000) -> dict[str, Any]:
+    routes = routes or KEY_ROUTES
+    async with async_api.async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            report = {}
+            for route in routes:
+                report[route] = await bench_route(browser, route, settle_ms)
+        finally:
+            await browser.close()
+    return {"routes": report}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any] | None) -> list[str]:
+    """List routes whose warm-visit cache hit ratio or bytes saved dropped."""
+    if not baseline:
+        return []
+    regressions = []
+    for route, stats in current["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if not before:
+            continue
+        hit_now, hit_before = stats["warm"]["hit_ratio"], before["warm"]["hit_ratio"]
+        if hit_now + 0.05 < hit_before:
+            regressions.append(
+                f"{route}: warm hit ratio {hit_before:.0%} -> {hit_now:.0%} (vs build {baseline['build']})"
+            )
+        if stats["warm"]["transferred"] > before["warm"]["transferred"] * 1.2 + 10_000:
+            regressions.append(
+                f"{route}: warm transfer {before['warm']['transferred']} -> "
+                f"{stats['warm']['transferred']} bytes (vs build {baseline['build']})"
+            )
+    return regressions
+
+
+def format_report(data: dict[str, Any]) -> str:
+    lines = [f"{'route':<16} {'visit':<5} {'reqs':>5} {'bytes':>10} " + " ".join(f"{b:>8}" for b in CACHE_BUCKETS)]
+    for route, stats in data["routes"].items():
+        for visit in ("cold", "warm"):
+            s = stats[visit]
+            lines.append(
+                f"{route:<16} {visit:<5} {s['requests']:>5} {s['transferred']:>10} "
+                + " ".join(f"{s['cache'][b]:>8}" for b in CACHE_BUCKETS)
+            )
+        lines.append(f"{'':<16} saved {stats['bytes_saved']} bytes ({stats['bytes_saved_ratio']:.0%})")
+    return "\n".join(lines)
+
+
+def main(routes: list[str] | None = None, settle_ms: int = 5000) -> int:
+    data = asyncio.run(run(routes, settle_ms))
+    baseline = results.previous(SUITE)
+    path = results.save(SUITE, data)
+    print(format_report(data))
+    print(f"\nSaved {path}")
+    regressions = compare(data, baseline)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
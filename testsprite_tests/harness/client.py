@@ -0,0 +1,59 @@
+"""Thin client for the warm runner daemon.
+
+Deliberately limited to the standard library so submitting a job does not pay
+for importing Playwright.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import sys
+from typing import Any, Iterator
+
+from .config import SOCKET_PATH
+
+
+def stream(request: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(SOCKET_PATH))
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise SystemExit(f"No harness daemon on {SOCKET_PATH}; start one with `python -m harness daemon`")
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("r", encoding="utf-8") as lines:
+            for line in lines:
+                yield json.loads(line)
+
+
+def _print(event: dict[str, Any]) -> None:
+    kind = event["event"]
+    if kind == "start":
+        print(f"{event['tc']} [{event['options'].get('profile', 'desktop')}] ...", flush=True)
+    elif kind == "step":
+        print(f"  {event['action_ms']:>8.0f} ms  {event['label'][:90]}", flush=True)
+    elif kind == "result":
+        print(f"{event['tc']}: {event['status']} in {event['duration_ms'] / 1000:.1f}s", flush=True)
+        if event.get("error"):
+            print(f"  {event['error'].splitlines()[0]}", flush=True)
+    elif kind == "done":
+        if event.get("error"):
+            print(f"daemon error: {event['error']}", file=sys.stderr)
+        elif "elapsed_ms" in event:
+            print(f"done in {event['elapsed_ms'] / 1000:.1f}s, saved {event['saved']}")
+
+
+def submit(tests: list[str], profiles: list[str], options: dict[str, Any] | None = None) -> int:
+    ok = False
+    for event in stream({"tests": tests, "profiles": profiles, "options": options or {}}):
+        _print(event)
+        if event["event"] == "done":
+            ok = event.get("ok", False)
+    return 0 if ok else 1
+
+
+def shutdown() -> int:
+    for event in stream({"shutdown": True}):
+        if event["event"] == "done":
+            return 0
+    return 1
@@ -0,0 +1,54 @@
+"""Virtual clock mode: deterministic, faster flows.
+
+The generated scripts sleep ``wait_for_timeout(3000)`` before almost every
+action so Framer Motion entrances and the testimonials marquee have settled.
+In clock mode the harness
+
+* emulates ``prefers-reduced-motion: reduce``, which the app honours through
+  ``MotionProvider`` and the reduced-motion rules in ``globals.css``,
+* installs Playwright's controllable clock in every context, and
+* turns each ``wait_for_timeout`` into ``clock.run_for``: page timers,
+  ``requestAnimationFrame`` and ``Date`` jump ahead by the requested amount
+  instantly, then the harness only waits (briefly) for in-flight requests.
+
+Playwright's own actionability checks (visible, stable, enabled) still run
+before every click, so a flow that passes in clock mode is not relying on
+luck; it just stops paying for animations in real time.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from playwright import async_api
+
+from .session import Plugin
+
+
+class ClockPlugin(Plugin):
+    name = "clock"
+
+    def __init__(self, settle_ms: int = 500) -> None:
+        # Upper bound for waiting on network after a fast-forward
+        self.settle_ms = settle_ms
+        self.fast_forwarded_ms = 0.0
+        self.waits = 0
+
+    def context_options(self) -> dict[str, Any]:
+        return {"reduced_motion": "reduce"}
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        await context.clock.install()
+
+    async def wait(self, page: async_api.Page, timeout_ms: float) -> bool:
+        self.waits += 1
+        self.fast_forwarded_ms += timeout_ms
+        await page.clock.run_for(int(timeout_ms))
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.settle_ms)
+        except async_api.Error:
+            pass
+        return True
+
+    def report(self) -> dict[str, Any]:
+        return {"waits": self.waits, "fast_forwarded_ms": round(self.fast_forwarded_ms)}
@@ -0,0 +1,81 @@
+"""Shared settings for the harness.
+
+Everything can be overridden through environment variables so the same
+commands work against a local dev server, ``next start`` or a preview deploy.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = TESTS_DIR.parent
+
+# Same endpoint TestSprite records in tmp/config.json
+BASE_URL = os.environ.get("HARNESS_BASE_URL", "http://localhost:3000").rstrip("/")
+
+RESULTS_DIR = Path(os.environ.get("HARNESS_RESULTS_DIR", TESTS_DIR / "results"))
+
+# Launch arguments used by every generated TC script
+LAUNCH_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+    "--single-process",
+]
+
+# Unix socket the warm runner daemon listens on
+SOCKET_PATH = Path(
+    os.environ.get("HARNESS_SOCKET", Path(tempfile.gettempdir()) / f"co-ventures-harness-{os.getuid()}.sock")
+)
+
+HEADLESS = os.environ.get("HARNESS_HEADLESS", "1") != "0"
+
+# Public routes a first-time visitor is most likely to land on
+KEY_ROUTES = [
+    "/",
+    "/properties",
+    "/about",
+    "/services",
+    "/how-it-works",
+    "/blog",
+    "/faqs",
+    "/contact",
+]
+
+
+def url(path: str) -> str:
+    """Resolve an app path against ``BASE_URL``."""
+    if path.startswith("http://") or path.startswith("https://"):
+        return path
+    return f"{BASE_URL}/{path.lstrip('/')}"
+
+
+def build_id() -> str:
+    """Identify the build under test.
+
+    Order of preference: ``HARNESS_BUILD_ID``, the Next.js ``.next/BUILD_ID``
+    written by ``next build``, then the current git commit.
+    """
+    explicit = os.environ.get("HARNESS_BUILD_ID")
+    if explicit:
+        return explicit
+
+    next_build = REPO_ROOT / ".next" / "BUILD_ID"
+    if next_build.is_file():
+        return next_build.read_text().strip()
+
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return f"git-{sha}"
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
@@ -0,0 +1,124 @@
+"""Long-lived runner that keeps the Playwright driver and Chromium warm.
+
+Start it once::
+
+    python -m harness daemon
+
+and submit work with the thin client (``python -m harness submit``), which
+only imports the standard library. Scripts are re-read from disk for every
+job, so editing a TC file and resubmitting costs one flow run, not an
+interpreter, driver and browser start.
+
+Protocol: newline-delimited JSON over a Unix socket. A request is one line::
+
+    {"tests": ["TC002"], "profiles": ["slow-4g-4x-cpu"], "options": {}}
+    {"shutdown": true}
+
+The daemon answers with a stream of events, one JSON object per line, ending
+with ``{"event": "done", ...}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import asdict
+from typing import Any
+
+from playwright import async_api
+
+from . import profiles, runner, tc
+from .browser import launch
+from .config import SOCKET_PATH
+
+
+class Daemon:
+    def __init__(self) -> None:
+        self.playwright: async_api.Playwright | None = None
+        self.browser: async_api.Browser | None = None
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+
+    async def _browser(self) -> async_api.Browser:
+        if self.browser is None or not self.browser.is_connected():
+            self.browser = await launch(self.playwright)
+        return self.browser
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        def send(event: dict[str, Any]) -> None:
+            writer.write(json.dumps(event).encode() + b"\n")
+
+        try:
+            request = json.loads(await reader.readline() or b"{}")
+            if request.get("shutdown"):
+                send({"event": "done", "ok": True, "shutdown": True})
+                self._stopped.set()
+                return
+            async with self._lock:
+                await self._run_job(request, send, writer)
+        except Exception as exc:
+            send({"event": "done", "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+        finally:
+            try:
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _run_job(self, request: dict[str, Any], send, writer: asyncio.StreamWriter) -> None:
+        names = request.get("tests") or tc.default_names()
+        extra = request.get("options") or {}
+        option_sets = [
+            runner.RunOptions(profile=name, **extra) for name in profiles.expand(request.get("profiles"))
+        ]
+        browser = await self._browser()
+        started = time.perf_counter()
+        run_results = []
+        for name in names:
+            script = tc.load(name)
+            for options in option_sets:
+                send({"event": "start", "tc": script.tc_id, "options": asdict(options)})
+                await writer.drain()
+                result = await runner.run_script(
+                    self.playwright, browser, script, options,
+                    on_step=lambda step: send({"event": "step", **step.as_dict()}),
+                )
+                run_results.append(result)
+                send({"event": "result", **result.as_dict()})
+                await writer.drain()
+        path = runner.store(run_results)
+        send({
+            "event": "done",
+            "ok": all(result.status == "passed" for result in run_results),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "saved": str(path),
+        })
+
+    async def serve(self) -> None:
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+        async with async_api.async_playwright() as pw:
+            self.playwright = pw
+            await self._browser()
+            server = await asyncio.start_unix_server(self.handle, path=str(SOCKET_PATH))
+            os.chmod(SOCKET_PATH, 0o600)
+            print(f"harness daemon ready on {SOCKET_PATH}", flush=True)
+            try:
+                async with server:
+                    await self._stopped.wait()
+            finally:
+                if self.browser is not None:
+                    await self.browser.close()
+                if SOCKET_PATH.exists():
+                    SOCKET_PATH.unlink()
+
+
+def main() -> int:
+    try:
+        asyncio.run(Daemon().serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
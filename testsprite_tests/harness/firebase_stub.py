@@ -0,0 +1,250 @@
+"""Local stand-in for Firebase phone authentication.
+
+``lib/firebase/config.ts`` initialises Firebase Auth, and the phone login and
+signup pages use ``RecaptchaVerifier`` + ``signInWithPhoneNumber``. Against
+the real backend that means loading reCAPTCHA and, in headless runs, getting
+stuck on its challenge. With this plugin every request the SDK makes is
+answered through Playwright request interception:
+
+``www.google.com/recaptcha/*``
+    a tiny ``grecaptcha`` implementation whose ``execute`` resolves at once
+``identitytoolkit.googleapis.com``
+    ``recaptchaParams``, ``recaptchaConfig``, ``accounts:sendVerificationCode``,
+    ``accounts:signInWithPhoneNumber`` and ``accounts:lookup``
+``securetoken.googleapis.com``
+    token refresh
+
+OTP codes are fixed per phone number (``123456`` unless configured), so flows
+can type the code directly. Nothing here reaches Google; the Supabase calls
+the pages make after Firebase sign-in still go to the configured project.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from playwright import async_api
+
+from .session import Plugin
+
+DEFAULT_CODE = "123456"
+RECAPTCHA_TOKEN = "harness-recaptcha-token"
+PROJECT_ID = os.environ.get("NEXT_PUBLIC_FIREBASE_PROJECT_ID", "co-ventures-prod")
+
+RECAPTCHA_PATTERNS = (
+    "https://www.google.com/recaptcha/**",
+    "https://www.gstatic.com/recaptcha/**",
+    "https://www.recaptcha.net/recaptcha/**",
+)
+IDENTITY_TOOLKIT = "https://identitytoolkit.googleapis.com/**"
+SECURE_TOKEN = "https://securetoken.googleapis.com/**"
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+}
+
+_GRECAPTCHA_JS = """
+(function () {
+  var widgets = {}, next = 0;
+  var api = {
+    ready: function (cb) { cb(); },
+    render: function (container, params) { next += 1; widgets[next] = params || {}; return next; },
+    execute: function (id) {
+      var params = widgets[id || next] || {};
+      setTimeout(function () { if (typeof params.callback === 'function') params.callback(%(token)s); }, 0);
+      return Promise.resolve(%(token)s);
+    },
+    getResponse: function () { return %(token)s; },
+    reset: function () {}
+  };
+  api.enterprise = api;
+  window.grecaptcha = api;
+  var onload = %(onload)s;
+  if (onload && typeof window[onload] === 'function') window[onload]();
+})();
+"""
+
+
+def parse_codes(spec: str | None) -> dict[str, str]:
+    """Parse ``+911234567890=654321,+919...=111111`` into a phone -> code map."""
+    codes = {}
+    for item in (spec or "").split(","):
+        if "=" in item:
+            phone, code = item.split("=", 1)
+            codes[phone.strip()] = code.strip()
+    return codes
+
+
+def _b64(data: dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def uid_for(phone: str) -> str:
+    return "harness" + hashlib.sha1(phone.encode()).hexdigest()[:21]
+
+
+def id_token(phone: str, lifetime: int = 3600) -> str:
+    """Unsigned JWT with the claims the client SDK reads (it never verifies it)."""
+    now = int(time.time())
+    uid = uid_for(phone)
+    claims = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "auth_time": now,
+        "user_id": uid,
+        "sub": uid,
+        "iat": now,
+        "exp": now + lifetime,
+        "phone_number": phone,
+        "firebase": {"identities": {"phone": [phone]}, "sign_in_provider": "phone"},
+    }
+    return f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}.harness"
+
+
+class FirebaseAuthStub(Plugin):
+    name = "firebase_stub"
+
+    def __init__(self, codes: dict[str, str] | None = None, default_code: str = DEFAULT_CODE) -> None:
+        self.codes = {**parse_codes(os.environ.get("HARNESS_FIREBASE_OTP")), **(codes or {})}
+        self.default_code = default_code
+        self.calls: list[dict[str, Any]] = []
+        self._started = time.perf_counter()
+
+    def code_for(self, phone: str) -> str:
+        return self.codes.get(phone, self.default_code)
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        for pattern in RECAPTCHA_PATTERNS:
+            await context.route(pattern, self._recaptcha)
+        await context.route(IDENTITY_TOOLKIT, self._identity_toolkit)
+        await context.route(SECURE_TOKEN, self._secure_token)
+
+    def _log(self, endpoint: str, status: int, started: float) -> None:
+        self.calls.append({
+            "endpoint": endpoint,
+            "status": status,
+            "at_ms": round((started - self._started) * 1000, 1),
+            "handled_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
+
+    async def _json(self, route: async_api.Route, endpoint: str, body: dict[str, Any],
+                    started: float, status: int = 200) -> None:
+        await route.fulfill(status=status, headers=CORS_HEADERS, content_type="application/json",
+                            body=json.dumps(body))
+        self._log(endpoint, status, started)
+
+    async def _error(self, route: async_api.Route, endpoint: str, message: str, started: float) -> None:
+        await self._json(route, endpoint, {"error": {"code": 400, "message": message, "errors": [
+            {"message": message, "domain": "global", "reason": "invalid"}]}}, started, status=400)
+
+    async def _recaptcha(self, route: async_api.Route) -> None:
+        started = time.perf_counter()
+        url = urlparse(route.request.url)
+        if not url.path.endswith(".js"):
+            # Anchor/bframe iframes are never needed by the stub grecaptcha
+            await route.fulfill(status=204, headers=CORS_HEADERS, body="")
+            self._log("recaptcha:frame", 204, started)
+            return
+        onload = parse_qs(url.query).get("onload", [""])[0]
+        script = _GRECAPTCHA_JS % {"token": json.dumps(RECAPTCHA_TOKEN), "onload": json.dumps(onload)}
+        await route.fulfill(status=200, headers=CORS_HEADERS, content_type="text/javascript", body=script)
+        self._log("recaptcha:api.js", 200, started)
+
+    async def _identity_toolkit(self, route: async_api.Route) -> None:
+        started = time.perf_counter()
+        request = route.request
+        if request.method == "OPTIONS":
+            await route.fulfill(status=204, headers=CORS_HEADERS, body="")
+            return
+        endpoint = urlparse(request.url).path.rsplit("/", 1)[-1]
+        payload = request.post_data_json if request.post_data else {}
+
+        if endpoint == "recaptchaParams":
+            await self._json(route, endpoint, {
+                "kind": "identitytoolkit#GetRecaptchaParamResponse",
+                "recaptchaSiteKey": "harness-site-key",
+            }, started)
+        elif endpoint == "recaptchaConfig":
+            await self._json(route, endpoint, {
+                "recaptchaKey": "",
+                "recaptchaEnforcementState": [
+                    {"provider": "EMAIL_PASSWORD_PROVIDER", "enforcementState": "OFF"},
+                    {"provider": "PHONE_PROVIDER", "enforcementState": "OFF"},
+                ],
+            }, started)
+        elif endpoint == "accounts:sendVerificationCode":
+            phone = payload.get("phoneNumber", "")
+            if not phone.startswith("+"):
+                await self._error(route, endpoint, "INVALID_PHONE_NUMBER", started)
+            else:
+                await self._json(route, endpoint, {"sessionInfo": f"harness-session:{phone}"}, started)
+        elif endpoint == "accounts:signInWithPhoneNumber":
+            phone = payload.get("sessionInfo", "").partition(":")[2]
+            if not phone:
+                await self._error(route, endpoint, "INVALID_SESSION_INFO", started)
+            elif payload.get("code") != self.code_for(phone):
+                await self._error(route, endpoint, "INVALID_CODE", started)
+            else:
+                await self._json(route, endpoint, self._tokens(phone), started)
+        elif endpoint == "accounts:lookup":
+            phone = self._phone_from_token(payload.get("idToken", ""))
+            await self._json(route, endpoint, {"users": [self._user(phone)]}, started)
+        else:
+            await self._error(route, endpoint, "OPERATION_NOT_ALLOWED", started)
+
+    async def _secure_token(self, route: async_api.Route) -> None:
+        started = time.perf_counter()
+        if route.request.method == "OPTIONS":
+            await route.fulfill(status=204, headers=CORS_HEADERS, body="")
+            return
+        form = parse_qs(route.request.post_data or "")
+        phone = (form.get("refresh_token", [""])[0]).partition(":")[2]
+        tokens = self._tokens(phone)
+        await self._json(route, "token", {
+            "access_token": tokens["idToken"],
+            "id_token": tokens["idToken"],
+            "refresh_token": tokens["refreshToken"],
+            "expires_in": tokens["expiresIn"],
+            "token_type": "Bearer",
+            "user_id": tokens["localId"],
+            "project_id": PROJECT_ID,
+        }, started)
+
+    def _tokens(self, phone: str) -> dict[str, Any]:
+        return {
+            "idToken": id_token(phone),
+            "refreshToken": f"harness-refresh:{phone}",
+            "expiresIn": "3600",
+            "localId": uid_for(phone),
+            "isNewUser": False,
+            "phoneNumber": phone,
+        }
+
+    @staticmethod
+    def _phone_from_token(token: str) -> str:
+        try:
+            claims = token.split(".")[1]
+            return json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))["phone_number"]
+        except (IndexError, KeyError, ValueError):
+            return ""
+
+    def _user(self, phone: str) -> dict[str, Any]:
+        now_ms = str(int(time.time() * 1000))
+        return {
+            "localId": uid_for(phone),
+            "phoneNumber": phone,
+            "providerUserInfo": [{"providerId": "phone", "rawId": phone, "phoneNumber": phone}],
+            "lastLoginAt": now_ms,
+            "createdAt": now_ms,
+        }
+
+    def report(self) -> dict[str, Any]:
+        return {"calls": self.calls}
@@ -0,0 +1,238 @@
+"""Minimal HTTP client for API benchmarks (standard library only).
+
+Benchmarks talk to the Next.js API routes directly; a browser is only needed
+for UI flows. ``HARNESS_COOKIE`` can carry a logged-in Supabase session cookie
+(``sb-<project>-auth-token=...``) for routes that require a user.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .config import url
+
+SESSION_COOKIE = os.environ.get("HARNESS_COOKIE", "")
+
+# Called with (method, url, status, headers) for every response; see harness.timings
+RESPONSE_HOOKS: list[Callable[[str, str, int, dict[str, str]], None]] = []
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    elapsed_ms: float = 0.0
+    # Time until the status line and headers arrived
+    ttfb_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body or b"null")
+
+
+def _headers(message: Any) -> dict[str, str]:
+    """Lowercased header names; repeated headers (e.g. ``Server-Timing``) joined with commas."""
+    headers: dict[str, str] = {}
+    for key, value in message.items():
+        key = key.lower()
+        headers[key] = f"{headers[key]}, {value}" if key in headers else value
+    return headers
+
+
+def _captured(method: str, target: str, status: int, headers: dict[str, str]) -> None:
+    for hook in RESPONSE_HOOKS:
+        hook(method, target, status, headers)
+
+
+def request(method: str, path: str, body: Any = None, headers: dict[str, str] | None = None,
+            timeout: float = 120, cookie: str | None = None) -> Response:
+    data = None
+    all_headers = {"Accept": "application/json"}
+    if body is not None:
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        all_headers["Content-Type"] = "application/json"
+    cookie = SESSION_COOKIE if cookie is None else cookie
+    if cookie:
+        all_headers["Cookie"] = cookie
+    all_headers.update(headers or {})
+
+    req = urllib.request.Request(url(path), data=data, headers=all_headers, method=method)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            ttfb = time.perf_counter()
+            payload = resp.read()
+            status, response_headers = resp.status, _headers(resp.headers)
+    except urllib.error.HTTPError as exc:
+        ttfb = time.perf_counter()
+        payload = exc.read()
+        status, response_headers = exc.code, _headers(exc.headers)
+    finished = time.perf_counter()
+    _captured(method, req.full_url, status, response_headers)
+    return Response(
+        status=status,
+        headers=response_headers,
+        body=payload,
+        elapsed_ms=(finished - started) * 1000,
+        ttfb_ms=(ttfb - started) * 1000,
+    )
+
+
+@dataclass
+class StreamResponse:
+    """A Server-Sent Events response with the arrival time of each event."""
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    # (milliseconds since the request started, event data)
+    events: list[tuple[float, str]] = field(default_factory=list)
+    body: bytes = b""
+    elapsed_ms: float = 0.0
+    ttfb_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+def stream(method: str, path: str, body: Any = None, headers: dict[str, str] | None = None,
+           timeout: float = 120, cookie: str | None = None) -> StreamResponse:
+    """Like ``request`` but reads ``data:`` lines as they arrive."""
+    data = None if body is None else json.dumps(body).encode()
+    all_headers = {"Accept": "text/event-stream", "Content-Type": "application/json"}
+    cookie = SESSION_COOKIE if cookie is None else cookie
+    if cookie:
+        all_headers["Cookie"] = cookie
+    all_headers.update(headers or {})
+
+    req = urllib.request.Request(url(path), data=data, headers=all_headers, method=method)
+    started = time.perf_counter()
+    events: list[tuple[float, str]] = []
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            ttfb = time.perf_counter()
+            status, response_headers = resp.status, _headers(resp.headers)
+            for line in resp:
+                if line.startswith(b"data:"):
+                    events.append(((time.perf_counter() - started) * 1000, line[5:].strip().decode()))
+            payload = b""
+    except urllib.error.HTTPError as exc:
+        ttfb = time.perf_counter()
+        payload = exc.read()
+        status, response_headers = exc.code, _headers(exc.headers)
+    finished = time.perf_counter()
+    _captured(method, req.full_url, status, response_headers)
+    return StreamResponse(
+        status=status,
+        headers=response_headers,
+        events=events,
+        body=payload,
+        elapsed_ms=(finished - started) * 1000,
+        ttfb_ms=(ttfb - started) * 1000,
+    )
+
+
+@dataclass
+class DownloadResponse:
+    """A response body consumed in chunks and counted, never held in memory."""
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    bytes: int = 0
+    lines: int = 0
+    # Start of the first and the last 200 bytes, for checking the content
+    head: bytes = b""
+    tail: bytes = b""
+    elapsed_ms: float = 0.0
+    ttfb_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+def download(path: str, headers: dict[str, str] | None = None, timeout: float = 600,
+             cookie: str | None = None, chunk_size: int = 65536,
+             on_chunk: Callable[[DownloadResponse], None] | None = None) -> DownloadResponse:
+    """GET ``path`` and count bytes and newlines as they stream in."""
+    all_headers = {}
+    cookie = SESSION_COOKIE if cookie is None else cookie
+    if cookie:
+        all_headers["Cookie"] = cookie
+    all_headers.update(headers or {})
+
+    req = urllib.request.Request(url(path), headers=all_headers, method="GET")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            result = DownloadResponse(
+                status=resp.status,
+                headers=_headers(resp.headers),
+                ttfb_ms=(time.perf_counter() - started) * 1000,
+            )
+            while chunk := resp.read(chunk_size):
+                if not result.head:
+                    result.head = chunk[:200]
+                result.bytes += len(chunk)
+                result.lines += chunk.count(b"\n")
+                result.tail = (result.tail + chunk)[-200:]
+                if on_chunk:
+                    on_chunk(result)
+    except urllib.error.HTTPError as exc:
+        body = exc.read()
+        result = DownloadResponse(
+            status=exc.code,
+            headers=_headers(exc.headers),
+            bytes=len(body),
+            head=body[:200],
+            ttfb_ms=(time.perf_counter() - started) * 1000,
+        )
+    result.elapsed_ms = (time.perf_counter() - started) * 1000
+    _captured("GET", req.full_url, result.status, result.headers)
+    return result
+
+
+def server_timing(headers: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """Parse ``Server-Timing`` into ``{name: {"dur": ms, "desc": str}}``."""
+    metrics: dict[str, dict[str, Any]] = {}
+    for entry in headers.get("server-timing", "").split(","):
+        name, *params = (part.strip() for part in entry.split(";"))
+        if not name:
+            continue
+        metric: dict[str, Any] = {}
+        for param in params:
+            key, _, value = param.partition("=")
+            value = value.strip('"')
+            if key == "dur":
+                metric["dur"] = float(value)
+            elif key:
+                metric[key] = value
+        metrics[name] = metric
+    return metrics
+
+
+def get(path: str, **kwargs: Any) -> Response:
+    return request("GET", path, **kwargs)
+
+
+def post(path: str, body: Any = None, **kwargs: Any) -> Response:
+    return request("POST", path, body=body, **kwargs)
+
+
+def hammer(call: Callable[[int], Response], total: int, concurrency: int) -> tuple[list[Response], float]:
+    """Issue ``total`` calls with ``concurrency`` threads; returns responses and wall time (s)."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        responses = list(pool.map(call, range(total)))
+    return responses, time.perf_counter() - started
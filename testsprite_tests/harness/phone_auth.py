@@ -0,0 +1,126 @@
+"""Timed phone signup and login flows against the Firebase stand-in.
+
+These replace the reCAPTCHA wrestling in TC006/TC007 with the flows a user
+actually goes through: enter the number, receive the OTP, verify it. Both
+pages check Supabase for an existing account before sending the code, so
+signup uses a fresh number each run and login uses ``--phone`` (default
+``+911234567890``, the number the TC scripts use). If that number has no
+account the login page redirects to signup, which is reported as such.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any
+
+from playwright import async_api
+
+from . import results
+from .browser import launch
+from .config import url
+from .firebase_stub import FirebaseAuthStub
+
+SUITE = "phone-auth"
+TEST_PHONE = "+911234567890"
+
+OTP_INPUT = 'input[placeholder="123456"]'
+
+
+class _Timer:
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    async def phase(self, name: str, coro) -> Any:
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self.phases[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _verify(page: async_api.Page, stub: FirebaseAuthStub, phone: str, timer: _Timer) -> str:
+    await timer.phase("otp_prompt", page.locator(OTP_INPUT).wait_for(state="visible", timeout=15000))
+    await page.fill(OTP_INPUT, stub.code_for(phone))
+    async with page.expect_response("**/accounts:signInWithPhoneNumber*") as verified:
+        await timer.phase("verify_click", page.click('button[type="submit"]'))
+    response = await timer.phase("verify_response", verified.value)
+    return "verified" if response.ok else f"verify failed ({response.status})"
+
+
+async def login_flow(context: async_api.BrowserContext, stub: FirebaseAuthStub, phone: str) -> dict[str, Any]:
+    page = await context.new_page()
+    timer = _Timer()
+    started = time.perf_counter()
+    await timer.phase("load", page.goto(url("/auth/phone-login"), wait_until="domcontentloaded"))
+    await page.fill('input[type="tel"]', phone)
+    await page.click('button[type="submit"]')
+    otp = page.locator(OTP_INPUT)
+    signup = page.wait_for_url("**/auth/phone-signup**", timeout=15000)
+    done, pending = await asyncio.wait(
+        [asyncio.ensure_future(otp.wait_for(state="visible", timeout=15000)), asyncio.ensure_future(signup)],
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    for task in pending:
+        task.cancel()
+    timer.phases["request_otp"] = round((time.perf_counter() - started) * 1000 - timer.phases["load"], 1)
+    if "phone-signup" in page.url:
+        outcome = "no account for this number (redirected to signup)"
+    else:
+        outcome = await _verify(page, stub, phone, timer)
+    timer.phases["total"] = round((time.perf_counter() - started) * 1000, 1)
+    await page.close()
+    return {"phone": phone, "outcome": outcome, "phases_ms": timer.phases}
+
+
+async def signup_flow(context: async_api.BrowserContext, stub: FirebaseAuthStub) -> dict[str, Any]:
+    phone = "+919" + "".join(random.choices("0123456789", k=9))
+    page = await context.new_page()
+    timer = _Timer()
+    started = time.perf_counter()
+    await timer.phase("load", page.goto(url("/auth/phone-signup"), wait_until="domcontentloaded"))
+    await page.fill('input[placeholder="John Doe"]', "Harness User")
+    await page.fill('input[placeholder="john@example.com"]', f"harness+{phone[1:]}@example.com")
+    await page.fill('input[placeholder="+91 9876543210"]', phone)
+    await timer.phase("request_otp", page.click('button[type="submit"]'))
+    outcome = await _verify(page, stub, phone, timer)
+    timer.phases["total"] = round((time.perf_counter() - started) * 1000, 1)
+    await page.close()
+    return {"phone": phone, "outcome": outcome, "phases_ms": timer.phases}
+
+
+async def run(phone: str = TEST_PHONE) -> dict[str, Any]:
+    async with async_api.async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            flows = {}
+            for name in ("signup", "login"):
+                stub = FirebaseAuthStub()
+                context = await browser.new_context()
+                await stub.on_context(context)
+                try:
+                    if name == "signup":
+                        flows[name] = await signup_flow(context, stub)
+                    else:
+                        flows[name] = await login_flow(context, stub, phone)
+                except async_api.Error as exc:
+                    flows[name] = {"outcome": f"error: {exc.message.splitlines()[0]}"}
+                flows[name]["firebase_calls"] = stub.calls
+                await context.close()
+        finally:
+            await browser.close()
+    return {"flows": flows}
+
+
+def main(phone: str = TEST_PHONE) -> int:
+    data = asyncio.run(run(phone))
+    for name, flow in data["flows"].items():
+        print(f"{name}: {flow['outcome']}")
+        for phase, ms in flow.get("phases_ms", {}).items():
+            print(f"  {phase:<16} {ms:>9.1f} ms")
+        for call in flow.get("firebase_calls", []):
+            print(f"  stub {call['endpoint']:<34} +{call['at_ms']:>8.1f} ms")
+    print(f"\nSaved {results.save(SUITE, data)}")
+    return 0 if all(flow["outcome"] == "verified" or "redirected" in flow["outcome"]
+                    for flow in data["flows"].values()) else 1
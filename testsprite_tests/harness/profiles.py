@@ -0,0 +1,118 @@
+"""Named network and CPU emulation profiles.
+
+Throttling is applied per page through the Chrome DevTools Protocol
+(``Network.emulateNetworkConditions`` and ``Emulation.setCPUThrottlingRate``),
+the same mechanism DevTools and Lighthouse use. Mobile profiles also switch
+the context to a mid-range Android viewport and user agent so responsive
+layouts and touch handlers behave as they do for most of our visitors.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from playwright import async_api
+
+from .session import Plugin
+
+ANDROID_UA = (
+    "Mozilla/5.0 (Linux; Android 13; SM-A546E) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    label: str
+    download_kbps: float | None = None
+    upload_kbps: float | None = None
+    latency_ms: float = 0
+    cpu_rate: float = 1
+    mobile: bool = False
+
+    @property
+    def throttles_network(self) -> bool:
+        return self.download_kbps is not None or self.latency_ms > 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "download_kbps": self.download_kbps,
+            "upload_kbps": self.upload_kbps,
+            "latency_ms": self.latency_ms,
+            "cpu_rate": self.cpu_rate,
+            "mobile": self.mobile,
+        }
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        Profile("desktop", "Desktop, no throttling"),
+        # Lighthouse's mobile preset: 150 ms RTT x 3.75 packet-level factor
+        Profile("slow-4g-4x-cpu", "Slow 4G + 4x CPU", 1600, 750, 562.5, 4, mobile=True),
+        Profile("fast-4g-2x-cpu", "Fast 4G + 2x CPU", 9000, 1500, 170, 2, mobile=True),
+        Profile("3g-6x-cpu", "Regular 3G + 6x CPU", 750, 250, 300, 6, mobile=True),
+    )
+}
+
+DEFAULT_PROFILE = "desktop"
+
+
+def get(name: str) -> Profile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown profile {name!r}; choose from {', '.join(PROFILES)}") from None
+
+
+def expand(names: list[str] | None) -> list[str]:
+    """Validate profile names from the command line; ``all`` means every profile."""
+    names = names or [DEFAULT_PROFILE]
+    if "all" in names:
+        return list(PROFILES)
+    for name in names:
+        get(name)
+    return names
+
+
+def _bytes_per_second(kbps: float | None) -> float:
+    return -1 if kbps is None else kbps * 1000 / 8
+
+
+class ProfilePlugin(Plugin):
+    name = "profile"
+
+    def __init__(self, profile: Profile) -> None:
+        self.profile = profile
+
+    def context_options(self) -> dict[str, Any]:
+        if not self.profile.mobile:
+            return {}
+        return {
+            "viewport": {"width": 412, "height": 915},
+            "device_scale_factor": 2.625,
+            "is_mobile": True,
+            "has_touch": True,
+            "user_agent": ANDROID_UA,
+        }
+
+    async def on_page(self, context: async_api.BrowserContext, page: async_api.Page) -> None:
+        if not self.profile.throttles_network and self.profile.cpu_rate == 1:
+            return
+        cdp = await context.new_cdp_session(page)
+        if self.profile.throttles_network:
+            await cdp.send("Network.enable")
+            await cdp.send("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": self.profile.latency_ms,
+                "downloadThroughput": _bytes_per_second(self.profile.download_kbps),
+                "uploadThroughput": _bytes_per_second(self.profile.upload_kbps),
+            })
+        if self.profile.cpu_rate != 1:
+            await cdp.send("Emulation.setCPUThrottlingRate", {"rate": self.profile.cpu_rate})
+
+    def report(self) -> dict[str, Any]:
+        return {"name": self.profile.name, **self.profile.as_dict()}
@@ -0,0 +1,63 @@
+"""Persist harness results per build so runs can be compared over time.
+
+Layout::
+
+    results/<suite>/<build_id>.json
+
+Each file holds the latest run of a suite for that build. ``previous`` finds
+the most recent run of the same suite for a *different* build, which is what
+regression reports compare against.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import RESULTS_DIR, BASE_URL, build_id
+
+
+def suite_dir(suite: str) -> Path:
+    path = RESULTS_DIR / suite
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def save(suite: str, data: dict[str, Any], build: str | None = None) -> Path:
+    """Write ``data`` for ``suite`` under the current (or given) build."""
+    build = build or build_id()
+    payload = {
+        "suite": suite,
+        "build": build,
+        "base_url": BASE_URL,
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        **data,
+    }
+    path = suite_dir(suite) / f"{build}.json"
+    path.write_text(json.dumps(payload, indent=2, sort_keys=False))
+    return path
+
+
+def load(suite: str, build: str) -> dict[str, Any] | None:
+    path = RESULTS_DIR / suite / f"{build}.json"
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text())
+
+
+def previous(suite: str, build: str | None = None) -> dict[str, Any] | None:
+    """Return the newest stored run of ``suite`` recorded for another build."""
+    build = build or build_id()
+    directory = RESULTS_DIR / suite
+    if not directory.is_dir():
+        return None
+    candidates = sorted(
+        (p for p in directory.glob("*.json") if p.stem != build),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    if not candidates:
+        return None
+    return json.loads(candidates[0].read_text())
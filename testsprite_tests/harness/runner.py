@@ -0,0 +1,153 @@
+"""Run generated TC flows in-process with harness plugins applied.
+
+A run loads the script (``harness.tc``), swaps its ``async_api`` for an
+instrumented session (``harness.session``) and awaits ``run_test`` against a
+browser the runner owns. Each run yields pass/fail, wall time, per-step
+timings and whatever the plugins report (profile, Web Vitals, ...).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from playwright import async_api
+
+from . import profiles, results, tc
+from .browser import launch
+from .clock import ClockPlugin
+from .config import build_id
+from .firebase_stub import FirebaseAuthStub
+from .session import Plugin, Session, StepTiming
+from .timings import ServerTimingPlugin, format_report
+from .vitals import VitalsPlugin
+
+SUITE = "flows"
+
+
+@dataclass
+class RunOptions:
+    profile: str = profiles.DEFAULT_PROFILE
+    # Virtual clock + reduced motion, see harness.clock
+    clock: bool = False
+    # Answer Firebase phone auth locally, see harness.firebase_stub
+    firebase_stub: bool = False
+    # Per-route Server-Timing breakdown of the responses, see harness.timings
+    server_timing: bool = False
+
+    def plugins(self) -> list[Plugin]:
+        plugins: list[Plugin] = [profiles.ProfilePlugin(profiles.get(self.profile)), VitalsPlugin()]
+        if self.clock:
+            plugins.append(ClockPlugin())
+        if self.firebase_stub:
+            plugins.append(FirebaseAuthStub())
+        if self.server_timing:
+            plugins.append(ServerTimingPlugin())
+        return plugins
+
+
+@dataclass
+class RunResult:
+    tc_id: str
+    options: RunOptions
+    status: str = "passed"
+    error: str | None = None
+    duration_ms: float = 0.0
+    steps: list[dict[str, Any]] = field(default_factory=list)
+    plugins: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        mode = "+clock" if self.options.clock else ""
+        return f"{self.tc_id}@{self.options.profile}{mode}"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "tc": self.tc_id,
+            "profile": self.options.profile,
+            "clock": self.options.clock,
+            "firebase_stub": self.options.firebase_stub,
+            "server_timing": self.options.server_timing,
+            "status": self.status,
+            "error": self.error,
+            "duration_ms": round(self.duration_ms, 1),
+            "steps": self.steps,
+            **self.plugins,
+        }
+
+
+async def run_script(playwright: async_api.Playwright, browser: async_api.Browser,
+                     script: tc.TCScript, options: RunOptions,
+                     on_step: Callable[[StepTiming], None] | None = None) -> RunResult:
+    plugins = options.plugins()
+    session = Session(playwright, browser, script, plugins)
+    session.steps.listener = on_step
+    result = RunResult(script.tc_id, options)
+    started = time.perf_counter()
+    try:
+        run_test = script.instantiate(session.async_api())
+        await run_test()
+    except AssertionError as exc:
+        result.status = "failed"
+        result.error = str(exc)
+    except Exception as exc:
+        result.status = "error"
+        result.error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+    finally:
+        result.duration_ms = (time.perf_counter() - started) * 1000
+        await session.close()
+    result.steps = session.steps.as_list()
+    result.plugins = {plugin.name: plugin.report() for plugin in plugins}
+    return result
+
+
+async def run_many(names: list[str], option_sets: list[RunOptions]) -> list[RunResult]:
+    scripts = [tc.load(name) for name in names]
+    run_results = []
+    async with async_api.async_playwright() as pw:
+        browser = await launch(pw)
+        try:
+            for script in scripts:
+                for options in option_sets:
+                    run_results.append(await run_script(pw, browser, script, options))
+        finally:
+            await browser.close()
+    return run_results
+
+
+def format_result(result: RunResult) -> str:
+    lines = [f"{result.key}: {result.status} in {result.duration_ms / 1000:.1f}s"]
+    if result.error:
+        lines.append(f"  {result.error.splitlines()[0]}")
+    for step in result.steps:
+        lines.append(
+            f"  {step['action_ms']:>8.0f} ms action {step['wait_ms']:>7.0f} ms wait  {step['label'][:80]}"
+        )
+    worst = result.plugins.get("vitals", {}).get("worst", {})
+    if worst:
+        lines.append("  vitals: " + ", ".join(
+            f"{name}={metric['value']} ({metric['rating']})" for name, metric in worst.items()
+        ))
+    if result.options.server_timing:
+        lines.extend("  " + line for line in format_report(result.plugins.get("server_timing", {})).splitlines())
+    return "\n".join(lines)
+
+
+def store(run_results: list[RunResult]) -> Any:
+    """Merge results into this build's ``flows`` report, keyed by TC and profile."""
+    existing = results.load(SUITE, build_id()) or {}
+    runs = existing.get("runs", {})
+    runs.update({result.key: result.as_dict() for result in run_results})
+    return results.save(SUITE, {"runs": runs})
+
+
+def main(names: list[str], option_sets: list[RunOptions]) -> int:
+    names = names or tc.default_names()
+    run_results = asyncio.run(run_many(names, option_sets))
+    for result in run_results:
+        print(format_result(result))
+    print(f"\nSaved {store(run_results)}")
+    return 0 if all(result.status == "passed" for result in run_results) else 1
@@ -0,0 +1,322 @@
+"""Instrumented stand-in for ``playwright.async_api`` used when running TC flows.
+
+The generated scripts call ``async_api.async_playwright().start()``, launch a
+browser, create a context and then drive pages through locators. The classes
+here mimic that surface and forward everything to a browser the harness owns,
+which lets the harness
+
+* reuse one browser across scripts (the script's ``launch`` / ``close`` /
+  ``stop`` calls become no-ops),
+* apply plugins to every context and page before the script touches them
+  (emulation profiles, Web Vitals collection, ...), and
+* time every action and attribute it to the ``# ->`` step it belongs to.
+
+Anything not wrapped here is delegated to the real Playwright object.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from playwright import async_api
+
+from .tc import TCScript
+
+LOCATOR_ACTIONS = {
+    "click", "dblclick", "fill", "type", "press", "press_sequentially", "check",
+    "uncheck", "select_option", "hover", "tap", "set_input_files", "focus",
+}
+PAGE_ACTIONS = {"goto", "reload", "go_back", "go_forward", "click", "fill", "press"}
+
+
+class Plugin:
+    """Hook points applied to every context a TC flow opens.
+
+    Subclasses override what they need; all hooks are optional.
+    """
+
+    name = "plugin"
+
+    def context_options(self) -> dict[str, Any]:
+        """Extra keyword arguments for ``browser.new_context``."""
+        return {}
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        """Called once per context, before any page exists."""
+
+    async def on_page(self, context: async_api.BrowserContext, page: async_api.Page) -> None:
+        """Called for each page before the script receives it."""
+
+    async def before_close(self, context: async_api.BrowserContext) -> None:
+        """Called right before the script closes a context."""
+
+    async def wait(self, page: async_api.Page, timeout_ms: float) -> bool:
+        """Handle ``page.wait_for_timeout``; return True if handled."""
+        return False
+
+    def report(self) -> dict[str, Any]:
+        return {}
+
+
+@dataclass
+class StepTiming:
+    label: str
+    actions: int = 0
+    action_ms: float = 0.0
+    wait_ms: float = 0.0
+    failed: bool = False
+
+    @property
+    def total_ms(self) -> float:
+        return self.action_ms + self.wait_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "actions": self.actions,
+            "action_ms": round(self.action_ms, 1),
+            "wait_ms": round(self.wait_ms, 1),
+            "total_ms": round(self.total_ms, 1),
+            "failed": self.failed,
+        }
+
+
+@dataclass
+class StepRecorder:
+    """Attributes timed calls to the TC step that issued them."""
+
+    script: TCScript
+    steps: dict[str, StepTiming] = field(default_factory=dict)
+    # Called with the step after every timed action (used to stream progress)
+    listener: Callable[[StepTiming], None] | None = None
+
+    def _current_step(self) -> str:
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code.co_filename == self.script.filename:
+                return self.script.step_at(frame.f_lineno)
+            frame = frame.f_back
+        return "setup"
+
+    def _step(self) -> StepTiming:
+        label = self._current_step()
+        if label not in self.steps:
+            self.steps[label] = StepTiming(label)
+        return self.steps[label]
+
+    async def action(self, call, *args, **kwargs):
+        step = self._step()
+        started = time.perf_counter()
+        try:
+            return await call(*args, **kwargs)
+        except Exception:
+            step.failed = True
+            raise
+        finally:
+            step.actions += 1
+            step.action_ms += (time.perf_counter() - started) * 1000
+            if self.listener is not None:
+                self.listener(step)
+
+    def waited(self, step: StepTiming, started: float) -> None:
+        step.wait_ms += (time.perf_counter() - started) * 1000
+
+    def as_list(self) -> list[dict[str, Any]]:
+        return [step.as_dict() for step in self.steps.values()]
+
+
+class _Proxy:
+    """Delegates unknown attributes to the wrapped Playwright object."""
+
+    def __init__(self, target: Any, session: "Session") -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_session", session)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target, name, value)
+
+
+class HarnessLocator(_Proxy):
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name in LOCATOR_ACTIONS:
+            return lambda *a, **kw: self._session.steps.action(attr, *a, **kw)
+        if name in {"nth", "locator", "filter", "get_by_text", "get_by_role", "get_by_label",
+                    "get_by_placeholder", "get_by_test_id"}:
+            return lambda *a, **kw: HarnessLocator(attr(*a, **kw), self._session)
+        return attr
+
+    @property
+    def first(self) -> "HarnessLocator":
+        return HarnessLocator(self._target.first, self._session)
+
+    @property
+    def last(self) -> "HarnessLocator":
+        return HarnessLocator(self._target.last, self._session)
+
+
+class HarnessPage(_Proxy):
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name in PAGE_ACTIONS:
+            return lambda *a, **kw: self._session.steps.action(attr, *a, **kw)
+        if name in {"locator", "get_by_text", "get_by_role", "get_by_label",
+                    "get_by_placeholder", "get_by_test_id"}:
+            return lambda *a, **kw: HarnessLocator(attr(*a, **kw), self._session)
+        return attr
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        step = self._session.steps._step()
+        started = time.perf_counter()
+        try:
+            for plugin in self._session.plugins:
+                if await plugin.wait(self._target, timeout):
+                    return
+            await self._target.wait_for_timeout(timeout)
+        finally:
+            self._session.steps.waited(step, started)
+
+
+class HarnessContext(_Proxy):
+    def _wrap(self, page: async_api.Page) -> HarnessPage:
+        return self._session.wrap_page(page)
+
+    @property
+    def pages(self) -> list[HarnessPage]:
+        return [self._wrap(page) for page in self._target.pages]
+
+    async def new_page(self) -> HarnessPage:
+        page = await self._target.new_page()
+        await self._session.prepare_page(self._target, page)
+        return self._wrap(page)
+
+    async def close(self, **kwargs: Any) -> None:
+        for plugin in self._session.plugins:
+            try:
+                await plugin.before_close(self._target)
+            except async_api.Error:
+                pass
+        if self._target in self._session.contexts:
+            self._session.contexts.remove(self._target)
+        await self._target.close(**kwargs)
+
+
+class HarnessBrowser(_Proxy):
+    async def new_context(self, **kwargs: Any) -> HarnessContext:
+        options = dict(kwargs)
+        for plugin in self._session.plugins:
+            options.update(plugin.context_options())
+        context = await self._target.new_context(**options)
+        self._session.contexts.append(context)
+        for plugin in self._session.plugins:
+            await plugin.on_context(context)
+        # Pages the app opens itself (popups, target=_blank links)
+        context.on("page", lambda page: self._session.adopt_page(context, page))
+        return HarnessContext(context, self._session)
+
+    async def new_page(self, **kwargs: Any) -> HarnessPage:
+        context = await self.new_context(**kwargs)
+        return await context.new_page()
+
+    async def close(self, **kwargs: Any) -> None:
+        # The harness owns the browser; the script only closes what it opened
+        for context in list(self._session.contexts):
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+
+
+class HarnessBrowserType(_Proxy):
+    async def launch(self, **kwargs: Any) -> HarnessBrowser:
+        return HarnessBrowser(self._session.browser, self._session)
+
+
+class HarnessPlaywright(_Proxy):
+    @property
+    def chromium(self) -> HarnessBrowserType:
+        return HarnessBrowserType(self._target.chromium, self._session)
+
+    async def start(self) -> "HarnessPlaywright":
+        return self
+
+    async def stop(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "HarnessPlaywright":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+
+class Session:
+    """State for one TC run: the shared browser, plugins and step timings."""
+
+    def __init__(self, playwright: async_api.Playwright, browser: async_api.Browser,
+                 script: TCScript, plugins: list[Plugin] | None = None) -> None:
+        self.playwright = playwright
+        self.browser = browser
+        self.script = script
+        self.plugins = list(plugins or [])
+        self.steps = StepRecorder(script)
+        self.contexts: list[async_api.BrowserContext] = []
+        # One preparation per page, shared by every caller so none gets the page early
+        self._prepared: dict[int, asyncio.Future[None]] = {}
+
+    def wrap_page(self, page: async_api.Page) -> HarnessPage:
+        return HarnessPage(page, self)
+
+    def prepare_page(self, context: async_api.BrowserContext, page: async_api.Page) -> asyncio.Future[None]:
+        """Future that resolves once every plugin's ``on_page`` has run for ``page``."""
+        key = id(page)
+        if key not in self._prepared:
+            self._prepared[key] = asyncio.ensure_future(self._run_on_page(context, page))
+        return self._prepared[key]
+
+    async def _run_on_page(self, context: async_api.BrowserContext, page: async_api.Page) -> None:
+        for plugin in self.plugins:
+            await plugin.on_page(context, page)
+
+    def adopt_page(self, context: async_api.BrowserContext, page: async_api.Page) -> None:
+        self.prepare_page(context, page)
+
+    def async_api(self) -> Any:
+        """Module-like object handed to the script in place of ``async_api``."""
+        session = self
+
+        class _Starter:
+            async def start(self) -> HarnessPlaywright:
+                return HarnessPlaywright(session.playwright, session)
+
+            async def __aenter__(self) -> HarnessPlaywright:
+                return HarnessPlaywright(session.playwright, session)
+
+            async def __aexit__(self, *exc: Any) -> None:
+                pass
+
+        class _Module:
+            def __getattr__(self, name: str) -> Any:
+                return getattr(async_api, name)
+
+            @staticmethod
+            def async_playwright() -> _Starter:
+                return _Starter()
+
+        return _Module()
+
+    async def close(self) -> None:
+        """Close anything the script left open."""
+        for context in self.contexts:
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+        self.contexts.clear()
@@ -0,0 +1,40 @@
+"""Small statistics helpers shared by the benchmarks."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; ``values`` need not be sorted."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values: Iterable[float]) -> dict[str, float]:
+    values = list(values)
+    if not values:
+        return {"n": 0}
+    return {
+        "n": len(values),
+        "min": round(min(values), 2),
+        "p50": round(percentile(values, 50), 2),
+        "p90": round(percentile(values, 90), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "max": round(max(values), 2),
+        "mean": round(sum(values) / len(values), 2),
+    }
+
+
+def format_summary(label: str, summary: dict[str, float], unit: str = "ms") -> str:
+    if not summary.get("n"):
+        return f"{label}: no samples"
+    return (
+        f"{label}: n={summary['n']} p50={summary['p50']}{unit} p95={summary['p95']}{unit} "
+        f"p99={summary['p99']}{unit} max={summary['max']}{unit}"
+    )
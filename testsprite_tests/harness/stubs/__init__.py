@@ -0,0 +1,10 @@
+"""Local stand-ins for external services used by the benchmarks.
+
+Each stub is a plain ``http.server`` application started in a background
+thread (see ``serve``), so benchmarks can run it in-process while the Next.js
+app is pointed at it through environment variables.
+"""
+
+from .server import StubServer, serve
+
+__all__ = ["StubServer", "serve"]
@@ -0,0 +1,69 @@
+"""Gemini REST API stub (``models`` list and ``generateContent``).
+
+Point the app at it with ``GEMINI_API_BASE_URL=http://127.0.0.1:<port>``.
+The stub counts calls per endpoint, which is what the AI config cache
+benchmark compares.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .server import StubHandler
+
+MODELS = [
+    {"name": "models/gemini-2.5-flash", "supportedGenerationMethods": ["generateContent", "countTokens"]},
+    {"name": "models/gemini-1.5-flash", "supportedGenerationMethods": ["generateContent", "countTokens"]},
+    {"name": "models/text-embedding-004", "supportedGenerationMethods": ["embedContent"]},
+]
+
+
+@dataclass
+class GeminiStub:
+    # Simulated round trip of the models list call
+    models_delay_ms: float = 150
+    generate_delay_ms: float = 300
+    reply: str = "Stub analysis: strong growth potential, moderate risk."
+    calls: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def count(self, endpoint: str) -> None:
+        with self._lock:
+            self.calls[endpoint] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+
+class GeminiHandler(StubHandler):
+    stub: GeminiStub
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/models"):
+            self.stub.count("models")
+            time.sleep(self.stub.models_delay_ms / 1000)
+            self.send_json({"models": MODELS})
+        else:
+            self.send_json({"error": {"code": 404, "message": f"Unknown path {path}"}}, status=404)
+
+    def do_POST(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if not path.endswith(":generateContent"):
+            self.send_json({"error": {"code": 404, "message": f"Unknown path {path}"}}, status=404)
+            return
+        self.read_json()
+        self.stub.count("generateContent")
+        time.sleep(self.stub.generate_delay_ms / 1000)
+        self.send_json({
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": self.stub.reply}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {"promptTokenCount": 200, "candidatesTokenCount": 12, "totalTokenCount": 212},
+        })
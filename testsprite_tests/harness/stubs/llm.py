@@ -0,0 +1,140 @@
+"""OpenAI-compatible chat completions stub with scripted latency.
+
+Point the app at it with ``OPENAI_BASE_URL=http://127.0.0.1:<port>/v1`` (the
+OpenAI SDK reads that variable) and any ``OPENAI_API_KEY``.
+
+Requests for the AI committee are attributed to an agent by the marker phrase
+in its seeded system prompt (``supabase/migrations/004_subscription_ai_system.sql``),
+so delays can be configured per agent slug::
+
+    LLMStub(delays_ms={"legal_regulatory": 30000}, default_delay_ms=1500)
+
+Streaming requests (``"stream": true``) get ``chat.completion.chunk`` events:
+the agent delay passes before the first token, then one word per
+``token_interval_ms``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .server import StubHandler
+
+AGENT_MARKERS = {
+    "market_pulse": "real estate market analyst",
+    "deal_underwriter": "real estate financial analyst",
+    "developer_verification": "developer due diligence specialist",
+    "legal_regulatory": "real estate legal advisor",
+    "exit_optimizer": "real estate exit strategy advisor",
+    "committee_synthesizer": "chairman of an investment committee",
+}
+
+DEFAULT_REPLY = (
+    "The location shows strong growth potential with good infrastructure and "
+    "positive rental demand. Key risk: possible construction delay."
+)
+
+
+def parse_delays(items: list[str] | None) -> dict[str, float]:
+    """``["market_pulse=2000", ...]`` -> ``{"market_pulse": 2000.0}``."""
+    delays = {}
+    for item in items or []:
+        slug, _, ms = item.partition("=")
+        delays[slug.strip()] = float(ms)
+    return delays
+
+
+@dataclass
+class LLMStub:
+    delays_ms: dict[str, float] = field(default_factory=dict)
+    default_delay_ms: float = 1000
+    reply: str = DEFAULT_REPLY
+    token_interval_ms: float = 0
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def agent_for(self, messages: list[dict[str, Any]]) -> str:
+        system = " ".join(
+            str(message.get("content", "")) for message in messages if message.get("role") == "system"
+        ).lower()
+        for slug, marker in AGENT_MARKERS.items():
+            if marker in system:
+                return slug
+        return "unknown"
+
+    def delay_for(self, agent: str) -> float:
+        return self.delays_ms.get(agent, self.default_delay_ms)
+
+    def record(self, **call: Any) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+
+class LLMHandler(StubHandler):
+    stub: LLMStub
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+            return
+        payload = self.read_json() or {}
+        agent = self.stub.agent_for(payload.get("messages", []))
+        delay = self.stub.delay_for(agent)
+        started = time.perf_counter()
+        time.sleep(delay / 1000)
+        if payload.get("stream"):
+            self.stream_reply(payload, agent, delay, started)
+            return
+        self.stub.record(agent=agent, delay_ms=delay, started=started, model=payload.get("model"))
+        words = len(self.stub.reply.split())
+        try:
+            self.send_json({
+                "id": "chatcmpl-harness",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.stub.reply},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 200, "completion_tokens": words, "total_tokens": 200 + words},
+            })
+        except (BrokenPipeError, ConnectionResetError):
+            # The app aborted the request at its per-agent deadline
+            self.stub.record(agent=agent, aborted=True, started=started)
+
+    def stream_reply(self, payload: dict[str, Any], agent: str, delay: float, started: float) -> None:
+        tokens = re.findall(r"\S+\s*", self.stub.reply)
+        self.start_event_stream()
+
+        def chunk(delta: dict[str, Any], finish_reason: str | None = None) -> dict[str, Any]:
+            return {
+                "id": "chatcmpl-harness",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": payload.get("model", "stub"),
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+
+        try:
+            self.send_event(chunk({"role": "assistant", "content": ""}))
+            for index, token in enumerate(tokens):
+                if index and self.stub.token_interval_ms:
+                    time.sleep(self.stub.token_interval_ms / 1000)
+                self.send_event(chunk({"content": token}))
+            self.send_event(chunk({}, "stop"))
+            self.send_event("[DONE]")
+        except (BrokenPipeError, ConnectionResetError):
+            self.stub.record(agent=agent, aborted=True, started=started, stream=True)
+            return
+        self.stub.record(agent=agent, delay_ms=delay, started=started, model=payload.get("model"),
+                         stream=True, tokens=len(tokens))
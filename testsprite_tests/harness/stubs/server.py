@@ -0,0 +1,73 @@
+"""Background-thread HTTP server shared by the stubs."""
+
+from __future__ import annotations
+
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Base handler with JSON helpers; subclasses implement ``do_GET`` etc."""
+
+    protocol_version = "HTTP/1.1"
+    # Set by ``serve``: the object holding the stub's configuration and counters
+    stub: Any = None
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw or b"null")
+
+    def send_json(self, body: Any, status: int = 200, headers: dict[str, str] | None = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def start_event_stream(self, status: int = 200) -> None:
+        """Begin a Server-Sent Events response; the body ends when the connection closes."""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+    def send_event(self, data: Any) -> None:
+        text = data if isinstance(data, str) else json.dumps(data)
+        self.wfile.write(f"data: {text}\n\n".encode())
+        self.wfile.flush()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+@contextmanager
+def serve(handler: type[StubHandler], stub: Any, host: str = "127.0.0.1", port: int = 0) -> Iterator[StubServer]:
+    """Run ``handler`` bound to ``stub`` until the ``with`` block exits."""
+    bound = type(handler.__name__, (handler,), {"stub": stub})
+    server = StubServer((host, port), bound)
+    thread = threading.Thread(target=server.serve_forever, name=f"stub-{handler.__name__}", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,145 @@
+"""SMTP stand-in for the email outbox.
+
+Speaks enough ESMTP for ``lib/services/smtp-client.ts`` (EHLO, AUTH PLAIN,
+MAIL, RCPT, DATA, RSET, QUIT; no STARTTLS) and records every accepted
+message instead of delivering it. Point the app at it with
+``EMAIL_TRANSPORT=smtp SMTP_HOST=127.0.0.1 SMTP_PORT=<port>``.
+
+``delay_ms`` is added before each DATA reply, like a provider's processing
+time; ``fail_rate`` answers that share of messages with a temporary 451;
+``rate_per_s`` rejects messages beyond that rate with 421, the way providers
+throttle, so the outbox's pacing shows up as zero throttled replies.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import socketserver
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+RECIPIENT = re.compile(rb"^RCPT TO:\s*<([^>]*)>", re.IGNORECASE)
+
+
+@dataclass
+class Message:
+    recipient: str
+    size: int
+    # Wall clock, so it can be compared with timestamps from the database
+    received_at: float
+    connection: int
+
+
+@dataclass
+class SmtpStub:
+    delay_ms: float = 0.0
+    fail_rate: float = 0.0
+    rate_per_s: float = 0.0
+    messages: list[Message] = field(default_factory=list)
+    calls: Counter = field(default_factory=Counter)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    _recent: list[float] = field(default_factory=list)
+
+    def throttled(self) -> bool:
+        """True when accepting one more message would exceed ``rate_per_s``."""
+        if not self.rate_per_s:
+            return False
+        now = time.perf_counter()
+        with self.lock:
+            self._recent = [at for at in self._recent if now - at < 1.0]
+            if len(self._recent) >= self.rate_per_s:
+                return True
+            self._recent.append(now)
+            return False
+
+    def record(self, message: Message) -> None:
+        with self.lock:
+            self.messages.append(message)
+
+
+class SmtpHandler(socketserver.StreamRequestHandler):
+    stub: SmtpStub
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        stub = self.stub
+        stub.calls["connection"] += 1
+        connection = stub.calls["connection"]
+        recipient: str | None = None
+        self.reply("220 harness-smtp ESMTP ready")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.strip().split(b" ", 1)[0].upper()
+            stub.calls[command.decode(errors="replace")] += 1
+
+            if command in (b"EHLO", b"HELO"):
+                self.wfile.write(b"250-harness-smtp\r\n250-AUTH PLAIN\r\n250 8BITMIME\r\n")
+                self.wfile.flush()
+            elif command == b"AUTH":
+                self.reply("235 2.7.0 Authentication successful")
+            elif command == b"MAIL":
+                recipient = None
+                self.reply("250 2.1.0 OK")
+            elif command == b"RCPT":
+                match = RECIPIENT.match(line.strip())
+                recipient = match.group(1).decode() if match else ""
+                self.reply("250 2.1.5 OK")
+            elif command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                for body_line in iter(self.rfile.readline, b""):
+                    if body_line in (b".\r\n", b".\n"):
+                        break
+                    size += len(body_line)
+                if stub.delay_ms:
+                    time.sleep(stub.delay_ms / 1000)
+                if stub.throttled():
+                    stub.calls["throttled"] += 1
+                    self.reply("421 4.7.0 Too many messages, slow down")
+                elif random.random() < stub.fail_rate:
+                    stub.calls["failed"] += 1
+                    self.reply("451 4.3.0 Temporary failure")
+                else:
+                    stub.record(Message(recipient or "", size, time.time(), connection))
+                    self.reply(f"250 2.0.0 OK queued as harness-{connection}-{len(stub.messages)}")
+                recipient = None
+            elif command == b"RSET":
+                recipient = None
+                self.reply("250 2.0.0 OK")
+            elif command == b"NOOP":
+                self.reply("250 2.0.0 OK")
+            elif command == b"QUIT":
+                self.reply("221 2.0.0 Bye")
+                return
+            else:
+                self.reply("502 5.5.2 Command not implemented")
+
+
+class SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+@contextmanager
+def serve_smtp(stub: SmtpStub, host: str = "127.0.0.1", port: int = 0) -> Iterator[SmtpServer]:
+    """Run the SMTP stand-in bound to ``stub`` until the ``with`` block exits."""
+    bound = type("SmtpHandler", (SmtpHandler,), {"stub": stub})
+    server = SmtpServer((host, port), bound)
+    thread = threading.Thread(target=server.serve_forever, name="stub-smtp", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
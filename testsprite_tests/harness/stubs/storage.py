@@ -0,0 +1,216 @@
+"""Supabase Storage resumable-upload (TUS) stand-in.
+
+Implements the part of ``/storage/v1/upload/resumable`` that
+``lib/utils/upload.ts`` uses: ``POST`` to create an upload, ``HEAD`` for its
+offset and ``PATCH`` to append a chunk. Uploaded bytes are written under a
+local directory instead of a bucket. Point the app at it with
+``NEXT_PUBLIC_STORAGE_UPLOAD_URL=http://127.0.0.1:<port>/upload/resumable``
+(a ``NEXT_PUBLIC_`` variable, so restart ``next dev`` after setting it).
+
+Faults for recovery benchmarks are armed with ``arm``: ``drop`` closes the
+connection halfway through the chunk that crosses ``at`` (a fraction of the
+file), ``outage`` answers 503 to everything for ``outage_ms`` from then on.
+``bandwidth_mbps`` throttles how fast request bodies are read.
+"""
+
+from __future__ import annotations
+
+import base64
+import socket
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .server import StubHandler
+
+PREFIX = "/upload/resumable"
+READ_SIZE = 64 * 1024
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "POST, HEAD, PATCH, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Expose-Headers": "Location, Upload-Offset, Upload-Length, Tus-Resumable",
+}
+
+
+def decode_metadata(header: str) -> dict[str, str]:
+    metadata = {}
+    for item in filter(None, (part.strip() for part in header.split(","))):
+        key, _, value = item.partition(" ")
+        metadata[key] = base64.b64decode(value).decode() if value else ""
+    return metadata
+
+
+@dataclass
+class Upload:
+    id: str
+    length: int
+    metadata: dict[str, str]
+    path: Path
+    offset: int = 0
+    created_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+
+@dataclass
+class StorageStub:
+    root: Path
+    bandwidth_mbps: float | None = None
+    latency_ms: float = 0
+    uploads: dict[str, Upload] = field(default_factory=dict)
+    calls: Counter = field(default_factory=Counter)
+    bytes_received: int = 0
+    fault: str | None = None
+    fault_at: float = 0.5
+    outage_ms: float = 0
+    outage_until: float = 0
+    faults_fired: list[dict[str, Any]] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def arm(self, fault: str | None, at: float = 0.5, outage_ms: float = 0) -> None:
+        with self._lock:
+            self.fault, self.fault_at, self.outage_ms = fault, at, outage_ms
+
+    def reset(self) -> None:
+        with self._lock:
+            self.uploads.clear()
+            self.calls.clear()
+            self.bytes_received = 0
+            self.faults_fired.clear()
+            self.fault = None
+            self.outage_until = 0
+
+    def completed(self) -> list[Upload]:
+        with self._lock:
+            return [upload for upload in self.uploads.values() if upload.finished_at is not None]
+
+    def in_outage(self) -> bool:
+        return time.perf_counter() < self.outage_until
+
+    def trigger(self, upload: Upload, chunk: int) -> str | None:
+        """Fire the armed fault if this chunk crosses its position in the file."""
+        with self._lock:
+            if not self.fault or upload.offset + chunk < upload.length * self.fault_at:
+                return None
+            fault, self.fault = self.fault, None
+            self.faults_fired.append({"fault": fault, "upload": upload.id, "offset": upload.offset,
+                                      "at": time.perf_counter()})
+            if fault == "outage":
+                self.outage_until = time.perf_counter() + self.outage_ms / 1000
+            return fault
+
+
+class StorageHandler(StubHandler):
+    stub: StorageStub
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for key, value in {**CORS_HEADERS, "Tus-Resumable": "1.0.0", **(headers or {})}.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _upload(self) -> Upload | None:
+        upload_id = self.path.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+        return self.stub.uploads.get(upload_id)
+
+    def _begin(self, method: str) -> bool:
+        """Count the call and apply latency; False if the request was refused."""
+        self.stub.calls[method] += 1
+        if self.stub.latency_ms:
+            time.sleep(self.stub.latency_ms / 1000)
+        if self.stub.in_outage():
+            self.stub.calls["refused"] += 1
+            self._discard_body()
+            self._reply(503)
+            return False
+        return True
+
+    def _discard_body(self) -> None:
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(READ_SIZE, remaining)))
+
+    def _read_body(self, limit: int | None = None) -> bytes:
+        """Read the request body (or its first ``limit`` bytes) at the configured bandwidth."""
+        length = int(self.headers.get("Content-Length") or 0)
+        wanted = length if limit is None else min(limit, length)
+        parts, received = [], 0
+        started = time.perf_counter()
+        while received < wanted:
+            part = self.rfile.read(min(READ_SIZE, wanted - received))
+            if not part:
+                break
+            parts.append(part)
+            received += len(part)
+            if self.stub.bandwidth_mbps:
+                due = received * 8 / (self.stub.bandwidth_mbps * 1e6)
+                time.sleep(max(0.0, due - (time.perf_counter() - started)))
+        self.stub.bytes_received += received
+        return b"".join(parts)
+
+    def do_OPTIONS(self) -> None:
+        self._reply(204)
+
+    def do_POST(self) -> None:
+        if not self._begin("create"):
+            return
+        if self.path.split("?", 1)[0].rstrip("/") != PREFIX:
+            self._reply(404)
+            return
+        metadata = decode_metadata(self.headers.get("Upload-Metadata", ""))
+        upload_id = uuid.uuid4().hex
+        target = self.stub.root / metadata.get("bucketName", "bucket") / metadata.get("objectName", upload_id)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"")
+        self.stub.uploads[upload_id] = Upload(upload_id, int(self.headers.get("Upload-Length") or 0), metadata, target)
+        self._reply(201, {"Location": f"{PREFIX}/{upload_id}"})
+
+    def do_HEAD(self) -> None:
+        if not self._begin("head"):
+            return
+        upload = self._upload()
+        if not upload:
+            self._reply(404)
+            return
+        self._reply(200, {"Upload-Offset": str(upload.offset), "Upload-Length": str(upload.length),
+                          "Cache-Control": "no-store"})
+
+    def do_PATCH(self) -> None:
+        if not self._begin("patch"):
+            return
+        upload = self._upload()
+        if not upload:
+            self._discard_body()
+            self._reply(404)
+            return
+        if int(self.headers.get("Upload-Offset") or -1) != upload.offset:
+            self._discard_body()
+            self._reply(409, {"Upload-Offset": str(upload.offset)})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        fault = self.stub.trigger(upload, length)
+        if fault == "drop":
+            # Half the chunk arrives, then the connection dies; the partial chunk is discarded
+            self._read_body(limit=length // 2)
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        if fault == "outage":
+            self._discard_body()
+            self._reply(503)
+            return
+
+        body = self._read_body()
+        with upload.path.open("ab") as handle:
+            handle.write(body)
+        upload.offset += len(body)
+        if upload.offset >= upload.length:
+            upload.finished_at = time.perf_counter()
+        self._reply(204, {"Upload-Offset": str(upload.offset)})
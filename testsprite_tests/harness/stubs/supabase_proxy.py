@@ -0,0 +1,84 @@
+"""Counting reverse proxy in front of a real Supabase project.
+
+Forwards every request to ``upstream`` unchanged and counts it by service
+(``auth``, ``rest``, ``storage``, ...), so a benchmark can tell how many
+round trips the app made to Supabase while serving one of its own requests.
+JWKS fetches (``/auth/v1/.well-known/jwks.json``) are counted as ``jwks``
+rather than ``auth``: the app caches them and they are not per-request work.
+Point the app at it with ``NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:<port>``
+(a ``NEXT_PUBLIC_`` variable, so restart ``next dev`` after setting it).
+"""
+
+from __future__ import annotations
+
+import threading
+import urllib.error
+import urllib.request
+from collections import Counter
+from dataclasses import dataclass, field
+
+from .server import StubHandler
+
+# Not forwarded in either direction; the proxy sets its own framing
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "te", "trailer",
+    "upgrade", "host", "content-length", "accept-encoding", "content-encoding",
+}
+
+
+def service(path: str) -> str:
+    if path.startswith("/auth/v1/.well-known/"):
+        return "jwks"
+    parts = path.split("/")
+    return parts[1] if len(parts) > 2 and parts[2] == "v1" else "other"
+
+
+@dataclass
+class SupabaseProxy:
+    upstream: str
+    timeout: float = 60
+    calls: Counter = field(default_factory=Counter)
+    paths: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, method: str, path: str) -> None:
+        with self._lock:
+            self.calls[service(path)] += 1
+            self.paths[f"{method} {path.split('?')[0]}"] += 1
+
+    def snapshot(self) -> Counter:
+        with self._lock:
+            return Counter(self.calls)
+
+
+class SupabaseProxyHandler(StubHandler):
+    stub: SupabaseProxy
+
+    def forward(self) -> None:
+        proxy = self.stub
+        proxy.record(self.command, self.path)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        headers = {key: value for key, value in self.headers.items() if key.lower() not in HOP_BY_HOP}
+        req = urllib.request.Request(proxy.upstream.rstrip("/") + self.path, data=body,
+                                     headers=headers, method=self.command)
+        try:
+            with urllib.request.urlopen(req, timeout=proxy.timeout) as resp:
+                status, response_headers, payload = resp.status, resp.headers.items(), resp.read()
+        except urllib.error.HTTPError as exc:
+            status, response_headers, payload = exc.code, exc.headers.items(), exc.read()
+        except OSError as exc:
+            self.send_json({"error": f"upstream unreachable: {exc}"}, status=502)
+            return
+
+        self.send_response(status)
+        for key, value in response_headers:
+            if key.lower() not in HOP_BY_HOP:
+                self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = do_HEAD = do_OPTIONS = forward
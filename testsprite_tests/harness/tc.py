@@ -0,0 +1,118 @@
+"""Load generated TC scripts so the harness can run them in-process.
+
+Every ``TC*.py`` ends with a module-level ``asyncio.run(run_test())`` and
+starts its own Playwright driver and browser. ``load`` compiles the script
+without that trailing call, so the harness can await ``run_test`` itself on
+its own event loop and hand it an instrumented ``async_api`` (see
+``harness.session``) instead of the real one.
+
+Step labels come from the ``# -> ...`` comments TestSprite writes above each
+group of actions; ``TCScript.step_at`` maps a source line back to the label of
+the step it belongs to.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from .config import TESTS_DIR
+
+STEP_MARKER = "# ->"
+
+
+@dataclass
+class TCScript:
+    tc_id: str
+    path: Path
+    code: Any
+    step_lines: list[int] = field(default_factory=list)
+    step_labels: list[str] = field(default_factory=list)
+
+    @property
+    def filename(self) -> str:
+        return str(self.path)
+
+    def step_at(self, lineno: int) -> str:
+        """Label of the step whose marker is the closest one above ``lineno``."""
+        index = bisect.bisect_right(self.step_lines, lineno) - 1
+        if index < 0:
+            return "setup"
+        return self.step_labels[index]
+
+    def instantiate(self, async_api_module: Any) -> Callable[[], Awaitable[None]]:
+        """Execute the module body and return its ``run_test`` coroutine function.
+
+        ``async_api_module`` replaces the ``async_api`` global the script
+        imported, which is how the harness injects its instrumented session.
+        """
+        namespace: dict[str, Any] = {"__name__": f"testsprite_{self.tc_id}", "__file__": self.filename}
+        exec(self.code, namespace)
+        namespace["async_api"] = async_api_module
+        # Some generated scripts assert with ``expect`` without importing it
+        namespace.setdefault("expect", getattr(async_api_module, "expect"))
+        return namespace["run_test"]
+
+
+def resolve(name: str) -> Path:
+    """Accept ``TC002``, ``TC002_Property_...py`` or a path."""
+    candidate = Path(name)
+    if candidate.is_file():
+        return candidate.resolve()
+    matches = sorted(TESTS_DIR.glob(f"{name.split('_')[0]}_*.py"))
+    if not matches:
+        raise FileNotFoundError(f"No TC script matches {name!r} in {TESTS_DIR}")
+    return matches[0]
+
+
+def all_scripts() -> list[Path]:
+    return sorted(TESTS_DIR.glob("TC[0-9][0-9][0-9]_*.py"))
+
+
+def default_names() -> list[str]:
+    return [path.name for path in all_scripts()]
+
+
+def from_plan(plan_path: str | Path) -> list[str]:
+    """TC ids listed in a plan file.
+
+    Accepts TestSprite's ``testsprite_frontend_test_plan.json`` (a list of
+    objects with an ``id``) as well as a plain JSON list of ids.
+    """
+    entries = json.loads(Path(plan_path).read_text(encoding="utf-8"))
+    return [entry["id"] if isinstance(entry, dict) else str(entry) for entry in entries]
+
+
+def _is_entrypoint(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return isinstance(func, ast.Attribute) and func.attr == "run" and getattr(func.value, "id", None) == "asyncio"
+
+
+def load(name: str) -> TCScript:
+    path = resolve(name)
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(path))
+    tree.body = [node for node in tree.body if not _is_entrypoint(node)]
+    code = compile(tree, str(path), "exec")
+
+    step_lines, step_labels = [], []
+    for lineno, line in enumerate(source.splitlines(), start=1):
+        stripped = line.strip()
+        if stripped.startswith(STEP_MARKER):
+            step_lines.append(lineno)
+            # Numbered, because TestSprite often repeats the same description
+            step_labels.append(f"{len(step_labels) + 1}. {stripped[len(STEP_MARKER):].strip()}")
+
+    return TCScript(
+        tc_id=path.name.split("_")[0],
+        path=path,
+        code=code,
+        step_lines=step_lines,
+        step_labels=step_labels,
+    )
@@ -0,0 +1,136 @@
+"""Per-route phase breakdowns from ``Server-Timing`` headers.
+
+API routes wrapped in ``withServerTiming`` (``lib/api/server-timing.ts``)
+report named phases, e.g. ``auth;dur=3.1, db;dur=41.0, llm;dur=900.2,
+serialize;dur=0.4, total;dur=948.7``, and middleware adds ``middleware``.
+With collection enabled, every response the harness captures is recorded:
+``httpclient`` responses (``python -m harness bench --timings <name>``) and,
+through ``ServerTimingPlugin``, every response a browser receives during a
+TC flow (``python -m harness run --timings``).
+
+Routes are grouped by method and path with ids replaced by ``[id]``. Each
+phase gets percentiles of its duration and its median share of ``total``;
+``other`` is the part of ``total`` no phase accounts for (handler code,
+waiting on unlisted services). Phases of one kind are summed per request, so
+concurrent database calls can add up to more than ``total``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import defaultdict
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+from . import httpclient
+from .httpclient import server_timing
+from .session import Plugin
+from .stats import percentile, summarize
+
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.IGNORECASE)
+# Reported alongside the route's phases but not part of its ``total``
+OUTSIDE_TOTAL = {"middleware", "total"}
+
+
+def route_key(method: str, url: str) -> str:
+    path = urlparse(url).path or "/"
+    segments = ["[id]" if ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class TimingCollector:
+    def __init__(self) -> None:
+        self.samples: dict[str, list[dict[str, float]]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def record(self, method: str, url: str, status: int, headers: dict[str, str]) -> None:
+        metrics = server_timing(headers)
+        if "total" not in metrics:
+            return
+        key = route_key(method, url)
+        durations = {name: metric.get("dur", 0.0) for name, metric in metrics.items()}
+        with self._lock:
+            self.samples[key].append(durations)
+            self.statuses[key][str(status)] += 1
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            samples = {key: list(values) for key, values in self.samples.items()}
+            statuses = {key: dict(values) for key, values in self.statuses.items()}
+
+        routes: dict[str, Any] = {}
+        for key, requests in sorted(samples.items()):
+            names = sorted({name for durations in requests for name in durations} - {"total"})
+            phases: dict[str, Any] = {}
+            for name in names + ["other"]:
+                values, shares = [], []
+                for durations in requests:
+                    total = durations["total"]
+                    if name == "other":
+                        value = max(0.0, total - sum(
+                            dur for phase, dur in durations.items() if phase not in OUTSIDE_TOTAL
+                        ))
+                    elif name in durations:
+                        value = durations[name]
+                    else:
+                        continue
+                    values.append(value)
+                    if name not in OUTSIDE_TOTAL and total:
+                        shares.append(value / total)
+                phases[name] = {
+                    **summarize(values),
+                    "share_p50": round(percentile(shares, 50), 3) if shares else None,
+                }
+            routes[key] = {
+                "requests": len(requests),
+                "statuses": statuses[key],
+                "total": summarize(durations["total"] for durations in requests),
+                "phases": phases,
+            }
+        return routes
+
+
+def format_report(routes: dict[str, Any]) -> str:
+    if not routes:
+        return "No responses carried Server-Timing with a total (is the route wrapped in withServerTiming?)"
+    lines = []
+    for key, route in routes.items():
+        total = route["total"]
+        lines.append(f"{key}  n={route['requests']}  total p50={total['p50']}ms p95={total['p95']}ms p99={total['p99']}ms")
+        for name, phase in route["phases"].items():
+            if not phase.get("n"):
+                continue
+            share = f"  {phase['share_p50'] * 100:.0f}% of total" if phase["share_p50"] is not None else ""
+            lines.append(
+                f"  {name:<10} n={phase['n']:<5} p50={phase['p50']}ms p95={phase['p95']}ms p99={phase['p99']}ms{share}"
+            )
+    return "\n".join(lines)
+
+
+def collect_http() -> TimingCollector:
+    """Record every ``httpclient`` response from now on into the returned collector."""
+    collector = TimingCollector()
+    httpclient.RESPONSE_HOOKS.append(collector.record)
+    return collector
+
+
+class ServerTimingPlugin(Plugin):
+    """Record Server-Timing of every response the flow's browser receives."""
+
+    name = "server_timing"
+
+    def __init__(self) -> None:
+        self.collector = TimingCollector()
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        context.on("response", self._on_response)
+
+    def _on_response(self, response: async_api.Response) -> None:
+        self.collector.record(response.request.method, response.url, response.status, response.headers)
+
+    def report(self) -> dict[str, Any]:
+        return self.collector.report()
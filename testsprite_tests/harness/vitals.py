@@ -0,0 +1,93 @@
+"""Web Vitals collection for pages opened during a TC flow.
+
+An init script registers ``PerformanceObserver``s in every document and pushes
+each update to Python through an exposed binding, so metrics survive full page
+navigations triggered by clicks as well as ``page.goto``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from playwright import async_api
+
+from .session import Plugin
+
+# web.dev "good" / "poor" boundaries
+THRESHOLDS = {
+    "TTFB": (800, 1800),
+    "FCP": (1800, 3000),
+    "LCP": (2500, 4000),
+    "CLS": (0.1, 0.25),
+    "INP": (200, 500),
+}
+
+_OBSERVER_SCRIPT = """
+(() => {
+  if (window.__harnessVitalsInstalled) return;
+  window.__harnessVitalsInstalled = true;
+  const report = (name, value) => {
+    try { window.__harnessReportVital(name, value, location.pathname); } catch (e) {}
+  };
+  const observe = (type, callback, options) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe(Object.assign({ type, buffered: true }, options || {}));
+    } catch (e) {}
+  };
+  observe('navigation', (e) => report('TTFB', e.responseStart));
+  observe('paint', (e) => { if (e.name === 'first-contentful-paint') report('FCP', e.startTime); });
+  observe('largest-contentful-paint', (e) => report('LCP', e.startTime));
+  let cls = 0;
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) { cls += e.value; report('CLS', cls); } });
+  let inp = 0;
+  observe('event', (e) => {
+    if (e.interactionId && e.duration > inp) { inp = e.duration; report('INP', inp); }
+  }, { durationThreshold: 16 });
+})();
+"""
+
+# Metrics that only make sense once per document keep their first value
+_FIRST_WINS = {"TTFB", "FCP"}
+
+
+def rate(metric: str, value: float) -> str:
+    good, poor = THRESHOLDS[metric]
+    if value <= good:
+        return "good"
+    if value <= poor:
+        return "needs-improvement"
+    return "poor"
+
+
+class VitalsPlugin(Plugin):
+    name = "vitals"
+
+    def __init__(self) -> None:
+        self.pages: dict[str, dict[str, float]] = {}
+
+    async def on_context(self, context: async_api.BrowserContext) -> None:
+        await context.expose_binding("__harnessReportVital", self._record)
+        await context.add_init_script(_OBSERVER_SCRIPT)
+
+    def _record(self, source: Any, name: str, value: float, path: str) -> None:
+        metrics = self.pages.setdefault(path, {})
+        if name in _FIRST_WINS and name in metrics:
+            return
+        metrics[name] = value
+
+    def report(self) -> dict[str, Any]:
+        worst: dict[str, float] = {}
+        for metrics in self.pages.values():
+            for name, value in metrics.items():
+                worst[name] = max(worst.get(name, value), value)
+        return {
+            "pages": {
+                path: {name: round(value, 3) for name, value in metrics.items()}
+                for path, metrics in self.pages.items()
+            },
+            "worst": {
+                name: {"value": round(value, 3), "rating": rate(name, value)}
+                for name, value in worst.items()
+            },
+        }